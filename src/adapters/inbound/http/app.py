@@ -27,6 +27,7 @@ from .routes import (
     prompts,
     resources,
     sampling,
+    tool_results,
     usage,
     workflow,
 )
@@ -123,6 +124,12 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     await usage_storage.initialize()
     logger.info("SQLite usage storage initialized")
 
+    tool_result_storage = container.tool_result_storage()
+    await tool_result_storage.initialize()
+
+    completion_cache = container.completion_cache()
+    await completion_cache.initialize()
+
     # Orchestrator 초기화 (Async Factory Pattern)
     orchestrator = container.orchestrator_adapter()
     await orchestrator.initialize()
@@ -166,6 +173,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info("Orchestrator closed")
     await conv_storage.close()
     await usage_storage.close()
+    await tool_result_storage.close()
+    await completion_cache.close()
     logger.info("Storage connections closed")
 
 
@@ -228,6 +237,7 @@ def create_app() -> FastAPI:
     app.include_router(conversations.router)
     app.include_router(workflow.router)  # Workflow Management
     app.include_router(usage.router)  # Usage & Cost Tracking
+    app.include_router(tool_results.router)  # Large Tool Results
 
     # DEV_MODE 전용 테스트 유틸리티 (Phase 1)
     if settings.dev_mode:
@@ -18,6 +18,8 @@ from src.domain.exceptions import (
     LlmAuthenticationError,
     LlmRateLimitError,
     ToolNotFoundError,
+    ToolResultNotFoundError,
+    TurnQueueTimeoutError,
 )
 
 
@@ -40,11 +42,14 @@ EXCEPTION_STATUS_MAP: dict[type[DomainException], int] = {
     # 404 Not Found
     EndpointNotFoundError: status.HTTP_404_NOT_FOUND,
     ToolNotFoundError: status.HTTP_404_NOT_FOUND,
+    ToolResultNotFoundError: status.HTTP_404_NOT_FOUND,
     ConversationNotFoundError: status.HTTP_404_NOT_FOUND,
     # 429 Too Many Requests
     LlmRateLimitError: status.HTTP_429_TOO_MANY_REQUESTS,
     # 502 Bad Gateway
     EndpointConnectionError: status.HTTP_502_BAD_GATEWAY,
+    # 503 Service Unavailable
+    TurnQueueTimeoutError: status.HTTP_503_SERVICE_UNAVAILABLE,
     # 504 Gateway Timeout
     EndpointTimeoutError: status.HTTP_504_GATEWAY_TIMEOUT,
 }
@@ -12,7 +12,12 @@ from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import StreamingResponse
 
-from src.adapters.inbound.http.schemas.chat import ChatRequest, ChatStreamEvent
+from src.adapters.inbound.http.schemas.chat import (
+    ChatRequest,
+    ChatStreamEvent,
+    TurnQueueStatsSchema,
+)
+from src.adapters.outbound.adk.turn_scheduler import TurnScheduler
 from src.config.container import Container
 from src.domain.entities.stream_chunk import StreamChunk
 from src.domain.exceptions import DomainException
@@ -33,7 +38,7 @@ async def _generate_chat_stream(
 
     Args:
         request: FastAPI Request (연결 상태 확인용)
-        body: 채팅 요청 (conversation_id, message, page_context)
+        body: 채팅 요청 (conversation_id, message, page_context, escalate)
         orchestrator: OrchestratorService
 
     Yields:
@@ -83,6 +88,7 @@ async def _generate_chat_stream(
             conversation_id=conversation_id,
             message=body.message,
             page_context=page_context_dict,
+            escalate=body.escalate,
         ):
             # 클라이언트 연결 해제 확인 (Zombie Task 방지)
             if await request.is_disconnected():
@@ -182,7 +188,7 @@ async def chat_stream(
 
     Args:
         request: FastAPI Request (연결 상태 확인용)
-        body: 채팅 요청 (conversation_id, message, page_context)
+        body: 채팅 요청 (conversation_id, message, page_context, escalate)
         orchestrator: OrchestratorService (DI)
 
     Returns:
@@ -192,6 +198,7 @@ async def chat_stream(
         - data: {"type": "text", "content": "..."}
         - data: {"type": "tool_call", "tool_name": "...", "tool_arguments": {...}}
         - data: {"type": "tool_result", "tool_name": "...", "result": "..."}
+          (대용량 결과: "result"는 미리보기, "result_url"로 전체 조회)
         - data: {"type": "agent_transfer", "agent_name": "..."}
         - data: {"type": "done"}
         - data: {"type": "error", "content": "...", "error_code": "..."}
@@ -242,3 +249,16 @@ async def chat_stream_get(
             "X-Accel-Buffering": "no",
         },
     )
+
+
+@router.get("/queue", response_model=TurnQueueStatsSchema)
+@inject
+async def get_turn_queue_stats(
+    turn_scheduler: TurnScheduler = Depends(Provide[Container.turn_scheduler]),
+):
+    """채팅 턴 대기열 상태 조회
+
+    Returns:
+        TurnQueueStatsSchema: 실행 중/대기 중인 턴 수, 승인 대기 시간
+    """
+    return TurnQueueStatsSchema(**turn_scheduler.get_stats())
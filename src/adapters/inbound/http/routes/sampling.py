@@ -1,7 +1,7 @@
 """Sampling HITL API Routes (Phase 6, Step 6.3)"""
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException
 
 from src.adapters.inbound.http.schemas.sampling import (
     SamplingApproveResponse,
@@ -16,6 +16,17 @@ from src.domain.services.sampling_service import SamplingService
 
 router = APIRouter(prefix="/api/sampling", tags=["sampling"])
 
+# 응답 캐시를 건너뛰는 Cache-Control 지시어
+_CACHE_BYPASS_DIRECTIVES = {"no-cache", "no-store"}
+
+
+def _allows_cache(cache_control: str | None) -> bool:
+    """Cache-Control 헤더에 no-cache/no-store가 없으면 응답 캐시 사용"""
+    if not cache_control:
+        return True
+    directives = {d.strip().lower() for d in cache_control.split(",")}
+    return not directives & _CACHE_BYPASS_DIRECTIVES
+
 
 @router.get("/requests", response_model=SamplingRequestListResponse)
 @inject
@@ -33,14 +44,17 @@ def list_sampling_requests(
 @inject
 async def approve_sampling_request(
     request_id: str,
+    cache_control: str | None = Header(default=None),
     sampling_service: SamplingService = Depends(Provide[Container.sampling_service]),
     orchestrator: OrchestratorPort = Depends(Provide[Container.orchestrator_adapter]),
 ):
     """Sampling 요청 승인 + LLM 실행 (Method C)
 
-    1. LLM 호출 (orchestrator.generate_response)
+    1. LLM 호출 (orchestrator.generate_response, 같은 요청은 응답 캐시 재사용)
     2. 결과를 sampling_service.approve()로 시그널
     3. RegistryService의 콜백이 깨어나서 MCP 서버에 전달
+
+    `Cache-Control: no-cache` (또는 no-store) 헤더로 응답 캐시를 건너뛸 수 있습니다.
     """
     # 1. 요청 조회
     request = sampling_service.get_request(request_id)
@@ -53,6 +67,7 @@ async def approve_sampling_request(
         model=request.model_preferences.get("model") if request.model_preferences else None,
         system_prompt=request.system_prompt,
         max_tokens=request.max_tokens,
+        use_cache=_allows_cache(cache_control),
     )
 
     # 3. 시그널 (콜백이 깨어남)
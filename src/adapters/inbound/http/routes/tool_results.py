@@ -0,0 +1,45 @@
+"""Tool Result API 엔드포인트
+
+대용량 도구 결과 조회 (SSE tool_result 청크의 result_url)
+"""
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, Query
+
+from src.adapters.inbound.http.schemas.tool_results import ToolResultPageSchema
+from src.config.container import Container
+from src.domain.ports.outbound.storage_port import ToolResultStoragePort
+
+router = APIRouter(prefix="/api/tool-results", tags=["Tool Results"])
+
+
+@router.get("/{handle}", response_model=ToolResultPageSchema)
+@inject
+async def get_tool_result(
+    handle: str,
+    offset: int = Query(default=0, ge=0),
+    length: int | None = Query(default=None, ge=1),
+    storage: ToolResultStoragePort = Depends(Provide[Container.tool_result_storage]),
+):
+    """분리 저장된 도구 결과 조회
+
+    Args:
+        handle: 결과 핸들
+        offset: 시작 위치 (문자 단위)
+        length: 최대 문자 수 (생략 시 끝까지)
+
+    Returns:
+        ToolResultPageSchema: 조회한 구간과 다음 구간 위치
+
+    Raises:
+        ToolResultNotFoundError: 핸들이 없거나 보존 기간이 지남 (404)
+    """
+    content, total = await storage.read_result(handle, offset, length)
+    next_offset = offset + len(content)
+    return ToolResultPageSchema(
+        handle=handle,
+        offset=offset,
+        content=content,
+        total_chars=total,
+        next_offset=next_offset if next_offset < total else None,
+    )
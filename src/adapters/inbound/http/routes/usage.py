@@ -7,9 +7,15 @@ from fastapi import APIRouter, Depends
 
 from src.adapters.inbound.http.schemas.usage import (
     BudgetStatusSchema,
+    CascadeStatsSchema,
+    DeploymentHealthSchema,
+    RateLimitStatsSchema,
     UpdateBudgetRequest,
     UsageSummarySchema,
 )
+from src.adapters.outbound.adk.llm_rate_limiter import LlmRateLimiter
+from src.adapters.outbound.adk.llm_router import LlmDeploymentRouter
+from src.adapters.outbound.adk.model_cascade import ModelCascade
 from src.config.container import Container
 from src.domain.services.cost_service import CostService
 
@@ -49,6 +55,45 @@ async def get_usage_by_model(
     return by_model
 
 
+@router.get("/deployments", response_model=dict[str, list[DeploymentHealthSchema]])
+@inject
+async def get_deployment_health(
+    llm_router: LlmDeploymentRouter = Depends(Provide[Container.llm_router]),
+):
+    """LLM 배포 풀 상태 조회
+
+    Returns:
+        dict: {"논리 모델": [DeploymentHealthSchema, ...], ...} (풀 미설정 시 빈 dict)
+    """
+    return llm_router.get_health()
+
+
+@router.get("/rate-limits", response_model=dict[str, RateLimitStatsSchema])
+@inject
+async def get_rate_limits(
+    llm_rate_limiter: LlmRateLimiter = Depends(Provide[Container.llm_rate_limiter]),
+):
+    """모델별 LLM rate limiter 상태 조회
+
+    Returns:
+        dict: {"모델": RateLimitStatsSchema, ...} (호출된 모델만 포함)
+    """
+    return llm_rate_limiter.get_stats()
+
+
+@router.get("/cascade", response_model=CascadeStatsSchema)
+@inject
+async def get_cascade_stats(
+    model_cascade: ModelCascade = Depends(Provide[Container.model_cascade]),
+):
+    """모델 캐스케이드 통계 조회 (모델별 비용은 /by-model 참고)
+
+    Returns:
+        CascadeStatsSchema: 턴 수, 승격 비율/사유, 단계별 평균 지연
+    """
+    return CascadeStatsSchema(**model_cascade.get_stats())
+
+
 @router.get("/budget", response_model=BudgetStatusSchema)
 @inject
 async def get_budget_status(
@@ -19,7 +19,7 @@ from src.adapters.inbound.http.schemas.workflow import (
     WorkflowStreamEvent,
 )
 from src.config.container import Container
-from src.domain.entities.workflow import Workflow, WorkflowStep
+from src.domain.entities.workflow import WORKFLOW_TYPES, Workflow, WorkflowStep
 from src.domain.exceptions import WorkflowNotFoundError
 from src.domain.ports.outbound.orchestrator_port import OrchestratorPort
 
@@ -44,13 +44,14 @@ async def create_workflow(request: CreateWorkflowRequest):
         생성된 Workflow 정보
 
     Raises:
-        422: workflow_type이 'sequential' 또는 'parallel'이 아닌 경우
+        422: workflow_type이 'sequential', 'parallel', 'dag'가 아니거나
+            의존성 그래프가 잘못된 경우 (중복/미등록 output_key, 순환)
     """
     # Validate workflow_type
-    if request.workflow_type not in ["sequential", "parallel"]:
+    if request.workflow_type not in WORKFLOW_TYPES:
         raise HTTPException(
             status_code=422,
-            detail="workflow_type must be 'sequential' or 'parallel'",
+            detail="workflow_type must be 'sequential', 'parallel' or 'dag'",
         )
 
     # Create Workflow entity
@@ -60,16 +61,24 @@ async def create_workflow(request: CreateWorkflowRequest):
         name=request.name,
         workflow_type=request.workflow_type,
         description=request.description,
+        max_parallelism=request.max_parallelism,
         steps=[
             WorkflowStep(
                 agent_endpoint_id=step.agent_endpoint_id,
                 output_key=step.output_key,
                 instruction=step.instruction,
+                depends_on=list(step.depends_on),
             )
             for step in request.steps
         ],
     )
 
+    # Validate dependency graph
+    try:
+        workflow.step_dependencies()
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
     # Store in-memory
     _workflows[workflow_id] = workflow
 
@@ -88,9 +97,11 @@ async def create_workflow(request: CreateWorkflowRequest):
                 agent_endpoint_id=step.agent_endpoint_id,
                 output_key=step.output_key,
                 instruction=step.instruction,
+                depends_on=step.depends_on,
             )
             for step in workflow.steps
         ],
+        max_parallelism=workflow.max_parallelism,
         created_at=workflow.created_at.isoformat(),
     )
 
@@ -114,9 +125,11 @@ async def list_workflows():
                     agent_endpoint_id=step.agent_endpoint_id,
                     output_key=step.output_key,
                     instruction=step.instruction,
+                    depends_on=step.depends_on,
                 )
                 for step in wf.steps
             ],
+            max_parallelism=wf.max_parallelism,
             created_at=wf.created_at.isoformat(),
         )
         for wf in _workflows.values()
@@ -263,9 +276,11 @@ async def get_workflow(workflow_id: str):
                 agent_endpoint_id=step.agent_endpoint_id,
                 output_key=step.output_key,
                 instruction=step.instruction,
+                depends_on=step.depends_on,
             )
             for step in workflow.steps
         ],
+        max_parallelism=workflow.max_parallelism,
         created_at=workflow.created_at.isoformat(),
     )
 
@@ -23,6 +23,7 @@ class ChatRequest(BaseModel):
     conversation_id: str | None = None
     message: str = Field(..., min_length=1)
     page_context: PageContextSchema | None = None  # Phase 5 Part C
+    escalate: bool = False  # 모델 캐스케이드: 소형 모델을 건너뛰고 기본 모델로 응답
 
 
 class ChatStreamEvent(BaseModel):
@@ -32,7 +33,8 @@ class ChatStreamEvent(BaseModel):
     content: str | None = None  # text, error
     tool_name: str | None = None  # tool_call, tool_result
     tool_arguments: dict[str, Any] | None = None  # tool_call
-    result: str | None = None  # tool_result
+    result: str | None = None  # tool_result (대용량 결과는 미리보기)
+    result_url: str | None = None  # tool_result (분리 저장된 대용량 결과 조회 URL)
     agent_name: str | None = None  # agent_transfer
     error_code: str | None = None  # error
 
@@ -45,6 +47,19 @@ class ChatStreamEvent(BaseModel):
             tool_name=chunk.tool_name or None,
             tool_arguments=chunk.tool_arguments or None,
             result=chunk.result or None,
+            result_url=chunk.result_url or None,
             agent_name=chunk.agent_name or None,
             error_code=chunk.error_code or None,
         )
+
+
+class TurnQueueStatsSchema(BaseModel):
+    """채팅 턴 스케줄러 상태 스키마"""
+
+    max_concurrent_turns: int = Field(..., description="전체 동시 실행 턴 수 (0이면 제한 없음)")
+    active_turns: int = Field(..., description="실행 중인 턴 수")
+    queued_turns: int = Field(..., description="전역 승인 대기열 길이")
+    conversation_waiting: int = Field(..., description="같은 대화의 이전 턴을 기다리는 턴 수")
+    admitted_turns: int = Field(..., description="승인된 턴 수 (누적)")
+    timed_out_turns: int = Field(..., description="대기 시간 초과로 거절된 턴 수 (누적)")
+    wait_ms: dict[str, float] = Field(..., description="승인 대기 시간 (ms, avg/p95/max)")
@@ -0,0 +1,13 @@
+"""Tool Result API 스키마"""
+
+from pydantic import BaseModel, Field
+
+
+class ToolResultPageSchema(BaseModel):
+    """분리 저장된 도구 결과 구간"""
+
+    handle: str = Field(..., description="결과 핸들")
+    offset: int = Field(..., description="시작 위치 (문자 단위)")
+    content: str = Field(..., description="조회한 구간")
+    total_chars: int = Field(..., description="전체 문자 수")
+    next_offset: int | None = Field(None, description="다음 구간 시작 위치 (끝이면 null)")
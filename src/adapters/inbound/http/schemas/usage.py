@@ -19,9 +19,55 @@ class UsageSummarySchema(BaseModel):
     total_cost: float = Field(..., description="총 비용 (USD)")
     total_tokens: int = Field(..., description="총 토큰 수")
     call_count: int = Field(..., description="호출 횟수")
+    cache_hits: int = Field(0, description="응답 캐시 hit 횟수 (call_count에 포함, 비용 0)")
+    cached_tokens: int = Field(0, description="프롬프트 캐시에서 읽은 입력 토큰 수 (할인 적용)")
     by_model: dict[str, float] = Field(..., description="모델별 비용")
 
 
+class DeploymentHealthSchema(BaseModel):
+    """LLM 배포(deployment) 상태 스키마"""
+
+    id: str = Field(..., description="배포 ID")
+    model: str = Field(..., description="LiteLLM 모델 문자열")
+    healthy: bool = Field(..., description="라우팅 대상 여부 (쿨다운 중이면 False)")
+    cooldown_remaining_seconds: float = Field(..., description="남은 쿨다운 시간 (초)")
+    ewma_latency_ms: float | None = Field(None, description="EWMA 응답 지연 (ms)")
+    in_flight: int = Field(..., description="처리 중인 요청 수")
+    requests: int = Field(..., description="총 시도 횟수")
+    failures: int = Field(..., description="장애 조치된 실패 횟수 (429/5xx/연결 실패)")
+    consecutive_failures: int = Field(..., description="연속 실패 횟수")
+    remaining_requests: int | None = Field(None, description="남은 요청 한도 (rate limit 헤더)")
+    remaining_tokens: int | None = Field(None, description="남은 토큰 한도 (rate limit 헤더)")
+    last_error: str | None = Field(None, description="마지막 오류")
+
+
+class CascadeStatsSchema(BaseModel):
+    """모델 캐스케이드 통계 스키마"""
+
+    enabled: bool = Field(..., description="캐스케이드 사용 여부")
+    cascade_model: str = Field(..., description="먼저 실행하는 소형 모델")
+    turns: int = Field(..., description="기록된 턴 수")
+    escalated_turns: int = Field(..., description="기본 모델로 승격된 턴 수")
+    escalation_rate: float = Field(..., description="승격 비율 (0~1)")
+    escalation_reasons: dict[str, int] = Field(
+        ..., description="승격 사유별 횟수 (user_flag/tool_depth/uncertainty/output_length)"
+    )
+    avg_latency_ms: dict[str, float | None] = Field(
+        ..., description="턴 평균 지연 (ms, cascade: 소형 모델로 끝난 턴, default: 승격된 턴)"
+    )
+
+
+class RateLimitStatsSchema(BaseModel):
+    """모델별 LLM rate limiter 상태 스키마"""
+
+    rpm: int = Field(..., description="분당 요청 한도 (0이면 제한 없음)")
+    tpm: int = Field(..., description="분당 토큰 한도 (0이면 제한 없음)")
+    requests: int = Field(..., description="전송한 요청 수 (재시도 포함)")
+    rate_limited: int = Field(..., description="프로바이더 429 응답 수")
+    waited_seconds: float = Field(..., description="한도/backoff로 대기한 누적 시간 (초)")
+    blocked_seconds: float = Field(..., description="Retry-After/backoff로 남은 대기 시간 (초)")
+
+
 class UpdateBudgetRequest(BaseModel):
     """예산 업데이트 요청"""
 
@@ -16,15 +16,21 @@ class WorkflowStepSchema(BaseModel):
     agent_endpoint_id: str = Field(..., description="등록된 A2A 에이전트 엔드포인트 ID")
     output_key: str = Field(..., description="이 Step 결과를 저장할 session.state 키")
     instruction: str = Field(default="", description="Step 특화 instruction (선택)")
+    depends_on: list[str] = Field(
+        default_factory=list, description="먼저 끝나야 하는 Step의 output_key 목록 (dag 전용)"
+    )
 
 
 class CreateWorkflowRequest(BaseModel):
     """Workflow 생성 요청"""
 
     name: str = Field(..., description="Workflow 이름")
-    workflow_type: str = Field(..., description="실행 방식: 'sequential' 또는 'parallel'")
+    workflow_type: str = Field(..., description="실행 방식: 'sequential', 'parallel' 또는 'dag'")
     description: str = Field(default="", description="Workflow 설명")
     steps: list[WorkflowStepSchema] = Field(..., description="실행할 Step 목록")
+    max_parallelism: int = Field(
+        default=0, ge=0, description="동시 실행 Step 수 (0이면 서버 기본값)"
+    )
 
     class Config:
         json_schema_extra = {
@@ -56,6 +62,7 @@ class WorkflowResponse(BaseModel):
     workflow_type: str
     description: str
     steps: list[WorkflowStepSchema]
+    max_parallelism: int = 0
     created_at: str
 
 
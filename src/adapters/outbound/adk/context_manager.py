@@ -0,0 +1,265 @@
+"""ConversationContextManager - 토큰 예산 기반 대화 컨텍스트 관리
+
+ADK before_model_callback에서 LLM 요청의 대화 기록(contents)을 토큰 예산 안으로 줄입니다.
+- 최근 N개 턴은 그대로 유지
+- 오래된 턴은 저렴한 모델이 백그라운드에서 생성하는 누적 요약(running summary)으로 대체
+- Content별 토큰 수는 해시 기준으로 캐싱하여 매 턴 재계산하지 않음
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import litellm
+from google.adk.models.llm_request import LlmRequest
+from google.genai import types
+
+logger = logging.getLogger(__name__)
+
+# 토큰 수 캐시 최대 항목 수 (Content 해시 → 토큰 수)
+_TOKEN_CACHE_SIZE = 4096
+# 요약 상태를 유지할 최대 세션 수
+_MAX_TRACKED_SESSIONS = 256
+# 요약 입력에 포함할 도구 인자/결과 최대 문자 수
+_SUMMARY_PART_CHARS = 500
+
+SUMMARY_PREFIX = "Summary of the earlier conversation:"
+
+_SUMMARY_PROMPT = (
+    "You maintain a running summary of a conversation between a user and an assistant "
+    "that can call tools. Update the summary with the new turns. Keep facts, decisions, "
+    "open questions, user preferences and tool results that later turns may rely on. "
+    "Be concise and write plain text only."
+)
+
+
+@dataclass
+class _SessionSummary:
+    """세션별 누적 요약 상태"""
+
+    text: str = ""
+    summarized_turns: int = 0  # 요약에 반영된 (세션 시작부터의) 턴 수
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+
+def _is_user_turn_start(content: types.Content) -> bool:
+    """사용자 텍스트 메시지인지 확인 (function_response는 턴 시작이 아님)"""
+    if content.role != "user" or not content.parts:
+        return False
+    return any(part.text for part in content.parts) and not any(
+        part.function_response for part in content.parts
+    )
+
+
+def _split_turns(contents: list[types.Content]) -> list[list[types.Content]]:
+    """
+    사용자 메시지 기준으로 턴 분할
+
+    도구 호출/결과 쌍이 같은 턴에 남도록 사용자 텍스트 메시지에서만 나눕니다.
+    """
+    turns: list[list[types.Content]] = []
+    for content in contents:
+        if not turns or _is_user_turn_start(content):
+            turns.append([content])
+        else:
+            turns[-1].append(content)
+    return turns
+
+
+def _render_content(content: types.Content) -> str:
+    """요약 입력용 텍스트 렌더링 (도구 인자/결과는 잘라서 포함)"""
+    lines: list[str] = []
+    for part in content.parts or []:
+        if part.text:
+            lines.append(part.text)
+        elif part.function_call:
+            args = json.dumps(part.function_call.args or {}, ensure_ascii=False, default=str)
+            lines.append(f"[tool call] {part.function_call.name}({args[:_SUMMARY_PART_CHARS]})")
+        elif part.function_response:
+            result = json.dumps(part.function_response.response, ensure_ascii=False, default=str)
+            lines.append(
+                f"[tool result] {part.function_response.name}: {result[:_SUMMARY_PART_CHARS]}"
+            )
+    return f"{content.role or 'user'}: " + "\n".join(lines)
+
+
+class ConversationContextManager:
+    """
+    토큰 예산 기반 대화 컨텍스트 관리자
+
+    before_model_callback으로 등록하면 LLM 요청마다:
+    1. 대화 기록이 max_context_tokens 이하면 그대로 전달
+    2. 초과하면 최근 keep_recent_turns개 턴 + (예산이 남는 만큼의) 직전 턴만 유지하고,
+       나머지는 누적 요약 한 개의 메시지로 대체
+    3. 아직 요약되지 않은 오래된 턴은 백그라운드에서 summary_model로 요약
+       (요약이 끝나기 전 턴은 직전 요약을 사용하므로 응답이 요약을 기다리지 않음)
+    """
+
+    def __init__(
+        self,
+        summary_model: str,
+        max_context_tokens: int = 32000,
+        keep_recent_turns: int = 6,
+        summary_max_tokens: int = 512,
+        acompletion: Callable[..., Awaitable[Any]] | None = None,
+        token_model: str | None = None,
+    ):
+        """
+        Args:
+            summary_model: 요약 생성 모델 (LiteLLM 모델 문자열)
+            max_context_tokens: 대화 기록 토큰 예산
+            keep_recent_turns: 항상 그대로 유지할 최근 턴 수
+            summary_max_tokens: 요약 최대 토큰 수
+            acompletion: 요약 호출 함수 (None이면 litellm.acompletion, 배포 풀 라우팅용)
+            token_model: 토큰 수 계산 모델 (예산이 적용되는 대화 모델, None이면 summary_model)
+        """
+        self._summary_model = summary_model
+        self._token_model = token_model or summary_model
+        self._max_context_tokens = max_context_tokens
+        self._keep_recent_turns = max(keep_recent_turns, 1)
+        self._summary_max_tokens = summary_max_tokens
+        self._acompletion = acompletion
+        self._token_cache: OrderedDict[str, int] = OrderedDict()
+        self._summaries: OrderedDict[str, _SessionSummary] = OrderedDict()
+
+    def count_tokens(self, content: types.Content) -> int:
+        """Content 토큰 수 (직렬화 해시 기준 캐싱)"""
+        serialized = content.model_dump_json(exclude_none=True)
+        key = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+        cached = self._token_cache.get(key)
+        if cached is not None:
+            self._token_cache.move_to_end(key)
+            return cached
+
+        try:
+            tokens = litellm.token_counter(model=self._token_model, text=serialized)
+        except Exception:
+            # 토크나이저를 찾지 못하면 대략적인 추정치 사용 (4자 ≈ 1토큰)
+            tokens = len(serialized) // 4 + 1
+
+        self._token_cache[key] = tokens
+        if len(self._token_cache) > _TOKEN_CACHE_SIZE:
+            self._token_cache.popitem(last=False)
+        return tokens
+
+    async def before_model_callback(
+        self,
+        callback_context: Any,
+        llm_request: LlmRequest,
+    ) -> None:
+        """
+        LLM 요청의 대화 기록을 토큰 예산 안으로 축소
+
+        Returns:
+            None (요청을 제자리에서 수정하고 모델 호출은 그대로 진행)
+        """
+        contents = llm_request.contents
+        if not contents:
+            return None
+
+        turns = _split_turns(contents)
+        turn_tokens = [sum(self.count_tokens(c) for c in turn) for turn in turns]
+        if sum(turn_tokens) <= self._max_context_tokens:
+            return None
+
+        session_id = callback_context.session.id
+        state = self._get_state(session_id)
+
+        # 오래된 턴(최근 N개 제외) 요약 갱신 (백그라운드)
+        older_count = max(len(turns) - self._keep_recent_turns, 0)
+        if older_count > state.summarized_turns and (state.task is None or state.task.done()):
+            state.task = asyncio.create_task(self._summarize(state, turns, older_count))
+
+        summary_content = self._summary_content(state.text) if state.text else None
+        budget = self._max_context_tokens
+        if summary_content is not None:
+            budget -= self.count_tokens(summary_content)
+
+        # 최근 N개 턴은 항상 유지, 그 이전 턴은 예산이 남는 만큼 최신순으로 유지
+        # (이미 요약된 턴은 요약으로 대체)
+        first_kept = older_count
+        used = sum(turn_tokens[older_count:])
+        while first_kept > state.summarized_turns:
+            if used + turn_tokens[first_kept - 1] > budget:
+                break
+            first_kept -= 1
+            used += turn_tokens[first_kept]
+
+        kept = [content for turn in turns[first_kept:] for content in turn]
+        llm_request.contents = [summary_content, *kept] if summary_content else kept
+        logger.debug(
+            f"Context compacted: {len(turns)} turns -> {len(turns) - first_kept} turns"
+            f"{' + summary' if summary_content else ''}",
+            extra={"session_id": session_id, "context_tokens": used},
+        )
+        return None
+
+    def _get_state(self, session_id: str) -> _SessionSummary:
+        """세션 요약 상태 (최근 사용 세션만 유지)"""
+        state = self._summaries.get(session_id)
+        if state is None:
+            state = _SessionSummary()
+            self._summaries[session_id] = state
+            if len(self._summaries) > _MAX_TRACKED_SESSIONS:
+                _, evicted = self._summaries.popitem(last=False)
+                if evicted.task is not None:
+                    evicted.task.cancel()
+        else:
+            self._summaries.move_to_end(session_id)
+        return state
+
+    @staticmethod
+    def _summary_content(text: str) -> types.Content:
+        """누적 요약을 대화 맨 앞에 넣을 메시지로 변환"""
+        return types.Content(role="user", parts=[types.Part(text=f"{SUMMARY_PREFIX}\n{text}")])
+
+    async def _summarize(
+        self,
+        state: _SessionSummary,
+        turns: list[list[types.Content]],
+        until: int,
+    ) -> None:
+        """이전 요약 + 새로 밀려난 턴으로 누적 요약 갱신 (실패 시 다음 턴에 재시도)"""
+        new_turns = "\n\n".join(
+            _render_content(content)
+            for turn in turns[state.summarized_turns : until]
+            for content in turn
+        )
+        previous = state.text or "(none)"
+        try:
+            acompletion = self._acompletion or litellm.acompletion
+            response = await acompletion(
+                model=self._summary_model,
+                messages=[
+                    {"role": "system", "content": _SUMMARY_PROMPT},
+                    {
+                        "role": "user",
+                        "content": f"Current summary:\n{previous}\n\nNew turns:\n{new_turns}",
+                    },
+                ],
+                max_tokens=self._summary_max_tokens,
+            )
+            text = response.choices[0].message.content or ""
+        except Exception as e:
+            logger.warning(f"Conversation summary failed: {e}")
+            return
+
+        if text:
+            state.text = text.strip()
+            state.summarized_turns = until
+
+    async def close(self) -> None:
+        """진행 중인 요약 작업 취소"""
+        tasks = [s.task for s in self._summaries.values() if s.task and not s.task.done()]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._summaries.clear()
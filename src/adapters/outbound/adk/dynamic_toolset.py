@@ -4,10 +4,16 @@ TDD Phase: GREEN - 최소 구현
 """
 
 import asyncio
+import contextlib
+import hashlib
+import json
 import logging
+import random
 import time
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
 
+import litellm
 from google.adk.tools import BaseTool
 from google.adk.tools.base_toolset import BaseToolset
 from google.adk.tools.mcp_tool.mcp_toolset import (
@@ -15,10 +21,13 @@ from google.adk.tools.mcp_tool.mcp_toolset import (
     SseConnectionParams,
     StreamableHTTPConnectionParams,
 )
+from google.genai import types
 
+from src.adapters.outbound.adk.tool_relevance_index import ToolRelevanceIndex
+from src.adapters.outbound.adk.tool_result_cache import ToolResultCache, canonical_arguments
 from src.config.settings import Settings
 from src.domain.entities.auth_config import AuthConfig
-from src.domain.entities.endpoint import Endpoint, EndpointType
+from src.domain.entities.endpoint import Endpoint, EndpointType, McpTransport
 from src.domain.entities.tool import Tool
 
 if TYPE_CHECKING:
@@ -26,10 +35,6 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# Context Explosion 방지 (Step 11: 30 → 100)
-MAX_ACTIVE_TOOLS = 100
-TOOL_TOKEN_WARNING_THRESHOLD = 10000  # 약 10k 토큰
-
 # 재시도 대상 에러 (일시적 에러)
 TRANSIENT_ERRORS = (ConnectionError, TimeoutError, asyncio.TimeoutError)
 
@@ -40,33 +45,210 @@ class ToolLimitExceededError(Exception):
     pass
 
 
-class DeferredToolProxy:
+class ToolNameConflictError(Exception):
+    """여러 MCP 서버가 같은 이름의 도구를 제공하여 대상을 특정할 수 없음"""
+
+    pass
+
+
+def _tool_input_schema(tool: BaseTool) -> dict[str, Any]:
+    """도구 입력 JSON 스키마 (ADK McpTool은 raw_mcp_tool.inputSchema)"""
+    raw_tool = getattr(tool, "raw_mcp_tool", None)
+    schema = getattr(raw_tool, "inputSchema", None) if raw_tool is not None else None
+    if not isinstance(schema, dict):
+        schema = getattr(tool, "input_schema", None)
+    return schema if isinstance(schema, dict) else {}
+
+
+def _tool_definition(tool: BaseTool) -> str:
+    """LLM에 전달되는 도구 정의 (name, description, JSON 스키마) 직렬화"""
+    return json.dumps(
+        {
+            "name": str(tool.name),
+            "description": str(tool.description or ""),
+            "parameters": _tool_input_schema(tool),
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+
+
+def _count_tokens(model: str, text: str) -> int:
+    """모델 토크나이저로 토큰 수 계산 (토크나이저를 쓸 수 없으면 4자당 1토큰 추정)"""
+    try:
+        return litellm.token_counter(model=model, text=text)
+    except Exception as e:
+        logger.debug(f"Tokenizer unavailable for {model}, estimating: {e}")
+        return len(text) // 4 + 1
+
+
+def _has_cacheable_hint(tool: BaseTool) -> bool:
+    """MCP 도구 annotations에 readOnlyHint 또는 idempotentHint가 명시되어 있는지"""
+    raw_tool = getattr(tool, "raw_mcp_tool", None)
+    annotations = getattr(raw_tool, "annotations", None) if raw_tool is not None else None
+    if annotations is None:
+        return False
+    return (
+        getattr(annotations, "readOnlyHint", None) is True
+        or getattr(annotations, "idempotentHint", None) is True
+    )
+
+
+def _is_error_result(result: Any) -> bool:
+    """
+    에러 응답 여부 (캐싱하지 않음)
+
+    MCP CallToolResult의 isError=True와 ADK McpTool의 {"error": ...} 응답
+    (실행 실패, 사용자 확인 요청/거부)을 에러로 봅니다.
+    """
+    if not isinstance(result, dict):
+        return False
+    return bool(result.get("isError")) or set(result) == {"error"}
+
+
+def _extract_user_text(readonly_context: Any) -> str:
+    """ReadonlyContext의 사용자 메시지 텍스트 (페이지 컨텍스트 포함, 없으면 빈 문자열)"""
+    user_content = getattr(readonly_context, "user_content", None) if readonly_context else None
+    parts = getattr(user_content, "parts", None) or []
+    return " ".join(text for part in parts if isinstance(text := getattr(part, "text", None), str))
+
+
+class ToolSchemaStore:
+    """
+    엔드포인트별 풀 도구(스키마) 저장소
+
+    같은 엔드포인트의 DeferredToolProxy들이 공유합니다.
+    조회는 dict lookup이며, 없는 도구는 엔드포인트당 하나의 조회로 합쳐서 채웁니다
+    (동시에 실행된 프록시 50개 → tools/list 1회).
+    """
+
+    def __init__(self, endpoint_id: str, loader: Callable[[], Awaitable[list[BaseTool]]]):
+        """
+        Args:
+            endpoint_id: 엔드포인트 ID
+            loader: 엔드포인트 도구 목록을 다시 조회하는 코루틴 함수
+        """
+        self._endpoint_id = endpoint_id
+        self._loader = loader
+        self._tools: dict[str, BaseTool] = {}
+        self._inflight: asyncio.Task | None = None
+
+    def update(self, tools: list[BaseTool]) -> None:
+        """도구 목록으로 저장소 교체 (캐시 저장 시 호출)"""
+        self._tools = {tool.name: tool for tool in tools}
+
+    async def resolve(self, name: str) -> BaseTool:
+        """
+        이름으로 풀 도구 조회
+
+        Raises:
+            RuntimeError: 다시 조회해도 도구가 없음
+        """
+        tool = self._tools.get(name)
+        if tool is not None:
+            return tool
+
+        await self._load()
+        tool = self._tools.get(name)
+        if tool is None:
+            raise RuntimeError(f"Tool not found: {name} (endpoint {self._endpoint_id})")
+        return tool
+
+    async def _load(self) -> None:
+        """진행 중인 조회가 있으면 합류, 없으면 새로 시작"""
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.ensure_future(self._loader())
+        self.update(await asyncio.shield(self._inflight))
+
+    def cancel(self) -> None:
+        """진행 중인 조회 취소 (엔드포인트 제거 시)"""
+        if self._inflight is not None and not self._inflight.done():
+            self._inflight.cancel()
+
+
+# get_tools()가 반환한 도구의 실행 함수: (endpoint_id, 풀 도구, 인자, ToolContext) → 결과
+ToolRunner = Callable[[str, BaseTool, dict[str, Any], Any], Awaitable[Any]]
+
+
+class ManagedTool(BaseTool):
+    """
+    get_tools()가 ADK Agent에 전달하는 MCP 도구 래퍼
+
+    선언(스키마)은 원본 도구를 그대로 사용하고, 실행만 DynamicToolset을 거치게 하여
+    Agent의 도구 호출에도 결과 캐시와 엔드포인트별 동시 실행 제한을 적용합니다.
+    """
+
+    def __init__(self, tool: BaseTool, endpoint_id: str, runner: ToolRunner):
+        super().__init__(
+            name=tool.name,
+            description=tool.description or "",
+            is_long_running=getattr(tool, "is_long_running", False),
+        )
+        self._tool = tool
+        self._endpoint_id = endpoint_id
+        self._runner = runner
+
+    def __getattr__(self, name: str) -> Any:
+        # raw_mcp_tool 등 원본 도구 속성 위임
+        tool = self.__dict__.get("_tool")
+        if tool is None:
+            raise AttributeError(name)
+        return getattr(tool, name)
+
+    def _get_declaration(self) -> types.FunctionDeclaration | None:
+        return self._tool._get_declaration()
+
+    async def process_llm_request(self, *, tool_context: Any, llm_request: Any) -> None:
+        """원본 도구의 요청 처리(선언 추가, 설명 fencing) 후 실행 대상을 래퍼로 교체"""
+        await self._tool.process_llm_request(tool_context=tool_context, llm_request=llm_request)
+        if llm_request.tools_dict.get(self.name) is self._tool:
+            llm_request.tools_dict[self.name] = self
+
+    async def run_async(self, *, args: dict[str, Any], tool_context: Any) -> Any:
+        return await self._runner(self._endpoint_id, self._tool, args, tool_context)
+
+
+class DeferredToolProxy(BaseTool):
     """
     메타데이터만 로드된 도구 프록시 (Step 11: Defer Loading)
 
-    도구 수가 defer_loading_threshold를 초과할 때,
+    도구 정의 토큰 합계가 defer_loading_token_threshold를 초과할 때,
     name과 description만 로드하고 실행 시 풀 스키마를 lazy load합니다.
+    프록시는 턴 간 재사용되며, 풀 도구는 엔드포인트 공유 ToolSchemaStore에서 조회합니다.
     """
 
-    def __init__(self, name: str, description: str, endpoint_id: str, toolset: "MCPToolset"):
-        self.name = name
-        self.description = description
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        endpoint_id: str,
+        schema_store: ToolSchemaStore,
+        runner: ToolRunner | None = None,
+    ):
+        super().__init__(name=name, description=description)
         self._endpoint_id = endpoint_id
-        self._toolset = toolset
-        self._full_tool: BaseTool | None = None  # lazy
+        self._schema_store = schema_store
+        self._runner = runner
+
+    def _get_declaration(self) -> types.FunctionDeclaration:
+        # 파라미터 스키마는 로드하지 않음 (임의 인자 허용)
+        return types.FunctionDeclaration(
+            name=self.name,
+            description=self.description,
+            parameters_json_schema={"type": "object"},
+        )
 
-    async def run_async(self, arguments: dict[str, Any], context: Any) -> Any:
+    async def run_async(self, args: dict[str, Any], tool_context: Any = None) -> Any:
         """
         도구 실행 시 풀 스키마 lazy load
 
-        첫 실행 시 _toolset.get_tools()를 호출하여 풀 도구를 로드합니다.
+        실행마다 스키마 저장소에서 조회하므로 캐시 갱신 후에도 최신 도구를 사용합니다.
         """
-        if self._full_tool is None:
-            # Lazy load: 풀 도구 조회
-            tools = await self._toolset.get_tools()
-            self._full_tool = next(t for t in tools if t.name == self.name)
-
-        return await self._full_tool.run_async(arguments, context)
+        full_tool = await self._schema_store.resolve(self.name)
+        if self._runner is not None:
+            return await self._runner(self._endpoint_id, full_tool, args, tool_context)
+        return await full_tool.run_async(args=args, tool_context=tool_context)
 
 
 class DynamicToolset(BaseToolset):
@@ -77,9 +259,13 @@ class DynamicToolset(BaseToolset):
     - BaseToolset 상속으로 ADK Agent와 자연스럽게 통합
     - get_tools() 호출 시마다 현재 등록된 모든 도구 반환
     - MCP 서버 추가/제거 시 Agent 재생성 불필요
-    - TTL 기반 캐싱으로 성능 최적화
+    - TTL 기반 캐싱으로 성능 최적화 (엔드포인트별 병렬 갱신 + 타임아웃)
+    - Stale-while-revalidate 모드 (만료 캐시 즉시 반환 + 백그라운드 갱신)
+    - 도구 목록 변경 알림(tools/list_changed) 기반 엔드포인트 단위 무효화
     - 레거시 SSE 서버 폴백 지원
     - 도구 개수 제한으로 Context Explosion 방지
+    - 읽기 전용 도구 결과 LRU 캐시 (readOnlyHint/idempotentHint 또는 엔드포인트 설정,
+      get_tools()가 반환한 도구의 Agent 실행에도 적용)
     """
 
     def __init__(self, settings: Settings | None = None, cache_ttl_seconds: int = 300):
@@ -101,7 +287,48 @@ class DynamicToolset(BaseToolset):
         self._cache_ttl = settings.mcp.cache_ttl_seconds if settings else cache_ttl_seconds
         self._tool_cache: dict[str, list[BaseTool]] = {}
         self._cache_timestamps: dict[str, float] = {}
-        self._cache_lock = asyncio.Lock()
+        # 엔드포인트별 TTL (jitter 적용, 동시 만료 방지)
+        self._cache_ttls: dict[str, float] = {}
+        # Stale-while-revalidate 백그라운드 갱신 태스크
+        self._background_refreshes: dict[str, asyncio.Task] = {}
+
+        # Defer mode: 엔드포인트별 스키마 저장소 + 턴 간 재사용되는 프록시
+        self._schema_stores: dict[str, ToolSchemaStore] = {}
+        self._deferred_proxies: dict[str, dict[str, DeferredToolProxy]] = {}
+        # Normal mode: 엔드포인트별 (원본 도구 목록, ManagedTool 래퍼) - 캐시가 바뀔 때만 재생성
+        self._managed_tools: dict[str, tuple[list[BaseTool], list[ManagedTool]]] = {}
+        # tools/list_changed 알림 지원 엔드포인트 (긴 안전망 TTL 적용)
+        self._list_changed_endpoints: set[str] = set()
+        # 알림을 받았지만 아직 다시 조회하지 않은 엔드포인트 (캐시 무효로 취급)
+        self._list_changed_pending: set[str] = set()
+
+        # 도구 카탈로그 버전: 등록 서버/도구 목록이 바뀔 때만 증가 (동적 instruction 메모이제이션 키)
+        self._catalog_version = 0
+        self._catalog: dict[str, tuple[str, frozenset[str]]] = {}  # endpoint_id -> (이름, 도구)
+
+        # 도구 이름 인덱스: tool_name -> {endpoint_id: BaseTool}
+        # 캐시 저장 시 갱신, 서버 제거 시 정리 (call_tool에서 O(1) 조회)
+        self._tool_index: dict[str, dict[str, BaseTool]] = {}
+
+        # 엔드포인트별 동시 도구 실행 제한
+        self._call_semaphores: dict[str, asyncio.Semaphore] = {}
+
+        # 읽기 전용 도구 결과 캐시 (엔드포인트 제거/도구 목록 변경 시 해당 엔드포인트만 무효화)
+        self._result_cache = ToolResultCache(settings.mcp.result_cache_max_bytes)
+
+        # 엔드포인트별 갱신 잠금 + 동시 갱신 수 제한 (느린 서버가 다른 서버를 막지 않도록)
+        self._refresh_locks: dict[str, asyncio.Lock] = {}
+        self._refresh_semaphore = asyncio.Semaphore(settings.mcp.max_concurrent_refreshes)
+        self._refresh_timeout = settings.mcp.refresh_timeout_seconds
+
+        # 도구 정의 토큰 수: 스키마 해시별 캐시 + 엔드포인트별 합계 (defer/제한 판단 기준)
+        self._definition_token_cache: dict[str, int] = {}
+        self._endpoint_tokens: dict[str, int] = {}
+
+        # 관련도 기반 도구 선택 (opt-in): 캐시 저장/서버 제거 시 증분 색인
+        self._relevance_index: ToolRelevanceIndex | None = (
+            ToolRelevanceIndex() if settings.mcp.relevance_selection else None
+        )
 
     async def get_tools(self, readonly_context=None) -> list[BaseTool]:
         """
@@ -109,6 +336,7 @@ class DynamicToolset(BaseToolset):
 
         ADK Agent가 각 turn마다 이 메서드를 호출합니다.
         TTL 기반 캐싱으로 불필요한 MCP 서버 조회를 방지합니다.
+        만료된 엔드포인트는 병렬로 갱신되며, 캐시가 유효한 엔드포인트는 대기하지 않습니다.
 
         Args:
             readonly_context: ReadonlyContext (선택적, ADK에서 제공)
@@ -116,45 +344,51 @@ class DynamicToolset(BaseToolset):
         Returns:
             등록된 모든 MCP 서버의 도구 목록
         """
-        all_tools: list[BaseTool] = []
         current_time = time.time()
         cache_hits = 0
         cache_misses = 0
+        cache_stale = 0
+
+        # 캐시 유효한 엔드포인트는 즉시 사용, 만료된 엔드포인트만 병렬 갱신
+        per_endpoint: dict[str, list[BaseTool]] = {}
+        refresh_ids: list[str] = []
+        for endpoint_id in self._mcp_toolsets:
+            if self._is_cache_valid(endpoint_id, current_time):
+                cached_tools = self._tool_cache[endpoint_id]
+                per_endpoint[endpoint_id] = cached_tools
+                cache_hits += 1
+                logger.debug(
+                    f"Tool cache HIT for endpoint {endpoint_id}",
+                    extra={"endpoint_id": endpoint_id, "tool_count": len(cached_tools)},
+                )
+            elif self._can_serve_stale(endpoint_id, current_time):
+                # Stale-while-revalidate: 만료된 캐시 즉시 반환 + 백그라운드 갱신
+                cached_tools = self._tool_cache[endpoint_id]
+                per_endpoint[endpoint_id] = cached_tools
+                cache_stale += 1
+                self._schedule_background_refresh(endpoint_id)
+                logger.debug(
+                    f"Tool cache STALE for endpoint {endpoint_id}, revalidating in background",
+                    extra={"endpoint_id": endpoint_id, "tool_count": len(cached_tools)},
+                )
+            else:
+                refresh_ids.append(endpoint_id)
 
-        async with self._cache_lock:
-            for endpoint_id, toolset in self._mcp_toolsets.items():
-                # 캐시 유효성 확인
-                if self._is_cache_valid(endpoint_id, current_time):
-                    cached_tools = self._tool_cache[endpoint_id]
-                    all_tools.extend(cached_tools)
-                    cache_hits += 1
-                    logger.debug(
-                        f"Tool cache HIT for endpoint {endpoint_id}",
-                        extra={"endpoint_id": endpoint_id, "tool_count": len(cached_tools)},
-                    )
-                    continue
-
-                # 캐시 미스: MCP 서버에서 도구 조회
-                cache_misses += 1
-                try:
-                    tools = await toolset.get_tools(readonly_context)
-                    self._tool_cache[endpoint_id] = tools
-                    self._cache_timestamps[endpoint_id] = current_time
-                    all_tools.extend(tools)
-                    logger.debug(
-                        f"Tool cache MISS for endpoint {endpoint_id}",
-                        extra={
-                            "endpoint_id": endpoint_id,
-                            "tool_count": len(tools),
-                            "refreshed": True,
-                        },
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to get tools from endpoint {endpoint_id}: {e}")
-                    # 실패 시 기존 캐시 사용 (있으면)
-                    if endpoint_id in self._tool_cache:
-                        all_tools.extend(self._tool_cache[endpoint_id])
-                    continue
+        if refresh_ids:
+            cache_misses = len(refresh_ids)
+            refreshed = await asyncio.gather(
+                *(self._refresh_endpoint(eid, readonly_context) for eid in refresh_ids)
+            )
+            per_endpoint.update(zip(refresh_ids, refreshed, strict=True))
+
+        # 등록 순서 유지 (Agent의 도구 실행이 결과 캐시/동시 실행 제한을 거치도록 래핑)
+        managed = {
+            endpoint_id: self._get_managed_tools(endpoint_id, per_endpoint.get(endpoint_id, []))
+            for endpoint_id in self._mcp_toolsets
+        }
+        all_tools: list[BaseTool] = []
+        for endpoint_id in self._mcp_toolsets:
+            all_tools.extend(managed[endpoint_id])
 
         logger.info(
             f"get_tools() completed: {len(all_tools)} tools from {len(self._mcp_toolsets)} endpoints",
@@ -163,42 +397,418 @@ class DynamicToolset(BaseToolset):
                 "endpoints_count": len(self._mcp_toolsets),
                 "cache_hits": cache_hits,
                 "cache_misses": cache_misses,
+                "cache_stale": cache_stale,
             },
         )
 
-        # Step 11: Defer Loading Logic
-        total_tool_count = len(all_tools)
-        defer_threshold = self._settings.mcp.defer_loading_threshold
+        # Step 11: Defer Loading Logic (도구 정의 토큰 합계 기준)
+        total_tokens = sum(self._endpoint_tokens.get(eid, 0) for eid in self._mcp_toolsets)
+        defer_threshold = self._settings.mcp.defer_loading_token_threshold
+
+        if total_tokens > defer_threshold and self._relevance_index is not None:
+            selected = self._select_relevant_tools(managed, readonly_context)
+            if selected is not None:
+                return selected
 
-        if total_tool_count > defer_threshold:
+        if total_tokens > defer_threshold:
             # Defer mode: 메타데이터만 반환
             logger.info(
-                f"Defer loading activated: {total_tool_count} tools > {defer_threshold} threshold"
+                f"Defer loading activated: {total_tokens} tool definition tokens "
+                f"> {defer_threshold} threshold",
+                extra={"total_tools": len(all_tools), "tool_definition_tokens": total_tokens},
             )
             deferred_tools: list[BaseTool] = []
-
-            for endpoint_id, cached_tools in self._tool_cache.items():
-                toolset = self._mcp_toolsets[endpoint_id]
-                for tool in cached_tools:
-                    # DeferredToolProxy 생성 (name, description만)
-                    proxy = DeferredToolProxy(
-                        name=tool.name,
-                        description=tool.description or "",
-                        endpoint_id=endpoint_id,
-                        toolset=toolset,
-                    )
-                    deferred_tools.append(proxy)  # type: ignore
+            for endpoint_id in self._mcp_toolsets:
+                proxies = self._get_deferred_proxies(endpoint_id, per_endpoint.get(endpoint_id, []))
+                deferred_tools.extend(proxies)
 
             return deferred_tools
         else:
             # Normal mode: 풀 도구 반환
             return all_tools
 
+    def _select_relevant_tools(
+        self, per_endpoint: dict[str, list[ManagedTool]], readonly_context: Any
+    ) -> list[BaseTool] | None:
+        """
+        현재 사용자 메시지와 관련도 높은 top-k 도구 + 고정(pinned) 도구 선택
+
+        Args:
+            per_endpoint: 엔드포인트별 ManagedTool 목록
+            readonly_context: ReadonlyContext (user_content에서 검색어 추출)
+
+        Returns:
+            선택된 도구 (등록 순서 유지). 색인이 없거나 검색어/일치하는 도구가 없으면 None
+            (호출자는 기존 Defer mode로 폴백)
+        """
+        index = self._relevance_index
+        if index is None:
+            return None
+
+        query = _extract_user_text(readonly_context)
+        if not query.strip():
+            return None
+
+        mcp_settings = self._settings.mcp
+        ranked = index.search(query, mcp_settings.relevance_top_k)
+        if not ranked:
+            return None
+
+        selected_keys = set(ranked)
+        pinned = set(mcp_settings.pinned_tools)
+        selected: list[BaseTool] = []
+        for endpoint_id in self._mcp_toolsets:
+            for tool in per_endpoint.get(endpoint_id, []):
+                if (endpoint_id, tool.name) in selected_keys or tool.name in pinned:
+                    selected.append(tool)
+
+        logger.info(
+            f"Relevance selection: {len(selected)} of "
+            f"{sum(len(t) for t in per_endpoint.values())} tools exposed",
+            extra={"selected_tools": len(selected), "ranked_tools": len(ranked)},
+        )
+        return selected
+
+    def _index_relevance(self, endpoint_id: str, tools: list[BaseTool]) -> None:
+        """관련도 색인에 엔드포인트 도구 반영 (이름 + 설명 + 파라미터 이름)"""
+        if self._relevance_index is None:
+            return
+        self._relevance_index.remove_endpoint(endpoint_id)
+        for tool in tools:
+            param_names = " ".join(_tool_input_schema(tool).get("properties", {}) or {})
+            text = f"{tool.name} {tool.description or ''} {param_names}"
+            self._relevance_index.add((endpoint_id, tool.name), text)
+
+    def _get_deferred_proxies(
+        self, endpoint_id: str, tools: list[BaseTool]
+    ) -> list[DeferredToolProxy]:
+        """
+        엔드포인트의 DeferredToolProxy 목록 (기존 프록시 재사용)
+
+        이름과 설명이 같은 도구는 이전 턴의 프록시를 그대로 반환하고,
+        사라진 도구의 프록시는 제거합니다.
+        """
+        previous = self._deferred_proxies.get(endpoint_id, {})
+        schema_store = self._get_schema_store(endpoint_id)
+        proxies: dict[str, DeferredToolProxy] = {}
+        for tool in tools:
+            description = tool.description or ""
+            proxy = previous.get(tool.name)
+            if proxy is None or proxy.description != description:
+                # DeferredToolProxy 생성 (name, description만)
+                proxy = DeferredToolProxy(
+                    name=tool.name,
+                    description=description,
+                    endpoint_id=endpoint_id,
+                    schema_store=schema_store,
+                    runner=self._run_agent_tool,
+                )
+            proxies[tool.name] = proxy
+
+        self._deferred_proxies[endpoint_id] = proxies
+        return list(proxies.values())
+
+    def _get_managed_tools(self, endpoint_id: str, tools: list[BaseTool]) -> list[ManagedTool]:
+        """엔드포인트 도구의 ManagedTool 래퍼 (도구 목록이 그대로면 이전 턴의 래퍼 재사용)"""
+        cached = self._managed_tools.get(endpoint_id)
+        if cached is not None and cached[0] is tools:
+            return cached[1]
+        wrapped = [ManagedTool(tool, endpoint_id, self._run_agent_tool) for tool in tools]
+        self._managed_tools[endpoint_id] = (tools, wrapped)
+        return wrapped
+
+    def _get_schema_store(self, endpoint_id: str) -> ToolSchemaStore:
+        """엔드포인트 스키마 저장소 조회 (없으면 생성)"""
+        store = self._schema_stores.get(endpoint_id)
+        if store is None:
+
+            async def load(eid: str = endpoint_id) -> list[BaseTool]:
+                # 캐시 유효 여부와 무관하게 tools/list 재조회 (기존 캐시는 실패 시 폴백)
+                return await self._refresh_endpoint(eid, force=True)
+
+            store = ToolSchemaStore(endpoint_id, load)
+            self._schema_stores[endpoint_id] = store
+        return store
+
+    async def _refresh_endpoint(
+        self, endpoint_id: str, readonly_context=None, force: bool = False
+    ) -> list[BaseTool]:
+        """
+        단일 엔드포인트 도구 캐시 갱신
+
+        엔드포인트별 잠금으로 같은 엔드포인트의 중복 갱신을 막고,
+        세마포어로 전체 동시 갱신 수를 제한합니다.
+        타임아웃/실패 시 기존 캐시(있으면)를 반환합니다.
+
+        Args:
+            endpoint_id: 갱신할 엔드포인트 ID
+            readonly_context: ReadonlyContext (선택적, ADK에서 제공)
+            force: 캐시가 유효해도 다시 조회 (실패 시 기존 캐시와 타임스탬프 유지)
+
+        Returns:
+            엔드포인트의 도구 목록
+        """
+        lock = self._refresh_locks.setdefault(endpoint_id, asyncio.Lock())
+        async with lock:
+            # 대기 중 다른 호출이 이미 갱신했으면 재사용
+            if not force and self._is_cache_valid(endpoint_id, time.time()):
+                return self._tool_cache[endpoint_id]
+
+            toolset = self._mcp_toolsets.get(endpoint_id)
+            if toolset is None:
+                return []
+
+            # 조회 시작 이후 도착한 알림은 다시 pending으로 남음 (다음 조회에서 반영)
+            was_pending = endpoint_id in self._list_changed_pending
+            self._list_changed_pending.discard(endpoint_id)
+            try:
+                async with self._refresh_semaphore:
+                    tools = await asyncio.wait_for(
+                        toolset.get_tools(readonly_context), timeout=self._refresh_timeout
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to get tools from endpoint {endpoint_id}: {e!r}")
+                if was_pending:
+                    self._list_changed_pending.add(endpoint_id)
+                # 실패 시 기존 캐시 사용 (있으면)
+                return self._tool_cache.get(endpoint_id, [])
+
+            # 갱신 중 제거된 엔드포인트는 캐시에 다시 넣지 않음
+            if endpoint_id not in self._mcp_toolsets:
+                return []
+
+            self._store_cache(endpoint_id, tools)
+            logger.debug(
+                f"Tool cache MISS for endpoint {endpoint_id}",
+                extra={
+                    "endpoint_id": endpoint_id,
+                    "tool_count": len(tools),
+                    "refreshed": True,
+                },
+            )
+            return tools
+
+    def _schedule_background_refresh(self, endpoint_id: str) -> None:
+        """엔드포인트 백그라운드 갱신 예약 (이미 진행 중이면 무시)"""
+        task = self._background_refreshes.get(endpoint_id)
+        if task is not None and not task.done():
+            return
+
+        task = asyncio.create_task(self._refresh_endpoint(endpoint_id))
+        self._background_refreshes[endpoint_id] = task
+
+        def _on_done(t: asyncio.Task, eid: str = endpoint_id) -> None:
+            if self._background_refreshes.get(eid) is t:
+                del self._background_refreshes[eid]
+
+        task.add_done_callback(_on_done)
+
+    def _store_cache(self, endpoint_id: str, tools: list[BaseTool]) -> None:
+        """
+        도구 캐시 저장 + 엔드포인트별 TTL 설정
+
+        TTL에 jitter를 적용해 여러 서버의 캐시가 같은 시점에 만료되지 않도록 분산합니다.
+        jitter는 TTL을 줄이는 방향으로만 적용됩니다 (설정 TTL을 초과하지 않음).
+        """
+        self._tool_cache[endpoint_id] = tools
+        self._cache_timestamps[endpoint_id] = time.time()
+        self._cache_ttls[endpoint_id] = self._jittered_ttl(endpoint_id)
+        self._index_endpoint_tools(endpoint_id, tools)
+        self._update_catalog(endpoint_id, tools)
+        self._index_relevance(endpoint_id, tools)
+        self._get_schema_store(endpoint_id).update(tools)
+        self._endpoint_tokens[endpoint_id] = self._count_definition_tokens(tools)
+
+    def _update_catalog(self, endpoint_id: str, tools: list[BaseTool]) -> None:
+        """서버 이름/도구 목록이 바뀐 경우에만 카탈로그 버전 증가 (캐시 갱신만으로는 불변)"""
+        endpoint = self._endpoints.get(endpoint_id)
+        entry = (endpoint.name if endpoint else "", frozenset(t.name for t in tools))
+        if self._catalog.get(endpoint_id) != entry:
+            self._catalog[endpoint_id] = entry
+            self._catalog_version += 1
+
+    @property
+    def catalog_version(self) -> int:
+        """도구 카탈로그 버전 (단조 증가, 같은 버전이면 get_registered_info() 내용 동일)"""
+        return self._catalog_version
+
+    def _count_definition_tokens(self, tools: list[BaseTool]) -> int:
+        """
+        도구 정의 토큰 합계
+
+        도구별 정의를 설정된 모델 토크나이저로 한 번만 계산하고 스키마 해시로 캐싱합니다.
+        """
+        model = self._settings.llm.default_model
+        total = 0
+        for tool in tools:
+            definition = _tool_definition(tool)
+            key = hashlib.sha256(definition.encode()).hexdigest()
+            tokens = self._definition_token_cache.get(key)
+            if tokens is None:
+                tokens = _count_tokens(model, definition)
+                self._definition_token_cache[key] = tokens
+            total += tokens
+        return total
+
+    def get_tool_definition_tokens(self) -> dict[str, int]:
+        """
+        엔드포인트별 도구 정의 토큰 수
+
+        Returns:
+            {endpoint_id: tokens}
+        """
+        return {eid: self._endpoint_tokens.get(eid, 0) for eid in self._mcp_toolsets}
+
+    def _jittered_ttl(self, endpoint_id: str) -> float:
+        """
+        엔드포인트 TTL 계산 (jitter 적용)
+
+        tools/list_changed 알림을 지원하는 서버는 list_changed_ttl_seconds를 안전망으로 사용합니다.
+        """
+        mcp_settings = self._settings.mcp
+        base_ttl = (
+            mcp_settings.list_changed_ttl_seconds
+            if endpoint_id in self._list_changed_endpoints
+            else self._cache_ttl
+        )
+        return base_ttl * (1 - random.uniform(0, mcp_settings.refresh_jitter_ratio))
+
+    def set_tools_list_changed_support(self, endpoint_id: str, supported: bool) -> None:
+        """
+        엔드포인트의 tools/list_changed 알림 지원 여부 설정
+
+        알림을 지원하는 서버는 변경 시 즉시 무효화되므로 TTL은 긴 안전망으로만 동작합니다.
+
+        Args:
+            endpoint_id: 엔드포인트 ID
+            supported: 서버 capability의 tools.listChanged 값
+        """
+        if supported:
+            self._list_changed_endpoints.add(endpoint_id)
+        else:
+            self._list_changed_endpoints.discard(endpoint_id)
+
+        # 이미 캐시된 엔드포인트는 새 TTL 즉시 적용
+        if endpoint_id in self._cache_ttls:
+            self._cache_ttls[endpoint_id] = self._jittered_ttl(endpoint_id)
+
+    async def handle_tools_list_changed(self, endpoint_id: str) -> None:
+        """
+        notifications/tools/list_changed 처리
+
+        해당 엔드포인트 캐시만 무효로 표시하고 백그라운드에서 다시 조회합니다.
+        기존 캐시는 갱신 실패 시 폴백용으로 유지되며, 다른 엔드포인트 캐시는 영향받지 않습니다.
+
+        Args:
+            endpoint_id: 알림을 보낸 엔드포인트 ID
+        """
+        if endpoint_id not in self._mcp_toolsets:
+            return
+
+        self._list_changed_pending.add(endpoint_id)
+        self._result_cache.invalidate_endpoint(endpoint_id)
+        logger.info(
+            f"Tool list changed on endpoint {endpoint_id}, refreshing",
+            extra={"endpoint_id": endpoint_id},
+        )
+        self._schedule_background_refresh(endpoint_id)
+
+    def _index_endpoint_tools(self, endpoint_id: str, tools: list[BaseTool]) -> None:
+        """
+        엔드포인트의 도구를 이름 인덱스에 반영
+
+        기존 항목을 제거한 뒤 새 도구 목록으로 다시 등록합니다.
+        다른 서버와 이름이 겹치는 도구는 경고 로그로 보고합니다.
+        """
+        self._unindex_endpoint_tools(endpoint_id)
+
+        for tool in tools:
+            owners = self._tool_index.setdefault(tool.name, {})
+            owners[endpoint_id] = tool
+            if len(owners) > 1:
+                logger.warning(
+                    f"Tool name conflict: '{tool.name}' is provided by {len(owners)} endpoints",
+                    extra={"tool_name": tool.name, "endpoint_ids": sorted(owners)},
+                )
+
+    def _unindex_endpoint_tools(self, endpoint_id: str) -> None:
+        """이름 인덱스에서 엔드포인트의 도구 제거"""
+        for tool_name in [
+            name for name, owners in self._tool_index.items() if endpoint_id in owners
+        ]:
+            owners = self._tool_index[tool_name]
+            del owners[endpoint_id]
+            if not owners:
+                del self._tool_index[tool_name]
+
+    def get_tool_name_conflicts(self) -> dict[str, list[str]]:
+        """
+        여러 엔드포인트가 제공하는 도구 이름 목록
+
+        Returns:
+            {tool_name: [endpoint_id, ...]} (충돌이 없으면 빈 딕셔너리)
+        """
+        return {
+            name: sorted(owners) for name, owners in self._tool_index.items() if len(owners) > 1
+        }
+
+    def _lookup_tool(
+        self, tool_name: str, endpoint_id: str | None = None
+    ) -> tuple[str, BaseTool] | None:
+        """
+        이름 인덱스에서 도구 조회
+
+        Args:
+            tool_name: 도구 이름
+            endpoint_id: 엔드포인트 ID (이름 충돌 시 대상 지정)
+
+        Returns:
+            (endpoint_id, 도구) 튜플 (없으면 None)
+
+        Raises:
+            ToolNameConflictError: endpoint_id 없이 충돌하는 이름을 조회함
+        """
+        owners = self._tool_index.get(tool_name)
+        if not owners:
+            return None
+        if endpoint_id is not None:
+            tool = owners.get(endpoint_id)
+            return (endpoint_id, tool) if tool is not None else None
+        if len(owners) > 1:
+            raise ToolNameConflictError(
+                f"Tool '{tool_name}' is provided by multiple endpoints: {sorted(owners)}. "
+                f"Specify endpoint_id to disambiguate."
+            )
+        return next(iter(owners.items()))
+
+    def _cache_age(self, endpoint_id: str, current_time: float) -> float | None:
+        """캐시 경과 시간 (캐시 없으면 None)"""
+        if endpoint_id not in self._cache_timestamps:
+            return None
+        return current_time - self._cache_timestamps[endpoint_id]
+
     def _is_cache_valid(self, endpoint_id: str, current_time: float) -> bool:
         """캐시 유효성 확인"""
-        if endpoint_id not in self._cache_timestamps:
+        if endpoint_id in self._list_changed_pending:
             return False
-        return (current_time - self._cache_timestamps[endpoint_id]) < self._cache_ttl
+        age = self._cache_age(endpoint_id, current_time)
+        if age is None:
+            return False
+        return age < self._cache_ttls.get(endpoint_id, self._cache_ttl)
+
+    def _can_serve_stale(self, endpoint_id: str, current_time: float) -> bool:
+        """
+        만료된 캐시를 반환할 수 있는지 확인 (Stale-while-revalidate)
+
+        max_staleness_seconds를 넘긴 캐시는 반환하지 않고 동기 갱신합니다.
+        """
+        mcp_settings = self._settings.mcp
+        if not mcp_settings.stale_while_revalidate:
+            return False
+        age = self._cache_age(endpoint_id, current_time)
+        if age is None or endpoint_id not in self._tool_cache:
+            return False
+        return age < mcp_settings.max_staleness_seconds
 
     def invalidate_cache(self, endpoint_id: str | None = None) -> None:
         """
@@ -210,17 +820,19 @@ class DynamicToolset(BaseToolset):
         if endpoint_id:
             self._tool_cache.pop(endpoint_id, None)
             self._cache_timestamps.pop(endpoint_id, None)
+            self._cache_ttls.pop(endpoint_id, None)
         else:
             self._tool_cache.clear()
             self._cache_timestamps.clear()
+            self._cache_ttls.clear()
 
     async def add_mcp_server(self, endpoint: Endpoint) -> list[Tool]:
         """
         MCP 서버 추가 (Streamable HTTP 우선, SSE 폴백)
 
         Context Explosion 방지:
-        - 활성 도구 수가 MAX_ACTIVE_TOOLS 초과 시 에러
-        - 도구 정의 토큰 수 경고 로깅
+        - 도구 정의 토큰 합계가 max_tool_definition_tokens 초과 시 에러
+        - defer_loading_token_threshold 초과 시 Defer Loading 안내 로깅
 
         Args:
             endpoint: MCP 엔드포인트 정보
@@ -230,43 +842,45 @@ class DynamicToolset(BaseToolset):
 
         Raises:
             ValueError: 엔드포인트 타입이 MCP가 아닐 때
-            ToolLimitExceededError: 도구 개수 제한 초과
+            ToolLimitExceededError: 도구 정의 토큰 예산 초과
             ConnectionError: MCP 서버 연결 실패
         """
         if endpoint.type != EndpointType.MCP:
             raise ValueError("Endpoint type must be MCP")
 
-        toolset = await self._create_mcp_toolset(endpoint.url, endpoint.auth_config)
+        toolset, transport = await self._create_mcp_toolset(
+            endpoint.url, endpoint.auth_config, endpoint.transport
+        )
+        # 확인된 전송 방식 기록 (저장 후 restore_endpoints에서 probing 생략)
+        endpoint.transport = transport
 
         # 연결 테스트 및 도구 목록 조회
         adk_tools = await toolset.get_tools()
 
-        # Context Explosion 방지: 도구 개수 제한 (Step 11: settings에서 가져옴)
-        max_active_tools = self._settings.mcp.max_active_tools
-        current_tool_count = sum(len(tools) for tools in self._tool_cache.values())
-        total_tools = current_tool_count + len(adk_tools)
+        # Context Explosion 방지: 도구 정의 토큰 예산 (도구 개수가 아닌 실제 스키마 크기 기준)
+        mcp_settings = self._settings.mcp
+        endpoint_tokens = self._count_definition_tokens(adk_tools)
+        total_tokens = sum(self._endpoint_tokens.values()) + endpoint_tokens
 
-        if total_tools > max_active_tools:
+        if total_tokens > mcp_settings.max_tool_definition_tokens:
             await toolset.close()
             raise ToolLimitExceededError(
-                f"Active tools ({total_tools}) exceed limit ({max_active_tools}). "
+                f"Tool definitions ({total_tokens} tokens) exceed budget "
+                f"({mcp_settings.max_tool_definition_tokens}). "
                 f"Consider removing unused MCP servers before adding new ones."
             )
 
-        # 토큰 추정 경고 (대략적 계산: 도구당 평균 300토큰 가정)
-        estimated_tokens = total_tools * 300
-        if estimated_tokens > TOOL_TOKEN_WARNING_THRESHOLD:
-            logger.warning(
-                f"Tool definitions may use ~{estimated_tokens} tokens. "
-                f"Consider reducing active tools to avoid context overflow."
+        if total_tokens > mcp_settings.defer_loading_token_threshold:
+            logger.info(
+                f"Tool definitions use {total_tokens} tokens, defer loading will be used",
+                extra={"endpoint_id": endpoint.id, "tool_definition_tokens": endpoint_tokens},
             )
 
         self._mcp_toolsets[endpoint.id] = toolset
         self._endpoints[endpoint.id] = endpoint
 
         # 캐시 갱신
-        self._tool_cache[endpoint.id] = adk_tools
-        self._cache_timestamps[endpoint.id] = time.time()
+        self._store_cache(endpoint.id, adk_tools)
 
         # 로깅
         logger.info(
@@ -275,6 +889,7 @@ class DynamicToolset(BaseToolset):
                 "endpoint_id": endpoint.id,
                 "endpoint_url": endpoint.url,
                 "tool_count": len(adk_tools),
+                "tool_definition_tokens": endpoint_tokens,
                 "total_endpoints": len(self._mcp_toolsets),
             },
         )
@@ -284,27 +899,31 @@ class DynamicToolset(BaseToolset):
             Tool(
                 name=t.name,
                 description=t.description or "",
-                input_schema=getattr(t, "input_schema", {}) or {},
+                input_schema=_tool_input_schema(t),
                 endpoint_id=endpoint.id,
             )
             for t in adk_tools
         ]
 
     async def _create_mcp_toolset(
-        self, url: str, auth_config: AuthConfig | None = None
-    ) -> MCPToolset:
+        self,
+        url: str,
+        auth_config: AuthConfig | None = None,
+        transport: McpTransport | None = None,
+    ) -> tuple[MCPToolset, McpTransport]:
         """
-        MCP Toolset 생성 (Streamable HTTP 우선, SSE 폴백)
+        MCP Toolset 생성 (Streamable HTTP / SSE 동시 probing)
 
-        2025년 3월 이후 Streamable HTTP가 권장 프로토콜이지만,
-        레거시 SSE 서버 호환을 위해 폴백 로직 포함
+        전송 방식을 모르면 두 방식을 동시에 시도해 먼저 성공한 쪽을 사용하고 나머지는 취소합니다.
+        기록된 전송 방식이 있으면 바로 연결하고, 실패 시에만 probing으로 돌아갑니다.
 
         Args:
             url: MCP 서버 URL
             auth_config: 인증 설정 (선택적)
+            transport: 이전에 확인된 전송 방식 (선택적)
 
         Returns:
-            MCPToolset 인스턴스
+            (MCPToolset 인스턴스, 연결된 전송 방식)
 
         Raises:
             ConnectionError: 모든 transport 시도 실패
@@ -312,37 +931,80 @@ class DynamicToolset(BaseToolset):
         # 인증 헤더 생성
         headers = auth_config.get_auth_headers() if auth_config else {}
 
-        # 1. Streamable HTTP 시도 (권장)
+        if transport is not None:
+            try:
+                toolset = await self._probe_transport(url, headers, transport)
+                logger.info(f"Connected to MCP server via recorded {transport.value}: {url}")
+                return toolset, transport
+            except Exception as e:
+                logger.warning(f"Recorded transport {transport.value} failed for {url}: {e!r}")
+
+        probes = {
+            asyncio.create_task(self._probe_transport(url, headers, candidate)): candidate
+            for candidate in McpTransport
+        }
+        errors: dict[McpTransport, BaseException] = {}
         try:
-            toolset = MCPToolset(
-                connection_params=StreamableHTTPConnectionParams(
-                    url=url,
-                    timeout=120,
-                    headers=headers,
-                ),
-            )
-            # 연결 테스트
-            await toolset.get_tools()
-            logger.info(f"Connected to MCP server via Streamable HTTP: {url}")
-            return toolset
-        except Exception as e:
-            logger.debug(f"Streamable HTTP failed for {url}: {e}")
+            pending = set(probes)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # 같은 시점에 둘 다 성공하면 Streamable HTTP 우선
+                for task in sorted(done, key=lambda t: list(McpTransport).index(probes[t])):
+                    if task.exception() is not None:
+                        errors[probes[task]] = task.exception()
+                        continue
+                    winner = probes[task]
+                    for other in done - {task}:
+                        if other.exception() is None and other.result() is not task.result():
+                            await self._close_quietly(other.result())
+                    logger.info(f"Connected to MCP server via {winner.value}: {url}")
+                    return task.result(), winner
+        finally:
+            pending_tasks = [task for task in probes if not task.done()]
+            for task in pending_tasks:
+                task.cancel()
+            # 취소된 probe의 toolset 정리가 끝난 뒤 반환 (고아 태스크 방지)
+            await asyncio.gather(*pending_tasks, return_exceptions=True)
+
+        logger.error(f"All MCP transports failed for {url}: {errors}")
+        raise ConnectionError(f"Failed to connect to MCP server: {url}") from errors.get(
+            McpTransport.SSE
+        )
 
-        # 2. 레거시 SSE 폴백
+    async def _probe_transport(
+        self, url: str, headers: dict[str, str], transport: McpTransport
+    ) -> MCPToolset:
+        """
+        단일 전송 방식으로 연결 시도 (probe_timeout_seconds 제한)
+
+        실패하거나 취소되면 생성한 toolset을 정리합니다.
+        """
+        mcp_settings = self._settings.mcp
+        params_cls = (
+            StreamableHTTPConnectionParams
+            if transport == McpTransport.STREAMABLE_HTTP
+            else SseConnectionParams
+        )
+        toolset = MCPToolset(
+            connection_params=params_cls(
+                url=url,
+                timeout=mcp_settings.call_timeout_seconds,
+                headers=headers,
+            ),
+        )
         try:
-            toolset = MCPToolset(
-                connection_params=SseConnectionParams(
-                    url=url,
-                    timeout=120,
-                    headers=headers,
-                ),
-            )
-            await toolset.get_tools()
-            logger.info(f"Connected to MCP server via SSE (fallback): {url}")
-            return toolset
-        except Exception as e:
-            logger.error(f"SSE fallback also failed for {url}: {e}")
-            raise ConnectionError(f"Failed to connect to MCP server: {url}") from e
+            # 연결 테스트
+            await asyncio.wait_for(toolset.get_tools(), timeout=mcp_settings.probe_timeout_seconds)
+        except BaseException as e:
+            logger.debug(f"{transport.value} probe failed for {url}: {e!r}")
+            await self._close_quietly(toolset)
+            raise
+        return toolset
+
+    async def _close_quietly(self, toolset: MCPToolset) -> None:
+        """probing에서 사용하지 않게 된 toolset 정리 (오류 무시)"""
+        with contextlib.suppress(Exception):
+            await toolset.close()
 
     async def remove_mcp_server(self, endpoint_id: str) -> bool:
         """
@@ -363,7 +1025,24 @@ class DynamicToolset(BaseToolset):
 
         toolset = self._mcp_toolsets.pop(endpoint_id)
         self._endpoints.pop(endpoint_id, None)
+        self._refresh_locks.pop(endpoint_id, None)
+        self._call_semaphores.pop(endpoint_id, None)
+        self._cancel_background_refresh(endpoint_id)
+        self._list_changed_endpoints.discard(endpoint_id)
+        self._list_changed_pending.discard(endpoint_id)
+        self._deferred_proxies.pop(endpoint_id, None)
+        self._managed_tools.pop(endpoint_id, None)
+        self._endpoint_tokens.pop(endpoint_id, None)
+        self._result_cache.invalidate_endpoint(endpoint_id)
+        if self._relevance_index is not None:
+            self._relevance_index.remove_endpoint(endpoint_id)
+        store = self._schema_stores.pop(endpoint_id, None)
+        if store is not None:
+            store.cancel()
+        self._unindex_endpoint_tools(endpoint_id)
         self.invalidate_cache(endpoint_id)
+        self._catalog.pop(endpoint_id, None)
+        self._catalog_version += 1
 
         try:
             await toolset.close()
@@ -381,7 +1060,9 @@ class DynamicToolset(BaseToolset):
 
         return True
 
-    async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
+    async def call_tool(
+        self, tool_name: str, arguments: dict[str, Any], endpoint_id: str | None = None
+    ) -> Any:
         """
         도구 직접 실행 (재시도 로직 포함)
 
@@ -389,47 +1070,145 @@ class DynamicToolset(BaseToolset):
         - 일시적 에러: ConnectionError, TimeoutError, asyncio.TimeoutError
         - 영구 에러: ValueError, RuntimeError 등 → 즉시 실패
 
-        비동기 블로킹 방지:
-        - 동기식 I/O나 CPU 집약적 도구가 메인 이벤트 루프를 차단하지 않도록
-        - asyncio.to_thread로 별도 스레드에서 실행
+        실행 방식:
+        - 기본: 메인 이벤트 루프에서 네이티브 async 실행 (MCP 세션이 생성된 루프 그대로 사용)
+        - 엔드포인트별 세마포어로 동시 실행 수 제한 (max_concurrent_calls_per_endpoint)
+        - thread_offload_tools에 명시한 CPU 집약적 도구만 별도 스레드에서 실행
+
+        도구 조회:
+        - 도구 이름 인덱스에서 O(1) 조회 (tools/list 호출 없음)
+        - 인덱스에 없으면 캐시 갱신(get_tools) 후 한 번 더 조회
+
+        결과 캐시:
+        - readOnlyHint/idempotentHint 도구 또는 result_cache_endpoints 엔드포인트 도구만 대상
+        - (endpoint_id, tool_name, 정규화된 인자)로 조회, 적중 시 서버 호출 생략
+        - 에러 응답(isError)과 예외는 캐싱하지 않음
 
         Args:
             tool_name: 실행할 도구 이름
             arguments: 도구 인자
+            endpoint_id: 엔드포인트 ID (선택, 여러 서버가 같은 이름의 도구를 제공할 때 지정)
 
         Returns:
             도구 실행 결과
 
         Raises:
             RuntimeError: 도구를 찾을 수 없음
+            ToolNameConflictError: 여러 서버가 같은 이름의 도구를 제공 (endpoint_id 미지정)
             TRANSIENT_ERRORS: 재시도 횟수 초과
             기타 에러: 영구 에러는 즉시 실패
         """
-        # 재시도 설정
-        max_retries = self._settings.mcp.max_retries
-        backoff = self._settings.mcp.retry_backoff_seconds
+        # 도구 찾기 (인덱스 미스 시 만료된 캐시만 갱신 후 재조회)
+        found = self._lookup_tool(tool_name, endpoint_id)
+        if found is None:
+            await self.get_tools()
+            found = self._lookup_tool(tool_name, endpoint_id)
 
-        # 도구 찾기
-        tool_to_execute = None
-        for toolset in self._mcp_toolsets.values():
-            adk_tools = await toolset.get_tools()
-            for tool in adk_tools:
-                if tool.name == tool_name:
-                    tool_to_execute = tool
-                    break
-            if tool_to_execute:
-                break
-
-        if tool_to_execute is None:
+        if found is None:
             raise RuntimeError(f"Tool not found: {tool_name}")
 
-        # 재시도 루프
+        owner_id, tool_to_execute = found
+        return await self._call_cached(
+            owner_id,
+            tool_to_execute,
+            arguments,
+            lambda: self._call_with_retry(owner_id, tool_to_execute, arguments),
+        )
+
+    async def _run_agent_tool(
+        self, endpoint_id: str, tool: BaseTool, arguments: dict[str, Any], tool_context: Any
+    ) -> Any:
+        """
+        ADK Agent의 도구 실행 (get_tools()가 반환한 ManagedTool/DeferredToolProxy에서 호출)
+
+        call_tool과 같은 결과 캐시와 엔드포인트별 동시 실행 제한을 적용합니다.
+        """
+        return await self._call_cached(
+            endpoint_id,
+            tool,
+            arguments,
+            lambda: self._execute_tool(endpoint_id, tool, arguments, tool_context),
+        )
+
+    async def _call_cached(
+        self,
+        endpoint_id: str,
+        tool: BaseTool,
+        arguments: dict[str, Any],
+        call: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        결과 캐시 적용 실행 (캐시 대상이 아니면 바로 실행)
+
+        (endpoint_id, tool_name, 정규화된 인자)로 조회하며 에러 응답은 저장하지 않습니다.
+        """
+        ttl = self._result_cache_ttl(endpoint_id, tool)
+        if ttl is None:
+            return await call()
+
+        key = (endpoint_id, tool.name, canonical_arguments(arguments))
+        hit, cached = self._result_cache.get(key)
+        logger.debug(
+            f"Tool result cache {'hit' if hit else 'miss'}: {tool.name}",
+            extra={
+                "endpoint_id": endpoint_id,
+                "tool_name": tool.name,
+                "result_cache": "hit" if hit else "miss",
+                **self._result_cache.stats(),
+            },
+        )
+        if hit:
+            return cached
+
+        result = await call()
+        if not _is_error_result(result):
+            self._result_cache.put(key, result, ttl)
+        return result
+
+    def _result_cache_ttl(self, endpoint_id: str, tool: BaseTool) -> float | None:
+        """
+        도구 결과 캐시 TTL (캐시 대상이 아니면 None)
+
+        도구별 TTL(result_cache_tool_ttls)이 기본 TTL보다 우선하며, 0이면 캐싱하지 않습니다.
+        """
+        mcp = self._settings.mcp
+        if mcp.result_cache_max_bytes <= 0:
+            return None
+
+        endpoint = self._endpoints.get(endpoint_id)
+        endpoint_opt_in = endpoint_id in mcp.result_cache_endpoints or (
+            endpoint is not None and endpoint.url in mcp.result_cache_endpoints
+        )
+        if not endpoint_opt_in and not _has_cacheable_hint(tool):
+            return None
+
+        ttl = mcp.result_cache_tool_ttls.get(tool.name, mcp.result_cache_ttl_seconds)
+        return ttl if ttl > 0 else None
+
+    def get_result_cache_stats(self) -> dict[str, int]:
+        """
+        도구 결과 캐시 통계 조회
+
+        Returns:
+            hit/miss/eviction 카운터와 현재 항목 수/크기
+        """
+        return self._result_cache.stats()
+
+    async def _call_with_retry(
+        self, endpoint_id: str, tool: BaseTool, arguments: dict[str, Any]
+    ) -> Any:
+        """
+        도구 실행 재시도 루프
+
+        일시적 에러는 exponential backoff로 재시도하고, 영구 에러는 즉시 전파합니다.
+        """
+        tool_name = tool.name
+        max_retries = self._settings.mcp.max_retries
+        backoff = self._settings.mcp.retry_backoff_seconds
+
         for attempt in range(max_retries + 1):
             try:
-                # 블로킹 방지: 스레드 풀에서 실행
-                return await asyncio.to_thread(
-                    lambda t=tool_to_execute: asyncio.run(t.run_async(arguments, None))
-                )
+                return await self._execute_tool(endpoint_id, tool, arguments)
             except TRANSIENT_ERRORS as e:
                 # 마지막 시도였으면 에러 발생
                 if attempt == max_retries:
@@ -448,6 +1227,34 @@ class DynamicToolset(BaseToolset):
                 logger.error(f"Tool {tool_name} failed with permanent error: {e}")
                 raise
 
+    async def _execute_tool(
+        self,
+        endpoint_id: str,
+        tool: BaseTool,
+        arguments: dict[str, Any],
+        tool_context: Any = None,
+    ) -> Any:
+        """
+        단일 도구 실행 (엔드포인트별 동시 실행 제한 적용)
+
+        thread_offload_tools에 포함된 도구만 별도 스레드(새 이벤트 루프)에서 실행합니다.
+        그 외 도구는 MCP 세션이 생성된 메인 루프에서 그대로 await합니다.
+        """
+        async with self._get_call_semaphore(endpoint_id):
+            if tool.name in self._settings.mcp.thread_offload_tools:
+                return await asyncio.to_thread(
+                    lambda: asyncio.run(tool.run_async(args=arguments, tool_context=tool_context))
+                )
+            return await tool.run_async(args=arguments, tool_context=tool_context)
+
+    def _get_call_semaphore(self, endpoint_id: str) -> asyncio.Semaphore:
+        """엔드포인트별 동시 실행 세마포어 (lazy 생성)"""
+        semaphore = self._call_semaphores.get(endpoint_id)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._settings.mcp.max_concurrent_calls_per_endpoint)
+            self._call_semaphores[endpoint_id] = semaphore
+        return semaphore
+
     async def health_check(self, endpoint_id: str) -> bool:
         """
         특정 MCP 서버 상태 확인
@@ -499,8 +1306,19 @@ class DynamicToolset(BaseToolset):
 
         return info
 
+    def _cancel_background_refresh(self, endpoint_id: str) -> None:
+        """진행 중인 백그라운드 갱신 취소"""
+        task = self._background_refreshes.pop(endpoint_id, None)
+        if task is not None and not task.done():
+            task.cancel()
+
     async def close(self) -> None:
         """모든 MCP 연결 정리"""
+        for endpoint_id in list(self._background_refreshes):
+            self._cancel_background_refresh(endpoint_id)
+        for store in self._schema_stores.values():
+            store.cancel()
+
         for toolset in self._mcp_toolsets.values():
             try:
                 await toolset.close()
@@ -511,3 +1329,20 @@ class DynamicToolset(BaseToolset):
         self._endpoints.clear()
         self._tool_cache.clear()
         self._cache_timestamps.clear()
+        self._cache_ttls.clear()
+        self._tool_index.clear()
+        if self._catalog:
+            self._catalog.clear()
+            self._catalog_version += 1
+        self._list_changed_endpoints.clear()
+        self._list_changed_pending.clear()
+        self._schema_stores.clear()
+        self._deferred_proxies.clear()
+        self._managed_tools.clear()
+        self._endpoint_tokens.clear()
+        self._definition_token_cache.clear()
+        self._result_cache.clear()
+        if self._relevance_index is not None:
+            self._relevance_index = ToolRelevanceIndex()
+        self._refresh_locks.clear()
+        self._call_semaphores.clear()
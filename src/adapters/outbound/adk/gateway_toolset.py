@@ -1,5 +1,7 @@
 """GatewayToolset - DynamicToolset을 Circuit Breaker + Rate Limiting으로 래핑"""
 
+import asyncio
+import copy
 import logging
 from typing import Any
 
@@ -7,6 +9,7 @@ from google.adk.tools import BaseTool
 from google.adk.tools.base_toolset import BaseToolset
 
 from src.adapters.outbound.adk.dynamic_toolset import DynamicToolset
+from src.adapters.outbound.adk.tool_result_cache import ResultCacheKey, canonical_arguments
 from src.domain.exceptions import EndpointConnectionError, RateLimitExceededError
 from src.domain.services.gateway_service import GatewayService
 
@@ -21,6 +24,7 @@ class GatewayToolset(BaseToolset):
     - get_tools() 위임: DynamicToolset의 도구 목록 반환
     - call_tool_with_gateway(): Circuit Breaker + Rate Limit 체크
     - Fallback 서버 전환: Primary 실패 시 자동 전환
+    - Single-flight: 동시에 들어온 동일 호출은 진행 중인 하나의 호출 결과를 공유
 
     참고:
     - https://python-dependency-injector.ets-labs.org/introduction/di_in_python.html
@@ -37,6 +41,11 @@ class GatewayToolset(BaseToolset):
         self._toolset = dynamic_toolset
         self._gateway = gateway_service
 
+        # Single-flight: (endpoint_id, tool_name, canonical_args) -> 진행 중인 호출
+        self._inflight_calls: dict[ResultCacheKey, asyncio.Task] = {}
+        self._singleflight_calls = 0
+        self._singleflight_collapsed = 0
+
     async def get_tools(self, readonly_context=None) -> list[BaseTool]:
         """
         등록된 모든 MCP 서버의 도구 반환 (DynamicToolset 위임)
@@ -55,6 +64,11 @@ class GatewayToolset(BaseToolset):
         """
         Gateway를 통한 도구 호출 (Circuit Breaker + Rate Limit 체크)
 
+        같은 (endpoint_id, tool_name, 정규화된 인자) 호출이 이미 진행 중이면 새로 호출하지 않고
+        그 결과(또는 예외)를 공유합니다. 합류한 호출은 Rate Limit 토큰을 소비하지 않으며,
+        합류한 쪽이 취소되어도 진행 중인 호출은 취소되지 않습니다.
+        캐싱 가능 여부와 무관하게 진행 중인 작업만 공유합니다.
+
         Args:
             endpoint_id: 엔드포인트 ID
             tool_name: 도구 이름
@@ -67,6 +81,55 @@ class GatewayToolset(BaseToolset):
             EndpointConnectionError: Circuit Breaker OPEN 상태
             RateLimitExceededError: Rate Limit 초과
         """
+        key = (endpoint_id, tool_name, canonical_arguments(arguments))
+        self._singleflight_calls += 1
+
+        task = self._inflight_calls.get(key)
+        if task is not None:
+            self._singleflight_collapsed += 1
+            logger.debug(
+                f"Joined in-flight tool call: {tool_name}",
+                extra={
+                    "endpoint_id": endpoint_id,
+                    "tool_name": tool_name,
+                    **self.get_singleflight_stats(),
+                },
+            )
+            # 공유 결과를 호출자가 수정해도 다른 호출자에게 영향이 없도록 복사
+            return copy.deepcopy(await asyncio.shield(task))
+
+        task = asyncio.ensure_future(self._call_through_gateway(endpoint_id, tool_name, arguments))
+        self._inflight_calls[key] = task
+        task.add_done_callback(lambda t, k=key: self._release_inflight(k, t))
+        return await asyncio.shield(task)
+
+    def _release_inflight(self, key: ResultCacheKey, task: asyncio.Task) -> None:
+        """완료된 호출 제거 (이후 호출은 새로 실행)"""
+        if self._inflight_calls.get(key) is task:
+            del self._inflight_calls[key]
+        # 모든 호출자가 취소된 경우에도 예외가 회수되지 않았다는 경고를 남기지 않음
+        if not task.cancelled():
+            task.exception()
+
+    def get_singleflight_stats(self) -> dict[str, Any]:
+        """
+        Single-flight 통계 조회
+
+        Returns:
+            전체 호출 수, 합류(collapse)한 호출 수, collapse 비율, 진행 중인 호출 수
+        """
+        calls = self._singleflight_calls
+        return {
+            "singleflight_calls": calls,
+            "singleflight_collapsed": self._singleflight_collapsed,
+            "singleflight_collapse_rate": self._singleflight_collapsed / calls if calls else 0.0,
+            "singleflight_inflight": len(self._inflight_calls),
+        }
+
+    async def _call_through_gateway(
+        self, endpoint_id: str, tool_name: str, arguments: dict[str, Any]
+    ) -> Any:
+        """Circuit Breaker + Rate Limit 체크 후 실제 도구 호출 (Fallback 포함)"""
         # Circuit Breaker 확인
         if not self._gateway.can_execute(endpoint_id):
             raise EndpointConnectionError(f"Circuit breaker OPEN for endpoint {endpoint_id}")
@@ -77,7 +140,7 @@ class GatewayToolset(BaseToolset):
 
         try:
             # DynamicToolset으로 도구 호출
-            result = await self._toolset.call_tool(tool_name, arguments)
+            result = await self._toolset.call_tool(tool_name, arguments, endpoint_id=endpoint_id)
             # 성공 기록
             self._gateway.record_success(endpoint_id)
             return result
@@ -112,7 +175,12 @@ class GatewayToolset(BaseToolset):
         logger.info(f"Switching to fallback server: {fallback_url}")
 
         # DynamicToolset으로 재시도 (Fallback URL로 전환은 외부에서 처리)
-        return await self._toolset.call_tool(tool_name, arguments)
+        return await self._toolset.call_tool(tool_name, arguments, endpoint_id=endpoint_id)
+
+    @property
+    def catalog_version(self) -> int:
+        """도구 카탈로그 버전 (DynamicToolset 위임)"""
+        return self._toolset.catalog_version
 
     def get_registered_info(self) -> dict[str, Any]:
         """
@@ -14,6 +14,20 @@ from src.domain.services.cost_service import CostService
 logger = logging.getLogger(__name__)
 
 
+def _cached_prompt_tokens(usage) -> int:
+    """
+    프롬프트 캐시에서 읽은 입력 토큰 수 추출
+
+    OpenAI 형식(prompt_tokens_details.cached_tokens)을 우선 사용하고,
+    없으면 Anthropic 형식(cache_read_input_tokens)을 사용합니다.
+    """
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None) if details is not None else None
+    if not isinstance(cached, int) or cached <= 0:
+        cached = getattr(usage, "cache_read_input_tokens", None)
+    return cached if isinstance(cached, int) and cached > 0 else 0
+
+
 class AgentHubLogger(CustomLogger):
     """AgentHub LiteLLM 커스텀 로거
 
@@ -55,6 +69,8 @@ class AgentHubLogger(CustomLogger):
             prompt_tokens = getattr(usage, "prompt_tokens", 0)
             completion_tokens = getattr(usage, "completion_tokens", 0)
             total_tokens = getattr(usage, "total_tokens", 0)
+            # 캐시 hit 입력 토큰 (prompt_tokens에 포함, 할인은 response_cost에 반영됨)
+            cached_tokens = min(_cached_prompt_tokens(usage), prompt_tokens)
 
             # LiteLLM response_cost 추출 (있으면)
             hidden_params = getattr(response_obj, "_hidden_params", {})
@@ -67,6 +83,7 @@ class AgentHubLogger(CustomLogger):
                 total_tokens=total_tokens,
                 cost_usd=cost_usd,
                 created_at=end_time,
+                cached_tokens=cached_tokens,
             )
 
             await self._cost_service.record_usage(usage_entity)
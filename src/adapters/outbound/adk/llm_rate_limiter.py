@@ -0,0 +1,295 @@
+"""LlmRateLimiter - 프로세스 전역 LLM 호출 rate limit (RPM/TPM + Retry-After + 적응형 backoff)
+
+모든 LLM 호출(ADK Runner, generate_response, stream_response, 대화 요약)이 이 limiter를 거칩니다.
+- 모델별 분당 요청 수(RPM)/토큰 수(TPM)를 GCRA(Generic Cell Rate Algorithm)로 간격을 두어 전송
+  (짧은 burst는 허용하되 평균 속도가 한도를 넘지 않도록 호출 전에 대기)
+- 429 응답의 Retry-After/rate limit reset 헤더를 읽어 해당 모델 호출을 그 시간 동안 멈춤
+- 헤더가 없으면 연속 429 횟수에 따라 1, 2, 4, ...초 적응형 backoff (성공 시 초기화)
+- 성공 응답의 남은 한도가 0이면 reset 시점까지 다음 호출을 미룸
+"""
+
+import asyncio
+import json
+import logging
+import random
+import re
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from litellm.exceptions import RateLimitError
+
+from src.domain.exceptions import LlmRateLimitError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 설정에 없는 모델에 적용할 한도 키
+WILDCARD_MODEL = "*"
+# RPM/TPM 한도 안에서 허용할 burst 구간 (초)
+_BURST_SECONDS = 6.0
+# 적응형 backoff 최대 지연 (초)
+_MAX_BACKOFF_SECONDS = 60.0
+# 토큰 수 추정 (4자 ≈ 1토큰)
+_CHARS_PER_TOKEN = 4
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+def parse_duration(value: Any) -> float | None:
+    """
+    rate limit 헤더 시간 값 → 초
+
+    "2", "1.5" (초), "20ms", "6m0s", "1h2m3s" 형식을 지원합니다.
+    """
+    if value is None:
+        return None
+    text = str(value).strip()
+    try:
+        return max(float(text), 0.0)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(text)
+    if not parts or "".join(n + u for n, u in parts) != text:
+        return None
+    scale = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+    return sum(float(number) * scale[unit] for number, unit in parts)
+
+
+def rate_limit_header(headers: Any, name: str) -> Any:
+    """
+    rate limit 헤더 값 (없으면 None)
+
+    LiteLLM은 성공 응답의 원본 프로바이더 헤더에 llm_provider- 접두사를 붙여 전달하므로
+    원래 이름이 없으면 접두사가 붙은 이름도 확인합니다.
+    """
+    value = headers.get(name)
+    if value is None:
+        value = headers.get(f"llm_provider-{name}")
+    return value
+
+
+def _error_headers(error: Exception) -> Any:
+    """LiteLLM 예외의 응답 헤더"""
+    headers = getattr(error, "litellm_response_headers", None)
+    if headers is None:
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+    return headers
+
+
+def retry_after_seconds(error: Exception) -> float | None:
+    """
+    오류 응답이 알려준 재시도 대기 시간 (초)
+
+    retry-after-ms → retry-after → x-ratelimit-reset-requests/-tokens 순서로 확인합니다.
+    """
+    headers = _error_headers(error)
+    if headers is None:
+        return None
+    try:
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            return max(float(retry_after_ms) / 1000, 0.0)
+        for name in (
+            "retry-after",
+            "x-ratelimit-reset-requests",
+            "x-ratelimit-reset-tokens",
+        ):
+            seconds = parse_duration(rate_limit_header(headers, name))
+            if seconds is not None:
+                return seconds
+    except (AttributeError, TypeError, ValueError):
+        return None
+    return None
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    return isinstance(error, RateLimitError) or getattr(error, "status_code", None) == 429
+
+
+def estimate_tokens(kwargs: dict[str, Any]) -> int:
+    """요청 토큰 수 추정 (메시지 문자 수 기반 + max_tokens)"""
+    messages = kwargs.get("messages") or []
+    try:
+        chars = len(json.dumps(messages, ensure_ascii=False, default=str))
+    except (TypeError, ValueError):
+        chars = 0
+    return chars // _CHARS_PER_TOKEN + int(kwargs.get("max_tokens") or 0)
+
+
+@dataclass
+class _ModelState:
+    """모델별 limiter 상태"""
+
+    rpm: int = 0
+    tpm: int = 0
+    request_tat: float = 0.0  # 요청 GCRA 이론 도착 시각
+    token_tat: float = 0.0  # 토큰 GCRA 이론 도착 시각
+    blocked_until: float = 0.0  # Retry-After/backoff로 호출을 멈출 시각
+    consecutive_rate_limits: int = 0
+    requests: int = 0
+    rate_limited: int = 0
+    waited_seconds: float = 0.0
+
+
+class LlmRateLimiter:
+    """
+    프로세스 전역 LLM rate limiter
+
+    limits 예시:
+        {"openai/gpt-4o": {"rpm": 500, "tpm": 30000}, "*": {"rpm": 1000}}
+
+    모델 이름은 호출 측이 사용하는 이름(배포 풀이면 논리 모델 이름)입니다.
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, dict[str, int]] | None = None,
+        max_retries: int = 3,
+        backoff_seconds: float = 1.0,
+    ):
+        """
+        Args:
+            limits: 모델 → {"rpm": 분당 요청 수, "tpm": 분당 토큰 수} (0/누락이면 제한 없음,
+                "*"는 설정에 없는 모델에 적용)
+            max_retries: 429 후 재시도 횟수
+            backoff_seconds: 적응형 backoff 기본 지연 (연속 429마다 2배)
+        """
+        self._limits = limits or {}
+        self._max_retries = max_retries
+        self._backoff_seconds = backoff_seconds
+        self._models: dict[str, _ModelState] = {}
+
+    def _state(self, model: str) -> _ModelState:
+        state = self._models.get(model)
+        if state is None:
+            limit = self._limits.get(model) or self._limits.get(WILDCARD_MODEL) or {}
+            state = _ModelState(rpm=int(limit.get("rpm") or 0), tpm=int(limit.get("tpm") or 0))
+            self._models[model] = state
+        return state
+
+    async def call(
+        self,
+        model: str,
+        send: Callable[[], Awaitable[T]],
+        estimated_tokens: int = 0,
+        max_retries: int | None = None,
+    ) -> T:
+        """
+        한도 안에서 LLM 호출 (429 시 Retry-After/backoff 후 재시도)
+
+        Args:
+            model: 모델 이름 (한도/상태 키)
+            send: 실제 호출 함수
+            estimated_tokens: TPM 계산용 추정 토큰 수 (응답 usage로 보정)
+            max_retries: 재시도 횟수 (None이면 설정값)
+
+        Returns:
+            send() 결과
+
+        Raises:
+            LlmRateLimitError: 재시도 후에도 429
+        """
+        retries = self._max_retries if max_retries is None else max_retries
+        state = self._state(model)
+        attempt = 0
+        while True:
+            await self._acquire(state, estimated_tokens)
+            try:
+                response = await send()
+            except Exception as e:
+                if not _is_rate_limit_error(e):
+                    raise
+                attempt += 1
+                delay = self._on_rate_limited(state, e)
+                if attempt > retries:
+                    raise LlmRateLimitError(
+                        f"LLM rate limit exceeded after {retries} retries"
+                    ) from e
+                logger.warning(
+                    f"Rate limit hit, retrying in {delay:.1f}s (attempt {attempt}/{retries})",
+                    extra={"model": model},
+                )
+                continue
+
+            self._on_success(state, response, estimated_tokens)
+            return response
+
+    async def _acquire(self, state: _ModelState, tokens: int) -> None:
+        """한도 안에 들어올 때까지 대기 후 요청/토큰 예약"""
+        while True:
+            now = time.monotonic()
+            wait = state.blocked_until - now
+            if state.rpm > 0:
+                wait = max(wait, state.request_tat - _BURST_SECONDS - now)
+            if state.tpm > 0:
+                wait = max(wait, state.token_tat - _BURST_SECONDS - now)
+            if wait <= 0:
+                break
+            state.waited_seconds += wait
+            await asyncio.sleep(wait)
+
+        if state.rpm > 0:
+            state.request_tat = max(state.request_tat, now) + 60.0 / state.rpm
+        if state.tpm > 0:
+            state.token_tat = max(state.token_tat, now) + tokens * 60.0 / state.tpm
+        state.requests += 1
+
+    def _on_rate_limited(self, state: _ModelState, error: Exception) -> float:
+        """429 반영: Retry-After가 있으면 그 시간, 없으면 적응형 backoff 동안 모델 호출 중지"""
+        state.rate_limited += 1
+        state.consecutive_rate_limits += 1
+        delay = retry_after_seconds(error)
+        if delay is None:
+            delay = min(
+                self._backoff_seconds * 2 ** (state.consecutive_rate_limits - 1),
+                _MAX_BACKOFF_SECONDS,
+            )
+            delay *= 1 + random.random() * 0.1  # 동시 재시도가 한꺼번에 몰리지 않도록
+        state.blocked_until = max(state.blocked_until, time.monotonic() + delay)
+        return delay
+
+    def _on_success(self, state: _ModelState, response: Any, estimated_tokens: int) -> None:
+        """성공 반영: backoff 초기화, 실제 토큰 수로 TPM 보정, 남은 한도 0이면 reset까지 대기"""
+        state.consecutive_rate_limits = 0
+
+        usage = getattr(response, "usage", None)
+        total = getattr(usage, "total_tokens", None)
+        if state.tpm > 0 and isinstance(total, int):
+            state.token_tat += (total - estimated_tokens) * 60.0 / state.tpm
+
+        hidden = getattr(response, "_hidden_params", None)
+        headers = hidden.get("additional_headers") if isinstance(hidden, dict) else None
+        if not isinstance(headers, dict):
+            return
+        for kind in ("requests", "tokens"):
+            remaining = rate_limit_header(headers, f"x-ratelimit-remaining-{kind}")
+            if remaining is None or str(remaining).strip() not in ("0", "0.0"):
+                continue
+            reset = parse_duration(rate_limit_header(headers, f"x-ratelimit-reset-{kind}"))
+            if reset:
+                state.blocked_until = max(state.blocked_until, time.monotonic() + reset)
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        모델별 limiter 상태
+
+        Returns:
+            {모델: {"rpm", "tpm", "requests", "rate_limited", "waited_seconds",
+                    "blocked_seconds"}}
+        """
+        now = time.monotonic()
+        return {
+            model: {
+                "rpm": state.rpm,
+                "tpm": state.tpm,
+                "requests": state.requests,
+                "rate_limited": state.rate_limited,
+                "waited_seconds": round(state.waited_seconds, 3),
+                "blocked_seconds": round(max(state.blocked_until - now, 0.0), 3),
+            }
+            for model, state in self._models.items()
+        }
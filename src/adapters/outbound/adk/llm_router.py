@@ -0,0 +1,297 @@
+"""LlmDeploymentRouter - 논리 모델별 배포(deployment) 풀 라우팅 + 장애 조치
+
+하나의 논리 모델 이름(예: "default")에 동등한 배포 여러 개(다른 API 키/리전/프로바이더)를 묶고,
+요청마다 다음 기준으로 배포를 선택합니다.
+- EWMA 응답 지연 (지수 가중 이동 평균, 낮을수록 우선)
+- 남은 rate limit 여유분 (응답의 x-ratelimit-remaining-* 헤더, 적을수록 후순위)
+- 429/5xx/연결 실패 시 해당 배포를 일정 시간 쿨다운하고 다음 배포로 즉시 재시도
+"""
+
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import litellm
+from litellm.exceptions import (
+    APIConnectionError,
+    BadGatewayError,
+    InternalServerError,
+    RateLimitError,
+    ServiceUnavailableError,
+    Timeout,
+)
+
+from src.adapters.outbound.adk.llm_rate_limiter import rate_limit_header, retry_after_seconds
+
+logger = logging.getLogger(__name__)
+
+# 이 시간(초)보다 오래된 rate limit 헤더 정보는 무시 (프로바이더 한도 창은 보통 1분)
+_HEADROOM_TTL_SECONDS = 60.0
+# 프로바이더 자격 증명을 환경 변수에서 읽는 값 접두사 (LiteLLM Router 설정과 동일한 형식)
+_ENV_PREFIX = "os.environ/"
+
+_FAILOVER_ERRORS = (
+    RateLimitError,
+    InternalServerError,
+    ServiceUnavailableError,
+    BadGatewayError,
+    APIConnectionError,
+    Timeout,
+)
+
+
+def _is_failover_error(error: Exception) -> bool:
+    """다른 배포로 재시도할 오류인지 확인 (429, 5xx, 연결 실패, 타임아웃)"""
+    if isinstance(error, _FAILOVER_ERRORS):
+        return True
+    status = getattr(error, "status_code", None)
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+
+def _header_int(headers: dict[str, Any], name: str) -> int | None:
+    """rate limit 헤더 정수 값 (LiteLLM이 원본 헤더에 붙이는 llm_provider- 접두사 포함)"""
+    value = rate_limit_header(headers, name)
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class _Deployment:
+    """배포 하나의 설정 + 상태"""
+
+    id: str
+    params: dict[str, Any]
+    ewma_latency_ms: float | None = None
+    in_flight: int = 0
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    cooldown_until: float = 0.0
+    remaining_requests: int | None = None
+    limit_requests: int | None = None
+    remaining_tokens: int | None = None
+    limit_tokens: int | None = None
+    headroom_updated_at: float = 0.0
+    last_error: str | None = None
+
+    def is_cooling_down(self, now: float) -> bool:
+        return now < self.cooldown_until
+
+    def headroom(self, now: float) -> float:
+        """남은 rate limit 비율 (0.0~1.0, 헤더 정보가 없거나 오래되면 1.0)"""
+        if now - self.headroom_updated_at > _HEADROOM_TTL_SECONDS:
+            return 1.0
+        ratios = [1.0]
+        for remaining, limit in (
+            (self.remaining_requests, self.limit_requests),
+            (self.remaining_tokens, self.limit_tokens),
+        ):
+            if remaining is None:
+                continue
+            if limit:
+                ratios.append(remaining / limit)
+            elif remaining <= 0:
+                ratios.append(0.0)
+        return max(min(ratios), 0.0)
+
+
+class LlmDeploymentRouter:
+    """
+    논리 모델별 배포 풀 라우터
+
+    deployments 예시:
+        {"default": [
+            {"model": "openai/gpt-4o-mini", "api_key": "os.environ/OPENAI_KEY_1"},
+            {"model": "azure/gpt-4o-mini", "api_base": "https://...", "api_key": "os.environ/AZURE_KEY"},
+        ]}
+
+    풀이 없는 모델 이름은 has_pool()이 False이므로 호출 측이 litellm을 직접 사용합니다.
+    """
+
+    def __init__(
+        self,
+        deployments: dict[str, list[dict[str, Any]]] | None = None,
+        ewma_alpha: float = 0.3,
+        cooldown_seconds: float = 30.0,
+    ):
+        """
+        Args:
+            deployments: 논리 모델 이름 → LiteLLM 호출 파라미터 목록 (model 필수, id 선택)
+            ewma_alpha: 지연 EWMA 가중치 (0~1, 클수록 최근 값 반영)
+            cooldown_seconds: 429/5xx 후 배포 제외 시간 (Retry-After가 있으면 그 값 사용)
+
+        Raises:
+            ValueError: model이 없는 배포 설정
+        """
+        self._ewma_alpha = ewma_alpha
+        self._cooldown_seconds = cooldown_seconds
+        self._pools: dict[str, list[_Deployment]] = {}
+        for name, entries in (deployments or {}).items():
+            pool = []
+            for index, entry in enumerate(entries):
+                params = dict(entry)
+                if not params.get("model"):
+                    raise ValueError(f"Deployment {index} of '{name}' has no model")
+                deployment_id = str(params.pop("id", None) or f"{name}/{index}")
+                pool.append(_Deployment(id=deployment_id, params=params))
+            if pool:
+                self._pools[name] = pool
+
+    def has_pool(self, model: str | None) -> bool:
+        """논리 모델 이름에 배포 풀이 설정되어 있는지 확인"""
+        return model in self._pools
+
+    def provider_model(self, model: str) -> str:
+        """논리 모델 이름 → 첫 배포의 실제 모델 (풀이 없으면 그대로, 토크나이저 선택용)"""
+        pool = self._pools.get(model)
+        return str(pool[0].params["model"]) if pool else model
+
+    def _ranked(self, model: str) -> list[_Deployment]:
+        """
+        시도 순서대로 정렬한 배포 목록
+
+        쿨다운 중이 아닌 배포를 (EWMA 지연 × (1 + 처리 중 요청 수) / 여유분) 오름차순으로 먼저,
+        여유분이 0인 배포를 그다음, 쿨다운 중인 배포는 쿨다운이 먼저 끝나는 순으로 마지막에 둡니다.
+        지연 측정값이 없는 배포는 0으로 취급해 먼저 시도합니다.
+        """
+        now = time.monotonic()
+        available: list[tuple[float, int, int, _Deployment]] = []
+        exhausted: list[_Deployment] = []
+        cooling: list[_Deployment] = []
+        for index, deployment in enumerate(self._pools[model]):
+            if deployment.is_cooling_down(now):
+                cooling.append(deployment)
+                continue
+            headroom = deployment.headroom(now)
+            if headroom <= 0:
+                exhausted.append(deployment)
+                continue
+            latency = deployment.ewma_latency_ms or 0.0
+            score = latency * (1 + deployment.in_flight) / headroom
+            available.append((score, deployment.in_flight, index, deployment))
+        available.sort(key=lambda item: item[:3])
+        cooling.sort(key=lambda d: d.cooldown_until)
+        return [item[3] for item in available] + exhausted + cooling
+
+    async def acompletion(self, model: str, **kwargs: Any) -> Any:
+        """
+        배포 풀에서 선택한 배포로 litellm.acompletion 호출 (429/5xx 시 다음 배포로 장애 조치)
+
+        stream=True 호출의 지연은 응답 헤더 수신(스트림 시작)까지의 시간입니다.
+
+        Args:
+            model: 논리 모델 이름
+            **kwargs: litellm.acompletion 인자 (배포 파라미터가 우선)
+
+        Returns:
+            litellm.acompletion 응답
+
+        Raises:
+            KeyError: 배포 풀이 없는 모델
+            RuntimeError: 시도할 배포가 없는 경우 (빈 풀)
+            Exception: 모든 배포가 실패하면 마지막 오류, 장애 조치 대상이 아닌 오류는 즉시 전파
+        """
+        if model not in self._pools:
+            raise KeyError(f"No deployment pool for model: {model}")
+
+        last_error: Exception | None = None
+        for deployment in self._ranked(model):
+            params = {
+                key: (
+                    os.environ.get(value[len(_ENV_PREFIX) :])
+                    if isinstance(value, str) and value.startswith(_ENV_PREFIX)
+                    else value
+                )
+                for key, value in deployment.params.items()
+            }
+            deployment.in_flight += 1
+            deployment.requests += 1
+            started = time.monotonic()
+            try:
+                response = await litellm.acompletion(**{**kwargs, **params})
+            except Exception as e:
+                if not _is_failover_error(e):
+                    raise
+                self._record_failure(deployment, e)
+                last_error = e
+                logger.warning(
+                    f"LLM deployment {deployment.id} failed, failing over: {type(e).__name__}",
+                    extra={"model": model, "deployment": deployment.id},
+                )
+                continue
+            finally:
+                deployment.in_flight -= 1
+
+            self._record_success(deployment, (time.monotonic() - started) * 1000, response)
+            return response
+
+        if last_error is None:
+            raise RuntimeError(f"No deployment to try for model: {model}")
+        raise last_error
+
+    def _record_success(self, deployment: _Deployment, latency_ms: float, response: Any) -> None:
+        """성공 호출 반영 (EWMA 지연 + rate limit 헤더)"""
+        if deployment.ewma_latency_ms is None:
+            deployment.ewma_latency_ms = latency_ms
+        else:
+            deployment.ewma_latency_ms += self._ewma_alpha * (
+                latency_ms - deployment.ewma_latency_ms
+            )
+        deployment.consecutive_failures = 0
+        deployment.cooldown_until = 0.0
+
+        hidden = getattr(response, "_hidden_params", None)
+        headers = hidden.get("additional_headers") if isinstance(hidden, dict) else None
+        if not isinstance(headers, dict):
+            return
+        deployment.remaining_requests = _header_int(headers, "x-ratelimit-remaining-requests")
+        deployment.limit_requests = _header_int(headers, "x-ratelimit-limit-requests")
+        deployment.remaining_tokens = _header_int(headers, "x-ratelimit-remaining-tokens")
+        deployment.limit_tokens = _header_int(headers, "x-ratelimit-limit-tokens")
+        deployment.headroom_updated_at = time.monotonic()
+
+    def _record_failure(self, deployment: _Deployment, error: Exception) -> None:
+        """실패 호출 반영 (쿨다운 시작)"""
+        deployment.failures += 1
+        deployment.consecutive_failures += 1
+        deployment.last_error = f"{type(error).__name__}: {error}"[:200]
+        cooldown = retry_after_seconds(error) or self._cooldown_seconds
+        deployment.cooldown_until = time.monotonic() + cooldown
+
+    def get_health(self) -> dict[str, list[dict[str, Any]]]:
+        """
+        배포별 상태 (자격 증명은 포함하지 않음)
+
+        Returns:
+            {논리 모델: [{"id", "model", "healthy", "cooldown_remaining_seconds",
+                          "ewma_latency_ms", "in_flight", "requests", "failures",
+                          "consecutive_failures", "remaining_requests", "remaining_tokens",
+                          "last_error"}, ...]}
+        """
+        now = time.monotonic()
+        return {
+            name: [
+                {
+                    "id": d.id,
+                    "model": d.params["model"],
+                    "healthy": not d.is_cooling_down(now),
+                    "cooldown_remaining_seconds": round(max(d.cooldown_until - now, 0.0), 3),
+                    "ewma_latency_ms": (
+                        round(d.ewma_latency_ms, 1) if d.ewma_latency_ms is not None else None
+                    ),
+                    "in_flight": d.in_flight,
+                    "requests": d.requests,
+                    "failures": d.failures,
+                    "consecutive_failures": d.consecutive_failures,
+                    "remaining_requests": d.remaining_requests,
+                    "remaining_tokens": d.remaining_tokens,
+                    "last_error": d.last_error,
+                }
+                for d in pool
+            ]
+            for name, pool in self._pools.items()
+        }
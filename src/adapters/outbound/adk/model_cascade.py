@@ -0,0 +1,352 @@
+"""ModelCascade - 소형 모델 우선 실행 + 조건부 기본 모델 승격 (모델 캐스케이드)
+
+ADK before_model_callback으로 턴(invocation)마다 모델을 선택하고,
+Agent 모델을 감싼 CascadeLlm이 소형 모델 응답을 검사해 같은 호출 안에서 기본 모델로 승격합니다.
+- 각 턴은 저렴하고 빠른 cascade_model로 먼저 실행 (llm_request.model 교체)
+- 다음 조건 중 하나가 발생하면 기본 모델로 승격하고, 이후 같은 턴의 호출도 기본 모델 사용
+  - user_flag: 사용자가 명시적으로 요청 (request_escalation)
+  - tool_depth: 현재 턴의 도구 호출 왕복 수가 임계값 이상
+  - uncertainty: 소형 모델이 불확실성 마커로 응답
+  - output_length: 소형 모델 응답이 최대 길이 초과
+- 소형 모델의 partial 응답은 승격 가능성이 있으므로 전달하지 않음 (기본 모델 응답은 스트리밍)
+- 턴별 모델 선택/승격 사유/지연은 로그 + 통계로 기록 (비용은 Usage에 모델별로 기록됨)
+"""
+
+import contextlib
+import logging
+from collections import OrderedDict
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
+from typing import Any
+
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+logger = logging.getLogger(__name__)
+
+# 턴 상태를 유지할 최대 invocation 수 (finish_turn 누락 대비)
+_MAX_TRACKED_TURNS = 256
+
+_UNCERTAINTY_INSTRUCTION = (
+    "If you are not confident that you can answer correctly and completely, "
+    "reply with exactly {marker} and nothing else."
+)
+
+
+@dataclass
+class _TurnState:
+    """턴(invocation)별 캐스케이드 상태"""
+
+    session_id: str
+    escalation_reason: str | None = None
+    cascade_calls: int = 0
+    default_calls: int = 0
+    # 마지막 소형 모델 호출 (승격 시 같은 요청을 기본 모델로 재호출)
+    request: LlmRequest | None = field(default=None, repr=False)
+    base_instruction: Any = field(default=None, repr=False)
+
+
+def _current_tool_depth(contents: list[types.Content]) -> int:
+    """현재 턴(마지막 사용자 텍스트 메시지 이후)의 도구 결과 수"""
+    depth = 0
+    for content in reversed(contents):
+        parts = content.parts or []
+        if any(part.function_response for part in parts):
+            depth += 1
+        elif content.role == "user" and any(part.text for part in parts):
+            break
+    return depth
+
+
+def _response_text(response: LlmResponse) -> str:
+    if not response.content or not response.content.parts:
+        return ""
+    return "".join(part.text for part in response.content.parts if part.text)
+
+
+class ModelCascade:
+    """
+    모델 캐스케이드 정책
+
+    before_model_callback으로 등록하고, wrap()이 반환한 CascadeLlm을 Agent 모델로 사용합니다.
+    소형 모델의 partial 응답은 승격 가능성이 있으므로 전달하지 않고 최종 응답만 전달합니다.
+    """
+
+    def __init__(
+        self,
+        cascade_model: str = "",
+        max_tool_depth: int = 2,
+        max_output_chars: int = 4000,
+        uncertainty_marker: str = "[ESCALATE]",
+    ):
+        """
+        Args:
+            cascade_model: 먼저 실행할 소형 모델 (LiteLLM 모델 문자열, 비어 있으면 비활성화)
+            max_tool_depth: 승격할 턴 내 도구 호출 왕복 수 (0이면 조건 비활성화)
+            max_output_chars: 승격할 소형 모델 응답 길이 (0이면 조건 비활성화)
+            uncertainty_marker: 소형 모델이 불확실할 때 응답할 마커 (비어 있으면 조건 비활성화)
+        """
+        self._cascade_model = cascade_model
+        self._max_tool_depth = max_tool_depth
+        self._max_output_chars = max_output_chars
+        self._uncertainty_marker = uncertainty_marker
+        self._llm: BaseLlm | None = None
+        self._pending_escalations: set[str] = set()
+        self._turns: OrderedDict[str, _TurnState] = OrderedDict()
+        self._stats: dict[str, Any] = {
+            "turns": 0,
+            "escalated_turns": 0,
+            "escalation_reasons": {},
+            "latency_ms_total": {"cascade": 0.0, "default": 0.0},
+        }
+
+    @property
+    def enabled(self) -> bool:
+        """캐스케이드 사용 여부"""
+        return bool(self._cascade_model)
+
+    @property
+    def cascade_model(self) -> str:
+        return self._cascade_model
+
+    def bind(self, llm: BaseLlm) -> None:
+        """소형/기본 모델 호출에 사용할 모델 연결 (Agent 재구성 시 갱신)"""
+        self._llm = llm
+
+    def wrap(self, llm: BaseLlm) -> "CascadeLlm":
+        """
+        기본 모델 연결 + Agent에 전달할 캐스케이드 모델 반환
+
+        Args:
+            llm: 기본 모델 (LlmAgent의 LiteLlm)
+
+        Returns:
+            llm을 감싼 CascadeLlm
+        """
+        self.bind(llm)
+        return CascadeLlm(model=llm.model, cascade=self)
+
+    def request_escalation(self, session_id: str) -> None:
+        """다음 턴을 처음부터 기본 모델로 실행 (사용자 명시 요청)"""
+        if self.enabled:
+            self._pending_escalations.add(session_id)
+
+    def _get_turn(self, callback_context: Any) -> _TurnState:
+        """invocation별 턴 상태 (첫 호출 시 사용자 명시 요청 반영)"""
+        invocation_id = callback_context.invocation_id
+        state = self._turns.get(invocation_id)
+        if state is None:
+            session_id = callback_context.session.id
+            state = _TurnState(session_id=session_id)
+            if session_id in self._pending_escalations:
+                self._pending_escalations.discard(session_id)
+                state.escalation_reason = "user_flag"
+            self._turns[invocation_id] = state
+            if len(self._turns) > _MAX_TRACKED_TURNS:
+                self._turns.popitem(last=False)
+        return state
+
+    async def before_model_callback(
+        self,
+        callback_context: Any,
+        llm_request: LlmRequest,
+    ) -> None:
+        """
+        모델 선택 (승격 전이면 소형 모델로 교체)
+
+        Returns:
+            None (요청을 제자리에서 수정하고 모델 호출은 그대로 진행)
+        """
+        if not self.enabled:
+            return None
+
+        state = self._get_turn(callback_context)
+        if (
+            state.escalation_reason is None
+            and self._max_tool_depth > 0
+            and _current_tool_depth(llm_request.contents) >= self._max_tool_depth
+        ):
+            state.escalation_reason = "tool_depth"
+
+        if state.escalation_reason is not None:
+            state.request = None
+            state.default_calls += 1
+            return None
+
+        state.request = llm_request
+        state.base_instruction = llm_request.config.system_instruction
+        llm_request.model = self._cascade_model
+        if self._uncertainty_marker:
+            llm_request.append_instructions(
+                [_UNCERTAINTY_INSTRUCTION.format(marker=self._uncertainty_marker)]
+            )
+        state.cascade_calls += 1
+        return None
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        """
+        모델 호출 (소형 모델 응답이 승격 조건이면 같은 요청을 기본 모델로 재호출)
+
+        소형 모델의 partial 응답은 버리고 최종 응답만 검사 후 전달합니다.
+        기본 모델 호출(승격 포함)은 stream이면 partial 응답까지 그대로 전달합니다.
+
+        Args:
+            llm_request: before_model_callback이 모델을 선택한 요청
+            stream: 스트리밍 호출 여부 (ADK StreamingMode.SSE)
+
+        Yields:
+            LlmResponse
+        """
+        if self._llm is None:
+            return
+        state = self._cascading_turn(llm_request)
+        if state is None:
+            async with contextlib.aclosing(
+                self._llm.generate_content_async(llm_request, stream=stream)
+            ) as responses:
+                async for response in responses:
+                    yield response
+            return
+
+        held: list[LlmResponse] = []
+        async with contextlib.aclosing(
+            self._llm.generate_content_async(llm_request, stream=stream)
+        ) as responses:
+            async for response in responses:
+                if response.partial:
+                    continue
+                held.append(response)
+                reason = self._escalation_reason(response)
+                if reason is not None:
+                    state.escalation_reason = reason
+                    break
+
+        if state.escalation_reason is None:
+            state.request = None
+            for response in held:
+                yield response
+            return
+
+        async with contextlib.aclosing(self._escalate(state, stream)) as responses:
+            async for response in responses:
+                yield response
+
+    def _cascading_turn(self, llm_request: LlmRequest) -> _TurnState | None:
+        """소형 모델로 보낸 요청의 턴 상태 (승격된 턴/캐스케이드 외 호출이면 None)"""
+        for state in reversed(self._turns.values()):
+            if state.request is llm_request:
+                return state
+        return None
+
+    def _escalation_reason(self, response: LlmResponse) -> str | None:
+        """소형 모델 최종 응답의 승격 사유 (없으면 None)"""
+        text = _response_text(response)
+        if self._uncertainty_marker and self._uncertainty_marker in text:
+            return "uncertainty"
+        if self._max_output_chars > 0 and len(text) > self._max_output_chars:
+            return "output_length"
+        return None
+
+    async def _escalate(self, state: _TurnState, stream: bool) -> AsyncGenerator[LlmResponse, None]:
+        """마지막 소형 모델 요청을 기본 모델로 재호출"""
+        request, state.request = state.request, None
+        if self._llm is None or request is None:
+            return
+
+        request.model = self._llm.model
+        request.config.system_instruction = state.base_instruction
+        state.default_calls += 1
+        logger.info(
+            f"Escalating to {self._llm.model}: {state.escalation_reason}",
+            extra={"session_id": state.session_id, "reason": state.escalation_reason},
+        )
+        async with contextlib.aclosing(
+            self._llm.generate_content_async(request, stream=stream)
+        ) as responses:
+            async for response in responses:
+                yield response
+
+    def finish_turn(self, invocation_id: str | None, latency_ms: float) -> dict[str, Any] | None:
+        """
+        턴 종료 기록 (모델 선택, 승격 사유, 지연)
+
+        Args:
+            invocation_id: ADK invocation ID
+            latency_ms: 턴 전체 지연 (ms)
+
+        Returns:
+            턴 기록 (캐스케이드 비활성화 또는 모델 호출이 없던 턴이면 None)
+        """
+        state = self._turns.pop(invocation_id, None) if invocation_id else None
+        if state is None:
+            return None
+
+        escalated = state.escalation_reason is not None
+        tier = "default" if escalated else "cascade"
+        self._stats["turns"] += 1
+        self._stats["latency_ms_total"][tier] += latency_ms
+        if escalated:
+            self._stats["escalated_turns"] += 1
+            reasons = self._stats["escalation_reasons"]
+            reasons[state.escalation_reason] = reasons.get(state.escalation_reason, 0) + 1
+
+        record = {
+            "session_id": state.session_id,
+            "model": self._llm.model if escalated and self._llm else self._cascade_model,
+            "escalated": escalated,
+            "escalation_reason": state.escalation_reason,
+            "cascade_calls": state.cascade_calls,
+            "default_calls": state.default_calls,
+            "latency_ms": round(latency_ms, 1),
+        }
+        logger.info(f"Cascade turn finished on {record['model']}", extra=record)
+        return record
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        캐스케이드 통계
+
+        Returns:
+            {"enabled", "cascade_model", "turns", "escalated_turns", "escalation_rate",
+             "escalation_reasons", "avg_latency_ms": {"cascade", "default"}}
+        """
+        turns = self._stats["turns"]
+        escalated = self._stats["escalated_turns"]
+        cascade_turns = turns - escalated
+        latency = self._stats["latency_ms_total"]
+        return {
+            "enabled": self.enabled,
+            "cascade_model": self._cascade_model,
+            "turns": turns,
+            "escalated_turns": escalated,
+            "escalation_rate": round(escalated / turns, 4) if turns else 0.0,
+            "escalation_reasons": dict(self._stats["escalation_reasons"]),
+            "avg_latency_ms": {
+                "cascade": round(latency["cascade"] / cascade_turns, 1) if cascade_turns else None,
+                "default": round(latency["default"] / escalated, 1) if escalated else None,
+            },
+        }
+
+
+class CascadeLlm(BaseLlm):
+    """
+    Agent 모델 래퍼 (ModelCascade.wrap()으로 생성)
+
+    ADK after_model_callback은 응답 하나만 돌려줄 수 있으므로,
+    승격된 기본 모델 응답을 스트리밍할 수 있도록 모델 호출 자체를 ModelCascade에 위임합니다.
+    """
+
+    cascade: Any
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        async with contextlib.aclosing(
+            self.cascade.generate_content_async(llm_request, stream=stream)
+        ) as responses:
+            async for response in responses:
+                yield response
@@ -4,30 +4,125 @@ TDD Phase: GREEN - Runner 패턴 적용 + A2A Sub-Agent 통합
 """
 
 import contextlib
+import copy
+import hashlib
+import ipaddress
+import json
 import logging
-from collections.abc import AsyncIterator
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any
+from urllib.parse import urlsplit
 
+import httpx
 import litellm
-from google.adk.agents import LlmAgent, ParallelAgent, SequentialAgent
+from a2a.client.card_resolver import parse_agent_card
+from a2a.types import AgentCard
+from google.adk.agents import LlmAgent
 from google.adk.agents.remote_a2a_agent import RemoteA2aAgent
-from google.adk.models.lite_llm import LiteLlm
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.models.lite_llm import LiteLlm, LiteLLMClient
 from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
+from google.adk.sessions import BaseSessionService, InMemorySessionService
 from google.genai import types
 
+from src.adapters.outbound.adk.context_manager import ConversationContextManager
 from src.adapters.outbound.adk.dynamic_toolset import DynamicToolset
 from src.adapters.outbound.adk.litellm_callbacks import AgentHubLogger
+from src.adapters.outbound.adk.llm_rate_limiter import LlmRateLimiter, estimate_tokens
+from src.adapters.outbound.adk.llm_router import LlmDeploymentRouter
+from src.adapters.outbound.adk.model_cascade import ModelCascade
+from src.adapters.outbound.adk.tool_result_spill import (
+    ToolResultSpiller,
+    spilled_result,
+    tool_result_url,
+)
+from src.adapters.outbound.adk.turn_scheduler import TurnScheduler
+from src.adapters.outbound.adk.workflow_dag import (
+    WORKFLOW_STEP_EVENT_KEY,
+    DagWorkflowAgent,
+    step_context_builder,
+    step_state_key,
+)
 from src.domain.entities.stream_chunk import StreamChunk
+from src.domain.entities.usage import Usage
 from src.domain.entities.workflow import Workflow
 from src.domain.exceptions import WorkflowNotFoundError
 from src.domain.ports.outbound.orchestrator_port import OrchestratorPort
+from src.domain.ports.outbound.storage_port import CompletionCachePort, ToolResultStoragePort
+from src.domain.ports.outbound.usage_port import UsageStoragePort
+from src.domain.services.cost_service import CostService
 
 logger = logging.getLogger(__name__)
 
 APP_NAME = "agenthub"
 DEFAULT_USER_ID = "default_user"
 
+# 프롬프트 캐싱 힌트: system 메시지(instruction)를 캐시 경계로 지정
+# Anthropic은 tools → system 순으로 prefix를 캐시하므로 도구 선언까지 함께 캐시됨
+# OpenAI는 동일 prefix를 자동 캐시하므로 instruction/도구 순서가 고정되는 것으로 충분
+PROMPT_CACHE_INJECTION_POINTS = [{"location": "message", "role": "system"}]
+
+
+class _OrchestratorLiteLLMClient(LiteLLMClient):
+    """ADK LiteLlm용 클라이언트 - Orchestrator의 LLM 호출 경로(rate limiter + 배포 풀 라우터) 사용"""
+
+    def __init__(self, acompletion: Callable[..., Awaitable[Any]]):
+        self._acompletion = acompletion
+
+    async def acompletion(self, model, messages, tools, **kwargs):
+        return await self._acompletion(model=model, messages=messages, tools=tools, **kwargs)
+
+
+def _agent_card_url(url: str) -> str:
+    """A2A 에이전트 URL → Agent Card URL (A2A 표준: {url}/.well-known/agent.json)"""
+    return url if url.endswith("agent.json") else f"{url}/.well-known/agent.json"
+
+
+def _url_origin(url: str) -> tuple[str, str, int | None]:
+    parts = urlsplit(url)
+    return parts.scheme.lower(), (parts.hostname or "").lower(), parts.port
+
+
+def _is_loopback_host(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _prefetched_agent_card(url: str, data: dict[str, Any]) -> AgentCard | None:
+    """
+    레지스트리가 이미 조회한 Agent Card JSON → RemoteA2aAgent에 직접 넘길 AgentCard
+
+    직접 넘긴 카드는 ADK의 RPC 대상 검증을 거치지 않으므로 같은 규칙을 여기서 적용합니다
+    (모든 RPC URL이 카드 URL과 같은 origin + https 또는 loopback http).
+    통과하지 못하면 None을 반환하고 RemoteA2aAgent가 URL에서 직접 조회/검증합니다.
+
+    Args:
+        url: A2A 에이전트 URL
+        data: Agent Card JSON (dict)
+
+    Returns:
+        검증된 AgentCard 또는 None
+    """
+    try:
+        card = parse_agent_card(copy.deepcopy(data))
+    except Exception as e:
+        logger.debug(f"Prefetched agent card for {url} not usable: {e}")
+        return None
+
+    source_origin = _url_origin(_agent_card_url(url))
+    rpc_urls = [iface.url for iface in card.supported_interfaces if iface.url]
+    for rpc_url in rpc_urls:
+        scheme, host, _ = origin = _url_origin(rpc_url)
+        if origin != source_origin or (scheme != "https" and not _is_loopback_host(host)):
+            return None
+    return card if rpc_urls else None
+
 
 class AdkOrchestratorAdapter(OrchestratorPort):
     """
@@ -39,10 +134,22 @@ class AdkOrchestratorAdapter(OrchestratorPort):
     - FastAPI startup 이벤트에서 호출
 
     특징:
-    - Runner + InMemorySessionService로 ADK 런타임 정상 사용
+    - Runner + SessionService로 ADK 런타임 정상 사용 (주입 없으면 InMemorySessionService)
     - LlmAgent + DynamicToolset 통합
     - 텍스트 스트리밍 응답 (AsyncIterator[str])
     - Lazy initialization 지원 (process_message에서 자동 초기화)
+    - 대용량 도구 결과 분리 저장 (미리보기 + 핸들, read_tool_result 내장 도구)
+    - 확인된 Agent Card를 URL별로 캐싱하여 Agent 재구성 시 재조회 방지
+    - update_a2a_agents()로 여러 A2A 에이전트 추가/제거를 한 번의 재구성으로 적용
+    - 동적 instruction은 카탈로그 버전별로 메모이제이션 (정렬된 순서로 생성해 바이트 단위 동일)
+    - generate_response() 응답 캐시 (같은 요청 재사용, hit은 비용 0으로 사용량 기록)
+    - 대화 기록 토큰 예산 (최근 N개 턴 유지 + 오래된 턴은 백그라운드 누적 요약으로 대체)
+    - 프롬프트 캐싱 힌트 (instruction + 도구 선언 prefix, 캐시 토큰은 Usage에 기록)
+    - 배포 풀 라우팅 (논리 모델별 EWMA 지연/rate limit 여유분 기준 선택 + 429/5xx 장애 조치)
+    - 모델 캐스케이드 (소형 모델 우선 실행, 정책 조건 발생 시 기본 모델로 승격)
+    - 턴 스케줄링 (대화별 직렬화 + 전역 동시 실행 제한 FIFO 승인 대기열)
+    - 전역 LLM rate limit (모델별 RPM/TPM 간격 조절 + Retry-After/적응형 backoff 재시도)
+    - DAG Workflow (의존성 충족 순 병렬 실행 + output_key 전달, 정의 해시별 Agent/Runner 캐시)
     """
 
     def __init__(
@@ -51,6 +158,27 @@ class AdkOrchestratorAdapter(OrchestratorPort):
         dynamic_toolset: DynamicToolset,
         instruction: str = "You are a helpful assistant with access to various tools.",
         enable_llm_logging: bool = True,
+        stream_tokens: bool = False,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        request_timeout: float = 120.0,
+        session_service: BaseSessionService | None = None,
+        tool_result_storage: ToolResultStoragePort | None = None,
+        tool_result_spill_chars: int = 20000,
+        tool_result_preview_chars: int = 2000,
+        completion_cache: CompletionCachePort | None = None,
+        usage_storage: UsageStoragePort | None = None,
+        context_max_tokens: int = 0,
+        context_keep_recent_turns: int = 6,
+        summary_model: str | None = None,
+        prompt_caching: bool = True,
+        cost_service: CostService | None = None,
+        llm_router: LlmDeploymentRouter | None = None,
+        model_cascade: ModelCascade | None = None,
+        turn_scheduler: TurnScheduler | None = None,
+        rate_limiter: LlmRateLimiter | None = None,
+        workflow_max_parallelism: int = 4,
+        workflow_cache_size: int = 32,
     ):
         """
         Args:
@@ -58,20 +186,93 @@ class AdkOrchestratorAdapter(OrchestratorPort):
             dynamic_toolset: DynamicToolset 인스턴스
             instruction: 시스템 프롬프트
             enable_llm_logging: LLM 호출 로깅 활성화 여부 (Step 5: Part B)
+            stream_tokens: 모델 출력 조각(partial)을 text 청크로 즉시 전달 (SSE 스트리밍)
+            max_connections: LLM HTTP 연결 풀 최대 연결 수
+            max_keepalive_connections: LLM HTTP 연결 풀 유지(keep-alive) 연결 수
+            request_timeout: LLM HTTP 요청 타임아웃 (초)
+            session_service: ADK 세션 저장소 (None이면 InMemorySessionService)
+            tool_result_storage: 대용량 도구 결과 저장소 (None이면 분리 저장 비활성화)
+            tool_result_spill_chars: 분리 저장 임계값 (문자 수, 0이면 비활성화)
+            tool_result_preview_chars: LLM/SSE에 전달할 미리보기 문자 수
+            completion_cache: generate_response() 응답 캐시 (None이면 비활성화)
+            usage_storage: 캐시 hit 사용량 기록용 저장소 (선택)
+            context_max_tokens: 대화 기록 토큰 예산 (0이면 축소하지 않음)
+            context_keep_recent_turns: 요약하지 않고 그대로 유지할 최근 턴 수
+            summary_model: 오래된 턴 요약 모델 (None이면 model 사용)
+            prompt_caching: instruction + 도구 선언에 프로바이더 캐시 힌트(cache_control) 지정
+            cost_service: LLM 호출 사용량/비용 기록 서비스 (선택)
+            llm_router: 논리 모델별 배포 풀 라우터 (풀이 없는 모델은 litellm 직접 호출)
+            model_cascade: 모델 캐스케이드 정책 (None 또는 비활성화 시 항상 model 사용)
+            turn_scheduler: 턴 스케줄러 (None이면 기본 설정으로 생성)
+            rate_limiter: 전역 LLM rate limiter (None이면 한도 없이 429 재시도만 수행)
+            workflow_max_parallelism: Workflow 동시 실행 step 수 기본값 (0이면 제한 없음)
+            workflow_cache_size: 정의 해시별로 보관할 컴파일된 Workflow Runner 수
         """
         self._model_name = model
         self._dynamic_toolset = dynamic_toolset
         self._instruction = instruction
         self._enable_llm_logging = enable_llm_logging
+        self._prompt_caching = prompt_caching
+        self._cost_service = cost_service
+        self._llm_router = llm_router
+        self._model_cascade = model_cascade if model_cascade and model_cascade.enabled else None
+        if stream_tokens and self._model_cascade is not None:
+            logger.warning(
+                "llm.stream_tokens is enabled with llm.cascade_model: answers from the cascade "
+                "model are sent only when complete (partials are held back in case of "
+                "escalation); turns served by the default model still stream"
+            )
+        self._turn_scheduler = turn_scheduler or TurnScheduler()
+        self._rate_limiter = rate_limiter or LlmRateLimiter()
+        self._http_limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._request_timeout = request_timeout
+        self._http_client: httpx.AsyncClient | None = None
+        self._completion_cache = completion_cache
+        self._usage_storage = usage_storage
+        self._run_config = RunConfig(
+            streaming_mode=StreamingMode.SSE if stream_tokens else StreamingMode.NONE
+        )
         self._agent: LlmAgent | None = None
         self._runner: Runner | None = None
-        self._session_service: InMemorySessionService | None = None
+        # SessionService (Agent 재구성/재초기화 시에도 유지)
+        self._session_service: BaseSessionService = session_service or InMemorySessionService()
         self._sub_agents: dict[str, RemoteA2aAgent] = {}  # A2A sub-agents
         self._a2a_urls: dict[str, str] = {}  # endpoint_id -> url (for rebuilding)
-        self._workflow_agents: dict[str, SequentialAgent | ParallelAgent] = {}  # workflow agents
+        self._agent_cards: dict[str, AgentCard] = {}  # agent card URL -> 확인된 AgentCard
+        # A2A 카탈로그 버전 (sub-agent 추가/제거 시 증가) + 버전별 동적 instruction 메모
+        self._a2a_catalog_version = 0
+        self._instruction_cache: tuple[tuple[Any, int], str] | None = None
         self._workflows: dict[str, Workflow] = {}  # workflow metadata
+        # 컴파일된 Workflow Runner (정의 해시 + A2A URL 키, LRU)
+        self._workflow_runners: OrderedDict[str, Runner] = OrderedDict()
+        self._workflow_max_parallelism = workflow_max_parallelism
+        self._workflow_cache_size = workflow_cache_size
         self._initialized = False
 
+        # 대용량 도구 결과 분리 저장 (after_tool_callback + read_tool_result 내장 도구)
+        self._result_spiller: ToolResultSpiller | None = None
+        if tool_result_storage is not None and tool_result_spill_chars > 0:
+            self._result_spiller = ToolResultSpiller(
+                tool_result_storage,
+                spill_chars=tool_result_spill_chars,
+                preview_chars=tool_result_preview_chars,
+            )
+
+        # 대화 기록 토큰 예산 (before_model_callback)
+        self._context_manager: ConversationContextManager | None = None
+        if context_max_tokens > 0:
+            self._context_manager = ConversationContextManager(
+                summary_model=summary_model or model,
+                max_context_tokens=context_max_tokens,
+                keep_recent_turns=context_keep_recent_turns,
+                acompletion=self._acompletion,
+                # 예산은 대화 모델 프롬프트에 적용되므로 대화 모델 토크나이저로 계산
+                token_model=llm_router.provider_model(model) if llm_router else model,
+            )
+
     async def initialize(self) -> None:
         """
         명시적 비동기 초기화
@@ -92,15 +293,12 @@ class AdkOrchestratorAdapter(OrchestratorPort):
 
         # Step 5: LiteLLM callbacks 등록 (설정에 따라 활성화)
         if self._enable_llm_logging:
-            litellm.callbacks = [AgentHubLogger()]
+            litellm.callbacks = [AgentHubLogger(cost_service=self._cost_service)]
             logger.info("LiteLLM callbacks registered: AgentHubLogger")
 
         # 도구 로딩 완료 대기 (비동기)
         await self._dynamic_toolset.get_tools()
 
-        # SessionService 생성 (Agent 재구성 시 유지)
-        self._session_service = InMemorySessionService()
-
         # Agent + Runner 생성
         await self._rebuild_agent()
 
@@ -122,21 +320,14 @@ class AdkOrchestratorAdapter(OrchestratorPort):
         - RemoteA2aAgent 인스턴스를 매번 새로 생성하여 re-parenting 에러 방지
         - ADK는 Agent를 한 번 parent에 할당하면 재할당 불가
         """
+        # 기존 인스턴스가 확인한 Agent Card 보존 (새 인스턴스가 재조회하지 않도록)
+        self._collect_agent_cards()
+
         # RemoteA2aAgent 인스턴스 재생성 (re-parenting 에러 방지)
         new_sub_agents: dict[str, RemoteA2aAgent] = {}
         for endpoint_id, url in self._a2a_urls.items():
-            # Agent Card URL 추출
-            agent_card_url = url if url.endswith("agent.json") else f"{url}/.well-known/agent.json"
-
-            # Agent name 정규화 (하이픈을 언더스코어로 변경)
-            agent_name = f"a2a_{endpoint_id}".replace("-", "_")
-
             try:
-                new_sub_agents[endpoint_id] = RemoteA2aAgent(
-                    name=agent_name,
-                    description=f"Remote A2A agent: {endpoint_id}",
-                    agent_card=agent_card_url,
-                )
+                new_sub_agents[endpoint_id] = self._create_remote_agent(endpoint_id, url)
             except Exception as e:
                 logger.warning(f"Failed to recreate RemoteA2aAgent for {endpoint_id}: {e}")
                 continue
@@ -147,13 +338,32 @@ class AdkOrchestratorAdapter(OrchestratorPort):
         # 동적 instruction 생성
         dynamic_instruction = self._build_dynamic_instruction()
 
+        # 대용량 결과 분리 저장 시 read_tool_result 내장 도구 추가
+        tools: list = [self._dynamic_toolset]
+        if self._result_spiller is not None:
+            tools.append(self._result_spiller.build_read_tool())
+
+        # 모델 호출 전 콜백 (대화 기록 축소 → 캐스케이드 모델 선택 순서)
+        before_model_callbacks: list = []
+        if self._context_manager is not None:
+            before_model_callbacks.append(self._context_manager.before_model_callback)
+        model = self._build_model()
+        if self._model_cascade is not None:
+            # 소형 모델 응답 검사/승격은 모델 호출 안에서 처리 (승격 응답 스트리밍)
+            model = self._model_cascade.wrap(model)
+            before_model_callbacks.append(self._model_cascade.before_model_callback)
+
         # Agent 생성 (sub_agents 포함)
         self._agent = LlmAgent(
-            model=LiteLlm(model=self._model_name),
+            model=model,
             name="agenthub_agent",
             instruction=dynamic_instruction,
-            tools=[self._dynamic_toolset],
+            tools=tools,
             sub_agents=list(self._sub_agents.values()),  # A2A sub-agents
+            before_model_callback=before_model_callbacks or None,
+            after_tool_callback=(
+                self._result_spiller.after_tool_callback if self._result_spiller else None
+            ),
         )
 
         # 도구 및 에이전트 수 계산
@@ -176,13 +386,85 @@ class AdkOrchestratorAdapter(OrchestratorPort):
             },
         )
 
+    def _build_model(self) -> LiteLlm:
+        """LiteLlm 모델 생성 (프롬프트 캐싱 힌트 + _acompletion 경유 호출)"""
+        kwargs: dict[str, Any] = {}
+        if self._prompt_caching:
+            kwargs["cache_control_injection_points"] = PROMPT_CACHE_INJECTION_POINTS
+        return LiteLlm(
+            model=self._model_name,
+            llm_client=_OrchestratorLiteLLMClient(self._acompletion),
+            **kwargs,
+        )
+
+    def _create_remote_agent(
+        self,
+        endpoint_id: str,
+        url: str,
+        name: str | None = None,
+        context_builder: Callable | None = None,
+    ) -> RemoteA2aAgent:
+        """
+        RemoteA2aAgent 생성 (캐시된 Agent Card가 있으면 재사용)
+
+        Args:
+            endpoint_id: Endpoint ID
+            url: A2A 에이전트 URL
+            name: Agent 이름 (None이면 "a2a_{endpoint_id}")
+            context_builder: 요청 메시지 구성 함수 (None이면 세션 기록 사용)
+
+        Returns:
+            새 RemoteA2aAgent 인스턴스 (ADK는 parent 재할당 불가하므로 매번 새로 생성)
+        """
+        agent_card_url = _agent_card_url(url)
+        kwargs: dict[str, Any] = {}
+        if context_builder is not None:
+            kwargs["context_builder"] = context_builder
+        return RemoteA2aAgent(
+            # RemoteA2aAgent는 유효한 Python identifier를 요구함 (하이픈 → 언더스코어)
+            name=(name or f"a2a_{endpoint_id}").replace("-", "_"),
+            description=f"Remote A2A agent: {endpoint_id}",
+            agent_card=self._agent_cards.get(agent_card_url, agent_card_url),
+            **kwargs,
+        )
+
+    def _collect_agent_cards(self) -> None:
+        """
+        현재 sub-agent가 확인한 Agent Card를 캐시에 수집 (fallback)
+
+        기본 경로는 update_a2a_agents(agent_cards=...)로 레지스트리가 조회한 카드를 넘기는 것입니다.
+        카드 없이 추가된 에이전트는 RemoteA2aAgent가 첫 호출 시 카드를 조회/검증한 뒤 인스턴스에
+        보관하므로, 재구성으로 인스턴스를 버리기 전에 검증된 카드만 URL별로 옮겨 둡니다.
+        """
+        # google-adk 2.11.0 RemoteA2aAgent의 private 속성 `_agent_card`에 의존 (공개 API 없음).
+        # ADK 업그레이드로 속성이 바뀌면 수집만 건너뛰고 URL 조회로 동작합니다.
+        for endpoint_id, agent in self._sub_agents.items():
+            url = self._a2a_urls.get(endpoint_id)
+            card = getattr(agent, "_agent_card", None)
+            if url is not None and isinstance(card, AgentCard):
+                self._agent_cards[_agent_card_url(url)] = card
+
     def _build_dynamic_instruction(self) -> str:
         """
         컨텍스트 인식 동적 시스템 프롬프트 생성
 
+        (도구 카탈로그 버전, A2A 카탈로그 버전)이 같으면 이전 결과를 그대로 반환합니다.
+        서버/도구/에이전트를 정렬된 순서로 나열하므로 같은 카탈로그는 항상 같은 문자열이 되어
+        provider 측 prompt caching의 prefix가 유지됩니다.
+
         Returns:
             등록된 도구/에이전트 정보를 포함한 instruction
         """
+        version = (self._dynamic_toolset.catalog_version, self._a2a_catalog_version)
+        if self._instruction_cache is not None and self._instruction_cache[0] == version:
+            return self._instruction_cache[1]
+
+        instruction = self._render_instruction()
+        self._instruction_cache = (version, instruction)
+        return instruction
+
+    def _render_instruction(self) -> str:
+        """동적 instruction 문자열 생성 (서버 이름/도구/에이전트 이름 순 정렬)"""
         # 기본 instruction
         instruction_parts = [
             "You are AgentHub, an intelligent assistant with access to external tools and agents.",
@@ -193,9 +475,11 @@ class AdkOrchestratorAdapter(OrchestratorPort):
         mcp_info = self._dynamic_toolset.get_registered_info()
         if mcp_info:
             instruction_parts.append("## Available MCP Tools:")
-            for _endpoint_id, info in mcp_info.items():
+            for _endpoint_id, info in sorted(
+                mcp_info.items(), key=lambda item: (item[1]["name"], item[0])
+            ):
                 server_name = info["name"]
-                tools = info["tools"]
+                tools = sorted(info["tools"])
                 if tools:
                     tools_str = ", ".join(tools)
                     instruction_parts.append(f'- Server "{server_name}": {tools_str}')
@@ -206,7 +490,7 @@ class AdkOrchestratorAdapter(OrchestratorPort):
         # A2A 에이전트 섹션
         if self._sub_agents:
             instruction_parts.append("## Available A2A Agents:")
-            for _endpoint_id, agent in self._sub_agents.items():
+            for agent in sorted(self._sub_agents.values(), key=lambda a: a.name):
                 agent_name = agent.name
                 agent_desc = agent.description or "Remote A2A agent"
                 instruction_parts.append(f'- Agent "{agent_name}": {agent_desc}')
@@ -258,32 +542,51 @@ class AdkOrchestratorAdapter(OrchestratorPort):
         message: str,
         conversation_id: str,
         page_context: dict | None = None,  # Phase 5 Part C
+        escalate: bool = False,
     ) -> AsyncIterator[StreamChunk]:
         """
         메시지 처리 및 스트리밍 응답
 
         Runner.run_async()를 통해 ADK 런타임을 정상적으로 사용합니다.
         conversation_id를 session_id로 매핑하여 대화 컨텍스트를 유지합니다.
+        같은 대화의 턴은 순서대로 하나씩 실행되고, 전체 동시 실행 턴 수를 넘으면
+        도착 순서대로 대기합니다 (TurnScheduler).
+        stream_tokens 모드에서는 partial 이벤트의 텍스트 조각을 바로 전달하고,
+        이어지는 집계(non-partial) 이벤트의 텍스트는 중복 전달하지 않습니다.
 
         Args:
             message: 사용자 메시지
             conversation_id: 대화 ID (ADK session_id로 사용)
             page_context: 페이지 컨텍스트 (Phase 5 Part C, optional)
+            escalate: 모델 캐스케이드 사용 시 이번 턴을 처음부터 기본 모델로 실행
 
         Yields:
             StreamChunk 이벤트 (text, tool_call, tool_result, agent_transfer)
 
         Raises:
             RuntimeError: Orchestrator가 초기화되지 않음
+            TurnQueueTimeoutError: 대기 시간 안에 턴 실행이 승인되지 않음
         """
         # 초기화 확인 (Lazy initialization 폴백)
         if not self._initialized:
             logger.warning("Orchestrator not initialized, performing lazy initialization")
             await self.initialize()
 
+        async with self._turn_scheduler.turn(conversation_id):
+            async for chunk in self._run_turn(message, conversation_id, page_context, escalate):
+                yield chunk
+
+    async def _run_turn(
+        self,
+        message: str,
+        conversation_id: str,
+        page_context: dict | None,
+        escalate: bool,
+    ) -> AsyncIterator[StreamChunk]:
+        """한 턴 실행 (세션 조회/생성 → Runner 실행 → StreamChunk 변환)"""
         runner = self._runner
         session_service = self._session_service
-        if runner is None or session_service is None:
+        if runner is None:
             raise RuntimeError("Orchestrator not initialized")
 
         # ADK 세션 생성/조회
@@ -313,74 +616,92 @@ class AdkOrchestratorAdapter(OrchestratorPort):
             parts=[types.Part(text=augmented_message)],
         )
 
+        if escalate and self._model_cascade is not None:
+            self._model_cascade.request_escalation(session_id)
+
         # Runner를 통해 Agent 실행
-        async for event in runner.run_async(
-            user_id=DEFAULT_USER_ID,
-            session_id=session_id,
-            new_message=user_content,
-        ):
-            # Tool Call 이벤트
-            if event.get_function_calls():
-                for fc in event.get_function_calls():
-                    yield StreamChunk.tool_call(fc.name, dict(fc.args or {}))
-
-            # Tool Result 이벤트
-            if event.get_function_responses():
-                for fr in event.get_function_responses():
-                    yield StreamChunk.tool_result(fr.name, str(fr.response))
-
-            # Agent Transfer 이벤트
-            if (
-                hasattr(event, "actions")
-                and event.actions
-                and getattr(event.actions, "transfer_to_agent", None)
+        streamed_text = False  # 현재 모델 응답의 텍스트를 partial로 이미 전달했는지
+        invocation_id: str | None = None  # 캐스케이드 턴 기록용
+        started = time.monotonic()
+        try:
+            async for event in runner.run_async(
+                user_id=DEFAULT_USER_ID,
+                session_id=session_id,
+                new_message=user_content,
+                run_config=self._run_config,
             ):
-                yield StreamChunk.agent_transfer(event.actions.transfer_to_agent)
-
-            # 최종 응답 텍스트
-            if event.is_final_response() and event.content and event.content.parts:
-                for part in event.content.parts:
-                    if part.text:
-                        yield StreamChunk.text(part.text)
-
-    async def add_a2a_agent(self, endpoint_id: str, url: str) -> None:  # pragma: no cover
+                invocation_id = invocation_id or event.invocation_id
+                # 토큰 스트리밍: partial 텍스트 조각 즉시 전달 (도구 호출 등은 집계 이벤트에서 처리)
+                if event.partial:
+                    if event.content and event.content.parts:
+                        for part in event.content.parts:
+                            if part.text:
+                                streamed_text = True
+                                yield StreamChunk.text(part.text)
+                    continue
+
+                # Tool Call 이벤트
+                if event.get_function_calls():
+                    for fc in event.get_function_calls():
+                        yield StreamChunk.tool_call(fc.name, dict(fc.args or {}))
+
+                # Tool Result 이벤트 (분리 저장된 결과는 미리보기 + 조회 URL만 전송)
+                if event.get_function_responses():
+                    for fr in event.get_function_responses():
+                        spilled = spilled_result(fr.response)
+                        if spilled is not None:
+                            handle, preview = spilled
+                            yield StreamChunk.tool_result(
+                                fr.name, preview, result_url=tool_result_url(handle)
+                            )
+                        else:
+                            yield StreamChunk.tool_result(fr.name, str(fr.response))
+
+                # Agent Transfer 이벤트
+                if (
+                    hasattr(event, "actions")
+                    and event.actions
+                    and getattr(event.actions, "transfer_to_agent", None)
+                ):
+                    yield StreamChunk.agent_transfer(event.actions.transfer_to_agent)
+
+                # 최종 응답 텍스트 (partial로 이미 전달한 경우 집계 텍스트는 생략)
+                if (
+                    event.is_final_response()
+                    and not streamed_text
+                    and event.content
+                    and event.content.parts
+                ):
+                    for part in event.content.parts:
+                        if part.text:
+                            yield StreamChunk.text(part.text)
+                streamed_text = False
+        finally:
+            if self._model_cascade is not None:
+                self._model_cascade.finish_turn(invocation_id, (time.monotonic() - started) * 1000)
+
+    async def add_a2a_agent(  # pragma: no cover
+        self, endpoint_id: str, url: str, agent_card: dict[str, Any] | None = None
+    ) -> None:
         """
         A2A 에이전트를 sub_agent로 추가 (Phase 5 유산, Phase 6에서 미사용)
 
         Args:
             endpoint_id: Endpoint ID (sub_agents dict의 key)
             url: A2A 에이전트 URL (Agent Card URL로 변환됨)
+            agent_card: 이미 조회한 Agent Card JSON (있으면 재조회 없이 사용)
 
         Raises:
             RuntimeError: Orchestrator가 초기화되지 않음
         """
-        # Agent Card URL 추출 (A2A 표준: {url}/.well-known/agent.json)
-        agent_card_url = url if url.endswith("agent.json") else f"{url}/.well-known/agent.json"
         if not self._initialized:
             raise RuntimeError("Orchestrator must be initialized before adding A2A agents")
 
-        # Agent name 정규화 (하이픈을 언더스코어로 변경)
-        # RemoteA2aAgent는 유효한 Python identifier를 요구함
-        agent_name = f"a2a_{endpoint_id}".replace("-", "_")
-
-        # RemoteA2aAgent 생성
-        remote_agent = RemoteA2aAgent(
-            name=agent_name,
-            description=f"Remote A2A agent: {endpoint_id}",
-            agent_card=agent_card_url,
+        await self.update_a2a_agents(
+            add={endpoint_id: url},
+            agent_cards={endpoint_id: agent_card} if agent_card else None,
         )
 
-        # sub_agents에 추가
-        self._sub_agents[endpoint_id] = remote_agent
-
-        # URL 저장 (재구성 시 사용)
-        self._a2a_urls[endpoint_id] = url
-
-        # Agent 재구성 (sub_agents 업데이트)
-        await self._rebuild_agent()
-
-        logger.info(f"A2A agent added: {endpoint_id} ({agent_card_url})")
-
     async def remove_a2a_agent(self, endpoint_id: str) -> None:  # pragma: no cover
         """
         A2A sub_agent 제거 (Phase 5 유산, Phase 6에서 미사용)
@@ -394,37 +715,80 @@ class AdkOrchestratorAdapter(OrchestratorPort):
         if not self._initialized:
             raise RuntimeError("Orchestrator must be initialized before removing A2A agents")
 
-        # sub_agents에서 제거
-        if endpoint_id not in self._sub_agents:
-            return
+        await self.update_a2a_agents(remove=[endpoint_id])
 
-        del self._sub_agents[endpoint_id]
-        self._a2a_urls.pop(endpoint_id, None)  # URL도 제거
+    async def update_a2a_agents(
+        self,
+        add: dict[str, str] | None = None,
+        remove: list[str] | None = None,
+        agent_cards: dict[str, dict[str, Any]] | None = None,
+    ) -> None:
+        """
+        여러 A2A sub_agent 추가/제거를 한 번의 Agent 재구성으로 적용
+
+        제거를 먼저 적용한 뒤 추가합니다. 변경이 없으면 재구성하지 않습니다.
+
+        Args:
+            add: 추가할 에이전트 {endpoint_id: url}
+            remove: 제거할 endpoint_id 목록
+            agent_cards: 레지스트리가 이미 조회한 Agent Card {endpoint_id: card JSON}
+                (검증을 통과하면 RemoteA2aAgent가 카드를 다시 조회하지 않음)
+
+        Raises:
+            RuntimeError: Orchestrator가 초기화되지 않음
+        """
+        if not self._initialized:
+            raise RuntimeError("Orchestrator must be initialized before updating A2A agents")
+
+        # 제거 전에 확인된 Agent Card 수집 (남은/재추가되는 에이전트가 재사용)
+        self._collect_agent_cards()
+
+        removed = [eid for eid in remove or [] if eid in self._a2a_urls]
+        for endpoint_id in removed:
+            url = self._a2a_urls.pop(endpoint_id)
+            self._sub_agents.pop(endpoint_id, None)
+            if url not in self._a2a_urls.values():
+                self._agent_cards.pop(_agent_card_url(url), None)
+
+        for endpoint_id, data in (agent_cards or {}).items():
+            url = (add or {}).get(endpoint_id)
+            card = _prefetched_agent_card(url, data) if url and data else None
+            if card is not None:
+                self._agent_cards[_agent_card_url(url)] = card
+
+        added = {eid: url for eid, url in (add or {}).items() if self._a2a_urls.get(eid) != url}
+        self._a2a_urls.update(added)
+
+        if not removed and not added:
+            return
+        self._a2a_catalog_version += 1
 
         # Agent 재구성 (sub_agents 업데이트)
         await self._rebuild_agent()
 
-        logger.info(f"A2A agent removed: {endpoint_id}")
+        for endpoint_id, url in added.items():
+            logger.info(f"A2A agent added: {endpoint_id} ({_agent_card_url(url)})")
+        for endpoint_id in removed:
+            logger.info(f"A2A agent removed: {endpoint_id}")
 
-    async def create_workflow_agent(self, workflow: Workflow) -> None:  # pragma: no cover
+    async def create_workflow_agent(self, workflow: Workflow) -> None:
         """
-        Workflow Agent 생성 (Phase 5 Part E 유산, Phase 6에서 미사용)
+        Workflow Agent 생성 (DagWorkflowAgent로 컴파일, 같은 정의는 캐시 재사용)
 
-        SequentialAgent 또는 ParallelAgent 생성
+        sequential/parallel/dag 모두 의존성 그래프로 실행합니다.
 
         Args:
             workflow: Workflow 엔티티
 
         Raises:
-            ValueError: workflow_type이 "sequential" 또는 "parallel"이 아닌 경우
+            ValueError: workflow_type이 유효하지 않거나 의존성 그래프가 잘못된 경우
             RuntimeError: 참조하는 A2A agent가 등록되지 않은 경우
         """
         if not self._initialized:
             raise RuntimeError("Orchestrator must be initialized before creating workflow")
 
-        # Workflow 타입 검증
-        if workflow.workflow_type not in ("sequential", "parallel"):
-            raise ValueError(f"Invalid workflow_type: {workflow.workflow_type}")
+        # Workflow 타입 + 의존성 그래프 검증 (ValueError)
+        workflow.step_dependencies()
 
         # Step의 agent들이 모두 등록되어 있는지 확인
         for step in workflow.steps:
@@ -434,59 +798,101 @@ class AdkOrchestratorAdapter(OrchestratorPort):
                     f"Register the A2A agent first via add_a2a_agent()"
                 )
 
+        self._get_workflow_runner(workflow)
+        self._workflows[workflow.id] = workflow
+
+        logger.info(
+            f"Workflow agent created: {workflow.id} ({workflow.workflow_type}, {len(workflow.steps)} steps)"
+        )
+
+    def _workflow_cache_key(self, workflow: Workflow) -> str:
+        """컴파일 캐시 키 (정의 해시 + 각 step의 A2A URL)"""
+        payload = json.dumps(
+            [
+                workflow.definition_hash(),
+                [self._a2a_urls.get(step.agent_endpoint_id, "") for step in workflow.steps],
+            ]
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get_workflow_runner(self, workflow: Workflow) -> tuple[str, Runner]:
+        """
+        컴파일된 Workflow Runner 조회 (없으면 컴파일 후 캐시, LRU로 최대 workflow_cache_size개 유지)
+
+        Returns:
+            (캐시 키, Runner)
+        """
+        key = self._workflow_cache_key(workflow)
+        runner = self._workflow_runners.get(key)
+        if runner is not None:
+            self._workflow_runners.move_to_end(key)
+            return key, runner
+
+        runner = Runner(
+            agent=self._compile_workflow(workflow, key),
+            app_name=APP_NAME,
+            session_service=self._session_service,
+        )
+        self._workflow_runners[key] = runner
+        while len(self._workflow_runners) > max(self._workflow_cache_size, 1):
+            self._workflow_runners.popitem(last=False)
+        return key, runner
+
+    def _compile_workflow(self, workflow: Workflow, key: str) -> DagWorkflowAgent:
+        """
+        Workflow → DagWorkflowAgent
+
+        각 step은 의존 step의 결과와 step instruction을 입력으로 받는 RemoteA2aAgent입니다.
+        output_key가 빈 step의 결과도 temp: 키로 의존 step에 전달합니다 (sequential 기본 동작).
+
+        Raises:
+            RuntimeError: RemoteA2aAgent 생성 실패
+        """
+        dependencies = workflow.step_dependencies()
+
         # Sub-agents를 새로 생성 (re-parenting 에러 방지)
         # ADK는 Agent를 한 번 parent에 할당하면 재할당 불가하므로,
         # workflow agent용 새 RemoteA2aAgent 인스턴스를 생성해야 함
-        sub_agents = []
-        for step in workflow.steps:
+        self._collect_agent_cards()
+        state_keys = [
+            step_state_key(step.output_key, number)
+            for number, step in enumerate(workflow.steps, start=1)
+        ]
+        step_agents = []
+        for number, step in enumerate(workflow.steps, start=1):
             endpoint_id = step.agent_endpoint_id
-            url = self._a2a_urls[endpoint_id]
-            agent_card_url = url if url.endswith("agent.json") else f"{url}/.well-known/agent.json"
-            agent_name = f"a2a_{endpoint_id}".replace("-", "_")
-
+            input_keys = [state_keys[index] for index in dependencies[number - 1]]
             try:
-                remote_agent = RemoteA2aAgent(
-                    name=agent_name,
-                    description=f"Remote A2A agent: {endpoint_id}",
-                    agent_card=agent_card_url,
+                step_agents.append(
+                    self._create_remote_agent(
+                        endpoint_id,
+                        self._a2a_urls[endpoint_id],
+                        # 같은 에이전트를 여러 step에서 사용할 수 있도록 step 번호 포함
+                        name=f"step_{number}_{endpoint_id}",
+                        context_builder=step_context_builder(step.instruction, input_keys),
+                    )
                 )
-                sub_agents.append(remote_agent)
             except Exception as e:
                 raise RuntimeError(
                     f"Failed to create RemoteA2aAgent for workflow: {endpoint_id}"
                 ) from e
 
-        # Workflow Agent 생성 (name을 유효한 Python identifier로 정규화)
-        # ADK Agent name은 하이픈(-)을 허용하지 않으므로 언더스코어로 변경
-        normalized_name = f"workflow_{workflow.id}".replace("-", "_")
-
-        if workflow.workflow_type == "sequential":
-            workflow_agent = SequentialAgent(
-                name=normalized_name,
-                sub_agents=sub_agents,
-            )
-        else:  # parallel
-            workflow_agent = ParallelAgent(
-                name=normalized_name,
-                sub_agents=sub_agents,
-            )
-
-        # 저장
-        self._workflow_agents[workflow.id] = workflow_agent
-        self._workflows[workflow.id] = workflow
-
-        logger.info(
-            f"Workflow agent created: {workflow.id} ({workflow.workflow_type}, {len(workflow.steps)} steps)"
+        return DagWorkflowAgent(
+            name=f"workflow_{key[:16]}",
+            sub_agents=step_agents,
+            dependencies=dependencies,
+            output_keys=state_keys,
+            max_parallelism=workflow.max_parallelism or self._workflow_max_parallelism,
         )
 
-    async def execute_workflow(  # pragma: no cover
+    async def execute_workflow(
         self,
         workflow_id: str,
         message: str,
         conversation_id: str,
     ) -> AsyncIterator[StreamChunk]:
         """
-        Workflow Agent 실행 및 이벤트 스트리밍 (Phase 5 Part E 유산, Phase 6에서 미사용)
+        Workflow Agent 실행 및 이벤트 스트리밍
 
         Args:
             workflow_id: Workflow ID
@@ -494,16 +900,17 @@ class AdkOrchestratorAdapter(OrchestratorPort):
             conversation_id: 대화 세션 ID
 
         Yields:
-            StreamChunk 이벤트
+            StreamChunk 이벤트 (실패/건너뛴 step이 있으면 workflow_complete status="failed")
 
         Raises:
             WorkflowNotFoundError: workflow_id를 찾을 수 없을 때
         """
-        if workflow_id not in self._workflow_agents:
+        if workflow_id not in self._workflows:
             raise WorkflowNotFoundError(f"Workflow not found: {workflow_id}")
 
         workflow = self._workflows[workflow_id]
-        workflow_agent = self._workflow_agents[workflow_id]
+        # 캐시에서 밀려났으면 다시 컴파일
+        _, runner = self._get_workflow_runner(workflow)
 
         # workflow_start 이벤트
         yield StreamChunk.workflow_start(
@@ -512,13 +919,6 @@ class AdkOrchestratorAdapter(OrchestratorPort):
             total_steps=len(workflow.steps),
         )
 
-        # Runner로 Workflow Agent 실행
-        runner = Runner(
-            agent=workflow_agent,
-            app_name=APP_NAME,
-            session_service=self._session_service,
-        )
-
         # 세션 생성/조회
         session_id = f"{conversation_id}_workflow_{workflow_id}"
         session = await self._session_service.get_session(
@@ -539,35 +939,29 @@ class AdkOrchestratorAdapter(OrchestratorPort):
             parts=[types.Part(text=message)],
         )
 
-        # Workflow 실행
-        current_step = 0
+        # Workflow 실행 (step 진행 이벤트 → workflow_step_start/complete)
+        failed_steps = 0
         async for event in runner.run_async(
             user_id=DEFAULT_USER_ID,
             session_id=session_id,
             new_message=user_content,
         ):
-            # Agent Transfer 감지 → workflow_step_start/complete
-            if (
-                hasattr(event, "actions")
-                and event.actions
-                and getattr(event.actions, "transfer_to_agent", None)
-            ):
-                # Previous step complete (if any)
-                if current_step > 0:
-                    yield StreamChunk.workflow_step_complete(
-                        workflow_id=workflow.id,
-                        step_number=current_step,
-                        agent_name=workflow.steps[current_step - 1].agent_endpoint_id,
-                    )
-
-                # Next step start
-                current_step += 1
-                if current_step <= len(workflow.steps):
+            progress = (event.custom_metadata or {}).get(WORKFLOW_STEP_EVENT_KEY)
+            if progress:
+                step_number = progress["step"]
+                agent_name = workflow.steps[step_number - 1].agent_endpoint_id
+                if progress["status"] == "start":
                     yield StreamChunk.workflow_step_start(
-                        workflow_id=workflow.id,
-                        step_number=current_step,
-                        agent_name=workflow.steps[current_step - 1].agent_endpoint_id,
+                        workflow_id=workflow.id, step_number=step_number, agent_name=agent_name
                     )
+                    continue
+                if progress["status"] != "complete":
+                    failed_steps += 1
+                if progress["status"] != "skipped":
+                    yield StreamChunk.workflow_step_complete(
+                        workflow_id=workflow.id, step_number=step_number, agent_name=agent_name
+                    )
+                continue
 
             # 텍스트 응답
             if event.is_final_response() and event.content and event.content.parts:
@@ -575,38 +969,120 @@ class AdkOrchestratorAdapter(OrchestratorPort):
                     if part.text:
                         yield StreamChunk.text(part.text)
 
-        # Last step complete
-        if current_step > 0:
-            yield StreamChunk.workflow_step_complete(
-                workflow_id=workflow.id,
-                step_number=current_step,
-                agent_name=workflow.steps[current_step - 1].agent_endpoint_id,
-            )
-
         # workflow_complete 이벤트
         yield StreamChunk.workflow_complete(
             workflow_id=workflow.id,
-            status="success",
+            status="failed" if failed_steps else "success",
             total_steps=len(workflow.steps),
         )
 
-    async def remove_workflow_agent(self, workflow_id: str) -> None:  # pragma: no cover
+    async def remove_workflow_agent(self, workflow_id: str) -> None:
         """
-        Workflow Agent 제거 (Phase 5 Part E 유산, Phase 6에서 미사용)
+        Workflow Agent 제거 (컴파일 캐시는 같은 정의의 다른 Workflow가 재사용하도록 유지)
 
         Args:
             workflow_id: Workflow ID
         """
-        self._workflow_agents.pop(workflow_id, None)
         self._workflows.pop(workflow_id, None)
         logger.info(f"Workflow agent removed: {workflow_id}")
 
+    def _ensure_http_client(self) -> None:
+        """
+        LiteLLM 공용 비동기 HTTP 클라이언트(연결 풀) 설정
+
+        litellm.aclient_session은 프로세스 전역이므로 다른 곳에서 이미 설정했다면 그대로 사용합니다.
+        ADK LiteLlm 호출도 같은 풀을 공유합니다.
+        """
+        if litellm.aclient_session is not None and not litellm.aclient_session.is_closed:
+            return
+        self._http_client = httpx.AsyncClient(
+            limits=self._http_limits, timeout=self._request_timeout
+        )
+        litellm.aclient_session = self._http_client
+
+    async def _acompletion(self, max_retries: int | None = None, **kwargs: Any) -> Any:
+        """
+        모든 LLM 호출의 단일 경로
+
+        전역 rate limiter로 모델별 RPM/TPM 한도를 지키고 429는 Retry-After/backoff 후 재시도합니다.
+        배포 풀이 있는 모델은 라우터, 그 외에는 litellm.acompletion을 호출합니다.
+
+        Args:
+            max_retries: 429 재시도 횟수 (None이면 rate limiter 설정값)
+            **kwargs: litellm.acompletion 인자
+
+        Raises:
+            LlmRateLimitError: 재시도 후에도 429
+        """
+        self._ensure_http_client()
+        model = kwargs.get("model") or self._model_name
+
+        async def send() -> Any:
+            if self._llm_router is not None and self._llm_router.has_pool(model):
+                return await self._llm_router.acompletion(**kwargs)
+            return await litellm.acompletion(**kwargs)
+
+        return await self._rate_limiter.call(
+            model, send, estimated_tokens=estimate_tokens(kwargs), max_retries=max_retries
+        )
+
+    @staticmethod
+    def _build_llm_messages(
+        messages: list[dict[str, Any]], system_prompt: str | None
+    ) -> list[dict[str, Any]]:
+        """system_prompt를 앞에 붙인 LLM 메시지 목록"""
+        llm_messages: list[dict[str, Any]] = []
+        if system_prompt:
+            llm_messages.append({"role": "system", "content": system_prompt})
+        llm_messages.extend(messages)
+        return llm_messages
+
+    @staticmethod
+    def _completion_cache_key(
+        model: str,
+        messages: list[dict[str, Any]],
+        system_prompt: str | None,
+        max_tokens: int,
+    ) -> str:
+        """모델/메시지/시스템 프롬프트/파라미터의 SHA-256 해시 (dict 키 순서 무관)"""
+        payload = json.dumps(
+            {
+                "model": model,
+                "messages": messages,
+                "system_prompt": system_prompt,
+                "max_tokens": max_tokens,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _record_cache_hit(self, model: str) -> None:
+        """캐시 hit 사용량 기록 (토큰/비용 0, 기록 실패는 응답에 영향 없음)"""
+        if self._usage_storage is None:
+            return
+        try:
+            await self._usage_storage.save_usage(
+                Usage(
+                    model=model,
+                    prompt_tokens=0,
+                    completion_tokens=0,
+                    total_tokens=0,
+                    cost_usd=0.0,
+                    cache_hit=True,
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record completion cache hit: {e}")
+
     async def generate_response(
         self,
         messages: list[dict[str, Any]],
         model: str | None = None,
         system_prompt: str | None = None,
         max_tokens: int = 1024,
+        use_cache: bool = True,
     ) -> dict[str, Any]:
         """단일 LLM 응답 생성 (Sampling 콜백용)
 
@@ -614,31 +1090,37 @@ class AdkOrchestratorAdapter(OrchestratorPort):
         - process_message: ADK Runner 기반 스트리밍 (Tool Call Loop 자동)
         - generate_response: 단일 LLM 호출 (Sampling HITL 승인 시 사용)
 
+        litellm.acompletion + 공용 연결 풀을 사용하므로 동시 승인이 많아도
+        executor 스레드를 점유하지 않습니다.
+        completion_cache가 있으면 같은 요청의 응답을 재사용합니다 (hit은 비용 0으로 기록).
+
         Args:
             messages: LLM 메시지 목록 [{"role": "user", "content": "..."}]
             model: 모델 이름 (None이면 기본 모델)
             system_prompt: 시스템 프롬프트 (선택)
             max_tokens: 최대 토큰 수
+            use_cache: False면 캐시를 조회/저장하지 않음
 
         Returns:
             {"role": "assistant", "content": "...", "model": "..."}
         """
-        import asyncio
-
         # 모델 선택 (기본값: 인스턴스의 model)
         target_model = model or self._model_name
 
-        # 메시지 준비 (system_prompt 추가)
-        llm_messages = []
-        if system_prompt:
-            llm_messages.append({"role": "system", "content": system_prompt})
-        llm_messages.extend(messages)
+        cache = self._completion_cache if use_cache else None
+        cache_key = ""
+        if cache is not None:
+            cache_key = self._completion_cache_key(
+                target_model, messages, system_prompt, max_tokens
+            )
+            cached = await cache.get(cache_key)
+            if cached is not None:
+                await self._record_cache_hit(cached.get("model") or target_model)
+                return cached
 
-        # LiteLLM 호출 (비동기)
-        response = await asyncio.to_thread(
-            litellm.completion,
+        response = await self._acompletion(
             model=target_model,
-            messages=llm_messages,
+            messages=self._build_llm_messages(messages, system_prompt),
             max_tokens=max_tokens,
         )
 
@@ -647,16 +1129,54 @@ class AdkOrchestratorAdapter(OrchestratorPort):
         content = choice.message.content or ""
         used_model = response.model or target_model
 
-        return {
+        result = {
             "role": "assistant",
             "content": content,
             "model": used_model,
         }
+        # 빈 응답은 캐시하지 않음 (일시적 실패일 수 있음)
+        if cache is not None and content:
+            await cache.put(cache_key, result)
+        return result
+
+    async def stream_response(
+        self,
+        messages: list[dict[str, Any]],
+        model: str | None = None,
+        system_prompt: str | None = None,
+        max_tokens: int = 1024,
+    ) -> AsyncIterator[str]:
+        """단일 LLM 응답을 텍스트 조각 단위로 스트리밍 (generate_response의 스트리밍 버전)
+
+        Args:
+            messages: LLM 메시지 목록 [{"role": "user", "content": "..."}]
+            model: 모델 이름 (None이면 기본 모델)
+            system_prompt: 시스템 프롬프트 (선택)
+            max_tokens: 최대 토큰 수
+
+        Yields:
+            응답 텍스트 조각
+        """
+        response = await self._acompletion(
+            model=model or self._model_name,
+            messages=self._build_llm_messages(messages, system_prompt),
+            max_tokens=max_tokens,
+            stream=True,
+        )
+        async for chunk in response:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            text = getattr(delta, "content", None)
+            if text:
+                yield text
 
     async def _call_llm_with_retry(self, message: str, max_retries: int = 3) -> dict:
         """
         LLM API 호출 with Exponential Backoff Retry (Chaos 테스트용)
 
+        재시도는 전역 rate limiter가 수행합니다 (Retry-After가 없으면 1s, 2s, 4s, ...).
+
         Args:
             message: User message
             max_retries: Maximum retry attempts (default: 3)
@@ -667,63 +1187,47 @@ class AdkOrchestratorAdapter(OrchestratorPort):
         Raises:
             LlmRateLimitError: Rate limit exceeded after max retries
         """
-        import asyncio
-
-        from litellm.exceptions import RateLimitError
-
-        from src.domain.exceptions import LlmRateLimitError
-
-        attempt = 0
-        while attempt <= max_retries:
-            try:
-                # litellm.completion 호출 (비동기)
-                response = await asyncio.to_thread(
-                    litellm.completion,
-                    model=self._model_name,
-                    messages=[{"role": "user", "content": message}],
-                )
-                return response
-            except RateLimitError as e:
-                attempt += 1
-                if attempt > max_retries:
-                    # 최대 재시도 초과
-                    raise LlmRateLimitError(
-                        f"LLM rate limit exceeded after {max_retries} retries"
-                    ) from e
-
-                # Exponential backoff: 1s, 2s, 4s, ...
-                delay = 2 ** (attempt - 1)
-                logger.warning(
-                    f"Rate limit hit, retrying in {delay}s (attempt {attempt}/{max_retries})"
-                )
-                await asyncio.sleep(delay)
-
-        # 도달 불가 (while 조건이 보장)
-        raise RuntimeError("Unexpected retry loop exit")
+        return await self._acompletion(
+            max_retries=max_retries,
+            model=self._model_name,
+            messages=[{"role": "user", "content": message}],
+        )
 
     async def close(self) -> None:
         """리소스 정리
 
         명시적으로 모든 리소스를 정리합니다:
         - DynamicToolset (MCP 연결)
-        - InMemorySessionService (세션 데이터)
+        - SessionService (대기 중인 세션 쓰기 기록 + 연결 종료)
         - Runner (ADK 런타임)
         - Workflow/Sub-agent 참조
+        - 진행 중인 대화 요약 작업
+        - LLM HTTP 연결 풀 (직접 생성한 경우만)
         """
         await self._dynamic_toolset.close()
 
-        # InMemorySessionService 명시적 정리
-        if self._session_service is not None:
-            if hasattr(self._session_service, "close"):
-                with contextlib.suppress(Exception):
-                    await self._session_service.close()
-            self._session_service = None
+        if self._context_manager is not None:
+            await self._context_manager.close()
+
+        if self._http_client is not None:
+            if litellm.aclient_session is self._http_client:
+                litellm.aclient_session = None
+            with contextlib.suppress(Exception):
+                await self._http_client.aclose()
+            self._http_client = None
+
+        # SessionService 명시적 정리 (재초기화 시 재사용)
+        if hasattr(self._session_service, "close"):
+            with contextlib.suppress(Exception):
+                await self._session_service.close()
 
         self._agent = None
         self._runner = None
         self._sub_agents.clear()
         self._a2a_urls.clear()
-        self._workflow_agents.clear()
+        self._agent_cards.clear()
+        self._instruction_cache = None
+        self._workflow_runners.clear()
         self._workflows.clear()
         self._initialized = False
         logger.info("AdkOrchestratorAdapter closed")
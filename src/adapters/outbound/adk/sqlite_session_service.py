@@ -0,0 +1,556 @@
+"""SqliteSessionService - aiosqlite 기반 ADK SessionService
+
+대화별 이벤트 이력을 SQLite에 영속화하여 재시작 후에도 컨텍스트를 유지합니다.
+- Write-behind: append_event()는 메모리만 갱신하고 큐에 넣으며, 백그라운드에서 배치로 기록
+- Lazy load: get_session() 시점에 DB에서 세션을 읽어 LRU 캐시에 적재
+- Hot session LRU: 최근 사용 세션만 메모리에 유지 (대화 수와 무관하게 메모리 일정)
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+import aiosqlite
+from google.adk.errors.already_exists_error import AlreadyExistsError
+from google.adk.events.event import Event
+from google.adk.sessions import BaseSessionService, Session
+from google.adk.sessions.base_session_service import GetSessionConfig, ListSessionsResponse
+from google.adk.sessions.state import State
+
+logger = logging.getLogger(__name__)
+
+# 세션 키: (app_name, user_id, session_id)
+SessionKey = tuple[str, str, str]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS adk_sessions (
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    state TEXT NOT NULL,
+    create_time REAL NOT NULL,
+    update_time REAL NOT NULL,
+    PRIMARY KEY (app_name, user_id, id)
+);
+
+CREATE TABLE IF NOT EXISTS adk_events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    event_data TEXT NOT NULL,
+    FOREIGN KEY (app_name, user_id, session_id)
+        REFERENCES adk_sessions(app_name, user_id, id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_adk_events_session
+ON adk_events(app_name, user_id, session_id, seq);
+
+CREATE TABLE IF NOT EXISTS adk_app_states (
+    app_name TEXT PRIMARY KEY,
+    state TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS adk_user_states (
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    state TEXT NOT NULL,
+    PRIMARY KEY (app_name, user_id)
+);
+"""
+
+
+@dataclass
+class _CachedSession:
+    """메모리에 적재된 세션 (세션 범위 state만 보관, app/user state는 조회 시 병합)"""
+
+    state: dict[str, Any]
+    events: list[Event]
+    update_time: float
+
+
+@dataclass
+class _PendingWrites:
+    """아직 기록되지 않은 변경분 (flush 시 한 트랜잭션으로 기록)"""
+
+    events: list[tuple[str, str, str, str, float, str]] = field(default_factory=list)
+    sessions: dict[SessionKey, tuple[str, float]] = field(default_factory=dict)
+    app_states: set[str] = field(default_factory=set)
+    user_states: set[tuple[str, str]] = field(default_factory=set)
+
+    def __len__(self) -> int:
+        return len(self.events) + len(self.sessions)
+
+    def is_empty(self) -> bool:
+        return not (self.events or self.sessions or self.app_states or self.user_states)
+
+
+def _split_state_delta(
+    delta: dict[str, Any],
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+    """state delta를 (app, user, session) 범위로 분리 (temp:는 제외, 접두사 제거)"""
+    app: dict[str, Any] = {}
+    user: dict[str, Any] = {}
+    session: dict[str, Any] = {}
+    for key, value in delta.items():
+        if key.startswith(State.APP_PREFIX):
+            app[key.removeprefix(State.APP_PREFIX)] = value
+        elif key.startswith(State.USER_PREFIX):
+            user[key.removeprefix(State.USER_PREFIX)] = value
+        elif not key.startswith(State.TEMP_PREFIX):
+            session[key] = value
+    return app, user, session
+
+
+class SqliteSessionService(BaseSessionService):
+    """
+    SQLite 기반 ADK SessionService (write-behind + lazy load + LRU)
+
+    Features:
+    - WAL 모드 + 싱글톤 연결 + 쓰기 Lock (SqliteConversationStorage와 동일한 구성)
+    - append_event(): 캐시 갱신 후 큐에 적재, flush_interval마다 또는 batch_size 도달 시 배치 기록
+    - get_session(): 캐시 미스 시 대기 중인 쓰기를 먼저 기록한 뒤 DB에서 적재
+    - max_cached_sessions를 넘으면 가장 오래 사용되지 않은 세션을 메모리에서 제거 (DB에는 유지)
+    - flush()/close() 시 대기 중인 쓰기를 모두 기록
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        max_cached_sessions: int = 256,
+        flush_interval_seconds: float = 0.5,
+        flush_batch_size: int = 100,
+    ):
+        """
+        Args:
+            db_path: SQLite 데이터베이스 파일 경로
+            max_cached_sessions: 메모리에 유지할 최대 세션 수
+            flush_interval_seconds: write-behind 기록 주기 (초)
+            flush_batch_size: 이 개수 이상 쌓이면 주기를 기다리지 않고 기록
+        """
+        self._db_path = db_path
+        self._max_cached_sessions = max_cached_sessions
+        self._flush_interval = flush_interval_seconds
+        self._flush_batch_size = flush_batch_size
+
+        self._connection: aiosqlite.Connection | None = None
+        self._connect_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+
+        self._sessions: OrderedDict[SessionKey, _CachedSession] = OrderedDict()
+        self._app_states: dict[str, dict[str, Any]] = {}
+        self._user_states: dict[tuple[str, str], dict[str, Any]] = {}
+        self._pending = _PendingWrites()
+
+        self._flush_wakeup = asyncio.Event()
+        self._flusher: asyncio.Task | None = None
+
+    # ------------------------------------------------------------------
+    # BaseSessionService
+    # ------------------------------------------------------------------
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: dict[str, Any] | None = None,
+        session_id: str | None = None,
+    ) -> Session:
+        """세션 생성 (즉시 기록)"""
+        session_id = session_id.strip() if session_id and session_id.strip() else None
+        session_id = session_id or str(uuid.uuid4())
+        key = (app_name, user_id, session_id)
+
+        if key in self._sessions or await self._load_session(key) is not None:
+            raise AlreadyExistsError(f"Session with id {session_id} already exists.")
+
+        app_delta, user_delta, session_state = _split_state_delta(state or {})
+        await self._apply_shared_state(app_name, user_id, app_delta, user_delta)
+
+        now = time.time()
+        conn = await self._get_connection()
+        async with self._write_lock:
+            await conn.execute(
+                """
+                INSERT INTO adk_sessions (app_name, user_id, id, state, create_time, update_time)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (app_name, user_id, session_id, json.dumps(session_state), now, now),
+            )
+            await conn.commit()
+
+        self._cache_session(key, _CachedSession(state=session_state, events=[], update_time=now))
+        return await self._to_session(key, self._sessions[key])
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: GetSessionConfig | None = None,
+    ) -> Session | None:
+        """세션 조회 (캐시 우선, 미스 시 DB에서 lazy load)"""
+        key = (app_name, user_id, session_id)
+        cached = self._sessions.get(key)
+        if cached is None:
+            cached = await self._load_session(key)
+            if cached is None:
+                return None
+            self._cache_session(key, cached)
+        else:
+            self._sessions.move_to_end(key)
+
+        return await self._to_session(key, cached, config)
+
+    async def list_sessions(
+        self, *, app_name: str, user_id: str | None = None
+    ) -> ListSessionsResponse:
+        """세션 목록 조회 (이벤트 제외, 대기 중인 쓰기 반영 후 조회)"""
+        await self.flush()
+        conn = await self._get_connection()
+        query = "SELECT user_id, id, state, update_time FROM adk_sessions WHERE app_name = ?"
+        params: list[Any] = [app_name]
+        if user_id is not None:
+            query += " AND user_id = ?"
+            params.append(user_id)
+        query += " ORDER BY update_time, user_id, id"
+        rows = await conn.execute_fetchall(query, params)
+
+        sessions = []
+        for row in rows:
+            merged = await self._merged_state(app_name, row["user_id"], json.loads(row["state"]))
+            sessions.append(
+                Session(
+                    app_name=app_name,
+                    user_id=row["user_id"],
+                    id=row["id"],
+                    state=merged,
+                    events=[],
+                    last_update_time=row["update_time"],
+                )
+            )
+        return ListSessionsResponse(sessions=sessions)
+
+    async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        """세션 삭제 (캐시 + 대기 중인 쓰기 + DB)"""
+        key = (app_name, user_id, session_id)
+        self._sessions.pop(key, None)
+        self._pending.sessions.pop(key, None)
+        self._pending.events = [e for e in self._pending.events if e[:3] != key]
+
+        conn = await self._get_connection()
+        async with self._write_lock:
+            await conn.execute(
+                "DELETE FROM adk_sessions WHERE app_name = ? AND user_id = ? AND id = ?", key
+            )
+            await conn.commit()
+
+    async def get_user_state(self, *, app_name: str, user_id: str) -> dict[str, Any]:
+        """사용자 범위 state 조회 (접두사 없는 키)"""
+        return dict(await self._get_user_state(app_name, user_id))
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        """
+        이벤트 추가 (write-behind)
+
+        전달받은 세션과 캐시를 즉시 갱신하고, DB 기록은 큐에 넣어 배치로 처리합니다.
+        """
+        if event.partial:
+            return event
+
+        self._apply_temp_state(session, event)
+        event = self._trim_temp_delta_state(event)
+        key = (session.app_name, session.user_id, session.id)
+
+        cached = self._sessions.get(key)
+        if cached is None:
+            cached = await self._load_session(key)
+            if cached is not None:
+                self._cache_session(key, cached)
+
+        app_delta, user_delta, session_delta = _split_state_delta(
+            event.actions.state_delta if event.actions else {}
+        )
+        await self._apply_shared_state(session.app_name, session.user_id, app_delta, user_delta)
+
+        if cached is not None:
+            cached.state.update(session_delta)
+            cached.update_time = event.timestamp
+            if cached.events is not session.events:
+                cached.events.append(event)
+            self._pending.sessions[key] = (json.dumps(cached.state), event.timestamp)
+
+        self._pending.events.append(
+            (*key, event.id, event.timestamp, event.model_dump_json(exclude_none=True))
+        )
+        session.last_update_time = event.timestamp
+        self._schedule_flush()
+
+        return self._commit_event_to_session(session, event)
+
+    async def flush(self) -> None:
+        """
+        대기 중인 쓰기를 한 트랜잭션으로 기록
+
+        쓰기 Lock 안에서 대기열을 교체하므로, 반환 시점에는 이전에 시작된
+        flush까지 모두 커밋되어 있습니다 (lazy load 직전 호출 시 누락 방지).
+        """
+        conn = await self._get_connection()
+        async with self._write_lock:
+            pending = self._pending
+            if pending.is_empty():
+                return
+            self._pending = _PendingWrites()
+            app_rows = [
+                (app, json.dumps(self._app_states.get(app, {}))) for app in pending.app_states
+            ]
+            user_rows = [
+                (app, user, json.dumps(self._user_states.get((app, user), {})))
+                for app, user in pending.user_states
+            ]
+
+            try:
+                if app_rows:
+                    await conn.executemany(
+                        "INSERT OR REPLACE INTO adk_app_states (app_name, state) VALUES (?, ?)",
+                        app_rows,
+                    )
+                if user_rows:
+                    await conn.executemany(
+                        "INSERT OR REPLACE INTO adk_user_states (app_name, user_id, state)"
+                        " VALUES (?, ?, ?)",
+                        user_rows,
+                    )
+                if pending.sessions:
+                    await conn.executemany(
+                        "UPDATE adk_sessions SET state = ?, update_time = ?"
+                        " WHERE app_name = ? AND user_id = ? AND id = ?",
+                        [(state, ts, *key) for key, (state, ts) in pending.sessions.items()],
+                    )
+                if pending.events:
+                    # 세션이 삭제된 이벤트는 FK 위반이 되므로 존재하는 세션만 기록
+                    await conn.executemany(
+                        """
+                        INSERT INTO adk_events
+                            (app_name, user_id, session_id, id, timestamp, event_data)
+                        SELECT ?, ?, ?, ?, ?, ?
+                        WHERE EXISTS (
+                            SELECT 1 FROM adk_sessions
+                            WHERE app_name = ?1 AND user_id = ?2 AND id = ?3
+                        )
+                        """,
+                        pending.events,
+                    )
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                self._requeue(pending)
+                raise
+
+        logger.debug(
+            f"Session writes flushed: {len(pending.events)} events",
+            extra={
+                "flushed_events": len(pending.events),
+                "flushed_sessions": len(pending.sessions),
+            },
+        )
+
+    # ------------------------------------------------------------------
+    # 수명 주기
+    # ------------------------------------------------------------------
+
+    async def initialize(self) -> None:
+        """데이터베이스 연결 및 스키마 생성"""
+        await self._get_connection()
+
+    async def close(self) -> None:
+        """백그라운드 기록 중지 + 남은 쓰기 기록 + 연결 종료 (이후 사용 시 재연결)"""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+
+        if self._connection is not None:
+            try:
+                await self.flush()
+            finally:
+                await self._connection.close()
+                self._connection = None
+
+        self._sessions.clear()
+        self._app_states.clear()
+        self._user_states.clear()
+
+    def get_cache_stats(self) -> dict[str, int]:
+        """캐시/대기열 상태 (모니터링용)"""
+        return {
+            "cached_sessions": len(self._sessions),
+            "pending_events": len(self._pending.events),
+        }
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+
+    async def _get_connection(self) -> aiosqlite.Connection:
+        """싱글톤 연결 반환 (최초 연결 시 WAL 설정 + 스키마 생성)"""
+        if self._connection is not None:
+            return self._connection
+
+        async with self._connect_lock:
+            if self._connection is None:
+                db_dir = os.path.dirname(self._db_path)
+                if db_dir:
+                    os.makedirs(db_dir, exist_ok=True)
+
+                conn = await aiosqlite.connect(self._db_path)
+                conn.row_factory = aiosqlite.Row
+                await conn.execute("PRAGMA journal_mode=WAL")
+                await conn.execute("PRAGMA busy_timeout=5000")
+                await conn.execute("PRAGMA foreign_keys=ON")
+                await conn.executescript(_SCHEMA)
+                await conn.commit()
+                self._connection = conn
+        return self._connection
+
+    async def _load_session(self, key: SessionKey) -> _CachedSession | None:
+        """DB에서 세션 적재 (대기 중인 쓰기를 먼저 기록하여 누락 방지)"""
+        await self.flush()
+        conn = await self._get_connection()
+        rows = list(
+            await conn.execute_fetchall(
+                "SELECT state, update_time FROM adk_sessions"
+                " WHERE app_name = ? AND user_id = ? AND id = ?",
+                key,
+            )
+        )
+        if not rows:
+            return None
+
+        event_rows = await conn.execute_fetchall(
+            "SELECT event_data FROM adk_events"
+            " WHERE app_name = ? AND user_id = ? AND session_id = ? ORDER BY seq",
+            key,
+        )
+        return _CachedSession(
+            state=json.loads(rows[0]["state"]),
+            events=[Event.model_validate_json(row["event_data"]) for row in event_rows],
+            update_time=rows[0]["update_time"],
+        )
+
+    def _cache_session(self, key: SessionKey, cached: _CachedSession) -> None:
+        """LRU 캐시에 추가 (상한 초과 시 오래된 세션 제거, DB에는 유지)"""
+        self._sessions[key] = cached
+        self._sessions.move_to_end(key)
+        while len(self._sessions) > self._max_cached_sessions:
+            self._sessions.popitem(last=False)
+
+    async def _to_session(
+        self,
+        key: SessionKey,
+        cached: _CachedSession,
+        config: GetSessionConfig | None = None,
+    ) -> Session:
+        """캐시 항목을 ADK Session으로 변환 (app/user state 병합, 이벤트 목록 복사)"""
+        events = cached.events
+        if config is not None:
+            if config.after_timestamp:
+                events = [e for e in events if e.timestamp >= config.after_timestamp]
+            if config.num_recent_events is not None:
+                events = events[-config.num_recent_events :] if config.num_recent_events else []
+
+        app_name, user_id, session_id = key
+        return Session(
+            app_name=app_name,
+            user_id=user_id,
+            id=session_id,
+            state=await self._merged_state(app_name, user_id, cached.state),
+            events=list(events),
+            last_update_time=cached.update_time,
+        )
+
+    async def _merged_state(
+        self, app_name: str, user_id: str, session_state: dict[str, Any]
+    ) -> dict[str, Any]:
+        merged = dict(session_state)
+        for k, v in (await self._get_app_state(app_name)).items():
+            merged[State.APP_PREFIX + k] = v
+        for k, v in (await self._get_user_state(app_name, user_id)).items():
+            merged[State.USER_PREFIX + k] = v
+        return merged
+
+    async def _get_app_state(self, app_name: str) -> dict[str, Any]:
+        if app_name not in self._app_states:
+            conn = await self._get_connection()
+            rows = list(
+                await conn.execute_fetchall(
+                    "SELECT state FROM adk_app_states WHERE app_name = ?", (app_name,)
+                )
+            )
+            self._app_states[app_name] = json.loads(rows[0]["state"]) if rows else {}
+        return self._app_states[app_name]
+
+    async def _get_user_state(self, app_name: str, user_id: str) -> dict[str, Any]:
+        key = (app_name, user_id)
+        if key not in self._user_states:
+            conn = await self._get_connection()
+            rows = list(
+                await conn.execute_fetchall(
+                    "SELECT state FROM adk_user_states WHERE app_name = ? AND user_id = ?", key
+                )
+            )
+            self._user_states[key] = json.loads(rows[0]["state"]) if rows else {}
+        return self._user_states[key]
+
+    async def _apply_shared_state(
+        self,
+        app_name: str,
+        user_id: str,
+        app_delta: dict[str, Any],
+        user_delta: dict[str, Any],
+    ) -> None:
+        """app/user 범위 state 갱신 (모든 세션이 공유, 다음 flush에 기록)"""
+        if app_delta:
+            (await self._get_app_state(app_name)).update(app_delta)
+            self._pending.app_states.add(app_name)
+        if user_delta:
+            (await self._get_user_state(app_name, user_id)).update(user_delta)
+            self._pending.user_states.add((app_name, user_id))
+
+    def _requeue(self, pending: _PendingWrites) -> None:
+        """기록 실패 시 변경분을 대기열 앞에 되돌림 (다음 flush에서 재시도)"""
+        pending.events.extend(self._pending.events)
+        pending.sessions.update(self._pending.sessions)
+        pending.app_states |= self._pending.app_states
+        pending.user_states |= self._pending.user_states
+        self._pending = pending
+
+    def _schedule_flush(self) -> None:
+        """백그라운드 기록 태스크 시작 (배치 크기 도달 시 즉시 기록)"""
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+        if len(self._pending) >= self._flush_batch_size:
+            self._flush_wakeup.set()
+
+    async def _flush_loop(self) -> None:
+        """flush_interval마다 (또는 배치 크기 도달 시) 대기 중인 쓰기 기록"""
+        while True:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._flush_wakeup.wait(), self._flush_interval)
+            self._flush_wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Session write-behind flush failed: {e}")
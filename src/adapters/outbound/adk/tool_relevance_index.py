@@ -0,0 +1,108 @@
+"""ToolRelevanceIndex - 도구 관련도 검색용 BM25 역색인 (순수 Python)
+
+도구 이름/설명/파라미터 이름으로 문서를 만들고, 사용자 메시지와 관련도가 높은
+도구 top-k를 고릅니다. 엔드포인트 추가/제거 시 해당 문서만 증분 갱신합니다.
+"""
+
+import math
+import re
+from collections import Counter
+
+# 문서 키: (endpoint_id, tool_name)
+DocKey = tuple[str, str]
+
+_CAMEL_CASE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    검색용 토큰 분리
+
+    camelCase/snake_case를 단어 단위로 나누고 소문자로 정규화합니다.
+    한글 등 유니코드 문자는 공백 기준 단어로 유지됩니다.
+    """
+    return _TOKEN.findall(_CAMEL_CASE.sub(" ", text).lower())
+
+
+class ToolRelevanceIndex:
+    """
+    BM25 (Okapi) 역색인
+
+    postings(term → {doc: tf})와 문서 길이를 유지하므로 문서 추가/제거가
+    전체 재색인 없이 해당 문서 크기에 비례하는 비용으로 끝납니다.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Args:
+            k1: 단어 빈도 포화 계수
+            b: 문서 길이 정규화 계수
+        """
+        self._k1 = k1
+        self._b = b
+        self._postings: dict[str, dict[DocKey, int]] = {}
+        self._doc_terms: dict[DocKey, Counter[str]] = {}
+        self._doc_lengths: dict[DocKey, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def add(self, key: DocKey, text: str) -> None:
+        """문서 추가 (같은 키가 있으면 교체)"""
+        self.remove(key)
+        terms = Counter(tokenize(text))
+        self._doc_terms[key] = terms
+        self._doc_lengths[key] = terms.total()
+        self._total_length += self._doc_lengths[key]
+        for term, tf in terms.items():
+            self._postings.setdefault(term, {})[key] = tf
+
+    def remove(self, key: DocKey) -> None:
+        """문서 제거 (없으면 무시)"""
+        terms = self._doc_terms.pop(key, None)
+        if terms is None:
+            return
+        self._total_length -= self._doc_lengths.pop(key)
+        for term in terms:
+            postings = self._postings[term]
+            del postings[key]
+            if not postings:
+                del self._postings[term]
+
+    def remove_endpoint(self, endpoint_id: str) -> None:
+        """엔드포인트의 모든 문서 제거"""
+        for key in [key for key in self._doc_terms if key[0] == endpoint_id]:
+            self.remove(key)
+
+    def search(self, query: str, top_k: int) -> list[DocKey]:
+        """
+        관련도 상위 문서 조회
+
+        Args:
+            query: 검색어 (사용자 메시지 + 페이지 컨텍스트)
+            top_k: 최대 반환 개수
+
+        Returns:
+            점수 내림차순 문서 키 목록 (일치하는 단어가 없는 문서는 제외)
+        """
+        doc_count = len(self._doc_terms)
+        if doc_count == 0 or top_k <= 0:
+            return []
+
+        avg_length = self._total_length / doc_count or 1.0
+        scores: dict[DocKey, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+            for key, tf in postings.items():
+                length = self._doc_lengths[key]
+                norm = self._k1 * (1 - self._b + self._b * length / avg_length)
+                scores[key] = scores.get(key, 0.0) + idf * tf * (self._k1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [key for key, _ in ranked[:top_k]]
@@ -0,0 +1,149 @@
+"""ToolResultCache - 읽기 전용 MCP 도구 결과 캐시 (LRU + 메모리 상한 + 항목별 TTL)
+
+키는 (endpoint_id, tool_name, 정규화된 인자 JSON)입니다.
+캐시 대상 판단(readOnlyHint/idempotentHint, 엔드포인트 설정)은 DynamicToolset이 담당합니다.
+"""
+
+import copy
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+# 캐시 키: (endpoint_id, tool_name, canonical_args)
+ResultCacheKey = tuple[str, str, str]
+
+
+def canonical_arguments(arguments: dict[str, Any] | None) -> str:
+    """
+    도구 인자 정규화 (키 정렬 + 공백 제거 JSON)
+
+    키 순서나 직렬화 방식만 다른 동일 인자가 같은 키로 모이도록 합니다.
+    """
+    return json.dumps(
+        arguments or {},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+
+
+def _estimate_size(value: Any) -> int:
+    """결과 크기 추정 (JSON 직렬화 바이트 수)"""
+    return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    size: int
+    expires_at: float
+
+
+class ToolResultCache:
+    """
+    메모리 상한이 있는 LRU 결과 캐시
+
+    - 조회 시 만료된 항목은 제거 후 미스로 처리
+    - 저장 후 총 크기가 상한을 넘으면 가장 오래 사용되지 않은 항목부터 제거
+    - 상한보다 큰 단일 결과는 저장하지 않음
+    - 호출자가 결과를 수정해도 캐시가 오염되지 않도록 저장/반환 시 복사
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Args:
+            max_bytes: 캐시 총 크기 상한 (0 이하면 저장하지 않음)
+        """
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[ResultCacheKey, _CacheEntry] = OrderedDict()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def get(self, key: ResultCacheKey) -> tuple[bool, Any]:
+        """
+        결과 조회 (hit/miss 카운터 갱신)
+
+        Returns:
+            (적중 여부, 결과 복사본)
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, copy.deepcopy(entry.value)
+
+    def put(self, key: ResultCacheKey, value: Any, ttl_seconds: float) -> bool:
+        """
+        결과 저장
+
+        Args:
+            key: 캐시 키
+            value: 도구 실행 결과
+            ttl_seconds: 항목 TTL (초)
+
+        Returns:
+            저장 여부 (TTL이 0 이하이거나 상한보다 큰 결과는 저장하지 않음)
+        """
+        if ttl_seconds <= 0:
+            return False
+        size = _estimate_size(value)
+        if size > self._max_bytes:
+            return False
+
+        self._remove(key)
+        self._entries[key] = _CacheEntry(
+            value=copy.deepcopy(value),
+            size=size,
+            expires_at=time.monotonic() + ttl_seconds,
+        )
+        self._total_bytes += size
+
+        while self._total_bytes > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+        return True
+
+    def invalidate_endpoint(self, endpoint_id: str) -> None:
+        """엔드포인트의 모든 결과 제거"""
+        for key in [key for key in self._entries if key[0] == endpoint_id]:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """모든 결과 제거 (카운터는 유지)"""
+        self._entries.clear()
+        self._total_bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        """캐시 통계 (로깅 extra/모니터링용)"""
+        return {
+            "result_cache_hits": self.hits,
+            "result_cache_misses": self.misses,
+            "result_cache_evictions": self.evictions,
+            "result_cache_entries": len(self._entries),
+            "result_cache_bytes": self._total_bytes,
+        }
+
+    def _remove(self, key: ResultCacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size
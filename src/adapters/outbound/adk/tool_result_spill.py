@@ -0,0 +1,153 @@
+"""ToolResultSpiller - 대용량 도구 결과 분리 저장 (미리보기 + 핸들)
+
+임계값을 넘는 도구 결과는 ToolResultStoragePort에 저장하고,
+LLM 컨텍스트/SSE에는 미리보기와 핸들만 전달합니다.
+나머지는 내장 도구 read_tool_result(handle, offset, length)로 나눠 읽습니다.
+"""
+
+import json
+import logging
+from typing import Any
+
+from google.adk.tools import BaseTool, FunctionTool
+
+from src.domain.exceptions import ToolResultNotFoundError
+from src.domain.ports.outbound.storage_port import ToolResultStoragePort
+
+logger = logging.getLogger(__name__)
+
+READ_TOOL_RESULT_NAME = "read_tool_result"
+# 분리된 결과 전체 조회 URL (SSE tool_result 청크에 포함)
+TOOL_RESULT_URL_PREFIX = "/api/tool-results"
+
+
+def _response_text(tool_response: Any) -> str:
+    """
+    도구 결과를 텍스트로 직렬화
+
+    MCP CallToolResult의 content가 모두 텍스트면 텍스트만 이어 붙이고,
+    그 외에는 JSON으로 직렬화합니다.
+    """
+    if isinstance(tool_response, dict):
+        content = tool_response.get("content")
+        if (
+            isinstance(content, list)
+            and content
+            and all(isinstance(item, dict) and item.get("type") == "text" for item in content)
+        ):
+            return "\n".join(str(item.get("text", "")) for item in content)
+    if isinstance(tool_response, str):
+        return tool_response
+    return json.dumps(tool_response, ensure_ascii=False, default=str)
+
+
+def tool_result_url(handle: str) -> str:
+    """분리된 결과 조회 URL"""
+    return f"{TOOL_RESULT_URL_PREFIX}/{handle}"
+
+
+def spilled_result(tool_response: Any) -> tuple[str, str] | None:
+    """
+    분리 저장된 결과인지 확인
+
+    Returns:
+        (핸들, 미리보기) 또는 None (일반 결과)
+    """
+    if isinstance(tool_response, dict) and isinstance(tool_response.get("result_handle"), str):
+        return tool_response["result_handle"], str(tool_response.get("preview", ""))
+    return None
+
+
+class ToolResultSpiller:
+    """
+    ADK after_tool_callback으로 대용량 결과를 분리 저장
+
+    - 임계값(spill_chars) 이하 결과는 그대로 통과
+    - read_tool_result 페이지는 임계값 이하로 제한되어 다시 분리되지 않음
+    """
+
+    def __init__(
+        self,
+        storage: ToolResultStoragePort,
+        spill_chars: int = 20000,
+        preview_chars: int = 2000,
+    ):
+        """
+        Args:
+            storage: 도구 결과 저장소
+            spill_chars: 분리 저장 임계값 (직렬화된 결과 문자 수)
+            preview_chars: LLM/SSE에 전달할 미리보기 문자 수
+        """
+        self._storage = storage
+        self._spill_chars = spill_chars
+        self._preview_chars = min(preview_chars, spill_chars)
+
+    async def after_tool_callback(
+        self,
+        tool: BaseTool,
+        args: dict[str, Any],  # noqa: ARG002 - ADK 콜백 시그니처 준수
+        tool_context: Any,  # noqa: ARG002 - ADK 콜백 시그니처 준수
+        tool_response: Any,
+    ) -> dict[str, Any] | None:
+        """
+        임계값을 넘는 결과를 저장하고 미리보기 + 핸들로 대체
+
+        Returns:
+            대체 결과 (None이면 원래 결과 사용)
+        """
+        if tool.name == READ_TOOL_RESULT_NAME:
+            return None
+
+        text = _response_text(tool_response)
+        if len(text) <= self._spill_chars:
+            return None
+
+        handle = await self._storage.save_result(text)
+        logger.info(
+            f"Tool result spilled: {tool.name} ({len(text)} chars)",
+            extra={"tool_name": tool.name, "result_handle": handle, "total_chars": len(text)},
+        )
+        return {
+            "result_handle": handle,
+            "preview": text[: self._preview_chars],
+            "total_chars": len(text),
+            "message": (
+                f"Result truncated: showing the first {self._preview_chars} of {len(text)} "
+                f'characters. Call {READ_TOOL_RESULT_NAME} with handle="{handle}" and '
+                f"offset={self._preview_chars} to read more."
+            ),
+        }
+
+    def build_read_tool(self) -> BaseTool:
+        """내장 read_tool_result 도구 생성"""
+        storage = self._storage
+        max_length = self._spill_chars
+
+        async def read_tool_result(handle: str, offset: int = 0, length: int = 4000) -> dict:
+            """Read part of a large tool result that was truncated.
+
+            Args:
+              handle: The result_handle returned with the truncated result.
+              offset: Character offset to start reading from.
+              length: Maximum number of characters to return.
+
+            Returns:
+              The requested content, the total size and the next offset (null at the end).
+            """
+            offset = max(offset, 0)
+            try:
+                content, total = await storage.read_result(
+                    handle, offset, min(max(length, 1), max_length)
+                )
+            except ToolResultNotFoundError as e:
+                return {"error": e.message}
+            next_offset = offset + len(content)
+            return {
+                "handle": handle,
+                "offset": offset,
+                "content": content,
+                "total_chars": total,
+                "next_offset": next_offset if next_offset < total else None,
+            }
+
+        return FunctionTool(read_tool_result)
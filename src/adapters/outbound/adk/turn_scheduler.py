@@ -0,0 +1,193 @@
+"""TurnScheduler - 대화 턴 직렬화 + 전역 동시 실행 제한 (FIFO 승인 대기열)
+
+같은 conversation_id의 턴이 같은 ADK 세션에서 동시에 실행되면 이벤트가 섞이므로
+대화별로 한 번에 한 턴만 실행하고, 전체 동시 실행 턴 수는 max_concurrent_turns로 제한합니다.
+- 대화별 잠금을 먼저 얻은 뒤 전역 승인 대기열에 들어감
+  (같은 대화의 이전 턴을 기다리는 동안 전역 슬롯을 점유하지 않음)
+- 전역 승인은 도착 순서(FIFO)대로 부여하며, 새로 도착한 턴이 대기 중인 턴을 앞지르지 않음
+- 대기열 길이/대기 시간을 통계로 제공하여 과부하 시 LLM 프로바이더를 몰아붙이는 대신 대기
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.domain.exceptions import TurnQueueTimeoutError
+
+logger = logging.getLogger(__name__)
+
+# 대기 시간 통계(p95)에 사용할 최근 턴 수
+_RECENT_WAITS = 512
+# 이 시간(초) 이상 기다린 턴은 경고 로그
+_SLOW_ADMISSION_SECONDS = 5.0
+
+
+@dataclass
+class _ConversationSlot:
+    """대화별 잠금 + 사용 중인 턴 수 (0이 되면 제거)"""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    users: int = 0
+
+
+class TurnScheduler:
+    """
+    대화 턴 스케줄러
+
+    사용 예:
+        async with scheduler.turn(conversation_id):
+            async for event in runner.run_async(...):
+                ...
+    """
+
+    def __init__(self, max_concurrent_turns: int = 16, queue_timeout_seconds: float = 0.0):
+        """
+        Args:
+            max_concurrent_turns: 전체 동시 실행 턴 수 (0이면 제한 없음, 대화별 직렬화는 유지)
+            queue_timeout_seconds: 최대 대기 시간 (초, 0이면 무기한 대기)
+        """
+        self._max_concurrent_turns = max_concurrent_turns
+        self._queue_timeout_seconds = queue_timeout_seconds
+        self._conversations: dict[str, _ConversationSlot] = {}
+        self._waiters: deque[asyncio.Future] = deque()
+        self._active = 0
+        self._conversation_waiting = 0
+        self._admitted = 0
+        self._timed_out = 0
+        self._max_wait = 0.0
+        self._total_wait = 0.0
+        self._recent_waits: deque[float] = deque(maxlen=_RECENT_WAITS)
+
+    @contextlib.asynccontextmanager
+    async def turn(self, conversation_id: str) -> AsyncIterator[float]:
+        """
+        턴 실행 권한 획득 (대화별 잠금 → 전역 승인)
+
+        Args:
+            conversation_id: 대화 ID
+
+        Yields:
+            승인까지 기다린 시간 (초)
+
+        Raises:
+            TurnQueueTimeoutError: queue_timeout_seconds 안에 승인되지 않음
+        """
+        started = time.monotonic()
+        slot = self._conversations.setdefault(conversation_id, _ConversationSlot())
+        slot.users += 1
+        try:
+            acquire = self._acquire(slot)
+            if self._queue_timeout_seconds > 0:
+                try:
+                    await asyncio.wait_for(acquire, self._queue_timeout_seconds)
+                except asyncio.TimeoutError:
+                    self._timed_out += 1
+                    raise TurnQueueTimeoutError(
+                        f"Chat turn was not admitted within {self._queue_timeout_seconds}s "
+                        f"({len(self._waiters)} turns queued)"
+                    ) from None
+            else:
+                await acquire
+
+            wait = time.monotonic() - started
+            self._record_wait(conversation_id, wait)
+            try:
+                yield wait
+            finally:
+                self._release_admission()
+                slot.lock.release()
+        finally:
+            slot.users -= 1
+            if slot.users == 0 and self._conversations.get(conversation_id) is slot:
+                del self._conversations[conversation_id]
+
+    async def _acquire(self, slot: _ConversationSlot) -> None:
+        """대화별 잠금 + 전역 승인 (취소 시 얻은 것은 반납)"""
+        self._conversation_waiting += 1
+        try:
+            await slot.lock.acquire()
+        finally:
+            self._conversation_waiting -= 1
+        try:
+            await self._admit()
+        except BaseException:
+            slot.lock.release()
+            raise
+
+    async def _admit(self) -> None:
+        """전역 승인 (슬롯이 없으면 FIFO 대기열에서 차례를 기다림)"""
+        if self._max_concurrent_turns <= 0 or (
+            self._active < self._max_concurrent_turns and not self._waiters
+        ):
+            self._active += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            # 슬롯은 반납하는 쪽이 _active를 유지한 채 넘겨줌
+            await waiter
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                # 승인과 취소가 동시에 일어난 경우 받은 슬롯을 다음 대기자에게 넘김
+                self._release_admission()
+            else:
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(waiter)
+            raise
+
+    def _release_admission(self) -> None:
+        """전역 슬롯 반납 (대기 중인 턴이 있으면 가장 먼저 온 턴에 넘김)"""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    def _record_wait(self, conversation_id: str, wait: float) -> None:
+        """승인 대기 시간 기록"""
+        self._admitted += 1
+        self._total_wait += wait
+        self._max_wait = max(self._max_wait, wait)
+        self._recent_waits.append(wait)
+        if wait >= _SLOW_ADMISSION_SECONDS:
+            logger.warning(
+                f"Chat turn waited {wait:.1f}s for admission",
+                extra={
+                    "conversation_id": conversation_id,
+                    "queued_turns": len(self._waiters),
+                    "active_turns": self._active,
+                },
+            )
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        스케줄러 통계
+
+        Returns:
+            {"max_concurrent_turns", "active_turns", "queued_turns", "conversation_waiting",
+             "admitted_turns", "timed_out_turns", "wait_ms": {"avg", "p95", "max"}}
+        """
+        recent = sorted(self._recent_waits)
+        p95 = recent[min(int(len(recent) * 0.95), len(recent) - 1)] if recent else 0.0
+        return {
+            "max_concurrent_turns": self._max_concurrent_turns,
+            "active_turns": self._active,
+            "queued_turns": sum(1 for w in self._waiters if not w.done()),
+            "conversation_waiting": self._conversation_waiting,
+            "admitted_turns": self._admitted,
+            "timed_out_turns": self._timed_out,
+            "wait_ms": {
+                "avg": round(self._total_wait / self._admitted * 1000, 1)
+                if self._admitted
+                else 0.0,
+                "p95": round(p95 * 1000, 1),
+                "max": round(self._max_wait * 1000, 1),
+            },
+        }
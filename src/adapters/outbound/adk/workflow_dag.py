@@ -0,0 +1,208 @@
+"""DagWorkflowAgent - 의존성 그래프(DAG) 기반 Workflow 실행 ADK Agent
+
+Workflow의 각 step을 sub-agent로 두고 의존성이 충족된 step부터 실행합니다.
+- 의존하는 step이 모두 끝나면 바로 시작 (레벨 단위로 기다리지 않음)
+- 독립 분기는 동시에 실행하되 max_parallelism으로 동시 실행 수 제한
+- step 최종 응답 텍스트를 output_key로 session.state에 기록 (state_delta 이벤트)
+- step 시작/완료를 custom_metadata 이벤트로 알려 실행 측이 진행 상황을 스트리밍
+- 실패한 step(error_message 이벤트)에 의존하는 step은 실행하지 않고 건너뜀
+
+sequential/parallel Workflow도 같은 엔진으로 실행합니다 (이전 step 의존 / 의존 없음).
+"""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator, Callable
+from typing import Any
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events.event import Event
+from google.adk.events.event_actions import EventActions
+from google.adk.sessions.state import State
+from google.genai import types
+from pydantic import Field
+
+# step 진행 이벤트의 custom_metadata 키 ({"step": 번호, "status": "start|complete|failed|skipped"})
+WORKFLOW_STEP_EVENT_KEY = "agenthub_workflow_step"
+
+
+def step_state_key(output_key: str, number: int) -> str:
+    """
+    step 결과를 기록할 session.state 키
+
+    output_key가 비어 있으면 현재 실행 동안만 유지되는 temp: 키를 사용해
+    의존 step에는 결과를 전달하되 세션 state에는 남기지 않습니다.
+
+    Args:
+        output_key: step의 output_key (비어 있을 수 있음)
+        number: step 번호 (1부터)
+
+    Returns:
+        state 키
+    """
+    return output_key or f"{State.TEMP_PREFIX}step_{number}"
+
+
+def _content_text(content: types.Content | None) -> str:
+    if content is None or not content.parts:
+        return ""
+    return "".join(part.text for part in content.parts if part.text)
+
+
+def step_context_builder(
+    instruction: str, input_keys: list[str]
+) -> Callable[[InvocationContext, str, Callable], tuple[list[Any], str | None]]:
+    """
+    RemoteA2aAgent context_builder - step 요청 메시지 구성
+
+    세션 전체 기록 대신 사용자 메시지 + step instruction + 의존 step 출력(output_key)만 전달합니다.
+
+    Args:
+        instruction: step 전용 instruction (비어 있으면 생략)
+        input_keys: 입력으로 전달할 의존 step의 output_key 목록
+
+    Returns:
+        (ctx, agent_name, part_converter) → (A2A 메시지 parts, context_id) 함수
+    """
+
+    def build(
+        ctx: InvocationContext, _agent_name: str, convert: Callable
+    ) -> tuple[list[Any], str | None]:
+        sections = []
+        message = _content_text(ctx.user_content)
+        if message:
+            sections.append(message)
+        if instruction:
+            sections.append(f"[Instruction]\n{instruction}")
+        for key in input_keys:
+            label = key.removeprefix(State.TEMP_PREFIX)
+            sections.append(f"[Input: {label}]\n{ctx.session.state.get(key, '')}")
+
+        converted = convert(types.Part(text="\n\n".join(sections)))
+        if converted is None:
+            return [], None
+        return (converted if isinstance(converted, list) else [converted]), None
+
+    return build
+
+
+class DagWorkflowAgent(BaseAgent):
+    """
+    의존성 그래프 기반 Workflow Agent
+
+    sub_agents[i]가 i번째 step이며 dependencies[i]는 먼저 끝나야 하는 step 인덱스 목록입니다.
+    """
+
+    dependencies: list[list[int]] = Field(default_factory=list)
+    output_keys: list[str] = Field(default_factory=list)
+    max_parallelism: int = 0  # 0이면 제한 없음
+
+    def _step_event(
+        self, ctx: InvocationContext, index: int, status: str, output: str | None = None
+    ) -> Event:
+        """step 진행 이벤트 (완료 시 output_key로 state 기록)"""
+        key = self.output_keys[index] if index < len(self.output_keys) else ""
+        state_delta = {key: output} if key and output is not None else {}
+        return Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(state_delta=state_delta),
+            custom_metadata={WORKFLOW_STEP_EVENT_KEY: {"step": index + 1, "status": status}},
+        )
+
+    def _branch_ctx(self, ctx: InvocationContext, agent: BaseAgent) -> InvocationContext:
+        """step별 격리된 branch (다른 step의 이벤트가 대화 기록에 섞이지 않도록)"""
+        branch_ctx = ctx.model_copy()
+        branch_ctx.branch = f"{ctx.branch}.{agent.name}" if ctx.branch else agent.name
+        return branch_ctx
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        steps = self.sub_agents
+        upstream = [
+            set(self.dependencies[i]) if i < len(self.dependencies) else set()
+            for i in range(len(steps))
+        ]
+        pending = list(range(len(steps)))
+        completed: set[int] = set()
+        failed: set[int] = set()
+        outputs: dict[int, list[str]] = {}
+        running: dict[int, asyncio.Task] = {}
+        # (step 인덱스, 이벤트 또는 None(종료), 재개 신호 또는 종료 시 예외)
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def run_step(index: int) -> None:
+            error: BaseException | None = None
+            try:
+                async with contextlib.aclosing(
+                    steps[index].run_async(self._branch_ctx(ctx, steps[index]))
+                ) as events:
+                    async for event in events:
+                        resume = asyncio.Event()
+                        await queue.put((index, event, resume))
+                        # 실행 측이 이벤트를 세션에 기록한 뒤 다음 이벤트 생성
+                        await resume.wait()
+            except Exception as e:
+                error = e
+            finally:
+                await queue.put((index, None, error))
+
+        def start_ready() -> list[int]:
+            started = []
+            for index in list(pending):
+                if self.max_parallelism > 0 and len(running) >= self.max_parallelism:
+                    break
+                if upstream[index] & failed:
+                    continue
+                if upstream[index] <= completed:
+                    pending.remove(index)
+                    outputs[index] = []
+                    running[index] = asyncio.create_task(run_step(index))
+                    started.append(index)
+            return started
+
+        def skip_blocked() -> list[int]:
+            skipped = [index for index in pending if upstream[index] & failed]
+            for index in skipped:
+                pending.remove(index)
+                failed.add(index)
+            return skipped
+
+        try:
+            for index in start_ready():
+                yield self._step_event(ctx, index, "start")
+
+            while running:
+                index, event, payload = await queue.get()
+                if event is not None:
+                    if event.error_message:
+                        failed.add(index)
+                    elif event.author == steps[index].name and not event.partial:
+                        text = _content_text(event.content)
+                        if text and event.is_final_response():
+                            outputs[index].append(text)
+                    yield event
+                    payload.set()
+                    continue
+
+                del running[index]
+                if isinstance(payload, BaseException):
+                    raise payload
+                if index in failed:
+                    yield self._step_event(ctx, index, "failed")
+                else:
+                    completed.add(index)
+                    yield self._step_event(ctx, index, "complete", "\n".join(outputs[index]))
+                # 실패가 전파되어 실행할 수 없게 된 step은 건너뜀 (연쇄 의존 포함)
+                while skipped := skip_blocked():
+                    for skipped_index in skipped:
+                        yield self._step_event(ctx, skipped_index, "skipped")
+                for started in start_ready():
+                    yield self._step_event(ctx, started, "start")
+        finally:
+            tasks = list(running.values())
+            for task in tasks:
+                task.cancel()
+            # 취소된 step이 A2A 스트림을 닫을 때까지 대기
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -5,6 +5,7 @@ Streamable HTTP Transport를 사용합니다.
 """
 
 import contextlib
+import logging
 import uuid
 from contextlib import AsyncExitStack
 
@@ -19,8 +20,11 @@ from src.domain.ports.outbound.mcp_client_port import (
     ElicitationCallback,
     McpClientPort,
     SamplingCallback,
+    ToolsChangedCallback,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class McpClientAdapter(McpClientPort):
     """MCP SDK 기반 클라이언트 어댑터
@@ -32,6 +36,8 @@ class McpClientAdapter(McpClientPort):
     def __init__(self) -> None:
         self._sessions: dict[str, ClientSession] = {}
         self._exit_stacks: dict[str, AsyncExitStack] = {}
+        # tools.listChanged capability를 광고한 엔드포인트
+        self._tools_list_changed: set[str] = set()
         self._is_cleaning_up: bool = False  # 중복 disconnect_all() 방지
 
     async def connect(
@@ -40,6 +46,7 @@ class McpClientAdapter(McpClientPort):
         url: str,
         sampling_callback: SamplingCallback | None = None,
         elicitation_callback: ElicitationCallback | None = None,
+        tools_changed_callback: ToolsChangedCallback | None = None,
     ) -> None:
         """MCP 서버에 연결
 
@@ -48,6 +55,7 @@ class McpClientAdapter(McpClientPort):
             url: MCP 서버 URL (Streamable HTTP)
             sampling_callback: Domain 샘플링 콜백 (optional)
             elicitation_callback: Domain Elicitation 콜백 (optional)
+            tools_changed_callback: 도구 목록 변경 알림 콜백 (optional)
         """
         # Domain 콜백 → MCP SDK 콜백 변환
         mcp_sampling_cb = None
@@ -58,6 +66,10 @@ class McpClientAdapter(McpClientPort):
         if elicitation_callback:
             mcp_elicitation_cb = self._wrap_elicitation_callback(endpoint_id, elicitation_callback)
 
+        message_handler = None
+        if tools_changed_callback:
+            message_handler = self._create_message_handler(endpoint_id, tools_changed_callback)
+
         # MCP SDK 연결 (AsyncExitStack으로 생명주기 관리)
         exit_stack = AsyncExitStack()
         read, write, _ = await exit_stack.enter_async_context(streamable_http_client(url))
@@ -67,13 +79,20 @@ class McpClientAdapter(McpClientPort):
                 write,
                 sampling_callback=mcp_sampling_cb,
                 elicitation_callback=mcp_elicitation_cb,
+                message_handler=message_handler,
             )
         )
-        await session.initialize()
+        init_result = await session.initialize()
 
         self._sessions[endpoint_id] = session
         self._exit_stacks[endpoint_id] = exit_stack
 
+        tools_capability = init_result.capabilities.tools
+        if tools_capability and tools_capability.listChanged:
+            self._tools_list_changed.add(endpoint_id)
+        else:
+            self._tools_list_changed.discard(endpoint_id)
+
     async def disconnect(self, endpoint_id: str) -> None:
         """세션 정리 (AsyncExitStack 해제)
 
@@ -91,6 +110,11 @@ class McpClientAdapter(McpClientPort):
             finally:
                 del self._exit_stacks[endpoint_id]
                 del self._sessions[endpoint_id]
+                self._tools_list_changed.discard(endpoint_id)
+
+    def supports_tools_list_changed(self, endpoint_id: str) -> bool:
+        """서버의 tools.listChanged capability 확인"""
+        return endpoint_id in self._tools_list_changed
 
     async def disconnect_all(self) -> None:
         """모든 세션 정리 (서버 종료 시)
@@ -188,6 +212,27 @@ class McpClientAdapter(McpClientPort):
             raise EndpointNotFoundError(f"Not connected: {endpoint_id}")
         return self._sessions[endpoint_id]
 
+    def _create_message_handler(
+        self, endpoint_id: str, tools_changed_callback: ToolsChangedCallback
+    ):
+        """서버 알림 핸들러 생성 (MCP SDK MessageHandlerFnT)
+
+        notifications/tools/list_changed만 Domain 콜백으로 전달합니다.
+        콜백 예외는 세션 수신 루프를 중단시키지 않도록 로깅 후 무시합니다.
+        """
+
+        async def message_handler(message) -> None:
+            if not isinstance(message, types.ServerNotification):
+                return
+            if not isinstance(message.root, types.ToolListChangedNotification):
+                return
+            try:
+                await tools_changed_callback(endpoint_id)
+            except Exception as e:
+                logger.warning(f"Tool list change handling failed for {endpoint_id}: {e}")
+
+        return message_handler
+
     def _wrap_sampling_callback(self, endpoint_id: str, domain_callback: SamplingCallback):
         """Domain 콜백을 MCP SDK SamplingFnT로 래핑
 
@@ -0,0 +1,126 @@
+"""FileToolResultStorage - 파일 기반 대용량 도구 결과 저장소"""
+
+import asyncio
+import re
+import time
+import uuid
+from pathlib import Path
+from typing import TextIO
+
+from src.domain.exceptions import ToolResultNotFoundError
+from src.domain.ports.outbound.storage_port import ToolResultStoragePort
+
+# 핸들 형식 (uuid4 hex) - 경로 조작 방지를 위해 조회 전 검증
+_HANDLE_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+# 구간 조회 시 건너뛰기/길이 계산용 읽기 단위 (문자)
+_READ_BLOCK_CHARS = 64 * 1024
+
+
+def _consume(f: TextIO, limit: int | None) -> int:
+    """블록 단위로 읽고 버린 문자 수 반환 (limit=None이면 끝까지)"""
+    consumed = 0
+    while limit is None or consumed < limit:
+        size = _READ_BLOCK_CHARS if limit is None else min(_READ_BLOCK_CHARS, limit - consumed)
+        block = f.read(size)
+        if not block:
+            break
+        consumed += len(block)
+    return consumed
+
+
+class FileToolResultStorage(ToolResultStoragePort):
+    """
+    파일 기반 도구 결과 저장소
+
+    특징:
+    - {data_dir}/tool_results/{handle}.txt에 UTF-8 텍스트로 저장
+    - asyncio.to_thread로 동기 파일 I/O 래핑
+    - 구간 조회는 파일을 스트리밍으로 읽어 전체 결과를 메모리에 올리지 않음
+    - 초기화 시, 이후에는 저장 시 최소 간격마다 보존 기간이 지난 결과 정리
+    """
+
+    def __init__(
+        self,
+        data_dir: str,
+        retention_seconds: int = 86400,
+        prune_interval_seconds: int = 300,
+    ):
+        """
+        Args:
+            data_dir: 데이터 디렉토리 경로
+            retention_seconds: 결과 보존 기간 (초)
+            prune_interval_seconds: 만료 결과 정리 최소 간격 (초, 0이면 저장마다 정리)
+        """
+        self._results_dir = Path(data_dir) / "tool_results"
+        self._retention_seconds = retention_seconds
+        self._prune_interval_seconds = prune_interval_seconds
+        self._next_prune_at = 0.0  # time.monotonic() 기준 다음 정리 시각
+
+    async def initialize(self) -> None:
+        """결과 디렉토리 생성 + 이전 실행에서 남은 만료 결과 정리"""
+
+        def _init() -> None:
+            self._results_dir.mkdir(parents=True, exist_ok=True)
+            self._prune_expired()
+
+        self._next_prune_at = time.monotonic() + self._prune_interval_seconds
+        await asyncio.to_thread(_init)
+
+    async def close(self) -> None:
+        """리소스 정리 (파일 저장소는 특별한 정리 불필요)"""
+        pass
+
+    async def save_result(self, content: str) -> str:
+        """도구 결과 저장 (정리 간격이 지났으면 만료된 결과 정리)"""
+        handle = uuid.uuid4().hex
+        # 디렉토리 전체 스캔은 간격마다 한 번만 (저장이 몰릴 때 glob + stat 반복 방지)
+        now = time.monotonic()
+        prune = now >= self._next_prune_at
+        if prune:
+            self._next_prune_at = now + self._prune_interval_seconds
+
+        def _write() -> None:
+            self._results_dir.mkdir(parents=True, exist_ok=True)
+            if prune:
+                self._prune_expired()
+            self._path(handle).write_text(content, encoding="utf-8")
+
+        await asyncio.to_thread(_write)
+        return handle
+
+    async def read_result(
+        self,
+        handle: str,
+        offset: int = 0,
+        length: int | None = None,
+    ) -> tuple[str, int]:
+        """도구 결과 구간 조회"""
+        if not _HANDLE_PATTERN.match(handle):
+            raise ToolResultNotFoundError(f"Tool result not found: {handle}")
+
+        path = self._path(handle)
+
+        def _read() -> tuple[str, int]:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    skipped = _consume(f, max(offset, 0))
+                    chunk = f.read(-1 if length is None else max(length, 0))
+                    total = skipped + len(chunk) + _consume(f, None)
+            except FileNotFoundError:
+                raise ToolResultNotFoundError(f"Tool result not found: {handle}") from None
+            return chunk, total
+
+        return await asyncio.to_thread(_read)
+
+    def _path(self, handle: str) -> Path:
+        return self._results_dir / f"{handle}.txt"
+
+    def _prune_expired(self) -> None:
+        """보존 기간이 지난 결과 파일 삭제 (to_thread 내부에서 호출)"""
+        cutoff = time.time() - self._retention_seconds
+        for path in self._results_dir.glob("*.txt"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except FileNotFoundError:
+                continue
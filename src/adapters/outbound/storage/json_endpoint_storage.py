@@ -8,7 +8,7 @@ import json
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from src.domain.entities.endpoint import EndpointStatus, EndpointType
+from src.domain.entities.endpoint import EndpointStatus, EndpointType, McpTransport
 from src.domain.ports.outbound.storage_port import EndpointStoragePort
 
 if TYPE_CHECKING:
@@ -153,6 +153,7 @@ class JsonEndpointStorage(EndpointStoragePort):
                 for tool in endpoint.tools
             ],
             "agent_card": endpoint.agent_card,  # dict | None → JSON 호환
+            "transport": endpoint.transport.value if endpoint.transport else None,
         }
 
     def _deserialize_endpoint(self, data: dict) -> "Endpoint":
@@ -184,6 +185,7 @@ class JsonEndpointStorage(EndpointStoragePort):
             registered_at=datetime.fromisoformat(data["registered_at"]),  # ISO str → datetime
             tools=tools,
             agent_card=data.get("agent_card"),  # 기존 데이터 하위 호환 (None default)
+            transport=McpTransport(data["transport"]) if data.get("transport") else None,
         )
 
         return endpoint
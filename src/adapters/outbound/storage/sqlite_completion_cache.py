@@ -0,0 +1,149 @@
+"""SQLite LLM Completion Cache - 단일 LLM 응답 캐시"""
+
+import asyncio
+import json
+import time
+from typing import Any
+
+import aiosqlite
+
+from src.domain.ports.outbound.storage_port import CompletionCachePort
+
+
+class SqliteCompletionCache(CompletionCachePort):
+    """
+    SQLite 기반 LLM 응답 캐시
+
+    특징:
+    - 재시작 후에도 유지 ({data_dir}/llm_cache.db)
+    - TTL이 지난 항목은 조회 시 무시하고 저장 시 정리
+    - 항목 수가 max_entries를 넘으면 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+    - max_entries=0이면 캐시 비활성화 (조회는 항상 miss, 저장은 무시)
+    """
+
+    def __init__(self, db_path: str, ttl_seconds: float = 3600.0, max_entries: int = 1000):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            ttl_seconds: 항목 유효 기간 (초)
+            max_entries: 최대 항목 수 (0이면 비활성화)
+        """
+        self._db_path = db_path
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._connection: aiosqlite.Connection | None = None
+        self._write_lock = asyncio.Lock()
+        self._initialized = False
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """캐시 사용 여부"""
+        return self._max_entries > 0
+
+    async def initialize(self) -> None:
+        """데이터베이스 초기화 (테이블 생성 + WAL 모드, 비활성화 상태면 생략)"""
+        if self._initialized or not self.enabled:
+            return
+
+        conn = await self._get_connection()
+        await conn.execute("PRAGMA journal_mode=WAL")
+        await conn.execute("PRAGMA busy_timeout=5000")
+        await conn.execute("""
+            CREATE TABLE IF NOT EXISTS completion_cache (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used_at REAL NOT NULL
+            )
+        """)
+        # LRU 제거를 위한 인덱스
+        await conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_completion_cache_last_used
+            ON completion_cache(last_used_at)
+        """)
+        await conn.commit()
+        self._initialized = True
+
+    async def _get_connection(self) -> aiosqlite.Connection:
+        """싱글톤 연결 반환"""
+        if self._connection is None:
+            self._connection = await aiosqlite.connect(self._db_path)
+        return self._connection
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """캐시된 응답 조회 (hit 시 최근 사용 시각 갱신)"""
+        if not self.enabled:
+            return None
+        await self.initialize()
+
+        conn = await self._get_connection()
+        now = time.time()
+        async with conn.execute(
+            "SELECT response FROM completion_cache WHERE key = ? AND created_at > ?",
+            (key, now - self._ttl_seconds),
+        ) as cursor:
+            row = await cursor.fetchone()
+
+        if row is None:
+            self._misses += 1
+            return None
+
+        async with self._write_lock:
+            await conn.execute(
+                "UPDATE completion_cache SET last_used_at = ? WHERE key = ?", (now, key)
+            )
+            await conn.commit()
+        self._hits += 1
+        return json.loads(row[0])
+
+    async def put(self, key: str, response: dict[str, Any]) -> None:
+        """응답 저장 + 만료/초과 항목 정리"""
+        if not self.enabled:
+            return
+        await self.initialize()
+
+        conn = await self._get_connection()
+        now = time.time()
+        async with self._write_lock:
+            await conn.execute(
+                """INSERT OR REPLACE INTO completion_cache (key, response, created_at, last_used_at)
+                   VALUES (?, ?, ?, ?)""",
+                (key, json.dumps(response, ensure_ascii=False), now, now),
+            )
+            await conn.execute(
+                "DELETE FROM completion_cache WHERE created_at <= ?",
+                (now - self._ttl_seconds,),
+            )
+            await conn.execute(
+                """DELETE FROM completion_cache WHERE key IN (
+                       SELECT key FROM completion_cache
+                       ORDER BY last_used_at DESC LIMIT -1 OFFSET ?
+                   )""",
+                (self._max_entries,),
+            )
+            await conn.commit()
+
+    async def get_stats(self) -> dict[str, Any]:
+        """캐시 통계 (항목 수, hit/miss 횟수)"""
+        entries = 0
+        if self.enabled:
+            await self.initialize()
+            conn = await self._get_connection()
+            async with conn.execute("SELECT COUNT(*) FROM completion_cache") as cursor:
+                entries = (await cursor.fetchone())[0]
+        return {
+            "enabled": self.enabled,
+            "entries": entries,
+            "max_entries": self._max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+    async def close(self) -> None:
+        """연결 종료"""
+        if self._connection:
+            await self._connection.close()
+            self._connection = None
+            self._initialized = False
@@ -43,10 +43,21 @@ class SqliteUsageStorage(UsageStoragePort):
                 completion_tokens INTEGER NOT NULL,
                 total_tokens INTEGER NOT NULL,
                 cost_usd REAL NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                cache_hit INTEGER NOT NULL DEFAULT 0,
+                cached_tokens INTEGER NOT NULL DEFAULT 0
             )
         """)
 
+        # 기존 DB 마이그레이션 (cache_hit, cached_tokens 컬럼 추가)
+        async with conn.execute("PRAGMA table_info(usage)") as cursor:
+            columns = {row["name"] for row in await cursor.fetchall()}
+        for column in ("cache_hit", "cached_tokens"):
+            if column not in columns:
+                await conn.execute(
+                    f"ALTER TABLE usage ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0"
+                )
+
         # 월별 조회를 위한 인덱스
         await conn.execute("""
             CREATE INDEX IF NOT EXISTS idx_usage_created_at
@@ -74,8 +85,8 @@ class SqliteUsageStorage(UsageStoragePort):
         async with self._write_lock:
             conn = await self._get_connection()
             await conn.execute(
-                """INSERT INTO usage (model, prompt_tokens, completion_tokens, total_tokens, cost_usd, created_at)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
+                """INSERT INTO usage (model, prompt_tokens, completion_tokens, total_tokens, cost_usd, created_at, cache_hit, cached_tokens)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
                 (
                     usage.model,
                     usage.prompt_tokens,
@@ -83,6 +94,8 @@ class SqliteUsageStorage(UsageStoragePort):
                     usage.total_tokens,
                     usage.cost_usd,
                     usage.created_at.isoformat(),
+                    int(usage.cache_hit),
+                    usage.cached_tokens,
                 ),
             )
             await conn.commit()
@@ -124,12 +137,14 @@ class SqliteUsageStorage(UsageStoragePort):
         """기간별 사용량 요약"""
         conn = await self._get_connection()
 
-        # 총 비용, 총 토큰, 호출 횟수
+        # 총 비용, 총 토큰, 호출 횟수, 캐시 hit 횟수, 프롬프트 캐시 토큰
         async with conn.execute(
             """SELECT
                    SUM(cost_usd) as total_cost,
                    SUM(total_tokens) as total_tokens,
-                   COUNT(*) as call_count
+                   COUNT(*) as call_count,
+                   SUM(cache_hit) as cache_hits,
+                   SUM(cached_tokens) as cached_tokens
                FROM usage
                WHERE created_at >= ? AND created_at <= ?""",
             (start_date.isoformat(), end_date.isoformat()),
@@ -138,6 +153,8 @@ class SqliteUsageStorage(UsageStoragePort):
             total_cost = row["total_cost"] if row["total_cost"] is not None else 0.0
             total_tokens = row["total_tokens"] if row["total_tokens"] is not None else 0
             call_count = row["call_count"]
+            cache_hits = row["cache_hits"] if row["cache_hits"] is not None else 0
+            cached_tokens = row["cached_tokens"] if row["cached_tokens"] is not None else 0
 
         # 모델별 비용
         by_model = await self.get_usage_by_model(start_date, end_date)
@@ -146,6 +163,8 @@ class SqliteUsageStorage(UsageStoragePort):
             "total_cost": total_cost,
             "total_tokens": total_tokens,
             "call_count": call_count,
+            "cache_hits": cache_hits,
+            "cached_tokens": cached_tokens,
             "by_model": by_model,
         }
 
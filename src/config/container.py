@@ -16,11 +16,18 @@ from dependency_injector import containers, providers
 from src.adapters.outbound.a2a.a2a_client_adapter import A2aClientAdapter
 from src.adapters.outbound.adk.dynamic_toolset import DynamicToolset
 from src.adapters.outbound.adk.gateway_toolset import GatewayToolset
+from src.adapters.outbound.adk.llm_rate_limiter import LlmRateLimiter
+from src.adapters.outbound.adk.llm_router import LlmDeploymentRouter
+from src.adapters.outbound.adk.model_cascade import ModelCascade
 from src.adapters.outbound.adk.orchestrator_adapter import AdkOrchestratorAdapter
+from src.adapters.outbound.adk.sqlite_session_service import SqliteSessionService
+from src.adapters.outbound.adk.turn_scheduler import TurnScheduler
 from src.adapters.outbound.mcp.mcp_client_adapter import McpClientAdapter
 from src.adapters.outbound.sse.broker import SseBroker
 from src.adapters.outbound.sse.hitl_notification_adapter import HitlNotificationAdapter
+from src.adapters.outbound.storage.file_tool_result_storage import FileToolResultStorage
 from src.adapters.outbound.storage.json_endpoint_storage import JsonEndpointStorage
+from src.adapters.outbound.storage.sqlite_completion_cache import SqliteCompletionCache
 from src.adapters.outbound.storage.sqlite_conversation_storage import (
     SqliteConversationStorage,
 )
@@ -65,6 +72,28 @@ class Container(containers.DeclarativeContainer):
         db_path=providers.Callable(lambda s: f"{s.storage.data_dir}/usage.db", settings),
     )
 
+    session_service = providers.Singleton(
+        SqliteSessionService,
+        db_path=providers.Callable(lambda s: f"{s.storage.data_dir}/sessions.db", settings),
+        max_cached_sessions=settings.provided.storage.session_cache_size,
+        flush_interval_seconds=settings.provided.storage.session_flush_interval_seconds,
+        flush_batch_size=settings.provided.storage.session_flush_batch_size,
+    )
+
+    completion_cache = providers.Singleton(
+        SqliteCompletionCache,
+        db_path=providers.Callable(lambda s: f"{s.storage.data_dir}/llm_cache.db", settings),
+        ttl_seconds=settings.provided.llm.completion_cache_ttl_seconds,
+        max_entries=settings.provided.llm.completion_cache_max_entries,
+    )
+
+    tool_result_storage = providers.Singleton(
+        FileToolResultStorage,
+        data_dir=settings.provided.storage.data_dir,
+        retention_seconds=settings.provided.mcp.tool_result_retention_seconds,
+        prune_interval_seconds=settings.provided.mcp.tool_result_prune_interval_seconds,
+    )
+
     # ADK Adapters
     dynamic_toolset = providers.Singleton(
         DynamicToolset,
@@ -87,11 +116,67 @@ class Container(containers.DeclarativeContainer):
         gateway_service=gateway_service,
     )
 
+    # Cost Service (Phase 6 Part A Step 3)
+    cost_service = providers.Factory(
+        CostService,
+        usage_port=usage_storage,
+        monthly_budget_usd=settings.provided.cost.monthly_budget_usd,
+    )
+
+    llm_router = providers.Singleton(
+        LlmDeploymentRouter,
+        deployments=settings.provided.llm.deployments,
+        ewma_alpha=settings.provided.llm.deployment_ewma_alpha,
+        cooldown_seconds=settings.provided.llm.deployment_cooldown_seconds,
+    )
+
+    model_cascade = providers.Singleton(
+        ModelCascade,
+        cascade_model=settings.provided.llm.cascade_model,
+        max_tool_depth=settings.provided.llm.cascade_max_tool_depth,
+        max_output_chars=settings.provided.llm.cascade_max_output_chars,
+        uncertainty_marker=settings.provided.llm.cascade_uncertainty_marker,
+    )
+
+    turn_scheduler = providers.Singleton(
+        TurnScheduler,
+        max_concurrent_turns=settings.provided.llm.max_concurrent_turns,
+        queue_timeout_seconds=settings.provided.llm.turn_queue_timeout_seconds,
+    )
+
+    llm_rate_limiter = providers.Singleton(
+        LlmRateLimiter,
+        limits=settings.provided.llm.rate_limits,
+        max_retries=settings.provided.llm.rate_limit_max_retries,
+        backoff_seconds=settings.provided.llm.rate_limit_backoff_seconds,
+    )
+
     orchestrator_adapter = providers.Singleton(
         AdkOrchestratorAdapter,
         model=settings.provided.llm.default_model,
         dynamic_toolset=gateway_toolset,  # ⚠️ GatewayToolset으로 교체 (LLM 보호)
         enable_llm_logging=settings.provided.observability.log_llm_requests,
+        stream_tokens=settings.provided.llm.stream_tokens,
+        max_connections=settings.provided.llm.max_connections,
+        max_keepalive_connections=settings.provided.llm.max_keepalive_connections,
+        request_timeout=settings.provided.llm.timeout,
+        completion_cache=completion_cache,
+        usage_storage=usage_storage,
+        context_max_tokens=settings.provided.llm.context_max_tokens,
+        context_keep_recent_turns=settings.provided.llm.context_keep_recent_turns,
+        summary_model=settings.provided.llm.summary_model,
+        prompt_caching=settings.provided.llm.prompt_caching,
+        cost_service=cost_service,
+        llm_router=llm_router,
+        model_cascade=model_cascade,
+        turn_scheduler=turn_scheduler,
+        rate_limiter=llm_rate_limiter,
+        workflow_max_parallelism=settings.provided.workflow.max_parallelism,
+        workflow_cache_size=settings.provided.workflow.compiled_cache_size,
+        session_service=session_service,
+        tool_result_storage=tool_result_storage,
+        tool_result_spill_chars=settings.provided.mcp.tool_result_spill_chars,
+        tool_result_preview_chars=settings.provided.mcp.tool_result_preview_chars,
     )
 
     # A2A Adapter
@@ -162,10 +247,3 @@ class Container(containers.DeclarativeContainer):
         a2a_client=a2a_client_adapter,
         check_interval_seconds=settings.provided.health_check.interval_seconds,
     )
-
-    # Cost Service (Phase 6 Part A Step 3)
-    cost_service = providers.Factory(
-        CostService,
-        usage_port=usage_storage,
-        monthly_budget_usd=settings.provided.cost.monthly_budget_usd,
-    )
@@ -4,8 +4,9 @@
 """
 
 import warnings
+from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from pydantic_settings import (
     BaseSettings,
     PydanticBaseSettingsSource,
@@ -26,6 +27,44 @@ class LLMSettings(BaseModel):
 
     default_model: str = "openai/gpt-4o-mini"
     timeout: int = 120
+    # 토큰 단위 스트리밍: 최종 응답을 기다리지 않고 모델 출력 조각을 text 청크로 즉시 전달
+    stream_tokens: bool = False
+    # LLM HTTP 연결 풀 (litellm.acompletion 공용 클라이언트, 요청 타임아웃은 timeout 사용)
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    # generate_response() 응답 캐시 ({data_dir}/llm_cache.db, 0이면 비활성화)
+    completion_cache_max_entries: int = 1000
+    completion_cache_ttl_seconds: float = 3600.0
+    # 대화 기록 토큰 예산: 초과 시 최근 N개 턴만 유지하고 이전 턴은 요약으로 대체
+    # (기본 0 = 비활성화, 켜면 오래된 턴 원문 대신 요약을 보내고 요약 모델 호출이 추가됨)
+    context_max_tokens: int = 0
+    context_keep_recent_turns: int = 6
+    summary_model: str = ""  # 요약 모델 (비어 있으면 default_model)
+    # 프롬프트 캐싱: instruction + 도구 선언 prefix에 프로바이더 캐시 힌트 지정
+    prompt_caching: bool = True
+    # 배포 풀: 논리 모델 이름 → 동등한 배포(LiteLLM 호출 파라미터) 목록
+    # EWMA 지연 + rate limit 여유분으로 선택, 429/5xx 시 cooldown 동안 제외하고 다음 배포로 장애 조치
+    # (api_key는 "os.environ/VAR" 형식으로 환경 변수 참조 가능)
+    deployments: dict[str, list[dict[str, Any]]] = {}
+    deployment_ewma_alpha: float = 0.3
+    deployment_cooldown_seconds: float = 30.0
+    # 모델 캐스케이드: 각 턴을 cascade_model로 먼저 실행하고 조건 발생 시 default_model로 승격
+    # (cascade_model이 비어 있으면 비활성화, 각 조건은 0/빈 값이면 비활성화)
+    # stream_tokens와 함께 쓰면 소형 모델 응답은 완성 후 전달 (승격된 기본 모델 응답만 스트리밍)
+    cascade_model: str = ""
+    cascade_max_tool_depth: int = 2  # 턴 내 도구 호출 왕복 수
+    cascade_max_output_chars: int = 4000  # 소형 모델 응답 길이
+    cascade_uncertainty_marker: str = "[ESCALATE]"  # 소형 모델이 불확실할 때 응답할 마커
+    # 턴 스케줄링: 같은 대화의 턴은 순서대로 실행 + 전체 동시 실행 턴 수 제한 (FIFO 대기)
+    max_concurrent_turns: int = 16  # 0이면 제한 없음
+    turn_queue_timeout_seconds: float = 0.0  # 최대 대기 시간 (0이면 무기한 대기)
+    # 전역 LLM rate limit: 모델 → {"rpm": 분당 요청 수, "tpm": 분당 토큰 수}
+    # ("*"는 설정에 없는 모델에 적용, 0/누락이면 제한 없음, 배포 풀은 논리 모델 이름 기준)
+    rate_limits: dict[str, dict[str, int]] = {}
+    rate_limit_max_retries: int = 3  # 429 재시도 횟수 (Retry-After 헤더 우선)
+    rate_limit_backoff_seconds: float = (
+        1.0  # Retry-After가 없을 때 backoff 시작 값 (연속 429마다 2배)
+    )
 
 
 class StorageSettings(BaseModel):
@@ -33,6 +72,10 @@ class StorageSettings(BaseModel):
 
     data_dir: str = "./data"
     database: str = "agenthub.db"
+    # ADK 세션 저장소 ({data_dir}/sessions.db): 최근 사용 세션만 메모리에 유지 + 이벤트 배치 기록
+    session_cache_size: int = 256
+    session_flush_interval_seconds: float = 0.5
+    session_flush_batch_size: int = 100  # 대기 중인 쓰기가 이 수를 넘으면 주기 전에 기록
 
 
 class HealthCheckSettings(BaseModel):
@@ -42,19 +85,72 @@ class HealthCheckSettings(BaseModel):
     timeout_seconds: int = 5
 
 
+# 제거된 도구 수 기준 MCP 설정 → 대체 토큰 기준 설정
+_LEGACY_MCP_KEYS = {
+    "max_active_tools": "max_tool_definition_tokens",
+    "defer_loading_threshold": "defer_loading_token_threshold",
+}
+
+
 class McpSettings(BaseModel):
     """MCP 설정"""
 
-    max_active_tools: int = 100  # Step 11: 30 → 100
-    defer_loading_threshold: int = 30  # Step 11: Defer loading 활성화 기준
+    # 도구 정의(name + description + JSON 스키마) 토큰 예산 (모델 토크나이저 기준)
+    max_tool_definition_tokens: int = 30000  # 초과 시 서버 등록 거부
+    defer_loading_token_threshold: int = 9000  # 초과 시 Defer loading (도구당 ~300토큰 x 30개)
     cache_ttl_seconds: int = 300
+    # 도구 캐시 갱신: 엔드포인트별 병렬 갱신 (동시 갱신 수 제한 + 엔드포인트별 타임아웃)
+    max_concurrent_refreshes: int = 8
+    refresh_timeout_seconds: float = 10.0
+    # Stale-while-revalidate: 만료 캐시를 즉시 반환하고 백그라운드에서 갱신
+    stale_while_revalidate: bool = False
+    max_staleness_seconds: int = 900  # 이 시간을 넘긴 캐시는 동기 갱신
+    refresh_jitter_ratio: float = 0.1  # TTL을 최대 10%까지 줄여 만료 시점 분산
+    # tools/list_changed 알림 지원 서버의 TTL (알림으로 무효화되므로 긴 안전망)
+    list_changed_ttl_seconds: int = 3600
+    # 관련도 기반 도구 선택: defer_loading_token_threshold 초과 시 사용자 메시지와 관련된 top-k만 노출
+    relevance_selection: bool = False
+    relevance_top_k: int = 15
+    pinned_tools: list[str] = Field(default_factory=list)  # 항상 노출할 도구 이름
+    # 연결: Streamable HTTP/SSE 동시 probing 타임아웃 (도구 호출 타임아웃과 별도)
+    probe_timeout_seconds: float = 10.0
+    call_timeout_seconds: float = 120.0
     max_retries: int = 2
     retry_backoff_seconds: float = 1.0
+    # 도구 실행: 엔드포인트별 동시 실행 제한 + CPU 집약적 도구만 스레드 오프로드 (명시적 opt-in)
+    max_concurrent_calls_per_endpoint: int = 10
+    thread_offload_tools: list[str] = Field(default_factory=list)
+    # 도구 결과 캐시: readOnlyHint/idempotentHint 도구 또는 지정 엔드포인트 도구의 결과를 LRU 캐싱
+    result_cache_max_bytes: int = 16 * 1024 * 1024  # 메모리 상한 (0이면 비활성화)
+    result_cache_ttl_seconds: float = 60.0
+    # 도구별 TTL 재정의 (0이면 캐싱 제외)
+    result_cache_tool_ttls: dict[str, float] = Field(default_factory=dict)
+    result_cache_endpoints: list[str] = Field(default_factory=list)  # 전체 도구 캐싱 (ID 또는 URL)
+    # 대용량 도구 결과: 임계값 초과 시 파일로 분리하고 LLM/SSE에는 미리보기 + 핸들만 전달
+    tool_result_spill_chars: int = 20000  # 0이면 비활성화
+    tool_result_preview_chars: int = 2000
+    tool_result_retention_seconds: int = 86400
+    tool_result_prune_interval_seconds: int = 300  # 만료 결과 정리 최소 간격 (저장마다 스캔 방지)
     # Phase 5: Dual-Track (ADK + SDK) 활성화 여부
     # False: ADK Track만 사용 (안전, anyio cancel scope 충돌 방지)
     # True: SDK Track 추가 연결 (Resources/Prompts/HITL, 세션 충돌 위험)
     enable_dual_track: bool = False
 
+    @model_validator(mode="before")
+    @classmethod
+    def warn_if_legacy_tool_limits(cls, data: Any) -> Any:
+        """도구 수 기준 설정(제거됨) 사용 시 경고 - 값은 무시되므로 토큰 기준 설정으로 안내"""
+        if isinstance(data, dict):
+            for legacy, replacement in _LEGACY_MCP_KEYS.items():
+                if legacy in data:
+                    warnings.warn(
+                        f"mcp.{legacy} is no longer supported and is ignored; "
+                        f"use mcp.{replacement} (tool definition tokens) instead.",
+                        FutureWarning,
+                        stacklevel=2,
+                    )
+        return data
+
 
 class ObservabilitySettings(BaseModel):
     """관찰성 설정 (Step 5-7: Part B)"""
@@ -74,6 +170,13 @@ class GatewaySettings(BaseModel):
     fallback_enabled: bool = True  # Fallback 서버 전환 활성화
 
 
+class WorkflowSettings(BaseModel):
+    """Workflow 실행 설정"""
+
+    max_parallelism: int = 4  # 동시 실행 step 수 (Workflow에 지정이 없을 때, 0이면 제한 없음)
+    compiled_cache_size: int = 32  # 정의 해시별로 보관할 컴파일된 Workflow Agent/Runner 수
+
+
 class CostSettings(BaseModel):
     """비용 추적 설정 (Phase 6 Part A Step 3)"""
 
@@ -101,6 +204,7 @@ class Settings(BaseSettings):
     observability: ObservabilitySettings = Field(default_factory=ObservabilitySettings)
     gateway: GatewaySettings = Field(default_factory=GatewaySettings)
     cost: CostSettings = Field(default_factory=CostSettings)
+    workflow: WorkflowSettings = Field(default_factory=WorkflowSettings)
 
     # Phase 1: DEV_MODE support
     dev_mode: bool = False  # DEV_MODE=true 시 개발 모드 활성화
@@ -14,6 +14,7 @@ class ErrorCode:
     # LLM 관련 에러
     LLM_RATE_LIMIT = "LlmRateLimitError"
     LLM_AUTHENTICATION = "LlmAuthenticationError"
+    TURN_QUEUE_TIMEOUT = "TurnQueueTimeoutError"
 
     # Endpoint 관련 에러
     ENDPOINT_CONNECTION = "EndpointConnectionError"
@@ -22,6 +23,7 @@ class ErrorCode:
 
     # Tool 관련 에러
     TOOL_NOT_FOUND = "ToolNotFoundError"
+    TOOL_RESULT_NOT_FOUND = "ToolResultNotFoundError"
 
     # Conversation 관련 에러
     CONVERSATION_NOT_FOUND = "ConversationNotFoundError"
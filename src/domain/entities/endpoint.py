@@ -9,7 +9,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
-from src.domain.entities.enums import EndpointStatus, EndpointType
+from src.domain.entities.enums import EndpointStatus, EndpointType, McpTransport
 from src.domain.exceptions import InvalidUrlError
 
 if TYPE_CHECKING:
@@ -37,6 +37,7 @@ class Endpoint:
         agent_card: A2A Agent Card 정보 (A2A only)
         auth_config: 인증 설정 (선택적, MCP 서버용)
         fallback_url: Fallback 서버 URL (선택적, Circuit Breaker OPEN 시 전환)
+        transport: 확인된 MCP 전송 방식 (MCP only, 미확인 시 None)
 
     Example:
         >>> endpoint = Endpoint(
@@ -59,6 +60,7 @@ class Endpoint:
     agent_card: dict[str, Any] | None = None
     auth_config: "AuthConfig | None" = None
     fallback_url: str | None = None
+    transport: McpTransport | None = None
 
     def __post_init__(self) -> None:
         """생성 후 URL 유효성 검증 및 이름 자동 설정"""
@@ -38,6 +38,20 @@ class EndpointType(str, Enum):
     A2A = "a2a"
 
 
+class McpTransport(str, Enum):
+    """MCP 전송 방식
+
+    등록 시 probing으로 확인한 전송 방식을 기록해 재시작 시 바로 연결합니다.
+
+    Attributes:
+        STREAMABLE_HTTP: Streamable HTTP (2025-03 이후 권장)
+        SSE: 레거시 HTTP+SSE
+    """
+
+    STREAMABLE_HTTP = "streamable_http"
+    SSE = "sse"
+
+
 class EndpointStatus(str, Enum):
     """엔드포인트 연결 상태
 
@@ -22,7 +22,8 @@ class StreamChunk:
         content: 텍스트 콘텐츠 (type="text", "error")
         tool_name: 도구 이름 (type="tool_call", "tool_result")
         tool_arguments: 도구 인자 dict (type="tool_call")
-        result: 도구 실행 결과 (type="tool_result")
+        result: 도구 실행 결과 (type="tool_result", 대용량 결과는 미리보기)
+        result_url: 대용량 결과 전체 조회 URL (type="tool_result", 분리 저장된 경우만)
         agent_name: 에이전트 이름 (type="agent_transfer", "workflow_step_start", "workflow_step_complete")
         error_code: 에러 코드 (type="error")
         workflow_id: 워크플로우 ID (workflow events)
@@ -37,6 +38,7 @@ class StreamChunk:
     tool_name: str = ""
     tool_arguments: dict[str, Any] = field(default_factory=dict)
     result: str = ""
+    result_url: str = ""
     agent_name: str = ""
     error_code: str = ""
     # Workflow-related fields
@@ -57,9 +59,9 @@ class StreamChunk:
         return StreamChunk(type="tool_call", tool_name=name, tool_arguments=arguments)
 
     @staticmethod
-    def tool_result(name: str, result: str) -> "StreamChunk":
-        """도구 결과 청크 생성"""
-        return StreamChunk(type="tool_result", tool_name=name, result=result)
+    def tool_result(name: str, result: str, result_url: str = "") -> "StreamChunk":
+        """도구 결과 청크 생성 (result_url: 분리 저장된 대용량 결과 조회 URL)"""
+        return StreamChunk(type="tool_result", tool_name=name, result=result, result_url=result_url)
 
     @staticmethod
     def agent_transfer(agent_name: str) -> "StreamChunk":
@@ -50,6 +50,8 @@ class Usage:
     total_tokens: int  # 총 토큰 수
     cost_usd: float  # 비용 (USD)
     created_at: datetime = field(default_factory=datetime.now)  # 생성 시간
+    cache_hit: bool = False  # 응답 캐시 hit 여부 (hit은 비용 0으로 기록)
+    cached_tokens: int = 0  # 프롬프트 캐시에서 읽은 입력 토큰 수 (prompt_tokens에 포함)
 
     def __post_init__(self):
         """검증 로직 (dataclass 초기화 후 실행)"""
@@ -60,6 +62,8 @@ class Usage:
             raise ValueError("completion_tokens must be non-negative")
         if self.total_tokens < 0:
             raise ValueError("total_tokens must be non-negative")
+        if not 0 <= self.cached_tokens <= self.prompt_tokens:
+            raise ValueError("cached_tokens must be between 0 and prompt_tokens")
 
         # 비용 검증 (음수 불가)
         if self.cost_usd < 0:
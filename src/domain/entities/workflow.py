@@ -4,13 +4,19 @@ Workflow domain entities
 Pure Python dataclasses representing multi-step agent workflows.
 No external dependencies (ADK, FastAPI, etc.) - Domain Layer purity.
 
-A Workflow defines a sequence of agent execution steps, where each step
+A Workflow defines a set of agent execution steps, where each step
 invokes a registered A2A agent endpoint with optional state sharing.
+Steps form a dependency graph (DAG): a step runs once the steps it depends on
+have finished, and receives their outputs through their output_key.
 """
 
-from dataclasses import dataclass, field
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 
+WORKFLOW_TYPES = ("sequential", "parallel", "dag")
+
 
 @dataclass
 class WorkflowStep:
@@ -20,12 +26,16 @@ class WorkflowStep:
     Attributes:
         agent_endpoint_id: ID of the registered A2A agent endpoint
         output_key: Key to store this step's result in session.state
+            (unique per workflow; may be empty except for "dag", in which case
+            the result is still passed to the steps that depend on this one)
         instruction: Optional step-specific instruction override
+        depends_on: output_keys of the steps this step waits for ("dag" only)
     """
 
     agent_endpoint_id: str
     output_key: str
     instruction: str = ""
+    depends_on: list[str] = field(default_factory=list)
 
 
 @dataclass
@@ -33,21 +43,96 @@ class Workflow:
     """
     Multi-step Agent Workflow definition
 
-    Represents a sequence of agent invocations that can be executed
-    either sequentially (SequentialAgent) or in parallel (ParallelAgent).
+    Represents agent invocations executed as a dependency graph:
+    - "sequential": each step depends on the previous step
+    - "parallel": no dependencies (all steps run concurrently)
+    - "dag": dependencies declared per step via depends_on
 
     Attributes:
         id: Unique workflow identifier
         name: Human-readable workflow name
-        workflow_type: Execution strategy ("sequential" | "parallel")
+        workflow_type: Execution strategy ("sequential" | "parallel" | "dag")
         steps: Ordered list of WorkflowStep to execute
         description: Optional workflow description
+        max_parallelism: Maximum steps running at once (0 = server default)
         created_at: Timestamp when workflow was created
     """
 
     id: str
     name: str
-    workflow_type: str  # "sequential" | "parallel"
+    workflow_type: str  # "sequential" | "parallel" | "dag"
     steps: list[WorkflowStep]
     description: str = ""
+    max_parallelism: int = 0
     created_at: datetime = field(default_factory=datetime.utcnow)
+
+    def step_dependencies(self) -> list[list[int]]:
+        """
+        Resolve the upstream step indexes of every step
+
+        Returns:
+            Upstream step indexes per step (same order as steps)
+
+        Raises:
+            ValueError: Unknown workflow_type, duplicate output_key, or
+                ("dag" only) missing/unknown output_key reference or a dependency cycle
+        """
+        if self.workflow_type not in WORKFLOW_TYPES:
+            raise ValueError(f"Invalid workflow_type: {self.workflow_type}")
+        seen: set[str] = set()
+        for step in self.steps:
+            if step.output_key in seen:
+                raise ValueError(f"Duplicate output_key: {step.output_key}")
+            if step.output_key:
+                seen.add(step.output_key)
+        if self.workflow_type == "sequential":
+            return [[index - 1] if index else [] for index in range(len(self.steps))]
+        if self.workflow_type == "parallel":
+            return [[] for _ in self.steps]
+
+        indexes: dict[str, int] = {}
+        for index, step in enumerate(self.steps):
+            if not step.output_key:
+                raise ValueError(f"DAG step {index + 1} requires an output_key")
+            indexes[step.output_key] = index
+
+        dependencies: list[list[int]] = []
+        for step in self.steps:
+            unknown = [key for key in step.depends_on if key not in indexes]
+            if unknown:
+                raise ValueError(f"Step {step.output_key} depends on unknown steps: {unknown}")
+            dependencies.append(sorted({indexes[key] for key in step.depends_on}))
+
+        # Kahn's algorithm: every step must become ready exactly once
+        pending = [len(upstream) for upstream in dependencies]
+        ready = [index for index, count in enumerate(pending) if count == 0]
+        visited = 0
+        while ready:
+            current = ready.pop()
+            visited += 1
+            for index, upstream in enumerate(dependencies):
+                if current in upstream:
+                    pending[index] -= 1
+                    if pending[index] == 0:
+                        ready.append(index)
+        if visited != len(self.steps):
+            raise ValueError("Workflow steps contain a dependency cycle")
+        return dependencies
+
+    def definition_hash(self) -> str:
+        """
+        SHA-256 of the execution definition (type, steps, parallelism)
+
+        Identity fields (id, name, description, created_at) are excluded,
+        so workflows with the same definition share a compiled agent.
+        """
+        payload = json.dumps(
+            {
+                "workflow_type": self.workflow_type,
+                "max_parallelism": self.max_parallelism,
+                "steps": [asdict(step) for step in self.steps],
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -71,6 +71,13 @@ class ToolNotFoundError(DomainException):
         super().__init__(message, code=ErrorCode.TOOL_NOT_FOUND)
 
 
+class ToolResultNotFoundError(DomainException):
+    """분리 저장된 도구 결과를 찾을 수 없음 (잘못된 핸들 또는 보존 기간 만료)"""
+
+    def __init__(self, message: str):
+        super().__init__(message, code=ErrorCode.TOOL_RESULT_NOT_FOUND)
+
+
 class ToolExecutionError(DomainException):
     """도구 실행 실패"""
 
@@ -109,6 +116,13 @@ class LlmAuthenticationError(DomainException):
         super().__init__(message, code=ErrorCode.LLM_AUTHENTICATION)
 
 
+class TurnQueueTimeoutError(DomainException):
+    """채팅 턴이 대기 시간 안에 실행 승인되지 않음 (동시 실행 턴 수 초과)"""
+
+    def __init__(self, message: str):
+        super().__init__(message, code=ErrorCode.TURN_QUEUE_TIMEOUT)
+
+
 # ============================================================
 # Conversation 관련 예외
 # ============================================================
@@ -29,6 +29,8 @@ class ChatPort(ABC):
         self,
         conversation_id: str | None,
         message: str,
+        page_context: dict | None = None,
+        escalate: bool = False,
     ) -> AsyncIterator[StreamChunk]:
         """
         메시지 전송 및 스트리밍 응답
@@ -39,6 +41,8 @@ class ChatPort(ABC):
         Args:
             conversation_id: 대화 ID (None이면 새 대화 생성)
             message: 사용자 메시지
+            page_context: 페이지 컨텍스트 (optional)
+            escalate: 모델 캐스케이드 사용 시 처음부터 기본 모델로 응답
 
         Yields:
             StreamChunk 이벤트 (text, tool_call, tool_result, agent_transfer, error, done)
@@ -41,6 +41,12 @@ class ElicitationCallback(Protocol):
     ) -> dict[str, Any]: ...
 
 
+class ToolsChangedCallback(Protocol):
+    """도구 목록 변경 알림 콜백 프로토콜 (notifications/tools/list_changed)"""
+
+    async def __call__(self, endpoint_id: str) -> None: ...
+
+
 class McpClientPort(ABC):
     """MCP SDK 기반 클라이언트 포트 - Resources/Prompts/HITL용
 
@@ -54,6 +60,7 @@ class McpClientPort(ABC):
         url: str,
         sampling_callback: SamplingCallback | None = None,
         elicitation_callback: ElicitationCallback | None = None,
+        tools_changed_callback: ToolsChangedCallback | None = None,
     ) -> None:
         """MCP 서버에 연결
 
@@ -62,6 +69,19 @@ class McpClientPort(ABC):
             url: MCP 서버 URL
             sampling_callback: Sampling HITL 콜백 (선택)
             elicitation_callback: Elicitation HITL 콜백 (선택)
+            tools_changed_callback: 도구 목록 변경 알림 콜백 (선택)
+        """
+        pass
+
+    @abstractmethod
+    def supports_tools_list_changed(self, endpoint_id: str) -> bool:
+        """서버가 도구 목록 변경 알림(tools.listChanged)을 지원하는지 확인
+
+        Args:
+            endpoint_id: 엔드포인트 ID
+
+        Returns:
+            initialize 응답의 tools.listChanged capability (미연결 시 False)
         """
         pass
 
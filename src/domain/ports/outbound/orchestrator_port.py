@@ -38,6 +38,8 @@ class OrchestratorPort(ABC):
         self,
         message: str,
         conversation_id: str,
+        page_context: dict | None = None,
+        escalate: bool = False,
     ) -> AsyncIterator[StreamChunk]:
         """
         메시지 처리 및 스트리밍 응답 반환
@@ -48,6 +50,9 @@ class OrchestratorPort(ABC):
         Args:
             message: 사용자 메시지
             conversation_id: 대화 세션 ID
+            page_context: 페이지 컨텍스트 (optional)
+            escalate: 모델 캐스케이드 사용 시 처음부터 기본 모델로 응답
+                (구현체가 캐스케이드를 지원하는 경우)
 
         Yields:
             StreamChunk 이벤트 (text, tool_call, tool_result, agent_transfer, error, done)
@@ -59,13 +64,16 @@ class OrchestratorPort(ABC):
         pass
 
     @abstractmethod
-    async def add_a2a_agent(self, endpoint_id: str, url: str) -> None:
+    async def add_a2a_agent(
+        self, endpoint_id: str, url: str, agent_card: dict[str, Any] | None = None
+    ) -> None:
         """
         A2A 에이전트를 LLM sub_agents에 추가
 
         Args:
             endpoint_id: 엔드포인트 ID
             url: A2A 에이전트 URL
+            agent_card: 이미 조회한 Agent Card (있으면 재조회 없이 사용)
         """
         pass
 
@@ -79,16 +87,33 @@ class OrchestratorPort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def update_a2a_agents(
+        self,
+        add: dict[str, str] | None = None,
+        remove: list[str] | None = None,
+        agent_cards: dict[str, dict[str, Any]] | None = None,
+    ) -> None:
+        """
+        여러 A2A 에이전트 추가/제거를 한 번에 적용 (LLM 재구성 1회)
+
+        Args:
+            add: 추가할 에이전트 {endpoint_id: url}
+            remove: 제거할 엔드포인트 ID 목록
+            agent_cards: 이미 조회한 Agent Card {endpoint_id: agent_card}
+        """
+        pass
+
     @abstractmethod
     async def create_workflow_agent(self, workflow: Workflow) -> None:
         """
-        Workflow Agent 생성 (SequentialAgent 또는 ParallelAgent)
+        Workflow Agent 생성 (sequential/parallel/dag 의존성 그래프)
 
         Args:
             workflow: Workflow 엔티티 (id, type, steps)
 
         Raises:
-            ValueError: workflow_type이 "sequential" 또는 "parallel"이 아닌 경우
+            ValueError: workflow_type이 유효하지 않거나 의존성 그래프가 잘못된 경우
         """
         pass
 
@@ -133,6 +158,7 @@ class OrchestratorPort(ABC):
         model: str | None = None,
         system_prompt: str | None = None,
         max_tokens: int = 1024,
+        use_cache: bool = True,
     ) -> dict[str, Any]:
         """단일 LLM 응답 생성 (Sampling 콜백용)
 
@@ -145,12 +171,34 @@ class OrchestratorPort(ABC):
             model: 모델 이름 (None이면 기본 모델)
             system_prompt: 시스템 프롬프트 (선택)
             max_tokens: 최대 토큰 수
+            use_cache: 응답 캐시 사용 여부 (구현체가 캐시를 지원하는 경우)
 
         Returns:
             {"role": "assistant", "content": "...", "model": "..."}
         """
         pass
 
+    @abstractmethod
+    def stream_response(
+        self,
+        messages: list[dict[str, Any]],
+        model: str | None = None,
+        system_prompt: str | None = None,
+        max_tokens: int = 1024,
+    ) -> AsyncIterator[str]:
+        """단일 LLM 응답을 텍스트 조각 단위로 스트리밍 (generate_response의 스트리밍 버전)
+
+        Args:
+            messages: LLM 메시지 목록 [{"role": "user", "content": "..."}]
+            model: 모델 이름 (None이면 기본 모델)
+            system_prompt: 시스템 프롬프트 (선택)
+            max_tokens: 최대 토큰 수
+
+        Yields:
+            응답 텍스트 조각
+        """
+        pass
+
     @abstractmethod
     async def close(self) -> None:
         """
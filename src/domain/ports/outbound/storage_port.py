@@ -4,7 +4,7 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from src.domain.entities.conversation import Conversation
@@ -248,3 +248,88 @@ class EndpointStoragePort(ABC):
             갱신 성공 여부
         """
         pass
+
+
+class ToolResultStoragePort(ABC):
+    """
+    대용량 도구 결과 저장소 포트
+
+    임계값을 넘는 도구 결과를 LLM 컨텍스트/SSE 대신 별도 저장소에 보관하고,
+    핸들로 일부 구간을 조회하는 인터페이스입니다.
+
+    구현체 예시:
+    - FileToolResultStorage (파일 기반)
+    - FakeToolResultStorage (테스트용)
+    """
+
+    @abstractmethod
+    async def save_result(self, content: str) -> str:  # pragma: no cover
+        """
+        도구 결과 저장
+
+        Args:
+            content: 직렬화된 도구 결과 전체
+
+        Returns:
+            결과 핸들 (조회 시 사용)
+        """
+        pass
+
+    @abstractmethod
+    async def read_result(  # pragma: no cover
+        self,
+        handle: str,
+        offset: int = 0,
+        length: int | None = None,
+    ) -> tuple[str, int]:
+        """
+        도구 결과 구간 조회
+
+        Args:
+            handle: save_result()가 반환한 핸들
+            offset: 시작 위치 (문자 단위)
+            length: 최대 문자 수 (None이면 끝까지)
+
+        Returns:
+            (조회한 구간, 전체 문자 수)
+
+        Raises:
+            ToolResultNotFoundError: 핸들이 없거나 보존 기간이 지남
+        """
+        pass
+
+
+class CompletionCachePort(ABC):
+    """
+    LLM 응답 캐시 포트
+
+    같은 요청(모델/메시지/시스템 프롬프트/파라미터)의 단일 LLM 응답을 재사용하기 위한
+    키-값 저장소 인터페이스입니다. 키 생성은 호출 측이 담당합니다.
+
+    구현체 예시:
+    - SqliteCompletionCache (SQLite, TTL + 항목 수 제한)
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> dict[str, Any] | None:  # pragma: no cover
+        """
+        캐시된 응답 조회
+
+        Args:
+            key: 요청 해시
+
+        Returns:
+            캐시된 응답 (없거나 만료되면 None)
+        """
+        pass
+
+    @abstractmethod
+    async def put(self, key: str, response: dict[str, Any]) -> None:  # pragma: no cover
+        """
+        응답 저장 (같은 키가 있으면 덮어씀)
+
+        Args:
+            key: 요청 해시
+            response: JSON 직렬화 가능한 응답
+        """
+        pass
@@ -29,6 +29,7 @@ class ToolsetPort(ABC):
         MCP 서버 추가 및 도구 조회
 
         MCP 서버에 연결하고 사용 가능한 도구 목록을 반환합니다.
+        연결된 전송 방식은 endpoint.transport에 기록합니다.
 
         Args:
             endpoint: MCP 엔드포인트
@@ -100,6 +101,31 @@ class ToolsetPort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def handle_tools_list_changed(self, endpoint_id: str) -> None:
+        """
+        도구 목록 변경 알림 처리
+
+        해당 엔드포인트의 도구 캐시만 무효화/갱신합니다.
+
+        Args:
+            endpoint_id: 알림을 보낸 엔드포인트 ID
+        """
+        pass
+
+    @abstractmethod
+    def set_tools_list_changed_support(self, endpoint_id: str, supported: bool) -> None:
+        """
+        엔드포인트의 도구 목록 변경 알림 지원 여부 설정
+
+        알림을 지원하는 서버는 긴 TTL(안전망)만 적용합니다.
+
+        Args:
+            endpoint_id: 엔드포인트 ID
+            supported: tools.listChanged capability 여부
+        """
+        pass
+
     @abstractmethod
     async def close(self) -> None:
         """
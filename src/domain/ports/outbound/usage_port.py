@@ -43,6 +43,8 @@ class UsageStoragePort(ABC):
                 "total_cost": float,
                 "total_tokens": int,
                 "call_count": int,
+                "cache_hits": int,
+                "cached_tokens": int,
                 "by_model": dict,
             }
         """
@@ -120,6 +120,7 @@ class ConversationService:
         conversation_id: str | None,
         content: str,
         page_context: dict | None = None,  # Phase 5 Part C
+        escalate: bool = False,
     ) -> AsyncIterator[StreamChunk]:
         """
         메시지 전송 및 스트리밍 응답
@@ -131,6 +132,7 @@ class ConversationService:
             conversation_id: 대화 ID 또는 None
             content: 사용자 메시지 내용
             page_context: 페이지 컨텍스트 (Phase 5 Part C, optional)
+            escalate: 모델 캐스케이드 사용 시 처음부터 기본 모델로 응답
 
         Yields:
             StreamChunk 이벤트
@@ -154,15 +156,17 @@ class ConversationService:
         await self._storage.save_conversation(conversation)
 
         # LLM 응답 스트리밍 (Phase 5 Part C: page_context 전달)
-        response_chunks: list[StreamChunk] = []
+        # 토큰 스트리밍 시 청크가 많으므로 text 조각만 모아 두고 완료 후 한 번만 저장
+        text_parts: list[str] = []
         async for chunk in self._orchestrator.process_message(
-            content, conversation.id, page_context=page_context
+            content, conversation.id, page_context=page_context, escalate=escalate
         ):
-            response_chunks.append(chunk)
+            if chunk.type == "text":
+                text_parts.append(chunk.content)
             yield chunk
 
         # 어시스턴트 응답 저장 (text 타입만 축적)
-        full_response = "".join(c.content for c in response_chunks if c.type == "text")
+        full_response = "".join(text_parts)
         assistant_message = Message.assistant(full_response, conversation.id)
         conversation.add_message(assistant_message)
         await self._storage.save_message(assistant_message)
@@ -90,6 +90,8 @@ class CostService:
                 "total_cost": float,
                 "total_tokens": int,
                 "call_count": int,
+                "cache_hits": int,
+                "cached_tokens": int,
                 "by_model": dict[str, float],
             }
         """
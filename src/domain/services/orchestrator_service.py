@@ -34,6 +34,7 @@ class OrchestratorService(ChatPort):
         conversation_id: str | None,
         message: str,
         page_context: dict | None = None,  # Phase 5 Part C
+        escalate: bool = False,
     ) -> AsyncIterator[StreamChunk]:
         """
         메시지 전송 및 스트리밍 응답
@@ -44,12 +45,13 @@ class OrchestratorService(ChatPort):
             conversation_id: 대화 ID 또는 None
             message: 사용자 메시지
             page_context: 페이지 컨텍스트 (Phase 5 Part C, optional)
+            escalate: 모델 캐스케이드 사용 시 처음부터 기본 모델로 응답
 
         Yields:
             StreamChunk 이벤트
         """
         async for chunk in self._conversation_service.send_message(
-            conversation_id, message, page_context=page_context
+            conversation_id, message, page_context=page_context, escalate=escalate
         ):
             yield chunk
 
@@ -4,6 +4,7 @@
 """
 
 import logging
+from typing import Any
 
 from src.domain.entities.auth_config import AuthConfig
 from src.domain.entities.elicitation_request import ElicitationAction, ElicitationRequest
@@ -160,7 +161,16 @@ class RegistryService:
                 try:
                     sampling_cb = self._create_sampling_callback(endpoint.id)
                     elicitation_cb = self._create_elicitation_callback(endpoint.id)
-                    await self._mcp_client.connect(endpoint.id, url, sampling_cb, elicitation_cb)
+                    await self._mcp_client.connect(
+                        endpoint.id,
+                        url,
+                        sampling_cb,
+                        elicitation_cb,
+                        tools_changed_callback=self._toolset.handle_tools_list_changed,
+                    )
+                    self._toolset.set_tools_list_changed_support(
+                        endpoint.id, self._mcp_client.supports_tools_list_changed(endpoint.id)
+                    )
                     logger.info(f"MCP endpoint {endpoint.id} connected: ADK Track + SDK Track")
                 except Exception as e:
                     logger.warning(f"SDK Track connection failed for {endpoint.id}: {e}")
@@ -177,7 +187,7 @@ class RegistryService:
 
             # LLM에 A2A 에이전트 연결 (orchestrator가 있는 경우만)
             if self._orchestrator:
-                await self._orchestrator.add_a2a_agent(endpoint.id, url)
+                await self._orchestrator.add_a2a_agent(endpoint.id, url, agent_card)
 
         # 저장
         await self._storage.save_endpoint(endpoint)
@@ -334,12 +344,19 @@ class RegistryService:
         endpoints = await self._storage.list_endpoints()
         restored: list[str] = []
         failed: list[str] = []
+        # A2A 에이전트는 모아서 한 번에 LLM에 연결 (에이전트마다 재구성하지 않음)
+        a2a_agents: dict[str, str] = {}
+        a2a_cards: dict[str, dict[str, Any]] = {}  # 조회한 Agent Card 재사용
 
         for endpoint in endpoints:
             try:
                 if endpoint.type == EndpointType.MCP:
-                    # ADK Track 재연결 (기존)
+                    # ADK Track 재연결 (기록된 전송 방식으로 바로 연결)
+                    recorded_transport = endpoint.transport
                     await self._toolset.add_mcp_server(endpoint)
+                    if endpoint.transport != recorded_transport:
+                        # 최초 probing 또는 서버 전송 방식 변경 → 다음 재시작을 위해 저장
+                        await self._storage.save_endpoint(endpoint)
 
                     # SDK Track 재연결 (M1 신규 - Phase 5)
                     if self._mcp_client:
@@ -347,7 +364,15 @@ class RegistryService:
                             sampling_cb = self._create_sampling_callback(endpoint.id)
                             elicitation_cb = self._create_elicitation_callback(endpoint.id)
                             await self._mcp_client.connect(
-                                endpoint.id, endpoint.url, sampling_cb, elicitation_cb
+                                endpoint.id,
+                                endpoint.url,
+                                sampling_cb,
+                                elicitation_cb,
+                                tools_changed_callback=self._toolset.handle_tools_list_changed,
+                            )
+                            self._toolset.set_tools_list_changed_support(
+                                endpoint.id,
+                                self._mcp_client.supports_tools_list_changed(endpoint.id),
                             )
                         except Exception as e:
                             logger.warning(f"SDK Track restoration failed for {endpoint.id}: {e}")
@@ -360,8 +385,8 @@ class RegistryService:
                     if self._a2a_client and self._orchestrator:
                         agent_card = await self._a2a_client.register_agent(endpoint)
                         endpoint.agent_card = agent_card
-                        await self._orchestrator.add_a2a_agent(endpoint.id, endpoint.url)
-                        restored.append(endpoint.url)
+                        a2a_agents[endpoint.id] = endpoint.url
+                        a2a_cards[endpoint.id] = agent_card
                     else:
                         logger.warning(
                             f"A2A endpoint {endpoint.url} skipped: "
@@ -373,6 +398,14 @@ class RegistryService:
                 logger.warning(f"Failed to restore endpoint {endpoint.url}: {e}")
                 failed.append(endpoint.url)
 
+        if a2a_agents and self._orchestrator:
+            try:
+                await self._orchestrator.update_a2a_agents(add=a2a_agents, agent_cards=a2a_cards)
+                restored.extend(a2a_agents.values())
+            except Exception as e:
+                logger.warning(f"Failed to restore A2A agents: {e}")
+                failed.extend(a2a_agents.values())
+
         logger.info(f"Endpoints restored: {len(restored)}, failed: {len(failed)}")
         return {"restored": restored, "failed": failed}
 
@@ -25,7 +25,7 @@ class TestLlmRateLimitRetry:
         Then: Exponential Backoff으로 재시도 후 성공
         """
         # Given: Mock LLM API (처음 2번 실패, 3번째 성공)
-        with patch("litellm.completion") as mock_llm:
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_llm:
             mock_llm.side_effect = [
                 RateLimitError(
                     message="Rate limit exceeded", llm_provider="openai", model="gpt-4o-mini"
@@ -66,7 +66,7 @@ class TestLlmRateLimitRetry:
         Then: LlmRateLimitError 발생
         """
         # Given: Mock LLM API (계속 실패)
-        with patch("litellm.completion") as mock_llm:
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_llm:
             mock_llm.side_effect = RateLimitError(
                 message="Rate limit exceeded", llm_provider="openai", model="gpt-4o-mini"
             )
@@ -94,7 +94,7 @@ class TestLlmRateLimitRetry:
         Then: Exponential Backoff 지연 시간 증가 (1s, 2s, 4s)
         """
         # Given: Mock LLM API
-        with patch("litellm.completion") as mock_llm:
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_llm:
             mock_llm.side_effect = [
                 RateLimitError(
                     message="Rate limit exceeded", llm_provider="openai", model="gpt-4o-mini"
@@ -132,6 +132,8 @@ async def authenticated_client(temp_data_dir: Path) -> AsyncIterator[TestClient]
 
     # CRITICAL FIX: db_path가 올바른 temp_data_dir을 가리키도록 storage를 재생성
     # Callable provider는 lazy evaluation이 아니므로 명시적으로 오버라이드 필요
+    from src.adapters.outbound.adk.sqlite_session_service import SqliteSessionService
+    from src.adapters.outbound.storage.sqlite_completion_cache import SqliteCompletionCache
     from src.adapters.outbound.storage.sqlite_conversation_storage import (
         SqliteConversationStorage,
     )
@@ -145,6 +147,12 @@ async def authenticated_client(temp_data_dir: Path) -> AsyncIterator[TestClient]
         providers.Singleton(SqliteConversationStorage, db_path=conv_db_path)
     )
     container.usage_storage.override(providers.Singleton(SqliteUsageStorage, db_path=usage_db_path))
+    container.session_service.override(
+        providers.Singleton(SqliteSessionService, db_path=str(temp_data_dir / "sessions.db"))
+    )
+    container.completion_cache.override(
+        providers.Singleton(SqliteCompletionCache, db_path=str(temp_data_dir / "llm_cache.db"))
+    )
 
     # Context manager로 lifespan 트리거
     with TestClient(app) as test_client:
@@ -171,6 +179,8 @@ async def authenticated_client(temp_data_dir: Path) -> AsyncIterator[TestClient]
     # Cleanup
     container.conversation_storage.reset_override()
     container.usage_storage.reset_override()
+    container.session_service.reset_override()
+    container.completion_cache.reset_override()
     container.reset_singletons()
     container.unwire()
 
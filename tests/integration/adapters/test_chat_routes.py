@@ -244,3 +244,23 @@ class TestChatStreamingGET:
 
         # Then: 422 Unprocessable Entity
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+class TestTurnQueue:
+    """GET /api/chat/queue 턴 대기열 상태"""
+
+    async def test_turn_queue_stats(self, authenticated_client):
+        """
+        Given: 실행 중인 턴 없음
+        When: GET /api/chat/queue 호출
+        Then: 200 OK + 대기열 비어 있음
+        """
+        # When
+        response = authenticated_client.get("/api/chat/queue")
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["active_turns"] == 0
+        assert data["queued_turns"] == 0
+        assert set(data["wait_ms"]) == {"avg", "p95", "max"}
@@ -21,7 +21,6 @@ def dynamic_toolset():
     """DynamicToolset 인스턴스 (캐시 TTL 1초로 설정)"""
     settings = Settings()
     settings.mcp = McpSettings(
-        max_active_tools=30,
         cache_ttl_seconds=1,  # 테스트용 짧은 TTL
         max_retries=2,
         retry_backoff_seconds=1.0,
@@ -212,8 +211,8 @@ class TestDynamicToolsetContextExplosion:
     """Context Explosion 방지 검증"""
 
     async def test_tool_limit_exceeded(self, dynamic_toolset):
-        """도구 개수 제한 초과 시 에러"""
-        # Given: 30개 도구 추가
+        """도구 정의 토큰 예산 초과 시 에러"""
+        # Given: 30개 도구 추가 후 현재 합계를 예산으로 설정
         mock_toolset = AsyncMock()
         mock_tools = [
             MagicMock(name=f"tool_{i}", description="", input_schema={}) for i in range(30)
@@ -226,8 +225,10 @@ class TestDynamicToolsetContextExplosion:
         ):
             endpoint1 = Endpoint(url="http://localhost:9000/mcp", type=EndpointType.MCP)
             await dynamic_toolset.add_mcp_server(endpoint1)
+            budget = sum(dynamic_toolset.get_tool_definition_tokens().values())
+            dynamic_toolset._settings.mcp.max_tool_definition_tokens = budget
 
-            # When: 1개 도구를 더 추가 시도 (총 31개)
+            # When: 1개 도구를 더 추가 시도 (예산 초과)
             endpoint2 = Endpoint(url="http://localhost:9001/mcp", type=EndpointType.MCP)
             mock_toolset2 = AsyncMock()
             mock_toolset2.get_tools = AsyncMock(return_value=[MagicMock(name="tool_31")])
@@ -241,7 +242,7 @@ class TestDynamicToolsetContextExplosion:
                 with pytest.raises(ToolLimitExceededError) as exc_info:
                     await dynamic_toolset.add_mcp_server(endpoint2)
 
-                assert "exceed limit (30)" in str(exc_info.value)
+                assert f"exceed budget ({budget})" in str(exc_info.value)
                 mock_toolset2.close.assert_called_once()
 
 
@@ -259,9 +260,15 @@ class TestDynamicToolsetCleanup:
         mock_toolset2.get_tools = AsyncMock(return_value=[])
         mock_toolset2.close = AsyncMock()
 
+        # 전송 방식 probing은 URL당 MCPToolset을 여러 개 만들 수 있으므로 URL로 구분
+        toolsets_by_url = {
+            "http://localhost:9000/mcp": mock_toolset1,
+            "http://localhost:9001/mcp": mock_toolset2,
+        }
+
         with patch(
             "src.adapters.outbound.adk.dynamic_toolset.MCPToolset",
-            side_effect=[mock_toolset1, mock_toolset2],
+            side_effect=lambda connection_params: toolsets_by_url[connection_params.url],
         ):
             endpoint1 = Endpoint(url="http://localhost:9000/mcp", type=EndpointType.MCP)
             endpoint2 = Endpoint(url="http://localhost:9001/mcp", type=EndpointType.MCP)
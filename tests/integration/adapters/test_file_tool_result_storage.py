@@ -0,0 +1,129 @@
+"""FileToolResultStorage 통합 테스트"""
+
+import os
+import time
+
+import pytest
+
+from src.adapters.outbound.storage.file_tool_result_storage import FileToolResultStorage
+from src.domain.exceptions import ToolResultNotFoundError
+
+
+@pytest.fixture
+async def storage(temp_data_dir):
+    """임시 디렉토리 기반 저장소"""
+    storage = FileToolResultStorage(data_dir=str(temp_data_dir))
+    await storage.initialize()
+    yield storage
+    await storage.close()
+
+
+class TestFileToolResultStorage:
+    """파일 기반 도구 결과 저장소"""
+
+    async def test_save_and_read_full_result(self, storage):
+        """
+        Given: 저장된 결과 (멀티바이트 문자 포함)
+        When: 구간 지정 없이 조회
+        Then: 전체 내용 + 문자 단위 전체 길이
+        """
+        content = "결과" * 1000 + "end"
+        handle = await storage.save_result(content)
+
+        chunk, total = await storage.read_result(handle)
+
+        assert chunk == content
+        assert total == len(content)
+
+    async def test_read_page_by_character_offset(self, storage):
+        """
+        Given: 블록 크기보다 큰 저장 결과
+        When: offset/length로 조회
+        Then: 해당 문자 구간만 반환 + 전체 길이 유지
+        """
+        content = "".join(chr(0xAC00 + i % 100) for i in range(200_000))
+        handle = await storage.save_result(content)
+
+        chunk, total = await storage.read_result(handle, offset=150_000, length=10)
+
+        assert chunk == content[150_000:150_010]
+        assert total == 200_000
+
+    async def test_read_past_end_returns_empty(self, storage):
+        """
+        Given: 저장된 결과
+        When: 전체 길이를 넘는 offset으로 조회
+        Then: 빈 구간 + 전체 길이
+        """
+        handle = await storage.save_result("abc")
+
+        assert await storage.read_result(handle, offset=10, length=5) == ("", 3)
+
+    @pytest.mark.parametrize("handle", ["../endpoints", "0" * 32, "not-a-handle"])
+    async def test_unknown_or_invalid_handle_raises(self, storage, handle):
+        """
+        Given: 존재하지 않거나 형식이 잘못된 핸들 (경로 조작 포함)
+        When: read_result() 호출
+        Then: ToolResultNotFoundError
+        """
+        with pytest.raises(ToolResultNotFoundError):
+            await storage.read_result(handle)
+
+    async def test_expired_results_pruned_on_save(self, temp_data_dir):
+        """
+        Given: 보존 기간이 지난 결과 파일 (정리 간격 0)
+        When: 새 결과 저장
+        Then: 만료된 결과는 삭제되어 조회 불가
+        """
+        storage = FileToolResultStorage(
+            data_dir=str(temp_data_dir), retention_seconds=60, prune_interval_seconds=0
+        )
+        await storage.initialize()
+        old_handle = await storage.save_result("old")
+        old_path = temp_data_dir / "tool_results" / f"{old_handle}.txt"
+        past = time.time() - 120
+        os.utime(old_path, (past, past))
+
+        new_handle = await storage.save_result("new")
+
+        with pytest.raises(ToolResultNotFoundError):
+            await storage.read_result(old_handle)
+        assert await storage.read_result(new_handle) == ("new", 3)
+
+    async def test_save_within_prune_interval_skips_scan(self, temp_data_dir):
+        """
+        Given: 정리 간격이 지나지 않은 저장소와 만료된 결과 파일
+        When: 새 결과 저장
+        Then: 디렉토리를 다시 스캔하지 않아 만료 파일이 남아 있음
+        """
+        storage = FileToolResultStorage(
+            data_dir=str(temp_data_dir), retention_seconds=60, prune_interval_seconds=3600
+        )
+        await storage.initialize()
+        old_handle = await storage.save_result("old")
+        past = time.time() - 120
+        os.utime(temp_data_dir / "tool_results" / f"{old_handle}.txt", (past, past))
+
+        await storage.save_result("new")
+
+        assert await storage.read_result(old_handle) == ("old", 3)
+
+    async def test_expired_results_pruned_on_initialize(self, temp_data_dir):
+        """
+        Given: 이전 실행에서 남은 만료 결과 파일
+        When: 새 저장소 initialize()
+        Then: 저장 없이도 만료된 결과가 삭제됨
+        """
+        results_dir = temp_data_dir / "tool_results"
+        results_dir.mkdir()
+        old_path = results_dir / f"{'a' * 32}.txt"
+        old_path.write_text("old", encoding="utf-8")
+        past = time.time() - 120
+        os.utime(old_path, (past, past))
+
+        storage = FileToolResultStorage(
+            data_dir=str(temp_data_dir), retention_seconds=60, prune_interval_seconds=3600
+        )
+        await storage.initialize()
+
+        assert not old_path.exists()
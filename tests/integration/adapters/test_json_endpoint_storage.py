@@ -9,7 +9,7 @@ import json
 import pytest
 
 from src.adapters.outbound.storage.json_endpoint_storage import JsonEndpointStorage
-from src.domain.entities.endpoint import Endpoint, EndpointStatus, EndpointType
+from src.domain.entities.endpoint import Endpoint, EndpointStatus, EndpointType, McpTransport
 
 
 @pytest.fixture
@@ -297,6 +297,20 @@ class TestJsonEndpointStorageA2A:
         assert retrieved.type == EndpointType.MCP
         assert retrieved.agent_card is None
 
+    async def test_mcp_transport_round_trip(self, storage, sample_endpoint):
+        """
+        Given: probing으로 전송 방식이 확인된 MCP Endpoint
+        When: 저장 후 조회하면
+        Then: transport가 유지됨 (재시작 시 probing 생략)
+        """
+        sample_endpoint.transport = McpTransport.SSE
+
+        await storage.save_endpoint(sample_endpoint)
+        retrieved = await storage.get_endpoint(sample_endpoint.id)
+
+        assert retrieved is not None
+        assert retrieved.transport == McpTransport.SSE
+
     async def test_json_file_format(self, tmp_path, sample_endpoint):
         """JSON 파일 형식 검증"""
         # Given: 엔드포인트 저장
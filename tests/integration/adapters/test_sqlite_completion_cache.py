@@ -0,0 +1,104 @@
+"""SqliteCompletionCache 통합 테스트
+
+TTL 만료, 항목 수 제한(LRU), 비활성화, 재시작 후 유지 검증
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.adapters.outbound.storage.sqlite_completion_cache import SqliteCompletionCache
+
+RESPONSE = {"role": "assistant", "content": "cached", "model": "openai/gpt-4o-mini"}
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> str:
+    return str(tmp_path / "llm_cache.db")
+
+
+@pytest.fixture
+async def cache(db_path: str):
+    cache = SqliteCompletionCache(db_path, ttl_seconds=60, max_entries=2)
+    yield cache
+    await cache.close()
+
+
+class TestSqliteCompletionCache:
+    """SqliteCompletionCache 기본 동작"""
+
+    async def test_put_and_get(self, cache):
+        """
+        Given: 저장된 응답
+        When: 같은 키 / 없는 키 조회
+        Then: 같은 키는 응답 반환, 없는 키는 None + hit/miss 통계 반영
+        """
+        await cache.put("k1", RESPONSE)
+
+        assert await cache.get("k1") == RESPONSE
+        assert await cache.get("missing") is None
+        stats = await cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+    async def test_expired_entry_is_miss(self, cache):
+        """
+        Given: TTL 60초로 저장된 응답
+        When: 61초 후 조회
+        Then: None
+        """
+        with patch("src.adapters.outbound.storage.sqlite_completion_cache.time.time") as now:
+            now.return_value = 1000.0
+            await cache.put("k1", RESPONSE)
+            now.return_value = 1061.0
+
+            assert await cache.get("k1") is None
+
+    async def test_max_entries_evicts_least_recently_used(self, cache):
+        """
+        Given: max_entries=2, k1/k2 저장 후 k1 조회
+        When: k3 저장
+        Then: 가장 오래 사용하지 않은 k2가 제거됨
+        """
+        with patch("src.adapters.outbound.storage.sqlite_completion_cache.time.time") as now:
+            now.return_value = 1000.0
+            await cache.put("k1", RESPONSE)
+            now.return_value = 1001.0
+            await cache.put("k2", RESPONSE)
+            now.return_value = 1002.0
+            await cache.get("k1")
+            now.return_value = 1003.0
+            await cache.put("k3", RESPONSE)
+
+            assert await cache.get("k2") is None
+            assert await cache.get("k1") == RESPONSE
+            assert await cache.get("k3") == RESPONSE
+
+    async def test_survives_restart(self, cache, db_path):
+        """
+        Given: 저장 후 close()
+        When: 새 인스턴스에서 조회
+        Then: 응답 유지
+        """
+        await cache.put("k1", RESPONSE)
+        await cache.close()
+
+        restarted = SqliteCompletionCache(db_path)
+        try:
+            assert await restarted.get("k1") == RESPONSE
+        finally:
+            await restarted.close()
+
+    async def test_zero_max_entries_disables_cache(self, db_path):
+        """
+        Given: max_entries=0
+        When: 저장 후 조회
+        Then: 항상 miss + DB 파일 생성 안 함
+        """
+        cache = SqliteCompletionCache(db_path, max_entries=0)
+
+        await cache.put("k1", RESPONSE)
+
+        assert await cache.get("k1") is None
+        assert not Path(db_path).exists()
+        await cache.close()
@@ -0,0 +1,211 @@
+"""SqliteSessionService 통합 테스트
+
+write-behind 배치 기록, lazy load, LRU 캐시, 재시작 후 컨텍스트 유지 검증
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from google.adk.errors.already_exists_error import AlreadyExistsError
+from google.adk.events.event import Event
+from google.adk.events.event_actions import EventActions
+from google.adk.sessions.base_session_service import GetSessionConfig
+from google.genai import types
+
+from src.adapters.outbound.adk.sqlite_session_service import SqliteSessionService
+
+APP = "agenthub"
+USER = "default_user"
+
+
+def _event(text: str, state_delta: dict | None = None) -> Event:
+    return Event(
+        author="user",
+        content=types.Content(role="user", parts=[types.Part(text=text)]),
+        actions=EventActions(state_delta=state_delta or {}),
+    )
+
+
+def _texts(session) -> list[str]:
+    return [e.content.parts[0].text for e in session.events]
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> str:
+    return str(tmp_path / "sessions.db")
+
+
+@pytest.fixture
+async def service(db_path: str):
+    # 주기 기록이 테스트 중 끼어들지 않도록 긴 주기 사용 (flush는 명시적으로 호출)
+    service = SqliteSessionService(db_path, max_cached_sessions=2, flush_interval_seconds=60)
+    yield service
+    await service.close()
+
+
+class TestSqliteSessionService:
+    """SqliteSessionService 기본 동작"""
+
+    async def test_context_survives_restart(self, service, db_path):
+        """
+        Given: 이벤트와 state가 추가된 세션
+        When: close() 후 새 인스턴스에서 get_session()
+        Then: 이벤트 순서와 state가 그대로 복원됨
+        """
+        session = await service.create_session(app_name=APP, user_id=USER, session_id="conv-1")
+        await service.append_event(session, _event("hello", {"topic": "adk"}))
+        await service.append_event(session, _event("world"))
+        await service.close()
+
+        restarted = SqliteSessionService(db_path)
+        try:
+            loaded = await restarted.get_session(app_name=APP, user_id=USER, session_id="conv-1")
+        finally:
+            await restarted.close()
+
+        assert _texts(loaded) == ["hello", "world"]
+        assert loaded.state["topic"] == "adk"
+
+    async def test_append_event_is_write_behind(self, service, db_path):
+        """
+        Given: 세션에 이벤트 추가 (flush 전)
+        When: 다른 인스턴스에서 조회 → flush() 후 다시 조회
+        Then: flush 전에는 DB에 없고, flush 후에는 반영됨
+        """
+        session = await service.create_session(app_name=APP, user_id=USER, session_id="conv-1")
+        await service.append_event(session, _event("hello"))
+        assert service.get_cache_stats()["pending_events"] == 1
+
+        reader = SqliteSessionService(db_path)
+        try:
+            before = await reader.get_session(app_name=APP, user_id=USER, session_id="conv-1")
+            await service.flush()
+            reader._sessions.clear()
+            after = await reader.get_session(app_name=APP, user_id=USER, session_id="conv-1")
+        finally:
+            await reader.close()
+
+        assert _texts(before) == []
+        assert _texts(after) == ["hello"]
+        assert service.get_cache_stats()["pending_events"] == 0
+
+    async def test_batch_size_triggers_background_flush(self, db_path):
+        """
+        Given: flush_batch_size=2
+        When: 이벤트 2개 추가 후 백그라운드 기록 대기
+        Then: 주기를 기다리지 않고 기록됨
+        """
+        service = SqliteSessionService(db_path, flush_interval_seconds=60, flush_batch_size=2)
+        try:
+            session = await service.create_session(app_name=APP, user_id=USER, session_id="c")
+            await service.append_event(session, _event("a"))
+            await service.append_event(session, _event("b"))
+            for _ in range(50):
+                if service.get_cache_stats()["pending_events"] == 0:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert service.get_cache_stats()["pending_events"] == 0
+        finally:
+            await service.close()
+
+    async def test_lru_evicts_and_lazy_loads(self, service):
+        """
+        Given: max_cached_sessions=2
+        When: 세션 3개 사용 후 가장 오래된 세션 조회
+        Then: 캐시는 2개로 유지되고, 제거된 세션은 DB에서 다시 적재됨 (대기 중 이벤트 포함)
+        """
+        for sid in ("s1", "s2", "s3"):
+            session = await service.create_session(app_name=APP, user_id=USER, session_id=sid)
+            await service.append_event(session, _event(sid))
+
+        assert service.get_cache_stats()["cached_sessions"] == 2
+
+        loaded = await service.get_session(app_name=APP, user_id=USER, session_id="s1")
+
+        assert _texts(loaded) == ["s1"]
+        assert service.get_cache_stats()["cached_sessions"] == 2
+
+    async def test_app_and_user_state_shared_across_sessions(self, service):
+        """
+        Given: 한 세션에서 app:/user:/temp: state 변경
+        When: 같은 사용자의 다른 세션 조회
+        Then: app:/user:는 공유되고, 세션 state와 temp:는 공유되지 않음
+        """
+        s1 = await service.create_session(app_name=APP, user_id=USER, session_id="s1")
+        await service.create_session(app_name=APP, user_id=USER, session_id="s2")
+        await service.append_event(
+            s1,
+            _event("x", {"app:theme": "dark", "user:lang": "ko", "temp:scratch": 1, "local": 2}),
+        )
+
+        s2 = await service.get_session(app_name=APP, user_id=USER, session_id="s2")
+
+        assert s2.state["app:theme"] == "dark"
+        assert s2.state["user:lang"] == "ko"
+        assert "local" not in s2.state
+        assert "temp:scratch" not in s2.state
+        assert await service.get_user_state(app_name=APP, user_id=USER) == {"lang": "ko"}
+
+    async def test_get_session_config_limits_events(self, service):
+        """
+        Given: 이벤트 3개가 있는 세션
+        When: num_recent_events=2로 조회
+        Then: 최근 2개만 반환
+        """
+        session = await service.create_session(app_name=APP, user_id=USER, session_id="s1")
+        for text in ("a", "b", "c"):
+            await service.append_event(session, _event(text))
+
+        loaded = await service.get_session(
+            app_name=APP,
+            user_id=USER,
+            session_id="s1",
+            config=GetSessionConfig(num_recent_events=2),
+        )
+
+        assert _texts(loaded) == ["b", "c"]
+
+    async def test_partial_event_is_not_persisted(self, service):
+        """
+        Given: partial=True 스트리밍 이벤트
+        When: append_event()
+        Then: 세션/대기열에 추가되지 않음
+        """
+        session = await service.create_session(app_name=APP, user_id=USER, session_id="s1")
+        event = _event("partial")
+        event.partial = True
+
+        await service.append_event(session, event)
+
+        assert session.events == []
+        assert service.get_cache_stats()["pending_events"] == 0
+
+    async def test_duplicate_create_raises(self, service):
+        """
+        Given: 이미 존재하는 세션 ID
+        When: create_session() 재호출
+        Then: AlreadyExistsError
+        """
+        await service.create_session(app_name=APP, user_id=USER, session_id="s1")
+
+        with pytest.raises(AlreadyExistsError):
+            await service.create_session(app_name=APP, user_id=USER, session_id="s1")
+
+    async def test_delete_session_discards_pending_events(self, service):
+        """
+        Given: 기록 대기 중인 이벤트가 있는 세션
+        When: delete_session() 후 flush()
+        Then: 세션이 조회되지 않고 목록에서도 제외됨
+        """
+        session = await service.create_session(app_name=APP, user_id=USER, session_id="s1")
+        await service.create_session(app_name=APP, user_id=USER, session_id="s2")
+        await service.append_event(session, _event("bye"))
+
+        await service.delete_session(app_name=APP, user_id=USER, session_id="s1")
+        await service.flush()
+
+        assert await service.get_session(app_name=APP, user_id=USER, session_id="s1") is None
+        listed = await service.list_sessions(app_name=APP, user_id=USER)
+        assert [s.id for s in listed.sessions] == ["s2"]
@@ -125,3 +125,60 @@ class TestSqliteUsageStorage:
         assert summary["call_count"] == 3
         assert summary["by_model"]["openai/gpt-4o-mini"] == 15.0
         assert summary["by_model"]["anthropic/claude-sonnet-4"] == 20.0
+
+    async def test_cache_hits_counted_in_summary(self, usage_storage):
+        """
+        Given: 실제 호출 1건 + 캐시 hit 2건 (비용 0)
+        When: 사용량 요약 조회
+        Then: 호출 횟수 3, cache_hits 2, 비용은 실제 호출분만
+        """
+        await usage_storage.save_usage(
+            Usage(
+                model="openai/gpt-4o-mini",
+                prompt_tokens=100,
+                completion_tokens=50,
+                total_tokens=150,
+                cost_usd=1.0,
+            )
+        )
+        for _ in range(2):
+            await usage_storage.save_usage(
+                Usage(
+                    model="openai/gpt-4o-mini",
+                    prompt_tokens=0,
+                    completion_tokens=0,
+                    total_tokens=0,
+                    cost_usd=0.0,
+                    cache_hit=True,
+                )
+            )
+
+        now = datetime.now()
+        summary = await usage_storage.get_usage_summary(datetime(now.year, now.month, 1), now)
+
+        assert summary["call_count"] == 3
+        assert summary["cache_hits"] == 2
+        assert summary["total_cost"] == 1.0
+
+    async def test_cached_tokens_summed_in_summary(self, usage_storage):
+        """
+        Given: 프롬프트 캐시 토큰이 있는 호출 2건
+        When: 사용량 요약 조회
+        Then: cached_tokens 합계 반환
+        """
+        for cached in (1000, 500):
+            await usage_storage.save_usage(
+                Usage(
+                    model="anthropic/claude-sonnet-4",
+                    prompt_tokens=2000,
+                    completion_tokens=10,
+                    total_tokens=2010,
+                    cost_usd=0.001,
+                    cached_tokens=cached,
+                )
+            )
+
+        now = datetime.now()
+        summary = await usage_storage.get_usage_summary(datetime(now.year, now.month, 1), now)
+
+        assert summary["cached_tokens"] == 1500
@@ -1,13 +1,25 @@
 """Thread Isolation Tests
 
 무거운 도구 실행 중에도 /health 엔드포인트가 즉시 응답하는지 검증
+
+스레드 오프로드는 명시적 opt-in (McpSettings.thread_offload_tools)이며,
+그 외 도구는 메인 이벤트 루프에서 네이티브 async로 실행됩니다.
 """
 
 import asyncio
+import threading
 import time
 from unittest.mock import AsyncMock, MagicMock
 
 from src.adapters.outbound.adk.dynamic_toolset import DynamicToolset
+from src.config.settings import McpSettings, Settings
+
+
+def _offload_settings(*tool_names: str) -> Settings:
+    """지정한 도구를 스레드 오프로드 대상으로 설정한 Settings"""
+    settings = Settings()
+    settings.mcp = McpSettings(thread_offload_tools=list(tool_names))
+    return settings
 
 
 class TestThreadIsolation:
@@ -19,8 +31,8 @@ class TestThreadIsolation:
         When: /health 엔드포인트를 호출하면
         Then: 즉시 응답을 받아야 함 (블로킹되지 않음)
         """
-        # Given: DynamicToolset에 무거운 도구 등록
-        toolset = DynamicToolset(cache_ttl_seconds=300)
+        # Given: DynamicToolset에 무거운 도구 등록 (스레드 오프로드 opt-in)
+        toolset = DynamicToolset(settings=_offload_settings("heavy_tool"))
 
         # Mock MCP 서버 및 무거운 도구
         mock_toolset = MagicMock()
@@ -32,7 +44,9 @@ class TestThreadIsolation:
 
         mock_tool = MagicMock()
         mock_tool.name = "heavy_tool"
-        mock_tool.run_async = AsyncMock(side_effect=lambda args, ctx: blocking_tool_function())
+        mock_tool.run_async = AsyncMock(
+            side_effect=lambda args, tool_context: blocking_tool_function()
+        )
 
         mock_toolset.get_tools = AsyncMock(return_value=[mock_tool])
         mock_toolset.close = AsyncMock()
@@ -64,12 +78,12 @@ class TestThreadIsolation:
 
     async def test_asyncio_to_thread_wrapper(self):
         """
-        Given: DynamicToolset.call_tool()이 asyncio.to_thread()를 사용
+        Given: thread_offload_tools에 등록된 도구 (asyncio.to_thread 사용)
         When: 동기 블로킹 작업을 실행하면
         Then: 메인 이벤트 루프가 차단되지 않음
         """
         # Given
-        toolset = DynamicToolset()
+        toolset = DynamicToolset(settings=_offload_settings("sync_tool"))
 
         mock_toolset = MagicMock()
 
@@ -80,7 +94,7 @@ class TestThreadIsolation:
 
         mock_tool = MagicMock()
         mock_tool.name = "sync_tool"
-        mock_tool.run_async = AsyncMock(side_effect=lambda args, ctx: sync_blocking())
+        mock_tool.run_async = AsyncMock(side_effect=lambda args, tool_context: sync_blocking())
 
         mock_toolset.get_tools = AsyncMock(return_value=[mock_tool])
         mock_toolset.close = AsyncMock()
@@ -107,11 +121,11 @@ class TestThreadIsolation:
 
     async def test_event_loop_not_blocked_during_tool_call(self):
         """
-        Given: 메인 이벤트 루프에서 실행 중
+        Given: 메인 이벤트 루프에서 실행 중 (오프로드 opt-in 도구)
         When: call_tool()로 블로킹 작업을 실행하면
         Then: 다른 코루틴이 동시에 실행 가능함
         """
-        toolset = DynamicToolset()
+        toolset = DynamicToolset(settings=_offload_settings("blocker"))
 
         mock_toolset = MagicMock()
 
@@ -121,7 +135,7 @@ class TestThreadIsolation:
 
         mock_tool = MagicMock()
         mock_tool.name = "blocker"
-        mock_tool.run_async = AsyncMock(side_effect=lambda args, ctx: blocking_operation())
+        mock_tool.run_async = AsyncMock(side_effect=lambda args, tool_context: blocking_operation())
 
         mock_toolset.get_tools = AsyncMock(return_value=[mock_tool])
         mock_toolset.close = AsyncMock()
@@ -144,3 +158,72 @@ class TestThreadIsolation:
         assert len(loop_active_count) >= 3, "Event loop was blocked"
 
         await toolset.close()
+
+    async def test_native_async_path_runs_on_main_loop(self):
+        """
+        Given: 오프로드 대상이 아닌 일반 도구
+        When: call_tool() 호출
+        Then: 새 이벤트 루프/스레드 없이 메인 루프에서 실행
+        """
+        toolset = DynamicToolset(settings=_offload_settings())
+        main_loop = asyncio.get_running_loop()
+        seen: dict = {}
+
+        async def capture(args, tool_context):
+            seen["loop"] = asyncio.get_running_loop()
+            seen["thread"] = threading.current_thread()
+            return "native"
+
+        mock_tool = MagicMock()
+        mock_tool.name = "io_tool"
+        mock_tool.run_async = AsyncMock(side_effect=capture)
+
+        mock_toolset = MagicMock()
+        mock_toolset.get_tools = AsyncMock(return_value=[mock_tool])
+        mock_toolset.close = AsyncMock()
+        toolset._mcp_toolsets["test"] = mock_toolset
+
+        result = await toolset.call_tool("io_tool", {})
+
+        assert result == "native"
+        assert seen["loop"] is main_loop
+        assert seen["thread"] is threading.main_thread()
+
+        await toolset.close()
+
+    async def test_per_endpoint_concurrency_limit(self):
+        """
+        Given: max_concurrent_calls_per_endpoint=2
+        When: 같은 엔드포인트 도구를 5회 동시 호출
+        Then: 동시에 실행되는 호출은 최대 2개
+        """
+        settings = Settings()
+        settings.mcp = McpSettings(max_concurrent_calls_per_endpoint=2)
+        toolset = DynamicToolset(settings=settings)
+
+        in_flight = 0
+        peak = 0
+
+        async def slow_call(args, tool_context):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return "ok"
+
+        mock_tool = MagicMock()
+        mock_tool.name = "slow_tool"
+        mock_tool.run_async = AsyncMock(side_effect=slow_call)
+
+        mock_toolset = MagicMock()
+        mock_toolset.get_tools = AsyncMock(return_value=[mock_tool])
+        mock_toolset.close = AsyncMock()
+        toolset._mcp_toolsets["test"] = mock_toolset
+
+        results = await asyncio.gather(*(toolset.call_tool("slow_tool", {}) for _ in range(5)))
+
+        assert results == ["ok"] * 5
+        assert peak == 2
+
+        await toolset.close()
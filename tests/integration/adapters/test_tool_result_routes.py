@@ -0,0 +1,49 @@
+"""Tool Result API 통합 테스트"""
+
+
+class TestToolResultRoutes:
+    """GET /api/tool-results/{handle}"""
+
+    async def test_get_tool_result_page(self, authenticated_client):
+        """
+        Given: 분리 저장된 도구 결과
+        When: offset/length로 조회
+        Then: 구간 + 전체 길이 + 다음 offset
+        """
+        storage = authenticated_client.app.container.tool_result_storage()
+        handle = await storage.save_result("a" * 100)
+
+        response = authenticated_client.get(
+            f"/api/tool-results/{handle}", params={"offset": 10, "length": 20}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["content"] == "a" * 20
+        assert data["total_chars"] == 100
+        assert data["next_offset"] == 30
+
+    async def test_get_full_tool_result(self, authenticated_client):
+        """
+        Given: 분리 저장된 도구 결과
+        When: 구간 지정 없이 조회
+        Then: 전체 내용 + next_offset 없음
+        """
+        storage = authenticated_client.app.container.tool_result_storage()
+        handle = await storage.save_result("full result")
+
+        data = authenticated_client.get(f"/api/tool-results/{handle}").json()
+
+        assert data["content"] == "full result"
+        assert data["next_offset"] is None
+
+    async def test_unknown_handle_returns_404(self, authenticated_client):
+        """
+        Given: 존재하지 않는 핸들
+        When: 조회
+        Then: 404 + ToolResultNotFoundError
+        """
+        response = authenticated_client.get(f"/api/tool-results/{'f' * 32}")
+
+        assert response.status_code == 404
+        assert response.json()["code"] == "ToolResultNotFoundError"
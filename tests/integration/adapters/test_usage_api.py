@@ -5,8 +5,11 @@ import tempfile
 from datetime import datetime
 
 import pytest
+from dependency_injector import providers
 from fastapi.testclient import TestClient
 
+from src.adapters.outbound.adk.llm_rate_limiter import LlmRateLimiter
+from src.adapters.outbound.adk.llm_router import LlmDeploymentRouter
 from src.adapters.outbound.storage.sqlite_usage import SqliteUsageStorage
 from src.domain.entities.usage import Usage
 from src.domain.services.cost_service import CostService
@@ -130,3 +133,59 @@ class TestUsageAPI:
         data = response.json()
 
         assert data["monthly_budget"] == 200.0
+
+    async def test_get_deployment_health(self, authenticated_client):
+        """LLM 배포 풀 상태 조회 (자격 증명 미노출)"""
+        # Given: 배포 풀이 설정된 라우터
+        router = LlmDeploymentRouter(
+            {"default": [{"model": "openai/gpt-4o-mini", "api_key": "sk-secret", "id": "primary"}]}
+        )
+        container = authenticated_client.app.container
+        container.llm_router.override(providers.Object(router))
+        try:
+            # When
+            response = authenticated_client.get("/api/usage/deployments")
+        finally:
+            container.llm_router.reset_override()
+
+        # Then
+        assert response.status_code == 200
+        data = response.json()
+        assert data["default"][0]["id"] == "primary"
+        assert data["default"][0]["healthy"] is True
+        assert "sk-secret" not in response.text
+
+    async def test_get_rate_limits(self, authenticated_client):
+        """모델별 LLM rate limiter 상태 조회"""
+        # Given: 한 번 호출된 모델이 있는 limiter
+        limiter = LlmRateLimiter({"openai/gpt-4o-mini": {"rpm": 60, "tpm": 1000}})
+
+        async def send():
+            return None
+
+        await limiter.call("openai/gpt-4o-mini", send, estimated_tokens=10)
+        container = authenticated_client.app.container
+        container.llm_rate_limiter.override(providers.Object(limiter))
+        try:
+            # When
+            response = authenticated_client.get("/api/usage/rate-limits")
+        finally:
+            container.llm_rate_limiter.reset_override()
+
+        # Then
+        assert response.status_code == 200
+        data = response.json()["openai/gpt-4o-mini"]
+        assert data["rpm"] == 60
+        assert data["requests"] == 1
+        assert data["rate_limited"] == 0
+
+    async def test_get_cascade_stats(self, authenticated_client):
+        """모델 캐스케이드 통계 조회 (기본 설정: 비활성화)"""
+        # When
+        response = authenticated_client.get("/api/usage/cascade")
+
+        # Then
+        assert response.status_code == 200
+        data = response.json()
+        assert data["enabled"] is False
+        assert data["turns"] == 0
@@ -76,6 +76,40 @@ class TestWorkflowCreation:
 
         assert response.status_code == 422
 
+    async def test_create_dag_workflow_returns_201(
+        self, authenticated_client: TestClient, sample_workflow_data
+    ):
+        """
+        Given: DAG workflow where math depends on echo
+        When: POST /api/workflows
+        Then: 201 Created with depends_on and max_parallelism echoed
+        """
+        sample_workflow_data["workflow_type"] = "dag"
+        sample_workflow_data["max_parallelism"] = 2
+        sample_workflow_data["steps"][1]["depends_on"] = ["echo_result"]
+        response = authenticated_client.post("/api/workflows", json=sample_workflow_data)
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["workflow_type"] == "dag"
+        assert data["max_parallelism"] == 2
+        assert data["steps"][1]["depends_on"] == ["echo_result"]
+
+    async def test_create_cyclic_dag_workflow_returns_422(
+        self, authenticated_client: TestClient, sample_workflow_data
+    ):
+        """
+        Given: DAG workflow whose steps depend on each other
+        When: POST /api/workflows
+        Then: 422 Unprocessable Entity
+        """
+        sample_workflow_data["workflow_type"] = "dag"
+        sample_workflow_data["steps"][0]["depends_on"] = ["math_result"]
+        sample_workflow_data["steps"][1]["depends_on"] = ["echo_result"]
+        response = authenticated_client.post("/api/workflows", json=sample_workflow_data)
+
+        assert response.status_code == 422
+
 
 class TestWorkflowRetrieval:
     """Workflow 조회 API 테스트"""
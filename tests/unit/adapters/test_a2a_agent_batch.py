@@ -0,0 +1,193 @@
+"""A2A sub-agent 배치 갱신 + Agent Card 캐시 테스트
+
+update_a2a_agents()가 한 번만 재구성하는지, 레지스트리가 조회한 카드 또는 재구성 전에 확인된
+Agent Card를 재사용하는지 검증
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from a2a.types import AgentCard
+
+from src.adapters.outbound.adk.orchestrator_adapter import AdkOrchestratorAdapter
+
+
+@pytest.fixture
+async def orchestrator() -> AdkOrchestratorAdapter:
+    toolset = AsyncMock()
+    toolset.get_tools = AsyncMock(return_value=[])
+    toolset.get_registered_info = MagicMock(return_value={})
+    adapter = AdkOrchestratorAdapter(
+        model="openai/gpt-4o-mini", dynamic_toolset=toolset, enable_llm_logging=False
+    )
+    await adapter.initialize()
+    return adapter
+
+
+def _resolve(orchestrator: AdkOrchestratorAdapter, endpoint_id: str) -> AgentCard:
+    """RemoteA2aAgent가 첫 호출에서 카드를 확인한 상태를 재현"""
+    card = AgentCard(name=endpoint_id, description="Echo agent", version="1.0")
+    orchestrator._sub_agents[endpoint_id]._agent_card = card
+    return card
+
+
+def _card_json(rpc_url: str) -> dict:
+    """레지스트리가 조회한 Agent Card JSON (A2A 0.3 형식)"""
+    return {"name": "echo", "description": "Echo agent", "version": "1.0", "url": rpc_url}
+
+
+class TestUpdateA2aAgents:
+    """update_a2a_agents() 배치 적용"""
+
+    async def test_batch_add_rebuilds_once(self, orchestrator):
+        """
+        Given: 초기화된 Orchestrator
+        When: A2A 에이전트 3개를 한 번에 추가
+        Then: Agent 재구성 1회 + sub_agents 3개
+        """
+        rebuild = AsyncMock(wraps=orchestrator._rebuild_agent)
+        orchestrator._rebuild_agent = rebuild
+
+        await orchestrator.update_a2a_agents(
+            add={f"agent-{i}": f"http://localhost:900{i}" for i in range(3)}
+        )
+
+        rebuild.assert_awaited_once()
+        assert len(orchestrator._sub_agents) == 3
+
+    async def test_batch_add_and_remove(self, orchestrator):
+        """
+        Given: A2A 에이전트 2개 등록
+        When: 하나 제거 + 하나 추가를 한 번에 적용
+        Then: 결과 sub_agents에 반영
+        """
+        await orchestrator.update_a2a_agents(
+            add={"a": "http://localhost:9001", "b": "http://localhost:9002"}
+        )
+
+        await orchestrator.update_a2a_agents(add={"c": "http://localhost:9003"}, remove=["a"])
+
+        assert set(orchestrator._sub_agents) == {"b", "c"}
+
+    async def test_no_change_skips_rebuild(self, orchestrator):
+        """
+        Given: 등록된 A2A 에이전트
+        When: 같은 URL로 재추가 + 없는 에이전트 제거
+        Then: 재구성하지 않음
+        """
+        await orchestrator.update_a2a_agents(add={"a": "http://localhost:9001"})
+        rebuild = AsyncMock()
+        orchestrator._rebuild_agent = rebuild
+
+        await orchestrator.update_a2a_agents(add={"a": "http://localhost:9001"}, remove=["zz"])
+
+        rebuild.assert_not_awaited()
+
+    async def test_requires_initialization(self):
+        """
+        Given: 초기화되지 않은 Orchestrator
+        When: update_a2a_agents() 호출
+        Then: RuntimeError
+        """
+        adapter = AdkOrchestratorAdapter(model="openai/gpt-4o-mini", dynamic_toolset=AsyncMock())
+
+        with pytest.raises(RuntimeError):
+            await adapter.update_a2a_agents(add={"a": "http://localhost:9001"})
+
+
+class TestAgentCardCache:
+    """확인된 Agent Card 재사용"""
+
+    async def test_resolved_card_reused_after_rebuild(self, orchestrator):
+        """
+        Given: Agent Card를 확인한 A2A 에이전트
+        When: 다른 에이전트 추가로 재구성
+        Then: 새 RemoteA2aAgent 인스턴스가 같은 카드를 재사용 (재조회 없음)
+        """
+        await orchestrator.update_a2a_agents(add={"a": "http://localhost:9001"})
+        card = _resolve(orchestrator, "a")
+        old_agent = orchestrator._sub_agents["a"]
+
+        await orchestrator.update_a2a_agents(add={"b": "http://localhost:9002"})
+
+        new_agent = orchestrator._sub_agents["a"]
+        assert new_agent is not old_agent
+        assert new_agent._agent_card is card
+        assert orchestrator._sub_agents["b"]._agent_card is None
+
+    async def test_card_cache_keyed_by_url(self, orchestrator):
+        """
+        Given: 확인된 카드가 있는 URL
+        When: 같은 URL을 다른 endpoint ID로 등록
+        Then: 캐시된 카드 재사용
+        """
+        await orchestrator.update_a2a_agents(add={"a": "http://localhost:9001"})
+        card = _resolve(orchestrator, "a")
+
+        await orchestrator.update_a2a_agents(
+            add={"a-copy": "http://localhost:9001/.well-known/agent.json"}
+        )
+
+        assert orchestrator._sub_agents["a-copy"]._agent_card is card
+
+    async def test_remove_drops_cached_card(self, orchestrator):
+        """
+        Given: 확인된 카드가 있는 A2A 에이전트
+        When: 제거 후 같은 URL로 재등록
+        Then: 카드를 다시 조회하도록 캐시에서 제거됨
+        """
+        await orchestrator.update_a2a_agents(add={"a": "http://localhost:9001"})
+        _resolve(orchestrator, "a")
+
+        await orchestrator.update_a2a_agents(remove=["a"])
+        await orchestrator.update_a2a_agents(add={"a": "http://localhost:9001"})
+
+        assert orchestrator._sub_agents["a"]._agent_card is None
+
+    async def test_prefetched_card_used_without_fetch(self, orchestrator):
+        """
+        Given: 레지스트리가 이미 조회한 Agent Card
+        When: agent_cards와 함께 추가
+        Then: RemoteA2aAgent가 첫 호출 전부터 카드를 보유 (URL 재조회 없음)
+        """
+        await orchestrator.update_a2a_agents(
+            add={"a": "http://localhost:9001"},
+            agent_cards={"a": _card_json("http://localhost:9001/rpc")},
+        )
+
+        card = orchestrator._sub_agents["a"]._agent_card
+        assert isinstance(card, AgentCard)
+        assert card.name == "echo"
+        assert [iface.url for iface in card.supported_interfaces] == ["http://localhost:9001/rpc"]
+
+    async def test_prefetched_card_kept_across_rebuild(self, orchestrator):
+        """
+        Given: 카드와 함께 추가된 A2A 에이전트 (아직 호출 전)
+        When: 다른 에이전트 추가로 재구성
+        Then: 새 인스턴스도 같은 카드를 사용
+        """
+        await orchestrator.update_a2a_agents(
+            add={"a": "http://localhost:9001"},
+            agent_cards={"a": _card_json("http://localhost:9001/rpc")},
+        )
+        card = orchestrator._sub_agents["a"]._agent_card
+
+        await orchestrator.update_a2a_agents(add={"b": "http://localhost:9002"})
+
+        assert orchestrator._sub_agents["a"]._agent_card is card
+
+    @pytest.mark.parametrize(
+        "rpc_url",
+        ["http://localhost:9999/rpc", "http://agents.example.com/rpc"],
+    )
+    async def test_prefetched_card_with_foreign_rpc_target_ignored(self, orchestrator, rpc_url):
+        """
+        Given: RPC URL이 다른 origin이거나 loopback이 아닌 http인 카드
+        When: agent_cards와 함께 추가
+        Then: 카드를 쓰지 않고 RemoteA2aAgent가 URL에서 조회/검증
+        """
+        url = "http://agents.example.com" if "example" in rpc_url else "http://localhost:9001"
+
+        await orchestrator.update_a2a_agents(add={"a": url}, agent_cards={"a": _card_json(rpc_url)})
+
+        assert orchestrator._sub_agents["a"]._agent_card is None
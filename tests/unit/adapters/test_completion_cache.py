@@ -0,0 +1,155 @@
+"""generate_response() 응답 캐시 테스트
+
+같은 요청은 LLM을 다시 호출하지 않고 캐시된 응답을 반환하며, hit은 비용 0으로 기록되는지 검증
+"""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.adapters.inbound.http.routes.sampling import _allows_cache
+from src.adapters.outbound.adk.orchestrator_adapter import AdkOrchestratorAdapter
+from src.domain.ports.outbound.storage_port import CompletionCachePort
+from tests.unit.fakes.fake_usage_storage import FakeUsageStorage
+
+MESSAGES = [{"role": "user", "content": "Summarize this"}]
+
+
+class InMemoryCompletionCache(CompletionCachePort):
+    """dict 기반 응답 캐시 (테스트용)"""
+
+    def __init__(self):
+        self.entries: dict[str, dict[str, Any]] = {}
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        return self.entries.get(key)
+
+    async def put(self, key: str, response: dict[str, Any]) -> None:
+        self.entries[key] = response
+
+
+def _response(content: str) -> MagicMock:
+    response = MagicMock()
+    response.choices = [MagicMock(message=MagicMock(content=content))]
+    response.model = "openai/gpt-4o-mini"
+    return response
+
+
+@pytest.fixture
+def cache() -> InMemoryCompletionCache:
+    return InMemoryCompletionCache()
+
+
+@pytest.fixture
+def usage_storage() -> FakeUsageStorage:
+    return FakeUsageStorage()
+
+
+@pytest.fixture
+async def orchestrator(cache, usage_storage):
+    adapter = AdkOrchestratorAdapter(
+        model="openai/gpt-4o-mini",
+        dynamic_toolset=AsyncMock(),
+        completion_cache=cache,
+        usage_storage=usage_storage,
+    )
+    yield adapter
+    await adapter.close()
+
+
+class TestCompletionCache:
+    """generate_response() 캐시 동작"""
+
+    async def test_repeated_request_served_from_cache(self, orchestrator, usage_storage):
+        """
+        Given: 같은 messages/system_prompt/max_tokens 요청 2회
+        When: generate_response()
+        Then: LLM 1회 호출 + 두 번째는 같은 응답 + 비용 0 cache hit 기록
+        """
+        acall = AsyncMock(return_value=_response("summary"))
+        with patch("litellm.acompletion", new=acall):
+            first = await orchestrator.generate_response(MESSAGES, system_prompt="s", max_tokens=64)
+            second = await orchestrator.generate_response(
+                MESSAGES, system_prompt="s", max_tokens=64
+            )
+
+        assert acall.await_count == 1
+        assert second == first
+        hits = [u for u in usage_storage._usages if u.cache_hit]
+        assert len(hits) == 1
+        assert hits[0].cost_usd == 0.0
+        assert hits[0].model == "openai/gpt-4o-mini"
+
+    async def test_different_parameters_miss(self, orchestrator):
+        """
+        Given: 캐시된 요청
+        When: max_tokens / system_prompt / model이 다른 요청
+        Then: 각각 LLM 호출
+        """
+        acall = AsyncMock(return_value=_response("summary"))
+        with patch("litellm.acompletion", new=acall):
+            await orchestrator.generate_response(MESSAGES, max_tokens=64)
+            await orchestrator.generate_response(MESSAGES, max_tokens=128)
+            await orchestrator.generate_response(MESSAGES, system_prompt="s", max_tokens=64)
+            await orchestrator.generate_response(MESSAGES, model="openai/gpt-4o", max_tokens=64)
+
+        assert acall.await_count == 4
+
+    async def test_use_cache_false_bypasses_cache(self, orchestrator, cache):
+        """
+        Given: 캐시된 요청
+        When: use_cache=False로 같은 요청
+        Then: LLM 재호출 + 캐시 갱신 안 함
+        """
+        acall = AsyncMock(side_effect=[_response("first"), _response("fresh")])
+        with patch("litellm.acompletion", new=acall):
+            await orchestrator.generate_response(MESSAGES)
+            result = await orchestrator.generate_response(MESSAGES, use_cache=False)
+
+        assert result["content"] == "fresh"
+        assert [e["content"] for e in cache.entries.values()] == ["first"]
+
+    async def test_empty_response_not_cached(self, orchestrator, cache):
+        """
+        Given: 빈 응답
+        When: generate_response()
+        Then: 캐시에 저장하지 않음
+        """
+        with patch("litellm.acompletion", new=AsyncMock(return_value=_response(""))):
+            await orchestrator.generate_response(MESSAGES)
+
+        assert cache.entries == {}
+
+    def test_cache_key_ignores_dict_key_order(self):
+        """
+        Given: 키 순서만 다른 메시지
+        When: 캐시 키 생성
+        Then: 같은 키
+        """
+        key_a = AdkOrchestratorAdapter._completion_cache_key(
+            "m", [{"role": "user", "content": "x"}], None, 10
+        )
+        key_b = AdkOrchestratorAdapter._completion_cache_key(
+            "m", [{"content": "x", "role": "user"}], None, 10
+        )
+
+        assert key_a == key_b
+
+
+class TestCacheOptOutHeader:
+    """Sampling 승인 API의 Cache-Control 옵트아웃"""
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            (None, True),
+            ("max-age=0", True),
+            ("no-cache", False),
+            ("No-Store", False),
+            ("private, no-cache", False),
+        ],
+    )
+    def test_allows_cache(self, header, expected):
+        """Cache-Control에 no-cache/no-store가 있으면 캐시 건너뜀"""
+        assert _allows_cache(header) is expected
@@ -0,0 +1,200 @@
+"""ConversationContextManager 테스트
+
+토큰 예산 초과 시 최근 턴만 유지하고 오래된 턴을 백그라운드 누적 요약으로 대체하는지 검증
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from google.adk.models.llm_request import LlmRequest
+from google.genai import types
+
+from src.adapters.outbound.adk.context_manager import SUMMARY_PREFIX, ConversationContextManager
+
+
+def _text(role: str, text: str) -> types.Content:
+    return types.Content(role=role, parts=[types.Part(text=text)])
+
+
+def _turns(count: int, words: int = 50) -> list[types.Content]:
+    contents: list[types.Content] = []
+    for i in range(count):
+        contents.append(_text("user", f"question {i} " + "word " * words))
+        contents.append(_text("model", f"answer {i} " + "word " * words))
+    return contents
+
+
+def _context(session_id: str = "conv-1") -> MagicMock:
+    return MagicMock(session=MagicMock(id=session_id))
+
+
+def _summary_response(text: str) -> MagicMock:
+    return MagicMock(choices=[MagicMock(message=MagicMock(content=text))])
+
+
+async def _drain(manager: ConversationContextManager) -> None:
+    """진행 중인 요약 작업 완료 대기"""
+    for state in manager._summaries.values():
+        if state.task is not None:
+            await state.task
+
+
+def _first_text(request: LlmRequest) -> str:
+    return request.contents[0].parts[0].text
+
+
+@pytest.fixture
+def manager() -> ConversationContextManager:
+    return ConversationContextManager(
+        summary_model="openai/gpt-4o-mini", max_context_tokens=400, keep_recent_turns=2
+    )
+
+
+class TestBudget:
+    """토큰 예산 적용"""
+
+    async def test_under_budget_is_untouched(self, manager):
+        """
+        Given: 예산 이하의 짧은 대화
+        When: before_model_callback
+        Then: contents 변경 없음 + 요약 호출 없음
+        """
+        request = LlmRequest(contents=_turns(2, words=5))
+        original = list(request.contents)
+
+        with patch("litellm.acompletion", new=AsyncMock()) as acall:
+            await manager.before_model_callback(_context(), request)
+
+        assert request.contents == original
+        acall.assert_not_awaited()
+
+    async def test_over_budget_keeps_recent_turns_and_summarizes(self, manager):
+        """
+        Given: 예산을 넘는 10턴 대화
+        When: before_model_callback → 요약 완료 → 다음 턴 before_model_callback
+        Then: 첫 호출은 최근 턴만 유지, 요약 완료 후에는 요약 + 최근 턴
+        """
+        contents = _turns(10)
+        acall = AsyncMock(return_value=_summary_response("User asked ten questions."))
+
+        with patch("litellm.acompletion", new=acall):
+            request = LlmRequest(contents=list(contents))
+            await manager.before_model_callback(_context(), request)
+            await manager._summaries["conv-1"].task
+
+            assert request.contents[-4:] == contents[-4:]
+            assert _first_text(request).startswith("question")
+
+            next_request = LlmRequest(contents=[*contents, *_turns(1)])
+            await manager.before_model_callback(_context(), next_request)
+            await _drain(manager)
+
+        assert acall.await_count >= 1
+        assert _first_text(next_request).startswith(SUMMARY_PREFIX)
+        assert "User asked ten questions." in _first_text(next_request)
+        assert acall.await_args_list[0].kwargs["model"] == "openai/gpt-4o-mini"
+
+    async def test_prompt_size_stays_bounded(self, manager):
+        """
+        Given: 턴마다 요약이 완료되는 긴 대화
+        When: 40턴 동안 대화 증가
+        Then: 매 요청의 토큰 수가 예산 + 요약 크기 이내
+        """
+        acall = AsyncMock(return_value=_summary_response("Short running summary."))
+        sizes = []
+
+        with patch("litellm.acompletion", new=acall):
+            for n in range(1, 41):
+                request = LlmRequest(contents=_turns(n))
+                await manager.before_model_callback(_context(), request)
+                await _drain(manager)
+                sizes.append(sum(manager.count_tokens(c) for c in request.contents))
+
+        assert max(sizes) <= 400 + 50
+        assert sizes[-1] <= 400 + 50
+
+    async def test_tool_call_pairs_stay_in_same_turn(self, manager):
+        """
+        Given: 마지막 턴에 도구 호출/결과가 포함된 대화
+        When: 예산 초과로 축소
+        Then: function_call과 function_response가 함께 유지
+        """
+        tool_turn = [
+            _text("user", "search please"),
+            types.Content(
+                role="model",
+                parts=[types.Part(function_call=types.FunctionCall(name="search", args={}))],
+            ),
+            types.Content(
+                role="user",
+                parts=[
+                    types.Part(
+                        function_response=types.FunctionResponse(
+                            name="search", response={"result": "ok"}
+                        )
+                    )
+                ],
+            ),
+            _text("model", "done"),
+        ]
+        request = LlmRequest(contents=[*_turns(10), *tool_turn])
+
+        with patch("litellm.acompletion", new=AsyncMock(return_value=_summary_response("s"))):
+            await manager.before_model_callback(_context(), request)
+            await _drain(manager)
+
+        assert request.contents[-4:] == tool_turn
+
+
+class TestTokenCache:
+    """Content별 토큰 수 캐싱"""
+
+    def test_same_content_counted_once(self, manager):
+        """
+        Given: 같은 내용의 Content 2개
+        When: count_tokens 반복 호출
+        Then: 토크나이저는 1회만 호출
+        """
+        with patch("litellm.token_counter", return_value=7) as counter:
+            assert manager.count_tokens(_text("user", "hello")) == 7
+            assert manager.count_tokens(_text("user", "hello")) == 7
+
+        counter.assert_called_once()
+
+    def test_tokens_counted_with_chat_model(self):
+        """
+        Given: 요약 모델과 다른 대화 모델(token_model)
+        When: count_tokens
+        Then: 대화 모델 토크나이저로 계산
+        """
+        manager = ConversationContextManager(
+            summary_model="openai/gpt-4o-mini", token_model="anthropic/claude-sonnet-4-5"
+        )
+
+        with patch("litellm.token_counter", return_value=7) as counter:
+            manager.count_tokens(_text("user", "hello"))
+
+        assert counter.call_args.kwargs["model"] == "anthropic/claude-sonnet-4-5"
+
+
+class TestSummaryFailure:
+    """요약 실패 처리"""
+
+    async def test_failed_summary_retries_next_turn(self, manager):
+        """
+        Given: 첫 요약 호출 실패
+        When: 다음 턴
+        Then: 예외 없이 최근 턴으로 진행하고 요약 재시도
+        """
+        acall = AsyncMock(side_effect=[RuntimeError("boom"), _summary_response("recovered")])
+
+        with patch("litellm.acompletion", new=acall):
+            request = LlmRequest(contents=_turns(10))
+            await manager.before_model_callback(_context(), request)
+            await manager._summaries["conv-1"].task
+
+            await manager.before_model_callback(_context(), LlmRequest(contents=_turns(11)))
+            await manager._summaries["conv-1"].task
+
+        assert acall.await_count == 2
+        assert manager._summaries["conv-1"].text == "recovered"
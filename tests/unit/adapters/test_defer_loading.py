@@ -3,14 +3,15 @@
 RED Phase: Defer Loading 기능 테스트
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from google.adk.tools import BaseTool
 
-from src.adapters.outbound.adk.dynamic_toolset import DynamicToolset
+from src.adapters.outbound.adk.dynamic_toolset import DynamicToolset, ToolLimitExceededError
 from src.config.settings import Settings
-from src.domain.entities.endpoint import Endpoint, EndpointType
+from src.domain.entities.endpoint import Endpoint, EndpointType, McpTransport
 
 
 class TestDeferLoading:
@@ -18,23 +19,20 @@ class TestDeferLoading:
 
     @pytest.fixture
     def settings(self):
-        """Settings with defer_loading_threshold=30, max_active_tools=100"""
+        """Settings with defer_loading_token_threshold=750 (도구 20개 < 750 < 도구 40개)"""
         settings = Settings()
-        settings.mcp.defer_loading_threshold = 30
-        settings.mcp.max_active_tools = 100
+        settings.mcp.defer_loading_token_threshold = 750
         return settings
 
     @pytest.fixture
     def dynamic_toolset(self, settings):
         return DynamicToolset(settings=settings)
 
-    async def test_max_active_tools_increased_to_100(self, dynamic_toolset):
+    async def test_many_small_tools_fit_token_budget(self, dynamic_toolset):
         """
-        RED: MAX_ACTIVE_TOOLS가 100으로 증가
-
-        Given: 100개 도구를 등록 시도
+        Given: 스키마가 작은 도구 100개를 등록 시도
         When: add_mcp_server() 호출
-        Then: ToolLimitExceededError 발생하지 않음 (기존 30 → 100)
+        Then: 토큰 예산 이내이므로 ToolLimitExceededError 발생하지 않음 (개수 제한 없음)
         """
         # Given: 100개 도구를 가진 Mock MCP 서버
         endpoint = Endpoint(
@@ -57,7 +55,9 @@ class TestDeferLoading:
 
         # Patch _create_mcp_toolset
         original_create = dynamic_toolset._create_mcp_toolset
-        dynamic_toolset._create_mcp_toolset = AsyncMock(return_value=mock_toolset)
+        dynamic_toolset._create_mcp_toolset = AsyncMock(
+            return_value=(mock_toolset, McpTransport.STREAMABLE_HTTP)
+        )
 
         # When: 100개 도구 등록
         try:
@@ -69,9 +69,9 @@ class TestDeferLoading:
 
     async def test_defer_loading_activates_above_threshold(self, dynamic_toolset):
         """
-        RED: defer_loading_threshold 초과 시 Defer Loading 활성화
+        RED: defer_loading_token_threshold 초과 시 Defer Loading 활성화
 
-        Given: 총 40개 도구 (threshold=30 초과)
+        Given: 총 40개 도구 (도구 정의 토큰 합계가 threshold 초과)
         When: get_tools() 호출
         Then: DeferredToolProxy 반환 (메타데이터만 로드)
         """
@@ -93,7 +93,9 @@ class TestDeferLoading:
             mock_toolset.get_tools = AsyncMock(return_value=mock_tools)
             mock_toolset.close = AsyncMock()
 
-            dynamic_toolset._create_mcp_toolset = AsyncMock(return_value=mock_toolset)
+            dynamic_toolset._create_mcp_toolset = AsyncMock(
+                return_value=(mock_toolset, McpTransport.STREAMABLE_HTTP)
+            )
             await dynamic_toolset.add_mcp_server(endpoint)
 
         # When: get_tools() 호출
@@ -110,9 +112,9 @@ class TestDeferLoading:
 
     async def test_normal_mode_below_threshold(self, dynamic_toolset):
         """
-        RED: defer_loading_threshold 이하 시 Normal Mode
+        RED: defer_loading_token_threshold 이하 시 Normal Mode
 
-        Given: 총 20개 도구 (threshold=30 이하)
+        Given: 총 20개 도구 (도구 정의 토큰 합계가 threshold 이하)
         When: get_tools() 호출
         Then: 풀 도구 반환 (BaseTool)
         """
@@ -133,7 +135,9 @@ class TestDeferLoading:
         mock_toolset.get_tools = AsyncMock(return_value=mock_tools)
         mock_toolset.close = AsyncMock()
 
-        dynamic_toolset._create_mcp_toolset = AsyncMock(return_value=mock_toolset)
+        dynamic_toolset._create_mcp_toolset = AsyncMock(
+            return_value=(mock_toolset, McpTransport.STREAMABLE_HTTP)
+        )
         await dynamic_toolset.add_mcp_server(endpoint)
 
         # When: get_tools() 호출
@@ -172,7 +176,9 @@ class TestDeferLoading:
             mock_toolset.get_tools = AsyncMock(return_value=mock_tools)
             mock_toolset.close = AsyncMock()
 
-            dynamic_toolset._create_mcp_toolset = AsyncMock(return_value=mock_toolset)
+            dynamic_toolset._create_mcp_toolset = AsyncMock(
+                return_value=(mock_toolset, McpTransport.STREAMABLE_HTTP)
+            )
             await dynamic_toolset.add_mcp_server(endpoint)
 
         # When: DeferredToolProxy 실행
@@ -184,3 +190,187 @@ class TestDeferLoading:
 
         # Then: lazy load 후 정상 실행
         assert result == "result"
+
+
+class TestToolDefinitionTokenBudget:
+    """도구 정의 토큰 예산"""
+
+    @staticmethod
+    def _mock_toolset(tools: list) -> AsyncMock:
+        mock_toolset = AsyncMock()
+        mock_toolset.get_tools = AsyncMock(return_value=tools)
+        mock_toolset.close = AsyncMock()
+        return mock_toolset
+
+    @staticmethod
+    def _tool(name: str, description: str = "", input_schema: dict | None = None) -> MagicMock:
+        tool = MagicMock()
+        tool.name = name
+        tool.description = description
+        tool.input_schema = input_schema or {}
+        return tool
+
+    async def test_huge_schema_server_rejected(self):
+        """
+        Given: max_tool_definition_tokens=2000
+        When: 도구 1개지만 스키마가 매우 큰 서버 등록
+        Then: ToolLimitExceededError + 연결 정리
+        """
+        settings = Settings()
+        settings.mcp.max_tool_definition_tokens = 2000
+        dynamic_toolset = DynamicToolset(settings=settings)
+        properties = {
+            f"field_{i}": {"type": "string", "description": f"Detailed description of field {i}"}
+            for i in range(200)
+        }
+        mock_toolset = self._mock_toolset(
+            [self._tool("giant", "Giant tool", {"type": "object", "properties": properties})]
+        )
+        dynamic_toolset._create_mcp_toolset = AsyncMock(
+            return_value=(mock_toolset, McpTransport.STREAMABLE_HTTP)
+        )
+
+        with pytest.raises(ToolLimitExceededError, match="exceed budget"):
+            await dynamic_toolset.add_mcp_server(
+                Endpoint(id="giant", url="http://giant.test/mcp", type=EndpointType.MCP)
+            )
+        mock_toolset.close.assert_called_once()
+
+    async def test_definition_tokens_cached_by_schema_hash(self, monkeypatch):
+        """
+        Given: 같은 정의의 도구를 제공하는 두 서버
+        When: 둘 다 등록
+        Then: 토크나이저는 고유 정의당 한 번만 호출, 엔드포인트별 합계 보고
+        """
+        calls: list[str] = []
+
+        def fake_token_counter(model: str, text: str) -> int:
+            calls.append(text)
+            return 10
+
+        monkeypatch.setattr(
+            "src.adapters.outbound.adk.dynamic_toolset.litellm.token_counter", fake_token_counter
+        )
+        dynamic_toolset = DynamicToolset(settings=Settings())
+        for endpoint_id in ("ep-a", "ep-b"):
+            dynamic_toolset._create_mcp_toolset = AsyncMock(
+                return_value=(
+                    self._mock_toolset([self._tool("echo"), self._tool("ping")]),
+                    McpTransport.STREAMABLE_HTTP,
+                )
+            )
+            await dynamic_toolset.add_mcp_server(
+                Endpoint(id=endpoint_id, url=f"http://{endpoint_id}.test", type=EndpointType.MCP)
+            )
+
+        assert len(calls) == 2
+        assert dynamic_toolset.get_tool_definition_tokens() == {"ep-a": 20, "ep-b": 20}
+
+
+class TestDeferredToolSchemaStore:
+    """DeferredToolProxy 재사용 + 엔드포인트 공유 스키마 저장소"""
+
+    @pytest.fixture
+    def settings(self):
+        settings = Settings()
+        settings.mcp.defer_loading_token_threshold = 750
+        return settings
+
+    @pytest.fixture
+    async def deferred_toolset(self, settings):
+        """2개 서버 x 20개 도구 (defer mode)"""
+        dynamic_toolset = DynamicToolset(settings=settings)
+        for i in range(2):
+            endpoint = Endpoint(id=f"mcp-{i}", url=f"http://test{i}.com/mcp", type=EndpointType.MCP)
+            mock_tools = []
+            for j in range(20):
+                mock_tool = MagicMock(spec=BaseTool)
+                mock_tool.name = f"tool_{i}_{j}"
+                mock_tool.description = f"Tool {i}-{j}"
+                mock_tool.run_async = AsyncMock(return_value=f"result_{i}_{j}")
+                mock_tools.append(mock_tool)
+
+            mock_toolset = AsyncMock()
+            mock_toolset.get_tools = AsyncMock(return_value=mock_tools)
+            mock_toolset.close = AsyncMock()
+            dynamic_toolset._create_mcp_toolset = AsyncMock(
+                return_value=(mock_toolset, McpTransport.STREAMABLE_HTTP)
+            )
+            await dynamic_toolset.add_mcp_server(endpoint)
+            mock_toolset.get_tools.reset_mock()
+        return dynamic_toolset
+
+    async def test_proxies_reused_across_turns(self, deferred_toolset):
+        """
+        Given: Defer mode
+        When: get_tools()를 두 번 호출 (두 턴)
+        Then: 같은 프록시 객체를 재사용
+        """
+        first = await deferred_toolset.get_tools()
+        second = await deferred_toolset.get_tools()
+
+        assert all(a is b for a, b in zip(first, second, strict=True))
+
+    async def test_execution_resolves_without_tools_list(self, deferred_toolset):
+        """
+        Given: 캐시가 채워진 Defer mode
+        When: 프록시 실행
+        Then: tools/list 재호출 없이 스키마 저장소에서 풀 도구 조회
+        """
+        tools = await deferred_toolset.get_tools()
+
+        result = await tools[25].run_async({"arg": "value"}, None)
+
+        assert result == "result_1_5"
+        for mcp_toolset in deferred_toolset._mcp_toolsets.values():
+            mcp_toolset.get_tools.assert_not_called()
+
+    async def test_concurrent_misses_coalesce_into_one_fetch(self, deferred_toolset):
+        """
+        Given: 스키마 저장소가 비어 있는 엔드포인트
+        When: 해당 엔드포인트 프록시 20개를 동시에 실행
+        Then: tools/list는 한 번만 호출
+        """
+        tools = await deferred_toolset.get_tools()
+        deferred_toolset._schema_stores["mcp-0"].update([])
+
+        results = await asyncio.gather(*(tool.run_async({}, None) for tool in tools[:20]))
+
+        assert results == [f"result_0_{j}" for j in range(20)]
+        deferred_toolset._mcp_toolsets["mcp-0"].get_tools.assert_called_once()
+        deferred_toolset._mcp_toolsets["mcp-1"].get_tools.assert_not_called()
+
+    async def test_failed_forced_fetch_keeps_stale_cache_servable(self, deferred_toolset, settings):
+        """
+        Given: 스키마 저장소가 비어 있고 tools/list가 실패하는 엔드포인트
+        When: 프록시 실행으로 강제 재조회
+        Then: 기존 캐시 타임스탬프 유지 (stale-while-revalidate 대상으로 남음)
+        """
+        settings.mcp.stale_while_revalidate = True
+        tools = await deferred_toolset.get_tools()
+        timestamp = deferred_toolset._cache_timestamps["mcp-0"]
+        deferred_toolset._schema_stores["mcp-0"].update([])
+        deferred_toolset._mcp_toolsets["mcp-0"].get_tools = AsyncMock(
+            side_effect=TimeoutError("slow server")
+        )
+
+        result = await tools[0].run_async({}, None)
+
+        assert result == "result_0_0"
+        assert deferred_toolset._cache_timestamps["mcp-0"] == timestamp
+        assert deferred_toolset._can_serve_stale(
+            "mcp-0", timestamp + settings.mcp.cache_ttl_seconds
+        )
+
+    async def test_remove_server_drops_proxies_and_store(self, deferred_toolset):
+        """
+        Given: Defer mode
+        When: 서버 제거
+        Then: 해당 엔드포인트 프록시/스키마 저장소 정리
+        """
+        await deferred_toolset.get_tools()
+
+        await deferred_toolset.remove_mcp_server("mcp-0")
+
+        assert "mcp-0" not in deferred_toolset._deferred_proxies
+        assert "mcp-0" not in deferred_toolset._schema_stores
@@ -0,0 +1,134 @@
+"""카탈로그 버전 + 동적 instruction 메모이제이션 테스트
+
+DynamicToolset.catalog_version이 카탈로그가 바뀔 때만 증가하고,
+AdkOrchestratorAdapter가 같은 버전에서 instruction을 재생성하지 않으며 정렬된 결과를 내는지 검증
+"""
+
+from unittest.mock import MagicMock
+
+from src.adapters.outbound.adk.dynamic_toolset import DynamicToolset
+from src.adapters.outbound.adk.orchestrator_adapter import AdkOrchestratorAdapter
+from src.config.settings import Settings
+from tests.unit.fakes.fake_mcp_tools import make_tool, register_mcp_endpoint
+
+
+def _tools(*names: str) -> list[MagicMock]:
+    return [make_tool(name) for name in names]
+
+
+async def _orchestrator(toolset: DynamicToolset) -> AdkOrchestratorAdapter:
+    adapter = AdkOrchestratorAdapter(
+        model="openai/gpt-4o-mini", dynamic_toolset=toolset, enable_llm_logging=False
+    )
+    await adapter.initialize()
+    return adapter
+
+
+class TestCatalogVersion:
+    """DynamicToolset.catalog_version"""
+
+    async def test_version_bumps_on_add_and_remove(self):
+        """
+        Given: 빈 DynamicToolset
+        When: 서버 추가 → 제거
+        Then: 매번 버전 증가
+        """
+        toolset = DynamicToolset(settings=Settings())
+        v0 = toolset.catalog_version
+
+        await register_mcp_endpoint(toolset, "ep-a", _tools("search"), name="Server A")
+        v1 = toolset.catalog_version
+        await toolset.remove_mcp_server("ep-a")
+
+        assert v0 < v1 < toolset.catalog_version
+
+    async def test_refresh_with_same_tools_keeps_version(self):
+        """
+        Given: 등록된 서버
+        When: 같은 도구 목록으로 캐시 갱신 (순서만 다름)
+        Then: 버전 유지
+        """
+        toolset = DynamicToolset(settings=Settings())
+        await register_mcp_endpoint(toolset, "ep-a", _tools("search", "fetch"), name="Server A")
+        version = toolset.catalog_version
+
+        toolset._store_cache("ep-a", [make_tool("fetch"), make_tool("search")])
+
+        assert toolset.catalog_version == version
+
+    async def test_tool_list_change_bumps_version(self):
+        """
+        Given: 등록된 서버
+        When: 도구가 추가된 목록으로 캐시 갱신
+        Then: 버전 증가
+        """
+        toolset = DynamicToolset(settings=Settings())
+        await register_mcp_endpoint(toolset, "ep-a", _tools("search"), name="Server A")
+        version = toolset.catalog_version
+
+        toolset._store_cache("ep-a", [make_tool("search"), make_tool("fetch")])
+
+        assert toolset.catalog_version == version + 1
+
+
+class TestDynamicInstructionMemo:
+    """AdkOrchestratorAdapter 동적 instruction"""
+
+    async def test_same_version_reuses_instruction(self):
+        """
+        Given: 초기화된 Orchestrator
+        When: 카탈로그 변경 없이 재구성
+        Then: get_registered_info()를 다시 호출하지 않고 같은 instruction 사용
+        """
+        toolset = DynamicToolset(settings=Settings())
+        await register_mcp_endpoint(toolset, "ep-a", _tools("search"), name="Server A")
+        orchestrator = await _orchestrator(toolset)
+        first = orchestrator._agent.instruction
+        toolset.get_registered_info = MagicMock(wraps=toolset.get_registered_info)
+
+        instruction = orchestrator._build_dynamic_instruction()
+
+        assert instruction is first
+        toolset.get_registered_info.assert_not_called()
+
+    async def test_catalog_change_rebuilds_instruction(self):
+        """
+        Given: 초기화된 Orchestrator
+        When: MCP 서버 추가 후 재구성 / A2A 에이전트 추가
+        Then: 새 서버와 에이전트가 instruction에 반영됨
+        """
+        toolset = DynamicToolset(settings=Settings())
+        orchestrator = await _orchestrator(toolset)
+
+        await register_mcp_endpoint(toolset, "ep-a", _tools("search"), name="Server A")
+        await orchestrator._rebuild_agent()
+        await orchestrator.update_a2a_agents(add={"echo": "http://localhost:9001"})
+
+        instruction = orchestrator._agent.instruction
+        assert 'Server "Server A": search' in instruction
+        assert 'Agent "a2a_echo"' in instruction
+
+    async def test_instruction_is_byte_stable_across_registration_order(self):
+        """
+        Given: 같은 서버/도구/에이전트를 서로 다른 순서로 등록한 두 Orchestrator
+        When: instruction 생성
+        Then: 완전히 같은 문자열 (서버/도구/에이전트 정렬)
+        """
+        forward = DynamicToolset(settings=Settings())
+        await register_mcp_endpoint(forward, "ep-a", _tools("search", "fetch"), name="Alpha")
+        await register_mcp_endpoint(forward, "ep-b", _tools("query"), name="Beta")
+        reverse = DynamicToolset(settings=Settings())
+        await register_mcp_endpoint(reverse, "ep-b", _tools("query"), name="Beta")
+        await register_mcp_endpoint(reverse, "ep-a", _tools("fetch", "search"), name="Alpha")
+
+        first = await _orchestrator(forward)
+        await first.update_a2a_agents(
+            add={"x": "http://localhost:9001", "y": "http://localhost:9002"}
+        )
+        second = await _orchestrator(reverse)
+        await second.update_a2a_agents(
+            add={"y": "http://localhost:9002", "x": "http://localhost:9001"}
+        )
+
+        assert first._agent.instruction == second._agent.instruction
+        assert 'Server "Alpha": fetch, search' in first._agent.instruction
@@ -7,7 +7,7 @@ import logging
 from unittest.mock import AsyncMock
 
 from src.adapters.outbound.adk.dynamic_toolset import DynamicToolset
-from src.domain.entities.endpoint import Endpoint, EndpointType
+from src.domain.entities.endpoint import Endpoint, EndpointType, McpTransport
 
 
 async def test_get_tools_logs_cache_hit_miss(caplog):
@@ -80,8 +80,8 @@ async def test_add_mcp_server_logs_endpoint_url_and_tool_count(caplog):
     mock_mcp.get_tools = AsyncMock(return_value=mock_tools)
     mock_mcp.close = AsyncMock()
 
-    async def mock_create_mcp(url, auth_config=None):
-        return mock_mcp
+    async def mock_create_mcp(url, auth_config=None, transport=None):
+        return mock_mcp, McpTransport.STREAMABLE_HTTP
 
     toolset._create_mcp_toolset = mock_create_mcp
 
@@ -115,8 +115,8 @@ async def test_remove_mcp_server_logs_removed_tool_count(caplog):
     mock_mcp.get_tools = AsyncMock(return_value=mock_tools)
     mock_mcp.close = AsyncMock()
 
-    async def mock_create_mcp(url, auth_config=None):
-        return mock_mcp
+    async def mock_create_mcp(url, auth_config=None, transport=None):
+        return mock_mcp, McpTransport.STREAMABLE_HTTP
 
     toolset._create_mcp_toolset = mock_create_mcp
 
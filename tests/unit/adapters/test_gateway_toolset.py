@@ -1,5 +1,6 @@
 """GatewayToolset Adapter 테스트 (TDD Red-Green-Refactor)"""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -132,7 +133,9 @@ class TestGatewayToolset:
 
         # Then
         assert result == {"result": "success"}
-        dynamic_toolset.call_tool.assert_called_once_with("tool1", {"arg": "value"})
+        dynamic_toolset.call_tool.assert_called_once_with(
+            "tool1", {"arg": "value"}, endpoint_id=endpoint.id
+        )
 
     async def test_call_tool_with_gateway_failure_records_failure(self):
         """
@@ -198,3 +201,136 @@ class TestGatewayToolset:
         # Then
         assert result == {"result": "fallback_success"}
         assert dynamic_toolset.call_tool.call_count == 2
+
+
+def _make_gateway_toolset(dynamic_toolset: AsyncMock) -> tuple[GatewayToolset, Endpoint]:
+    endpoint = Endpoint(url="https://example.com/mcp", type=EndpointType.MCP)
+    gateway_service = GatewayService(rate_limit_rps=5.0, burst_size=10)
+    gateway_service.register_endpoint(endpoint)
+    return (
+        GatewayToolset(dynamic_toolset=dynamic_toolset, gateway_service=gateway_service),
+        endpoint,
+    )
+
+
+class TestGatewayToolsetSingleFlight:
+    """동일 호출 single-flight 병합"""
+
+    async def test_concurrent_identical_calls_share_one_request(self):
+        """
+        Given: 응답이 지연되는 도구
+        When: 키 순서만 다른 같은 인자로 동시에 3번 호출
+        Then: 실제 호출 1회 + 모두 같은 결과 + collapse 비율 2/3
+        """
+        release = asyncio.Event()
+
+        async def slow_call(tool_name, arguments, endpoint_id=None):
+            await release.wait()
+            return {"items": [1]}
+
+        dynamic_toolset = AsyncMock()
+        dynamic_toolset.call_tool.side_effect = slow_call
+        gateway_toolset, endpoint = _make_gateway_toolset(dynamic_toolset)
+
+        calls = [
+            asyncio.ensure_future(
+                gateway_toolset.call_tool_with_gateway(endpoint.id, "search", arguments)
+            )
+            for arguments in ({"q": "a", "n": 1}, {"n": 1, "q": "a"}, {"q": "a", "n": 1})
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*calls)
+
+        assert results == [{"items": [1]}] * 3
+        dynamic_toolset.call_tool.assert_awaited_once()
+        stats = gateway_toolset.get_singleflight_stats()
+        assert stats["singleflight_collapsed"] == 2
+        assert stats["singleflight_collapse_rate"] == pytest.approx(2 / 3)
+        assert stats["singleflight_inflight"] == 0
+
+    async def test_different_arguments_are_not_collapsed(self):
+        """
+        Given: 응답이 지연되는 도구
+        When: 서로 다른 인자로 동시에 호출
+        Then: 각각 실제 호출
+        """
+        release = asyncio.Event()
+
+        async def slow_call(tool_name, arguments, endpoint_id=None):
+            await release.wait()
+            return arguments
+
+        dynamic_toolset = AsyncMock()
+        dynamic_toolset.call_tool.side_effect = slow_call
+        gateway_toolset, endpoint = _make_gateway_toolset(dynamic_toolset)
+
+        calls = [
+            asyncio.ensure_future(
+                gateway_toolset.call_tool_with_gateway(endpoint.id, "search", {"q": q})
+            )
+            for q in ("a", "b")
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*calls) == [{"q": "a"}, {"q": "b"}]
+        assert dynamic_toolset.call_tool.await_count == 2
+
+    async def test_error_is_shared_and_next_call_runs_again(self):
+        """
+        Given: 동시에 합류한 호출이 실패
+        When: 완료 후 같은 인자로 다시 호출
+        Then: 합류한 호출 모두 같은 예외, 이후 호출은 새로 실행
+        """
+        release = asyncio.Event()
+
+        async def failing_call(tool_name, arguments, endpoint_id=None):
+            await release.wait()
+            raise RuntimeError("boom")
+
+        dynamic_toolset = AsyncMock()
+        dynamic_toolset.call_tool.side_effect = failing_call
+        gateway_toolset, endpoint = _make_gateway_toolset(dynamic_toolset)
+
+        calls = [
+            asyncio.ensure_future(gateway_toolset.call_tool_with_gateway(endpoint.id, "t", {}))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*calls, return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert dynamic_toolset.call_tool.await_count == 1
+
+        dynamic_toolset.call_tool.side_effect = None
+        dynamic_toolset.call_tool.return_value = "ok"
+        assert await gateway_toolset.call_tool_with_gateway(endpoint.id, "t", {}) == "ok"
+
+    async def test_cancelled_follower_does_not_cancel_shared_call(self):
+        """
+        Given: 진행 중인 호출에 합류한 호출
+        When: 합류한 호출만 취소
+        Then: 최초 호출은 정상 완료
+        """
+        release = asyncio.Event()
+
+        async def slow_call(tool_name, arguments, endpoint_id=None):
+            await release.wait()
+            return "done"
+
+        dynamic_toolset = AsyncMock()
+        dynamic_toolset.call_tool.side_effect = slow_call
+        gateway_toolset, endpoint = _make_gateway_toolset(dynamic_toolset)
+
+        leader = asyncio.ensure_future(gateway_toolset.call_tool_with_gateway(endpoint.id, "t", {}))
+        follower = asyncio.ensure_future(
+            gateway_toolset.call_tool_with_gateway(endpoint.id, "t", {})
+        )
+        await asyncio.sleep(0)
+        follower.cancel()
+        release.set()
+
+        assert await leader == "done"
+        assert follower.cancelled()
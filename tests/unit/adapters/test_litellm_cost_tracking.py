@@ -67,3 +67,48 @@ class TestLiteLLMCostTracking:
         usage: Usage = cost_service_mock.record_usage.call_args[0][0]
 
         assert usage.cost_usd == 0.0  # 비용 정보 없을 때 기본값
+
+    async def test_log_success_records_openai_cached_tokens(self, logger, cost_service_mock):
+        """
+        Given: OpenAI 형식 캐시 토큰 (prompt_tokens_details.cached_tokens)
+        When: 성공 이벤트 기록
+        Then: Usage.cached_tokens에 반영
+        """
+        response_obj = MagicMock()
+        response_obj.usage = MagicMock(
+            prompt_tokens=2000,
+            completion_tokens=10,
+            total_tokens=2010,
+            prompt_tokens_details=MagicMock(cached_tokens=1536),
+        )
+        response_obj._hidden_params = {"response_cost": 0.0002}
+
+        await logger.log_success_event(
+            {"model": "openai/gpt-4o-mini"}, response_obj, datetime.now(), datetime.now()
+        )
+
+        usage: Usage = cost_service_mock.record_usage.call_args[0][0]
+        assert usage.cached_tokens == 1536
+
+    async def test_log_success_records_anthropic_cache_read_tokens(self, logger, cost_service_mock):
+        """
+        Given: Anthropic 형식 캐시 토큰 (cache_read_input_tokens)
+        When: 성공 이벤트 기록
+        Then: Usage.cached_tokens에 반영
+        """
+        response_obj = MagicMock()
+        response_obj.usage = MagicMock(
+            prompt_tokens=3000,
+            completion_tokens=20,
+            total_tokens=3020,
+            prompt_tokens_details=None,
+            cache_read_input_tokens=2800,
+        )
+        response_obj._hidden_params = {}
+
+        await logger.log_success_event(
+            {"model": "anthropic/claude-sonnet-4"}, response_obj, datetime.now(), datetime.now()
+        )
+
+        usage: Usage = cost_service_mock.record_usage.call_args[0][0]
+        assert usage.cached_tokens == 2800
@@ -0,0 +1,149 @@
+"""비동기 LiteLLM 호출 + 공용 HTTP 연결 풀 테스트
+
+generate_response()/stream_response()가 스레드 없이 litellm.acompletion을 사용하고,
+Orchestrator가 만든 연결 풀을 공유한 뒤 close()에서 정리하는지 검증
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import litellm
+import pytest
+
+from src.adapters.outbound.adk.orchestrator_adapter import AdkOrchestratorAdapter
+
+
+def _response(content: str, model: str = "openai/gpt-4o-mini") -> MagicMock:
+    response = MagicMock()
+    response.choices = [MagicMock(message=MagicMock(content=content))]
+    response.model = model
+    return response
+
+
+def _chunk(text: str | None) -> MagicMock:
+    return MagicMock(choices=[MagicMock(delta=MagicMock(content=text))])
+
+
+async def _stream(*texts: str | None):
+    for text in texts:
+        yield _chunk(text)
+
+
+@pytest.fixture
+async def orchestrator():
+    previous = litellm.aclient_session
+    litellm.aclient_session = None
+    adapter = AdkOrchestratorAdapter(
+        model="openai/gpt-4o-mini",
+        dynamic_toolset=AsyncMock(),
+        max_connections=8,
+        max_keepalive_connections=4,
+        request_timeout=30.0,
+    )
+    yield adapter
+    await adapter.close()
+    litellm.aclient_session = previous
+
+
+class TestGenerateResponse:
+    """generate_response() 비동기 호출"""
+
+    async def test_uses_acompletion_without_thread(self, orchestrator):
+        """
+        Given: litellm.acompletion 응답
+        When: system_prompt와 함께 generate_response() 호출
+        Then: asyncio.to_thread 없이 acompletion 1회 호출 + system 메시지가 맨 앞
+        """
+        with (
+            patch("litellm.acompletion", new=AsyncMock(return_value=_response("hi"))) as acall,
+            patch.object(asyncio, "to_thread") as to_thread,
+        ):
+            result = await orchestrator.generate_response(
+                messages=[{"role": "user", "content": "hello"}],
+                system_prompt="be brief",
+                max_tokens=16,
+            )
+
+        assert result == {"role": "assistant", "content": "hi", "model": "openai/gpt-4o-mini"}
+        to_thread.assert_not_called()
+        messages = acall.await_args.kwargs["messages"]
+        assert messages[0] == {"role": "system", "content": "be brief"}
+        assert acall.await_args.kwargs["max_tokens"] == 16
+
+    async def test_concurrent_calls_share_pooled_client(self, orchestrator):
+        """
+        Given: 설정된 연결 수 제한
+        When: generate_response() 동시 호출
+        Then: 모든 호출이 같은 httpx.AsyncClient(litellm.aclient_session)를 사용
+        """
+        with patch("litellm.acompletion", new=AsyncMock(return_value=_response("ok"))):
+            await asyncio.gather(
+                *(
+                    orchestrator.generate_response([{"role": "user", "content": str(i)}])
+                    for i in range(5)
+                )
+            )
+
+        client = litellm.aclient_session
+        assert isinstance(client, httpx.AsyncClient)
+        assert client is orchestrator._http_client
+        assert orchestrator._http_limits.max_connections == 8
+        assert client.timeout.read == 30.0
+
+
+class TestPooledClientLifecycle:
+    """공용 연결 풀 생성/정리"""
+
+    async def test_close_releases_owned_client(self, orchestrator):
+        """
+        Given: Orchestrator가 생성한 연결 풀
+        When: close()
+        Then: 클라이언트가 닫히고 litellm.aclient_session이 해제됨
+        """
+        with patch("litellm.acompletion", new=AsyncMock(return_value=_response("ok"))):
+            await orchestrator.generate_response([{"role": "user", "content": "hi"}])
+        client = orchestrator._http_client
+
+        await orchestrator.close()
+
+        assert client.is_closed
+        assert litellm.aclient_session is None
+
+    async def test_existing_session_is_not_replaced(self, orchestrator):
+        """
+        Given: 외부에서 이미 설정한 litellm.aclient_session
+        When: generate_response() 후 close()
+        Then: 외부 클라이언트를 그대로 사용하고 닫지 않음
+        """
+        external = httpx.AsyncClient()
+        litellm.aclient_session = external
+        try:
+            with patch("litellm.acompletion", new=AsyncMock(return_value=_response("ok"))):
+                await orchestrator.generate_response([{"role": "user", "content": "hi"}])
+            await orchestrator.close()
+
+            assert litellm.aclient_session is external
+            assert not external.is_closed
+        finally:
+            await external.aclose()
+
+
+class TestStreamResponse:
+    """stream_response() 스트리밍"""
+
+    async def test_yields_text_deltas(self, orchestrator):
+        """
+        Given: 스트리밍 응답 (내용 없는 조각 포함)
+        When: stream_response() 순회
+        Then: 텍스트 조각만 순서대로 반환 + stream=True로 호출
+        """
+        acall = AsyncMock(return_value=_stream("Hel", None, "lo"))
+
+        with patch("litellm.acompletion", new=acall):
+            chunks = [
+                c async for c in orchestrator.stream_response([{"role": "user", "content": "hi"}])
+            ]
+
+        assert chunks == ["Hel", "lo"]
+        assert acall.await_args.kwargs["stream"] is True
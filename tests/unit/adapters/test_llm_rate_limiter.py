@@ -0,0 +1,319 @@
+"""LlmRateLimiter 테스트
+
+모델별 RPM/TPM 간격 조절, Retry-After/rate limit 헤더 해석, 적응형 backoff,
+Orchestrator의 모든 LLM 호출 경로(generate_response, ADK LiteLlm) 연동을 검증
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import litellm
+import pytest
+
+from src.adapters.outbound.adk import llm_rate_limiter
+from src.adapters.outbound.adk.llm_rate_limiter import (
+    LlmRateLimiter,
+    parse_duration,
+    retry_after_seconds,
+)
+from src.adapters.outbound.adk.orchestrator_adapter import AdkOrchestratorAdapter
+from src.domain.exceptions import LlmRateLimitError
+
+MODEL = "openai/gpt-4o-mini"
+
+
+def _rate_limit(headers: dict | None = None) -> litellm.RateLimitError:
+    return litellm.RateLimitError(
+        message="429",
+        llm_provider="openai",
+        model=MODEL,
+        response=httpx.Response(
+            429, headers=headers or {}, request=httpx.Request("POST", "https://x")
+        ),
+    )
+
+
+def _response(total_tokens: int | None = None, headers: dict | None = None) -> MagicMock:
+    response = MagicMock()
+    response.choices = [MagicMock(message=MagicMock(content="ok"))]
+    response.model = MODEL
+    response.usage = MagicMock(total_tokens=total_tokens)
+    response._hidden_params = {"additional_headers": headers or {}}
+    return response
+
+
+class _Clock:
+    """asyncio.sleep 호출 시 시간을 진행시키는 가짜 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 3))
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(llm_rate_limiter, "time", SimpleNamespace(monotonic=clock.monotonic))
+    monkeypatch.setattr(llm_rate_limiter, "asyncio", SimpleNamespace(sleep=clock.sleep))
+    return clock
+
+
+def _sender(*results):
+    """순서대로 결과를 반환하거나 예외를 발생시키는 send 함수"""
+    return AsyncMock(side_effect=list(results))
+
+
+class TestHeaderParsing:
+    """Retry-After / rate limit 헤더 해석"""
+
+    @pytest.mark.parametrize(
+        ("value", "seconds"),
+        [("2", 2.0), ("1.5", 1.5), ("20ms", 0.02), ("6m0s", 360.0), ("1h2m3s", 3723.0)],
+    )
+    def test_parse_duration(self, value, seconds):
+        """
+        Given: 초/OpenAI 형식 시간 값
+        When: parse_duration
+        Then: 초 단위 값
+        """
+        assert parse_duration(value) == pytest.approx(seconds)
+
+    def test_parse_duration_rejects_garbage(self):
+        """
+        Given: 해석할 수 없는 값
+        When: parse_duration
+        Then: None
+        """
+        assert parse_duration("soon") is None
+        assert parse_duration(None) is None
+
+    def test_retry_after_header_precedence(self):
+        """
+        Given: retry-after-ms, retry-after, x-ratelimit-reset-* 헤더
+        When: retry_after_seconds
+        Then: retry-after-ms → retry-after → reset 헤더 순으로 사용
+        """
+        assert retry_after_seconds(_rate_limit({"retry-after-ms": "250", "retry-after": "9"})) == (
+            0.25
+        )
+        assert retry_after_seconds(_rate_limit({"retry-after": "3"})) == 3.0
+        assert retry_after_seconds(_rate_limit({"x-ratelimit-reset-tokens": "1m30s"})) == 90.0
+        assert retry_after_seconds(_rate_limit()) is None
+
+
+class TestSpacing:
+    """RPM/TPM 간격 조절"""
+
+    async def test_rpm_spaces_requests_after_burst(self, clock):
+        """
+        Given: rpm=60 (1초 간격, 6초 burst 허용)
+        When: 동시에 9번 호출
+        Then: 처음 7번은 바로 전송, 이후는 1초 간격으로 대기
+        """
+        limiter = LlmRateLimiter({MODEL: {"rpm": 60}})
+
+        for _ in range(9):
+            await limiter.call(MODEL, _sender(_response()))
+
+        assert clock.sleeps == [1.0, 1.0]
+        assert limiter.get_stats()[MODEL]["requests"] == 9
+
+    async def test_tpm_waits_for_token_budget(self, clock):
+        """
+        Given: tpm=600 (초당 10토큰)
+        When: 100토큰 요청 2번
+        Then: 두 번째 요청은 burst 구간(6초)을 넘는 만큼(4초) 대기
+        """
+        limiter = LlmRateLimiter({MODEL: {"tpm": 600}})
+
+        await limiter.call(MODEL, _sender(_response()), estimated_tokens=100)
+        await limiter.call(MODEL, _sender(_response()), estimated_tokens=100)
+
+        assert clock.sleeps == [4.0]
+
+    async def test_actual_usage_corrects_estimate(self, clock):
+        """
+        Given: tpm=600, 100토큰으로 추정한 요청의 실제 사용량이 20토큰
+        When: 다음 100토큰 요청
+        Then: 실제 사용량 기준으로 대기하지 않음
+        """
+        limiter = LlmRateLimiter({MODEL: {"tpm": 600}})
+
+        await limiter.call(MODEL, _sender(_response(total_tokens=20)), estimated_tokens=100)
+        await limiter.call(MODEL, _sender(_response()), estimated_tokens=100)
+
+        assert clock.sleeps == []
+
+    async def test_wildcard_limit_and_unlimited_default(self, clock):
+        """
+        Given: "*" 한도만 설정 / 한도 미설정
+        When: 설정에 없는 모델 호출
+        Then: "*" 한도 적용 / 제한 없음
+        """
+        limited = LlmRateLimiter({"*": {"rpm": 30}})
+        unlimited = LlmRateLimiter()
+
+        await limited.call("other/model", _sender(_response()))
+        await unlimited.call("other/model", _sender(_response()))
+
+        assert limited.get_stats()["other/model"]["rpm"] == 30
+        assert unlimited.get_stats()["other/model"]["rpm"] == 0
+
+
+class TestRetry:
+    """429 재시도"""
+
+    async def test_retry_after_is_honored(self, clock):
+        """
+        Given: Retry-After: 2 헤더가 있는 429 후 성공
+        When: call
+        Then: 2초 대기 후 재시도하여 응답 반환
+        """
+        limiter = LlmRateLimiter()
+        response = _response()
+
+        result = await limiter.call(MODEL, _sender(_rate_limit({"retry-after": "2"}), response))
+
+        assert result is response
+        assert clock.sleeps == [2.0]
+        assert limiter.get_stats()[MODEL]["rate_limited"] == 1
+
+    async def test_adaptive_backoff_without_header(self, clock):
+        """
+        Given: Retry-After 없는 429가 계속 발생 (max_retries=3)
+        When: call
+        Then: 약 1, 2, 4초 backoff 후 LlmRateLimitError
+        """
+        limiter = LlmRateLimiter(max_retries=3, backoff_seconds=1.0)
+        send = _sender(*[_rate_limit() for _ in range(4)])
+
+        with pytest.raises(LlmRateLimitError):
+            await limiter.call(MODEL, send)
+
+        assert send.await_count == 4
+        for sleep, base in zip(clock.sleeps, [1.0, 2.0, 4.0], strict=True):
+            assert base <= sleep <= base * 1.1
+
+    async def test_backoff_resets_after_success(self, clock):
+        """
+        Given: 429 → 성공 이후 다시 429
+        When: 두 번째 호출
+        Then: backoff가 처음 값(약 1초)부터 다시 시작
+        """
+        limiter = LlmRateLimiter()
+
+        await limiter.call(MODEL, _sender(_rate_limit(), _response()))
+        await limiter.call(MODEL, _sender(_rate_limit(), _response()))
+
+        assert all(1.0 <= sleep <= 1.1 for sleep in clock.sleeps)
+
+    async def test_rate_limit_blocks_other_callers(self, clock):
+        """
+        Given: 한 호출이 Retry-After: 5로 429를 받고 최대 재시도 0
+        When: 같은 모델의 다른 호출
+        Then: 다른 호출도 5초 동안 대기 (프로세스 전역)
+        """
+        limiter = LlmRateLimiter(max_retries=0)
+
+        with pytest.raises(LlmRateLimitError):
+            await limiter.call(MODEL, _sender(_rate_limit({"retry-after": "5"})))
+        await limiter.call(MODEL, _sender(_response()))
+
+        assert clock.sleeps == [5.0]
+
+    async def test_exhausted_headroom_delays_next_call(self, clock):
+        """
+        Given: 성공 응답의 x-ratelimit-remaining-requests가 0, reset 3s
+        When: 다음 호출
+        Then: reset 시간만큼 대기
+        """
+        limiter = LlmRateLimiter()
+        headers = {"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "3s"}
+
+        await limiter.call(MODEL, _sender(_response(headers=headers)))
+        await limiter.call(MODEL, _sender(_response()))
+
+        assert clock.sleeps == [3.0]
+
+    async def test_exhausted_headroom_reads_provider_prefixed_headers(self, clock):
+        """
+        Given: LiteLLM이 llm_provider- 접두사로 전달한 remaining 0, reset 2s 헤더
+        When: 다음 호출
+        Then: reset 시간만큼 대기
+        """
+        limiter = LlmRateLimiter()
+        headers = {
+            "llm_provider-x-ratelimit-remaining-tokens": "0",
+            "llm_provider-x-ratelimit-reset-tokens": "2s",
+        }
+
+        await limiter.call(MODEL, _sender(_response(headers=headers)))
+        await limiter.call(MODEL, _sender(_response()))
+
+        assert clock.sleeps == [2.0]
+
+    async def test_other_errors_are_not_retried(self, clock):
+        """
+        Given: 429가 아닌 오류
+        When: call
+        Then: 재시도 없이 그대로 전파
+        """
+        limiter = LlmRateLimiter()
+        send = _sender(ValueError("bad request"))
+
+        with pytest.raises(ValueError):
+            await limiter.call(MODEL, send)
+
+        assert send.await_count == 1
+        assert clock.sleeps == []
+
+
+class TestOrchestratorIntegration:
+    """Orchestrator LLM 호출 경로 연동"""
+
+    async def test_generate_response_retries_rate_limit(self):
+        """
+        Given: 첫 호출이 retry-after-ms: 10인 429
+        When: generate_response()
+        Then: 재시도하여 응답 반환
+        """
+        orchestrator = AdkOrchestratorAdapter(model=MODEL, dynamic_toolset=AsyncMock())
+        acall = AsyncMock(side_effect=[_rate_limit({"retry-after-ms": "10"}), _response()])
+
+        with patch("litellm.acompletion", new=acall):
+            result = await orchestrator.generate_response([{"role": "user", "content": "hi"}])
+        await orchestrator.close()
+
+        assert result["content"] == "ok"
+        assert acall.await_count == 2
+
+    async def test_agent_model_calls_go_through_limiter(self):
+        """
+        Given: 한도가 설정된 limiter를 가진 Orchestrator
+        When: ADK LiteLlm 클라이언트로 호출 (429 후 성공)
+        Then: limiter가 재시도하고 호출 수를 기록
+        """
+        limiter = LlmRateLimiter({MODEL: {"rpm": 100}})
+        orchestrator = AdkOrchestratorAdapter(
+            model=MODEL, dynamic_toolset=AsyncMock(), rate_limiter=limiter
+        )
+        model = orchestrator._build_model()
+        acall = AsyncMock(side_effect=[_rate_limit({"retry-after-ms": "10"}), _response()])
+
+        with patch("litellm.acompletion", new=acall):
+            await model.llm_client.acompletion(
+                model=MODEL, messages=[{"role": "user", "content": "hi"}], tools=None
+            )
+        await orchestrator.close()
+
+        stats = limiter.get_stats()[MODEL]
+        assert stats["requests"] == 2
+        assert stats["rate_limited"] == 1
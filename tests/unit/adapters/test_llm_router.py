@@ -0,0 +1,297 @@
+"""LlmDeploymentRouter 테스트
+
+논리 모델별 배포 풀에서 EWMA 지연/rate limit 여유분으로 배포를 선택하고,
+429/5xx 시 쿨다운 후 다음 배포로 장애 조치하는지 검증
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import litellm
+import pytest
+from google.adk.models.lite_llm import LiteLlm
+
+from src.adapters.outbound.adk.llm_router import LlmDeploymentRouter
+from src.adapters.outbound.adk.orchestrator_adapter import AdkOrchestratorAdapter
+
+
+def _response(content: str = "ok", headers: dict | None = None) -> MagicMock:
+    response = MagicMock()
+    response.choices = [MagicMock(message=MagicMock(content=content))]
+    response.model = "m"
+    response._hidden_params = {"additional_headers": headers or {}}
+    return response
+
+
+def _rate_limit(retry_after: str | None = None) -> litellm.RateLimitError:
+    headers = {"retry-after": retry_after} if retry_after else {}
+    return litellm.RateLimitError(
+        message="429",
+        llm_provider="openai",
+        model="m",
+        response=httpx.Response(429, headers=headers, request=httpx.Request("POST", "https://x")),
+    )
+
+
+def _deployed_model(call) -> str:
+    return call.kwargs["model"]
+
+
+@pytest.fixture
+def router() -> LlmDeploymentRouter:
+    return LlmDeploymentRouter(
+        {
+            "default": [
+                {"model": "openai/gpt-4o-mini", "api_key": "key-a", "id": "a"},
+                {"model": "azure/gpt-4o-mini", "api_key": "key-b", "id": "b"},
+            ]
+        },
+        ewma_alpha=0.5,
+        cooldown_seconds=30.0,
+    )
+
+
+def _set_latency(router: LlmDeploymentRouter, **latencies: float) -> None:
+    for deployment in router._pools["default"]:
+        if deployment.id in latencies:
+            deployment.ewma_latency_ms = latencies[deployment.id]
+
+
+class TestFailover:
+    """429/5xx 장애 조치"""
+
+    async def test_rate_limit_fails_over_and_cools_down(self, router):
+        """
+        Given: 첫 배포가 429 응답
+        When: acompletion 2회 호출
+        Then: 두 번째 배포로 장애 조치 + 첫 배포는 쿨다운으로 다음 호출에서 제외
+        """
+        acall = AsyncMock(side_effect=[_rate_limit(), _response(), _response()])
+
+        with patch("litellm.acompletion", new=acall):
+            await router.acompletion(model="default", messages=[])
+            await router.acompletion(model="default", messages=[])
+
+        assert [_deployed_model(c) for c in acall.await_args_list] == [
+            "openai/gpt-4o-mini",
+            "azure/gpt-4o-mini",
+            "azure/gpt-4o-mini",
+        ]
+        health = {d["id"]: d for d in router.get_health()["default"]}
+        assert health["a"]["healthy"] is False
+        assert health["a"]["failures"] == 1
+        assert health["b"]["healthy"] is True
+
+    async def test_retry_after_sets_cooldown(self, router):
+        """
+        Given: Retry-After: 2 헤더가 있는 429
+        When: 장애 조치
+        Then: 쿨다운이 기본값(30초) 대신 2초
+        """
+        acall = AsyncMock(side_effect=[_rate_limit(retry_after="2"), _response()])
+
+        with patch("litellm.acompletion", new=acall):
+            await router.acompletion(model="default", messages=[])
+
+        cooldown = router.get_health()["default"][0]["cooldown_remaining_seconds"]
+        assert 0 < cooldown <= 2
+
+    async def test_server_error_fails_over(self, router):
+        """
+        Given: 첫 배포가 503 응답
+        When: acompletion
+        Then: 두 번째 배포 응답 반환
+        """
+        unavailable = litellm.ServiceUnavailableError(
+            message="503", llm_provider="openai", model="m"
+        )
+        acall = AsyncMock(side_effect=[unavailable, _response("from b")])
+
+        with patch("litellm.acompletion", new=acall):
+            response = await router.acompletion(model="default", messages=[])
+
+        assert response.choices[0].message.content == "from b"
+
+    async def test_client_error_is_not_retried(self, router):
+        """
+        Given: 400 (BadRequest) 오류
+        When: acompletion
+        Then: 다른 배포로 재시도하지 않고 즉시 전파
+        """
+        bad_request = litellm.BadRequestError(message="bad", llm_provider="openai", model="m")
+        acall = AsyncMock(side_effect=bad_request)
+
+        with patch("litellm.acompletion", new=acall), pytest.raises(litellm.BadRequestError):
+            await router.acompletion(model="default", messages=[])
+
+        assert acall.await_count == 1
+
+    async def test_all_deployments_failing_raises_last_error(self, router):
+        """
+        Given: 모든 배포가 429
+        When: acompletion
+        Then: 각 배포를 한 번씩 시도한 뒤 RateLimitError 전파
+        """
+        acall = AsyncMock(side_effect=[_rate_limit(), _rate_limit()])
+
+        with patch("litellm.acompletion", new=acall), pytest.raises(litellm.RateLimitError):
+            await router.acompletion(model="default", messages=[])
+
+        assert acall.await_count == 2
+
+    async def test_empty_pool_raises_runtime_error(self, router):
+        """
+        Given: 배포가 하나도 없는 풀
+        When: acompletion
+        Then: litellm 호출 없이 RuntimeError
+        """
+        router._pools["empty"] = []
+        acall = AsyncMock()
+
+        with patch("litellm.acompletion", new=acall), pytest.raises(RuntimeError):
+            await router.acompletion(model="empty", messages=[])
+
+        acall.assert_not_awaited()
+
+
+class TestRanking:
+    """EWMA 지연 + rate limit 여유분 기반 선택"""
+
+    async def test_prefers_lower_latency(self, router):
+        """
+        Given: b의 EWMA 지연이 더 낮음
+        When: acompletion
+        Then: b 선택
+        """
+        _set_latency(router, a=900.0, b=200.0)
+        acall = AsyncMock(return_value=_response())
+
+        with patch("litellm.acompletion", new=acall):
+            await router.acompletion(model="default", messages=[])
+
+        assert _deployed_model(acall.await_args) == "azure/gpt-4o-mini"
+
+    async def test_low_headroom_is_penalized(self, router):
+        """
+        Given: a가 더 빠르지만 남은 요청 한도가 1%
+        When: a 응답 헤더 반영 후 acompletion
+        Then: 여유분이 많은 b 선택
+        """
+        _set_latency(router, a=100.0, b=300.0)
+        headers = {"x-ratelimit-remaining-requests": "1", "x-ratelimit-limit-requests": "100"}
+        acall = AsyncMock(side_effect=[_response(headers=headers), _response()])
+
+        with patch("litellm.acompletion", new=acall):
+            await router.acompletion(model="default", messages=[])
+            await router.acompletion(model="default", messages=[])
+
+        assert [_deployed_model(c) for c in acall.await_args_list] == [
+            "openai/gpt-4o-mini",
+            "azure/gpt-4o-mini",
+        ]
+        assert router.get_health()["default"][0]["remaining_requests"] == 1
+
+    async def test_latency_is_ewma(self, router):
+        """
+        Given: ewma_alpha=0.5, 기존 지연 100ms
+        When: 약 300ms 응답 반영
+        Then: EWMA가 두 값 사이로 이동
+        """
+        deployment = router._pools["default"][0]
+        deployment.ewma_latency_ms = 100.0
+
+        router._record_success(deployment, 300.0, _response())
+
+        assert deployment.ewma_latency_ms == 200.0
+
+
+class TestParams:
+    """배포 파라미터"""
+
+    async def test_env_reference_and_deployment_params_win(self, monkeypatch):
+        """
+        Given: api_key가 os.environ/ 참조인 배포
+        When: 논리 모델 이름으로 호출
+        Then: 실제 모델/환경 변수 키로 호출 + 나머지 인자 유지
+        """
+        monkeypatch.setenv("TEST_DEPLOY_KEY", "secret")
+        router = LlmDeploymentRouter(
+            {"fast": [{"model": "openai/gpt-4o-mini", "api_key": "os.environ/TEST_DEPLOY_KEY"}]}
+        )
+        acall = AsyncMock(return_value=_response())
+
+        with patch("litellm.acompletion", new=acall):
+            await router.acompletion(model="fast", messages=[{"role": "user"}], max_tokens=5)
+
+        kwargs = acall.await_args.kwargs
+        assert kwargs["model"] == "openai/gpt-4o-mini"
+        assert kwargs["api_key"] == "secret"
+        assert kwargs["max_tokens"] == 5
+        assert router.get_health()["fast"][0]["id"] == "fast/0"
+
+    def test_deployment_without_model_is_rejected(self):
+        """
+        Given: model이 없는 배포 설정
+        When: 라우터 생성
+        Then: ValueError
+        """
+        with pytest.raises(ValueError):
+            LlmDeploymentRouter({"default": [{"api_key": "k"}]})
+
+
+class TestOrchestratorIntegration:
+    """Orchestrator 연동"""
+
+    async def test_generate_response_routes_logical_model(self, router):
+        """
+        Given: 배포 풀 라우터가 있는 Orchestrator (model="default")
+        When: generate_response()
+        Then: 라우터를 통해 실제 배포 모델로 호출
+        """
+        orchestrator = AdkOrchestratorAdapter(
+            model="default", dynamic_toolset=AsyncMock(), llm_router=router
+        )
+        acall = AsyncMock(return_value=_response("routed"))
+
+        with patch("litellm.acompletion", new=acall):
+            result = await orchestrator.generate_response([{"role": "user", "content": "hi"}])
+        await orchestrator.close()
+
+        assert result["content"] == "routed"
+        assert _deployed_model(acall.await_args) == "openai/gpt-4o-mini"
+
+    async def test_agent_model_routes_through_orchestrator(self, router):
+        """
+        Given: 배포 풀 라우터가 있는 Orchestrator
+        When: _build_model()로 만든 LiteLlm 클라이언트로 논리 모델 호출
+        Then: 라우터를 통해 실제 배포 모델로 호출
+        """
+        orchestrator = AdkOrchestratorAdapter(
+            model="default", dynamic_toolset=AsyncMock(), llm_router=router
+        )
+        model = orchestrator._build_model()
+        acall = AsyncMock(return_value=_response())
+
+        with patch("litellm.acompletion", new=acall):
+            await model.llm_client.acompletion(model="default", messages=[], tools=None)
+        await orchestrator.close()
+
+        assert isinstance(model, LiteLlm)
+        assert _deployed_model(acall.await_args) == "openai/gpt-4o-mini"
+
+    async def test_context_budget_counts_with_deployed_chat_model(self, router):
+        """
+        Given: 배포 풀 라우터 + 대화 기록 토큰 예산을 켠 Orchestrator (model="default")
+        When: Orchestrator 생성
+        Then: 토큰 수는 요약 모델이 아닌 대화 모델의 실제 배포 모델로 계산
+        """
+        orchestrator = AdkOrchestratorAdapter(
+            model="default",
+            dynamic_toolset=AsyncMock(),
+            llm_router=router,
+            context_max_tokens=1000,
+            summary_model="openai/gpt-4.1-nano",
+        )
+
+        assert orchestrator._context_manager._token_model == "openai/gpt-4o-mini"
+        await orchestrator.close()
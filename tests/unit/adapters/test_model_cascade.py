@@ -0,0 +1,339 @@
+"""ModelCascade 테스트
+
+각 턴을 소형 모델로 먼저 실행하고, 정책 조건(사용자 요청/도구 깊이/불확실성 마커/응답 길이)
+발생 시 기본 모델로 승격하며 턴별 선택을 기록하는지 검증
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from google.adk.events.event import Event
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from src.adapters.outbound.adk.model_cascade import CascadeLlm, ModelCascade
+from src.adapters.outbound.adk.orchestrator_adapter import AdkOrchestratorAdapter
+
+CHEAP = "openai/gpt-4o-mini"
+DEFAULT = "openai/gpt-4o"
+
+
+def _context(invocation_id: str = "inv-1", session_id: str = "conv-1") -> MagicMock:
+    return MagicMock(invocation_id=invocation_id, session=MagicMock(id=session_id))
+
+
+def _text_response(text: str, partial: bool = False) -> LlmResponse:
+    return LlmResponse(
+        content=types.Content(role="model", parts=[types.Part(text=text)]), partial=partial
+    )
+
+
+def _request(*contents: types.Content, instruction: str = "be helpful") -> LlmRequest:
+    request = LlmRequest(model=DEFAULT, contents=list(contents) or [_user("hi")])
+    request.config.system_instruction = instruction
+    return request
+
+
+def _user(text: str) -> types.Content:
+    return types.Content(role="user", parts=[types.Part(text=text)])
+
+
+def _tool_round() -> list[types.Content]:
+    return [
+        types.Content(
+            role="model",
+            parts=[types.Part(function_call=types.FunctionCall(name="search", args={}))],
+        ),
+        types.Content(
+            role="user",
+            parts=[
+                types.Part(
+                    function_response=types.FunctionResponse(name="search", response={"r": 1})
+                )
+            ],
+        ),
+    ]
+
+
+class _FakeLlm:
+    """요청 모델별 응답을 돌려주고 호출을 기록하는 LiteLlm 대체 (stream이면 partial 2개 + 최종)"""
+
+    def __init__(self, text: str = "flagship answer", cheap_text: str = "Paris."):
+        self.model = DEFAULT
+        self.texts = {DEFAULT: text, CHEAP: cheap_text}
+        self.requests: list[tuple[str, bool]] = []
+        self.instructions: list = []
+
+    async def generate_content_async(self, llm_request, stream=False):
+        self.requests.append((llm_request.model, stream))
+        self.instructions.append(llm_request.config.system_instruction)
+        text = self.texts[llm_request.model]
+        if stream:
+            half = len(text) // 2
+            yield _text_response(text[:half], partial=True)
+            yield _text_response(text[half:], partial=True)
+        yield _text_response(text)
+
+
+async def _generate(cascade: ModelCascade, request: LlmRequest, stream: bool = False) -> list:
+    return [r async for r in cascade.generate_content_async(request, stream=stream)]
+
+
+@pytest.fixture
+def llm() -> _FakeLlm:
+    return _FakeLlm()
+
+
+@pytest.fixture
+def cascade(llm) -> ModelCascade:
+    cascade = ModelCascade(cascade_model=CHEAP, max_tool_depth=2, max_output_chars=100)
+    cascade.bind(llm)
+    return cascade
+
+
+class TestModelSelection:
+    """턴 시작 시 모델 선택"""
+
+    async def test_turn_runs_on_cascade_model_first(self, cascade, llm):
+        """
+        Given: 캐스케이드 활성화
+        When: before → 모델 호출 (짧고 확신 있는 응답) → finish_turn
+        Then: 소형 모델로 호출 + 소형 모델 응답 전달 + 승격 없음으로 기록
+        """
+        request = _request()
+
+        await cascade.before_model_callback(_context(), request)
+        responses = await _generate(cascade, request)
+        record = cascade.finish_turn("inv-1", 120.0)
+
+        assert request.model == CHEAP
+        assert "[ESCALATE]" in request.config.system_instruction
+        assert [r.content.parts[0].text for r in responses] == ["Paris."]
+        assert llm.requests == [(CHEAP, False)]
+        assert record["model"] == CHEAP
+        assert record["escalated"] is False
+
+    async def test_user_flag_skips_cascade_model(self, cascade):
+        """
+        Given: 사용자가 승격 요청한 세션
+        When: 다음 턴 before_model_callback
+        Then: 기본 모델 그대로 사용 + user_flag로 기록 (다음 턴에는 다시 소형 모델)
+        """
+        cascade.request_escalation("conv-1")
+        request = _request()
+
+        await cascade.before_model_callback(_context(), request)
+        record = cascade.finish_turn("inv-1", 300.0)
+
+        next_request = _request()
+        await cascade.before_model_callback(_context("inv-2"), next_request)
+
+        assert request.model == DEFAULT
+        assert request.config.system_instruction == "be helpful"
+        assert record["escalation_reason"] == "user_flag"
+        assert next_request.model == CHEAP
+
+    async def test_tool_depth_escalates_rest_of_turn(self, cascade):
+        """
+        Given: 현재 턴에 도구 호출 왕복 2회
+        When: before_model_callback
+        Then: 기본 모델 사용 + tool_depth로 기록
+        """
+        request = _request(_user("find flights"), *_tool_round(), *_tool_round())
+
+        await cascade.before_model_callback(_context(), request)
+        record = cascade.finish_turn("inv-1", 900.0)
+
+        assert request.model == DEFAULT
+        assert record["escalation_reason"] == "tool_depth"
+
+    async def test_tool_depth_counts_current_turn_only(self, cascade):
+        """
+        Given: 이전 턴에 도구 호출이 많고 현재 턴에는 없음
+        When: before_model_callback
+        Then: 소형 모델 사용
+        """
+        request = _request(_user("old"), *_tool_round(), *_tool_round(), _user("new question"))
+
+        await cascade.before_model_callback(_context(), request)
+
+        assert request.model == CHEAP
+
+
+class TestEscalation:
+    """소형 모델 응답 기반 승격"""
+
+    async def test_uncertainty_marker_recalls_default_model(self, cascade, llm):
+        """
+        Given: 소형 모델이 불확실성 마커로 응답
+        When: 모델 호출
+        Then: 같은 요청을 원래 instruction으로 기본 모델에 재호출 + 그 응답만 전달
+        """
+        llm.texts[CHEAP] = "[ESCALATE]"
+        request = _request(instruction="be helpful")
+        await cascade.before_model_callback(_context(), request)
+
+        responses = await _generate(cascade, request)
+        record = cascade.finish_turn("inv-1", 800.0)
+
+        assert [r.content.parts[0].text for r in responses] == ["flagship answer"]
+        assert llm.requests == [(CHEAP, False), (DEFAULT, False)]
+        assert llm.instructions[1] == "be helpful"
+        assert record["escalation_reason"] == "uncertainty"
+        assert record["default_calls"] == 1
+
+    async def test_long_output_escalates(self, cascade, llm):
+        """
+        Given: max_output_chars=100
+        When: 소형 모델이 200자 응답
+        Then: output_length로 승격
+        """
+        llm.texts[CHEAP] = "x" * 200
+        request = _request()
+        await cascade.before_model_callback(_context(), request)
+
+        responses = await _generate(cascade, request)
+
+        assert responses[-1].content.parts[0].text == "flagship answer"
+        assert cascade.finish_turn("inv-1", 1.0)["escalation_reason"] == "output_length"
+
+    async def test_cascade_partials_are_held_back(self, cascade):
+        """
+        Given: 소형 모델 토큰 스트리밍
+        When: 승격 없이 모델 호출 (stream)
+        Then: 소형 모델 partial은 전달하지 않고 최종 응답만 전달
+        """
+        request = _request()
+        await cascade.before_model_callback(_context(), request)
+
+        responses = await _generate(cascade, request, stream=True)
+
+        assert [(bool(r.partial), r.content.parts[0].text) for r in responses] == [
+            (False, "Paris.")
+        ]
+
+    async def test_escalated_call_streams(self, cascade, llm):
+        """
+        Given: 토큰 스트리밍 + 소형 모델이 불확실성 마커로 응답
+        When: 모델 호출 (stream)
+        Then: 소형 모델 출력은 숨기고 기본 모델 호출은 partial까지 스트리밍
+        """
+        llm.texts[CHEAP] = "[ESCALATE]"
+        request = _request()
+        await cascade.before_model_callback(_context(), request)
+
+        responses = await _generate(cascade, request, stream=True)
+
+        assert llm.requests == [(CHEAP, True), (DEFAULT, True)]
+        assert [bool(r.partial) for r in responses] == [True, True, False]
+        assert "".join(r.content.parts[0].text for r in responses[:2]) == "flagship answer"
+
+    async def test_default_model_turn_streams(self, cascade, llm):
+        """
+        Given: 사용자가 승격 요청한 턴
+        When: 모델 호출 (stream)
+        Then: 기본 모델 응답을 partial까지 그대로 전달
+        """
+        cascade.request_escalation("conv-1")
+        request = _request()
+        await cascade.before_model_callback(_context(), request)
+
+        responses = await _generate(cascade, request, stream=True)
+
+        assert llm.requests == [(DEFAULT, True)]
+        assert [bool(r.partial) for r in responses] == [True, True, False]
+
+
+class TestStats:
+    """턴별 기록 집계"""
+
+    async def test_stats_aggregate_turns(self, cascade):
+        """
+        Given: 소형 모델 턴 1회 + 승격 턴 1회
+        When: get_stats()
+        Then: 승격 비율/사유/단계별 평균 지연
+        """
+        await cascade.before_model_callback(_context("inv-1"), _request())
+        cascade.finish_turn("inv-1", 100.0)
+        cascade.request_escalation("conv-1")
+        await cascade.before_model_callback(_context("inv-2"), _request())
+        cascade.finish_turn("inv-2", 500.0)
+
+        stats = cascade.get_stats()
+
+        assert stats["turns"] == 2
+        assert stats["escalation_rate"] == 0.5
+        assert stats["escalation_reasons"] == {"user_flag": 1}
+        assert stats["avg_latency_ms"] == {"cascade": 100.0, "default": 500.0}
+
+    async def test_process_message_records_turn(self, cascade):
+        """
+        Given: 캐스케이드가 있는 Orchestrator (Runner는 before 콜백만 흉내)
+        When: escalate=True로 process_message
+        Then: 이번 턴은 기본 모델로 실행되고 user_flag 턴으로 기록
+        """
+        orchestrator = AdkOrchestratorAdapter(
+            model=DEFAULT, dynamic_toolset=AsyncMock(), model_cascade=cascade
+        )
+        requests = []
+
+        async def run_async(**kwargs):
+            request = _request()
+            await cascade.before_model_callback(_context("inv-9", kwargs["session_id"]), request)
+            requests.append(request)
+            yield Event(
+                invocation_id="inv-9",
+                author="agenthub_agent",
+                content=types.Content(role="model", parts=[types.Part(text="ok")]),
+            )
+
+        orchestrator._runner = MagicMock(run_async=run_async)
+        orchestrator._session_service = InMemorySessionService()
+        orchestrator._initialized = True
+
+        chunks = [c async for c in orchestrator.process_message("hi", "conv-9", escalate=True)]
+
+        assert [c.content for c in chunks] == ["ok"]
+        assert requests[0].model == DEFAULT
+        assert cascade.get_stats()["escalation_reasons"] == {"user_flag": 1}
+
+    def test_stream_tokens_with_cascade_warns(self, cascade, caplog):
+        """
+        Given: stream_tokens + 캐스케이드 활성화
+        When: Orchestrator 생성
+        Then: 소형 모델 응답은 스트리밍되지 않음을 경고
+        """
+        AdkOrchestratorAdapter(
+            model=DEFAULT, dynamic_toolset=AsyncMock(), model_cascade=cascade, stream_tokens=True
+        )
+
+        assert any("cascade_model" in r.getMessage() for r in caplog.records)
+
+    def test_agent_model_is_cascade_wrapper(self, cascade):
+        """
+        Given: 캐스케이드 활성화
+        When: Agent 모델 구성
+        Then: 기본 모델을 감싼 CascadeLlm 사용
+        """
+        orchestrator = AdkOrchestratorAdapter(
+            model=DEFAULT, dynamic_toolset=AsyncMock(), model_cascade=cascade
+        )
+
+        model = cascade.wrap(orchestrator._build_model())
+
+        assert isinstance(model, CascadeLlm)
+        assert model.model == DEFAULT
+
+    def test_disabled_cascade(self):
+        """
+        Given: cascade_model 미설정
+        When: Orchestrator 생성
+        Then: 캐스케이드 비활성화 (콜백 미등록)
+        """
+        orchestrator = AdkOrchestratorAdapter(
+            model=DEFAULT, dynamic_toolset=AsyncMock(), model_cascade=ModelCascade()
+        )
+
+        assert orchestrator._model_cascade is None
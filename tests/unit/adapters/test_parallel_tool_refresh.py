@@ -0,0 +1,125 @@
+"""DynamicToolset 병렬 캐시 갱신 테스트
+
+엔드포인트별 잠금 + 동시 갱신 제한 + 엔드포인트별 타임아웃 검증
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.adapters.outbound.adk.dynamic_toolset import DynamicToolset
+from tests.unit.fakes.fake_mcp_tools import make_mcp_toolset, make_settings, make_tool
+
+
+@pytest.fixture
+def settings():
+    return make_settings(
+        cache_ttl_seconds=300,
+        max_concurrent_refreshes=8,
+        refresh_timeout_seconds=0.5,
+    )
+
+
+class TestParallelRefresh:
+    """만료된 엔드포인트 병렬 갱신"""
+
+    async def test_expired_endpoints_refresh_concurrently(self, settings):
+        """
+        Given: 각 0.3초 걸리는 MCP 서버 5개 (캐시 없음)
+        When: get_tools() 호출
+        Then: 순차 실행(1.5초)이 아닌 병렬 실행으로 완료
+        """
+        toolset = DynamicToolset(settings=settings)
+        for i in range(5):
+            toolset._mcp_toolsets[f"ep-{i}"] = make_mcp_toolset([make_tool(f"tool_{i}")], 0.3)
+
+        start = time.monotonic()
+        tools = await toolset.get_tools()
+        elapsed = time.monotonic() - start
+
+        assert [t.name for t in tools] == [f"tool_{i}" for i in range(5)]
+        assert elapsed < 0.9, f"Took {elapsed:.2f}s, expected parallel refresh"
+
+    async def test_refresh_fanout_is_bounded(self, settings):
+        """
+        Given: max_concurrent_refreshes=2, MCP 서버 6개
+        When: get_tools() 호출
+        Then: 동시에 진행 중인 갱신은 최대 2개
+        """
+        settings.mcp.max_concurrent_refreshes = 2
+        toolset = DynamicToolset(settings=settings)
+
+        in_flight = 0
+        peak = 0
+
+        def make_tracking_toolset(name: str) -> AsyncMock:
+            async def get_tools(*args, **kwargs):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.05)
+                in_flight -= 1
+                return [make_tool(name)]
+
+            mock = AsyncMock()
+            mock.get_tools = AsyncMock(side_effect=get_tools)
+            return mock
+
+        for i in range(6):
+            toolset._mcp_toolsets[f"ep-{i}"] = make_tracking_toolset(f"tool_{i}")
+
+        tools = await toolset.get_tools()
+
+        assert len(tools) == 6
+        assert peak == 2
+
+
+class TestRefreshTimeout:
+    """엔드포인트별 갱신 타임아웃"""
+
+    async def test_hung_endpoint_times_out_and_serves_stale_cache(self, settings):
+        """
+        Given: 캐시가 만료된 응답 없는 서버 1개 + 정상 서버 1개
+        When: get_tools() 호출
+        Then: 타임아웃 후 기존(stale) 캐시 반환, 정상 서버 도구도 포함
+        """
+        toolset = DynamicToolset(settings=settings)
+        stale_tool = make_tool("stale_tool")
+        toolset._mcp_toolsets["hung"] = make_mcp_toolset([make_tool("never")], delay=10)
+        toolset._mcp_toolsets["ok"] = make_mcp_toolset([make_tool("ok_tool")])
+        toolset._tool_cache["hung"] = [stale_tool]
+        toolset._cache_timestamps["hung"] = time.time() - 1000  # 만료
+
+        start = time.monotonic()
+        tools = await toolset.get_tools()
+        elapsed = time.monotonic() - start
+
+        assert [t.name for t in tools] == ["stale_tool", "ok_tool"]
+        assert elapsed < 2.0
+
+    async def test_cached_endpoint_does_not_wait_on_cold_one(self, settings):
+        """
+        Given: 느린 서버의 갱신이 진행 중
+        When: 캐시가 유효한 다른 서버만 있는 상태에서 get_tools() 동시 호출
+        Then: 캐시된 엔드포인트는 느린 갱신을 기다리지 않음
+        """
+        toolset = DynamicToolset(settings=settings)
+        toolset._mcp_toolsets["slow"] = make_mcp_toolset([make_tool("slow_tool")], delay=0.4)
+
+        slow_refresh = asyncio.create_task(toolset._refresh_endpoint("slow"))
+        await asyncio.sleep(0.05)
+
+        # 다른 엔드포인트는 캐시 유효
+        toolset._mcp_toolsets["warm"] = make_mcp_toolset([])
+        toolset._tool_cache["warm"] = [make_tool("warm_tool")]
+        toolset._cache_timestamps["warm"] = time.time()
+
+        start = time.monotonic()
+        warm_tools = await toolset._refresh_endpoint("warm")
+        elapsed = time.monotonic() - start
+
+        assert [t.name for t in warm_tools] == ["warm_tool"]
+        assert elapsed < 0.1
+        await slow_refresh
@@ -0,0 +1,83 @@
+"""프롬프트 캐싱 힌트 테스트
+
+Agent 모델에 instruction + 도구 선언 prefix용 cache_control 힌트가 지정되고,
+LLM 호출 사용량이 CostService로 기록되는지 검증
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import litellm
+import pytest
+
+from src.adapters.outbound.adk.litellm_callbacks import AgentHubLogger
+from src.adapters.outbound.adk.orchestrator_adapter import (
+    PROMPT_CACHE_INJECTION_POINTS,
+    AdkOrchestratorAdapter,
+)
+
+
+def _toolset() -> AsyncMock:
+    toolset = AsyncMock()
+    toolset.get_tools = AsyncMock(return_value=[])
+    toolset.get_registered_info = MagicMock(return_value={})
+    return toolset
+
+
+@pytest.fixture
+def restore_callbacks():
+    previous = litellm.callbacks
+    yield
+    litellm.callbacks = previous
+
+
+class TestPromptCachingHints:
+    """LiteLlm 모델 캐시 힌트"""
+
+    async def test_system_prefix_marked_for_caching(self):
+        """
+        Given: prompt_caching=True (기본값)
+        When: initialize()
+        Then: LiteLlm 추가 인자에 system 메시지 cache_control 주입 지점 포함
+        """
+        adapter = AdkOrchestratorAdapter(
+            model="anthropic/claude-sonnet-4", dynamic_toolset=_toolset(), enable_llm_logging=False
+        )
+        await adapter.initialize()
+
+        args = adapter._agent.model._additional_args
+        assert args["cache_control_injection_points"] == PROMPT_CACHE_INJECTION_POINTS
+
+    async def test_disabled_sends_no_hint(self):
+        """
+        Given: prompt_caching=False
+        When: initialize()
+        Then: 캐시 힌트 없음
+        """
+        adapter = AdkOrchestratorAdapter(
+            model="openai/gpt-4o-mini",
+            dynamic_toolset=_toolset(),
+            enable_llm_logging=False,
+            prompt_caching=False,
+        )
+        await adapter.initialize()
+
+        assert "cache_control_injection_points" not in adapter._agent.model._additional_args
+
+
+class TestUsageRecording:
+    """LLM 호출 사용량 기록 연결"""
+
+    async def test_logger_records_to_cost_service(self, restore_callbacks):
+        """
+        Given: cost_service를 주입한 Orchestrator
+        When: initialize() (LLM 로깅 활성화)
+        Then: AgentHubLogger가 같은 cost_service로 등록됨
+        """
+        cost_service = AsyncMock()
+        adapter = AdkOrchestratorAdapter(
+            model="openai/gpt-4o-mini", dynamic_toolset=_toolset(), cost_service=cost_service
+        )
+        await adapter.initialize()
+
+        loggers = [cb for cb in litellm.callbacks if isinstance(cb, AgentHubLogger)]
+        assert loggers[0]._cost_service is cost_service
@@ -0,0 +1,124 @@
+"""DynamicToolset Stale-while-revalidate 테스트
+
+만료 캐시 즉시 반환 + 백그라운드 갱신 + max staleness + TTL jitter 검증
+"""
+
+import time
+
+import pytest
+
+from src.adapters.outbound.adk.dynamic_toolset import DynamicToolset
+from src.config.settings import Settings
+from tests.unit.fakes.fake_mcp_tools import make_mcp_toolset, make_settings, make_tool
+
+
+@pytest.fixture
+def settings():
+    return make_settings(
+        cache_ttl_seconds=60,
+        stale_while_revalidate=True,
+        max_staleness_seconds=600,
+        refresh_jitter_ratio=0.0,
+    )
+
+
+@pytest.fixture
+def slow_toolset():
+    """0.3초 후 새 도구 목록을 반환하는 Mock MCPToolset"""
+    return make_mcp_toolset([make_tool("fresh_tool")], delay=0.3)
+
+
+class TestStaleWhileRevalidate:
+    """만료 캐시 즉시 반환"""
+
+    async def test_expired_cache_served_immediately(self, settings, slow_toolset):
+        """
+        Given: TTL은 지났지만 max staleness 이내인 캐시
+        When: get_tools() 호출
+        Then: 기다리지 않고 stale 캐시 반환, 백그라운드 갱신 후 새 도구 반영
+        """
+        toolset = DynamicToolset(settings=settings)
+        toolset._mcp_toolsets["ep"] = slow_toolset
+        toolset._tool_cache["ep"] = [make_tool("stale_tool")]
+        toolset._cache_timestamps["ep"] = time.time() - 120  # TTL(60초) 초과
+
+        start = time.monotonic()
+        tools = await toolset.get_tools()
+        elapsed = time.monotonic() - start
+
+        assert [t.name for t in tools] == ["stale_tool"]
+        assert elapsed < 0.1
+
+        # 백그라운드 갱신 완료 대기
+        await toolset._background_refreshes["ep"]
+        tools = await toolset.get_tools()
+        assert [t.name for t in tools] == ["fresh_tool"]
+        slow_toolset.get_tools.assert_called_once()
+
+    async def test_single_background_refresh_per_endpoint(self, settings, slow_toolset):
+        """
+        Given: stale 캐시
+        When: 갱신 진행 중 get_tools() 여러 번 호출
+        Then: 백그라운드 갱신은 한 번만 실행
+        """
+        toolset = DynamicToolset(settings=settings)
+        toolset._mcp_toolsets["ep"] = slow_toolset
+        toolset._tool_cache["ep"] = [make_tool("stale_tool")]
+        toolset._cache_timestamps["ep"] = time.time() - 120
+
+        for _ in range(5):
+            await toolset.get_tools()
+        await toolset._background_refreshes["ep"]
+
+        slow_toolset.get_tools.assert_called_once()
+
+    async def test_cache_beyond_max_staleness_refreshes_inline(self, settings, slow_toolset):
+        """
+        Given: max_staleness_seconds를 넘긴 캐시
+        When: get_tools() 호출
+        Then: stale 캐시 대신 동기 갱신 결과 반환
+        """
+        toolset = DynamicToolset(settings=settings)
+        toolset._mcp_toolsets["ep"] = slow_toolset
+        toolset._tool_cache["ep"] = [make_tool("stale_tool")]
+        toolset._cache_timestamps["ep"] = time.time() - 1000  # max staleness(600초) 초과
+
+        tools = await toolset.get_tools()
+
+        assert [t.name for t in tools] == ["fresh_tool"]
+        assert "ep" not in toolset._background_refreshes
+
+    async def test_disabled_by_default(self, slow_toolset):
+        """
+        Given: 기본 설정 (stale_while_revalidate=False)
+        When: 만료 캐시 상태에서 get_tools() 호출
+        Then: 동기 갱신
+        """
+        toolset = DynamicToolset(settings=Settings())
+        toolset._mcp_toolsets["ep"] = slow_toolset
+        toolset._tool_cache["ep"] = [make_tool("stale_tool")]
+        toolset._cache_timestamps["ep"] = time.time() - 1000
+
+        tools = await toolset.get_tools()
+
+        assert [t.name for t in tools] == ["fresh_tool"]
+
+
+class TestRefreshJitter:
+    """엔드포인트별 TTL jitter"""
+
+    async def test_jitter_spreads_ttls_below_configured_ttl(self):
+        """
+        Given: refresh_jitter_ratio=0.2, TTL 300초
+        When: 여러 엔드포인트 캐시 저장
+        Then: 엔드포인트별 TTL은 240~300초 사이로 분산
+        """
+        settings = make_settings(cache_ttl_seconds=300, refresh_jitter_ratio=0.2)
+        toolset = DynamicToolset(settings=settings)
+
+        for i in range(20):
+            toolset._store_cache(f"ep-{i}", [])
+
+        ttls = list(toolset._cache_ttls.values())
+        assert all(240 <= ttl <= 300 for ttl in ttls)
+        assert len(set(ttls)) > 1
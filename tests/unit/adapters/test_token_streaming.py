@@ -0,0 +1,103 @@
+"""토큰 단위 스트리밍 테스트
+
+stream_tokens 모드에서 partial 텍스트를 즉시 전달하고 집계 텍스트를 중복 전달하지 않는지 검증
+"""
+
+from unittest.mock import MagicMock
+
+from google.adk.agents.run_config import StreamingMode
+from google.adk.events.event import Event
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from src.adapters.outbound.adk.dynamic_toolset import DynamicToolset
+from src.adapters.outbound.adk.orchestrator_adapter import AdkOrchestratorAdapter
+from src.domain.entities.enums import MessageRole
+from src.domain.services.conversation_service import ConversationService
+from tests.unit.fakes import FakeConversationStorage
+
+
+def _text_event(text: str, partial: bool) -> Event:
+    return Event(
+        author="agenthub_agent",
+        content=types.Content(role="model", parts=[types.Part(text=text)]),
+        partial=partial,
+    )
+
+
+def _orchestrator(events: list[Event], stream_tokens: bool) -> AdkOrchestratorAdapter:
+    orchestrator = AdkOrchestratorAdapter(
+        model="openai/gpt-4o-mini",
+        dynamic_toolset=DynamicToolset(),
+        enable_llm_logging=False,
+        stream_tokens=stream_tokens,
+    )
+    run_configs = []
+
+    async def run_async(**kwargs):
+        run_configs.append(kwargs["run_config"])
+        for event in events:
+            yield event
+
+    orchestrator._runner = MagicMock(run_async=run_async)
+    orchestrator._runner.run_configs = run_configs
+    orchestrator._session_service = InMemorySessionService()
+    orchestrator._initialized = True
+    return orchestrator
+
+
+STREAMED = [
+    _text_event("Hel", partial=True),
+    _text_event("lo!", partial=True),
+    _text_event("Hello!", partial=False),
+]
+
+
+class TestTokenStreaming:
+    """process_message 토큰 스트리밍"""
+
+    async def test_partial_deltas_forwarded_without_duplicate_final(self):
+        """
+        Given: stream_tokens=True, Runner가 partial 2개 + 집계 이벤트 반환
+        When: process_message 호출
+        Then: partial 조각만 text 청크로 전달 (집계 텍스트 중복 없음) + SSE 모드로 실행
+        """
+        orchestrator = _orchestrator(STREAMED, stream_tokens=True)
+
+        chunks = [chunk async for chunk in orchestrator.process_message("hi", "conv-1")]
+
+        assert [c.content for c in chunks] == ["Hel", "lo!"]
+        assert orchestrator._runner.run_configs[0].streaming_mode == StreamingMode.SSE
+
+    async def test_non_streaming_mode_yields_final_text_only(self):
+        """
+        Given: stream_tokens=False, Runner가 최종 응답만 반환
+        When: process_message 호출
+        Then: 최종 텍스트 1개
+        """
+        orchestrator = _orchestrator([_text_event("Hello!", partial=False)], stream_tokens=False)
+
+        chunks = [chunk async for chunk in orchestrator.process_message("hi", "conv-1")]
+
+        assert [c.content for c in chunks] == ["Hello!"]
+        assert orchestrator._runner.run_configs[0].streaming_mode == StreamingMode.NONE
+
+    async def test_conversation_persists_assembled_message_once(self):
+        """
+        Given: 토큰 스트리밍 오케스트레이터
+        When: ConversationService.send_message
+        Then: 조각은 그대로 전달되고, 어시스턴트 메시지는 조립된 전체 텍스트로 1회 저장
+        """
+        storage = FakeConversationStorage()
+        service = ConversationService(
+            storage=storage, orchestrator=_orchestrator(STREAMED, stream_tokens=True)
+        )
+
+        chunks = [chunk async for chunk in service.send_message(None, "hi")]
+
+        conversation_id = next(iter(storage.messages))
+        assistant = [
+            m for m in storage.messages[conversation_id] if m.role == MessageRole.ASSISTANT
+        ]
+        assert len(chunks) == 2
+        assert [m.content for m in assistant] == ["Hello!"]
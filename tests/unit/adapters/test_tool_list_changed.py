@@ -0,0 +1,148 @@
+"""DynamicToolset 도구 목록 변경 알림 테스트
+
+notifications/tools/list_changed 수신 시 해당 엔드포인트 캐시만 갱신하고,
+알림 지원 서버에는 긴 안전망 TTL을 적용하는지 검증
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.adapters.outbound.adk.dynamic_toolset import DynamicToolset
+from tests.unit.fakes.fake_mcp_tools import make_mcp_toolset, make_settings, make_tool
+
+
+@pytest.fixture
+def settings():
+    return make_settings(
+        cache_ttl_seconds=300, list_changed_ttl_seconds=3600, refresh_jitter_ratio=0.0
+    )
+
+
+@pytest.fixture
+def toolset(settings):
+    toolset = DynamicToolset(settings=settings)
+    toolset._mcp_toolsets["ep-a"] = make_mcp_toolset([make_tool("search")])
+    toolset._mcp_toolsets["ep-b"] = make_mcp_toolset([make_tool("fetch")])
+    return toolset
+
+
+class TestToolListChangedNotification:
+    """알림 기반 엔드포인트 단위 갱신"""
+
+    async def test_notification_refreshes_only_that_endpoint(self, toolset):
+        """
+        Given: 두 엔드포인트 캐시가 모두 유효
+        When: ep-a에서 tools/list_changed 알림 수신
+        Then: ep-a만 다시 조회되고 새 도구가 인덱스에 반영
+        """
+        await toolset.get_tools()
+        mcp_a, mcp_b = toolset._mcp_toolsets["ep-a"], toolset._mcp_toolsets["ep-b"]
+        mcp_a.get_tools = AsyncMock(return_value=[make_tool("search"), make_tool("summarize")])
+        mcp_b.get_tools.reset_mock()
+
+        await toolset.handle_tools_list_changed("ep-a")
+        await toolset._background_refreshes["ep-a"]
+
+        names = [t.name for t in await toolset.get_tools()]
+        assert names == ["search", "summarize", "fetch"]
+        assert "summarize" in toolset._tool_index
+        mcp_a.get_tools.assert_called_once()
+        mcp_b.get_tools.assert_not_called()
+
+    async def test_notification_during_refresh_is_not_lost(self, toolset):
+        """
+        Given: ep-a 갱신이 진행 중 (이전 목록 반환 예정)
+        When: 조회 도중 알림 수신
+        Then: 진행 중 결과가 저장돼도 캐시는 무효로 남아 다음 get_tools()에서 다시 조회
+        """
+        release = asyncio.Event()
+        responses = [[make_tool("old")], [make_tool("new")]]
+
+        async def get_tools(*args, **kwargs):
+            await release.wait()
+            return responses.pop(0)
+
+        toolset._mcp_toolsets["ep-a"].get_tools = AsyncMock(side_effect=get_tools)
+        toolset._cache_ttls["ep-a"] = 0
+        in_flight = asyncio.create_task(toolset._refresh_endpoint("ep-a"))
+        await asyncio.sleep(0)
+
+        await toolset.handle_tools_list_changed("ep-a")
+        background = toolset._background_refreshes["ep-a"]
+        release.set()
+        await in_flight
+        await background
+
+        assert "new" in [t.name for t in await toolset.get_tools()]
+
+    async def test_notification_for_unknown_endpoint_is_ignored(self, toolset):
+        """
+        Given: 등록되지 않은 엔드포인트
+        When: 알림 수신
+        Then: 백그라운드 갱신 없음
+        """
+        await toolset.handle_tools_list_changed("ep-unknown")
+
+        assert toolset._background_refreshes == {}
+
+    async def test_failed_refresh_keeps_endpoint_pending(self, toolset):
+        """
+        Given: 알림 후 재조회가 실패
+        When: 갱신 완료
+        Then: 기존 캐시로 폴백하되 다음 조회에서 다시 시도
+        """
+        await toolset.get_tools()
+        toolset._mcp_toolsets["ep-a"].get_tools = AsyncMock(side_effect=ConnectionError("down"))
+
+        await toolset.handle_tools_list_changed("ep-a")
+        await toolset._background_refreshes["ep-a"]
+
+        assert [t.name for t in toolset._tool_cache["ep-a"]] == ["search"]
+        assert "ep-a" in toolset._list_changed_pending
+
+
+class TestListChangedSafetyNetTtl:
+    """알림 지원 서버의 TTL"""
+
+    async def test_supported_endpoint_uses_long_ttl(self, toolset):
+        """
+        Given: ep-a만 tools.listChanged 지원
+        When: 캐시 저장
+        Then: ep-a는 list_changed_ttl_seconds, ep-b는 cache_ttl_seconds 적용
+        """
+        toolset.set_tools_list_changed_support("ep-a", True)
+
+        await toolset.get_tools()
+
+        assert toolset._cache_ttls["ep-a"] == 3600
+        assert toolset._cache_ttls["ep-b"] == 300
+
+    async def test_support_change_updates_cached_ttl(self, toolset):
+        """
+        Given: 이미 기본 TTL로 캐시된 엔드포인트
+        When: 알림 지원 여부를 나중에 설정/해제
+        Then: 캐시된 TTL이 즉시 변경
+        """
+        await toolset.get_tools()
+
+        toolset.set_tools_list_changed_support("ep-a", True)
+        assert toolset._cache_ttls["ep-a"] == 3600
+
+        toolset.set_tools_list_changed_support("ep-a", False)
+        assert toolset._cache_ttls["ep-a"] == 300
+
+    async def test_remove_server_clears_list_changed_state(self, toolset):
+        """
+        Given: 알림 지원 + pending 상태의 엔드포인트
+        When: 서버 제거
+        Then: 관련 상태 정리
+        """
+        toolset.set_tools_list_changed_support("ep-a", True)
+        toolset._list_changed_pending.add("ep-a")
+
+        await toolset.remove_mcp_server("ep-a")
+
+        assert "ep-a" not in toolset._list_changed_endpoints
+        assert "ep-a" not in toolset._list_changed_pending
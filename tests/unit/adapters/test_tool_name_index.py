@@ -0,0 +1,109 @@
+"""DynamicToolset 도구 이름 인덱스 테스트
+
+call_tool()이 tools/list 호출 없이 인덱스에서 도구를 찾는지 검증
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.adapters.outbound.adk.dynamic_toolset import DynamicToolset, ToolNameConflictError
+from src.config.settings import Settings
+from tests.unit.fakes.fake_mcp_tools import make_mcp_toolset, make_tool, register_mcp_endpoint
+
+
+@pytest.fixture
+def dynamic_toolset():
+    return DynamicToolset(settings=Settings())
+
+
+class TestToolNameIndex:
+    """인덱스 기반 도구 조회"""
+
+    async def test_call_tool_uses_index_without_list_round_trip(self, dynamic_toolset):
+        """
+        Given: 2개 서버 등록 (add_mcp_server)
+        When: call_tool() 호출
+        Then: 어느 서버에도 tools/list를 다시 호출하지 않음
+        """
+        mcp_a = make_mcp_toolset([make_tool("search", result="a")])
+        mcp_b = make_mcp_toolset([make_tool("fetch", result="b")])
+        await register_mcp_endpoint(dynamic_toolset, "ep-a", mcp_a)
+        await register_mcp_endpoint(dynamic_toolset, "ep-b", mcp_b)
+        mcp_a.get_tools.reset_mock()
+        mcp_b.get_tools.reset_mock()
+
+        result = await dynamic_toolset.call_tool("fetch", {})
+
+        assert result == "b"
+        mcp_a.get_tools.assert_not_called()
+        mcp_b.get_tools.assert_not_called()
+
+    async def test_remove_mcp_server_drops_index_entries(self, dynamic_toolset):
+        """
+        Given: 등록 후 제거된 서버
+        When: 해당 서버 도구로 call_tool() 호출
+        Then: RuntimeError (도구 없음)
+        """
+        await register_mcp_endpoint(dynamic_toolset, "ep-a", [make_tool("search")])
+        await dynamic_toolset.remove_mcp_server("ep-a")
+
+        assert "search" not in dynamic_toolset._tool_index
+        with pytest.raises(RuntimeError, match="Tool not found"):
+            await dynamic_toolset.call_tool("search", {})
+
+    async def test_cache_refresh_updates_index(self, dynamic_toolset):
+        """
+        Given: 서버가 캐시 갱신 후 새 도구를 제공
+        When: 캐시 무효화 후 get_tools() → call_tool() 호출
+        Then: 새 도구가 인덱스에 반영, 사라진 도구는 제거
+        """
+        mcp = make_mcp_toolset([make_tool("old_tool")])
+        await register_mcp_endpoint(dynamic_toolset, "ep-a", mcp)
+
+        mcp.get_tools = AsyncMock(return_value=[make_tool("new_tool", result="new")])
+
+        dynamic_toolset.invalidate_cache("ep-a")
+        await dynamic_toolset.get_tools()
+
+        assert await dynamic_toolset.call_tool("new_tool", {}) == "new"
+        assert "old_tool" not in dynamic_toolset._tool_index
+
+
+class TestToolNameConflicts:
+    """서버 간 도구 이름 충돌"""
+
+    async def test_conflict_is_reported(self, dynamic_toolset, caplog):
+        """
+        Given: 2개 서버가 같은 이름의 도구 제공
+        When: 두 번째 서버 등록
+        Then: 경고 로그 + get_tool_name_conflicts()에 보고
+        """
+        await register_mcp_endpoint(dynamic_toolset, "ep-a", [make_tool("search")])
+        await register_mcp_endpoint(dynamic_toolset, "ep-b", [make_tool("search")])
+
+        assert dynamic_toolset.get_tool_name_conflicts() == {"search": ["ep-a", "ep-b"]}
+        assert any("Tool name conflict" in r.message for r in caplog.records)
+
+    async def test_ambiguous_call_raises(self, dynamic_toolset):
+        """
+        Given: 이름이 충돌하는 도구
+        When: endpoint_id 없이 call_tool() 호출
+        Then: ToolNameConflictError (첫 번째 서버로 임의 선택하지 않음)
+        """
+        await register_mcp_endpoint(dynamic_toolset, "ep-a", [make_tool("search", result="a")])
+        await register_mcp_endpoint(dynamic_toolset, "ep-b", [make_tool("search", result="b")])
+
+        with pytest.raises(ToolNameConflictError):
+            await dynamic_toolset.call_tool("search", {})
+
+    async def test_endpoint_id_disambiguates(self, dynamic_toolset):
+        """
+        Given: 이름이 충돌하는 도구
+        When: endpoint_id를 지정하여 call_tool() 호출
+        Then: 지정한 서버의 도구 실행
+        """
+        await register_mcp_endpoint(dynamic_toolset, "ep-a", [make_tool("search", result="a")])
+        await register_mcp_endpoint(dynamic_toolset, "ep-b", [make_tool("search", result="b")])
+
+        assert await dynamic_toolset.call_tool("search", {}, endpoint_id="ep-b") == "b"
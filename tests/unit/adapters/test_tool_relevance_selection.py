@@ -0,0 +1,164 @@
+"""관련도 기반 도구 선택 테스트
+
+BM25 색인(ToolRelevanceIndex)과 DynamicToolset의 top-k + pinned 선택 검증
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.adapters.outbound.adk.dynamic_toolset import DynamicToolset
+from src.adapters.outbound.adk.tool_relevance_index import ToolRelevanceIndex, tokenize
+from src.config.settings import McpSettings, Settings
+from tests.unit.fakes.fake_mcp_tools import make_tool, register_mcp_endpoint
+
+
+def _make_tool(name: str, description: str, params: list[str] | None = None) -> MagicMock:
+    schema = {"type": "object", "properties": {p: {"type": "string"} for p in params or []}}
+    return make_tool(name, description, input_schema=schema)
+
+
+def _context(text: str) -> SimpleNamespace:
+    """ReadonlyContext 대용 (user_content.parts[].text만 사용)"""
+    return SimpleNamespace(user_content=SimpleNamespace(parts=[SimpleNamespace(text=text)]))
+
+
+def _filler_tools(prefix: str, count: int) -> list[MagicMock]:
+    return [_make_tool(f"{prefix}_{i}", f"Unrelated utility number {i}") for i in range(count)]
+
+
+class TestToolRelevanceIndex:
+    """BM25 역색인"""
+
+    def test_tokenize_splits_snake_and_camel_case(self):
+        assert tokenize("get_weatherForecast(cityName)") == [
+            "get",
+            "weather",
+            "forecast",
+            "city",
+            "name",
+        ]
+
+    def test_search_ranks_matching_documents(self):
+        """
+        Given: 날씨/파일 도구 문서
+        When: 날씨 관련 검색
+        Then: 날씨 도구가 상위, 일치 단어 없는 문서는 제외
+        """
+        index = ToolRelevanceIndex()
+        index.add(("ep", "get_weather"), "get_weather Current weather for a city city")
+        index.add(("ep", "read_file"), "read_file Read a file from disk path")
+
+        assert index.search("what's the weather in Seoul", top_k=5) == [("ep", "get_weather")]
+
+    def test_remove_endpoint_is_incremental(self):
+        """
+        Given: 두 엔드포인트 문서
+        When: 한 엔드포인트 제거
+        Then: 해당 문서만 검색에서 빠지고 나머지는 유지
+        """
+        index = ToolRelevanceIndex()
+        index.add(("ep-a", "search"), "search the web")
+        index.add(("ep-b", "search_docs"), "search internal docs")
+
+        index.remove_endpoint("ep-a")
+
+        assert len(index) == 1
+        assert index.search("search", top_k=5) == [("ep-b", "search_docs")]
+
+
+class TestRelevanceSelection:
+    """DynamicToolset top-k 선택"""
+
+    @pytest.fixture
+    def settings(self):
+        settings = Settings()
+        settings.mcp = McpSettings(
+            defer_loading_token_threshold=100,
+            relevance_selection=True,
+            relevance_top_k=2,
+            pinned_tools=["pinned_helper"],
+        )
+        return settings
+
+    @pytest.fixture
+    async def toolset(self, settings):
+        toolset = DynamicToolset(settings=settings)
+        await register_mcp_endpoint(
+            toolset,
+            "ep-weather",
+            [
+                _make_tool("get_weather", "Current weather conditions", ["city"]),
+                _make_tool("get_forecast", "Weather forecast for coming days", ["city", "days"]),
+            ],
+        )
+        await register_mcp_endpoint(
+            toolset,
+            "ep-misc",
+            [_make_tool("pinned_helper", "Always on")] + _filler_tools("misc", 6),
+        )
+        return toolset
+
+    async def test_exposes_top_k_plus_pinned(self, toolset):
+        """
+        Given: threshold 초과 + 관련도 모드
+        When: 날씨 관련 메시지로 get_tools()
+        Then: 관련 도구 top-k + pinned 도구만 반환 (등록 순서 유지)
+        """
+        tools = await toolset.get_tools(_context("Will it rain in Busan? check the weather"))
+
+        assert [t.name for t in tools] == ["get_weather", "get_forecast", "pinned_helper"]
+
+    async def test_parameter_names_are_indexed(self, toolset):
+        """
+        Given: 파라미터 이름에만 등장하는 단어 (days)
+        When: 해당 단어로 검색
+        Then: 그 도구가 선택됨
+        """
+        tools = await toolset.get_tools(_context("next 5 days"))
+
+        assert "get_forecast" in [t.name for t in tools]
+
+    async def test_falls_back_to_defer_mode_without_query(self, toolset):
+        """
+        Given: 사용자 메시지가 없는 호출 (readonly_context 없음)
+        When: get_tools()
+        Then: 기존 Defer mode (전체 도구 프록시)
+        """
+        tools = await toolset.get_tools()
+
+        assert len(tools) == 9
+        assert all(type(t).__name__ == "DeferredToolProxy" for t in tools)
+
+    async def test_index_updates_on_add_and_remove(self, toolset):
+        """
+        Given: 새 서버 추가 후 제거
+        When: 해당 서버 도구 관련 메시지로 get_tools()
+        Then: 추가 후에는 선택, 제거 후에는 선택되지 않음
+        """
+        await register_mcp_endpoint(
+            toolset, "ep-calendar", [_make_tool("create_event", "Calendar event")]
+        )
+        tools = await toolset.get_tools(_context("add a calendar event"))
+        assert "create_event" in [t.name for t in tools]
+
+        await toolset.remove_mcp_server("ep-calendar")
+        tools = await toolset.get_tools(_context("add a calendar event"))
+        assert "create_event" not in [t.name for t in tools]
+
+    async def test_disabled_by_default(self):
+        """
+        Given: 기본 설정 (relevance_selection=False)
+        When: threshold 초과 상태에서 메시지와 함께 get_tools()
+        Then: 색인 없이 기존 Defer mode
+        """
+        settings = Settings()
+        settings.mcp = McpSettings(defer_loading_token_threshold=100)
+        toolset = DynamicToolset(settings=settings)
+        await register_mcp_endpoint(toolset, "ep", _filler_tools("tool", 8))
+
+        tools = await toolset.get_tools(_context("utility"))
+
+        assert toolset._relevance_index is None
+        assert len(tools) == 8
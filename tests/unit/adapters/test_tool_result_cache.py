@@ -0,0 +1,328 @@
+"""읽기 전용 MCP 도구 결과 캐시 테스트
+
+ToolResultCache(LRU + 메모리 상한 + TTL)와 DynamicToolset.call_tool() 통합,
+get_tools()가 반환한 도구(Agent 실행 경로)의 캐시/동시 실행 제한 적용 검증
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from google.adk.models.llm_request import LlmRequest
+from google.genai import types
+from mcp.types import ToolAnnotations
+
+from src.adapters.outbound.adk.dynamic_toolset import DynamicToolset, ManagedTool
+from src.adapters.outbound.adk.tool_result_cache import ToolResultCache, canonical_arguments
+from src.config.settings import Settings
+from tests.unit.fakes.fake_mcp_tools import make_tool, register_mcp_endpoint
+
+READ_ONLY = ToolAnnotations(readOnlyHint=True)
+
+
+class TestToolResultCache:
+    """ToolResultCache 단위 동작"""
+
+    def test_canonical_arguments_ignores_key_order(self):
+        """
+        Given: 키 순서만 다른 동일 인자
+        When: canonical_arguments() 호출
+        Then: 같은 문자열
+        """
+        assert canonical_arguments({"b": 1, "a": [1, 2]}) == canonical_arguments(
+            {"a": [1, 2], "b": 1}
+        )
+
+    def test_lru_eviction_respects_memory_cap(self):
+        """
+        Given: 항목 2개만 들어가는 메모리 상한
+        When: 첫 항목 조회 후 세 번째 항목 저장
+        Then: 가장 오래 사용되지 않은 두 번째 항목이 제거됨
+        """
+        value = {"text": "x" * 80}
+        cache = ToolResultCache(max_bytes=250)
+        cache.put(("ep", "t", "1"), value, 60)
+        cache.put(("ep", "t", "2"), value, 60)
+        cache.get(("ep", "t", "1"))
+
+        cache.put(("ep", "t", "3"), value, 60)
+
+        assert cache.get(("ep", "t", "1"))[0] is True
+        assert cache.get(("ep", "t", "2"))[0] is False
+        assert cache.evictions == 1
+        assert cache.total_bytes <= 250
+
+    def test_oversized_result_not_stored(self):
+        """
+        Given: 메모리 상한보다 큰 결과
+        When: put() 호출
+        Then: 저장하지 않음
+        """
+        cache = ToolResultCache(max_bytes=10)
+
+        assert cache.put(("ep", "t", "{}"), {"text": "x" * 100}, 60) is False
+        assert len(cache) == 0
+
+    def test_expired_entry_is_miss(self):
+        """
+        Given: TTL이 지난 항목
+        When: get() 호출
+        Then: 미스 + 항목 제거
+        """
+        cache = ToolResultCache(max_bytes=1024)
+        with patch("src.adapters.outbound.adk.tool_result_cache.time.monotonic", return_value=0.0):
+            cache.put(("ep", "t", "{}"), {"ok": True}, 5)
+        with patch("src.adapters.outbound.adk.tool_result_cache.time.monotonic", return_value=10.0):
+            hit, _ = cache.get(("ep", "t", "{}"))
+
+        assert hit is False
+        assert len(cache) == 0
+        assert cache.total_bytes == 0
+
+    def test_cached_value_is_isolated_from_caller_mutation(self):
+        """
+        Given: 캐시된 결과
+        When: 반환된 결과를 호출자가 수정
+        Then: 다음 조회 결과는 원본 그대로
+        """
+        cache = ToolResultCache(max_bytes=1024)
+        cache.put(("ep", "t", "{}"), {"items": [1]}, 60)
+
+        cache.get(("ep", "t", "{}"))[1]["items"].append(2)
+
+        assert cache.get(("ep", "t", "{}"))[1] == {"items": [1]}
+
+
+class TestCallToolResultCache:
+    """DynamicToolset.call_tool() 결과 캐시"""
+
+    async def test_read_only_tool_result_is_cached(self):
+        """
+        Given: readOnlyHint=True 도구
+        When: 키 순서만 다른 같은 인자로 두 번 호출
+        Then: 서버 호출 1회 + hit/miss 카운터 반영
+        """
+        toolset = DynamicToolset(settings=Settings())
+        tool = make_tool("search_docs", annotations=READ_ONLY)
+        await register_mcp_endpoint(toolset, "ep-a", [tool])
+
+        first = await toolset.call_tool("search_docs", {"q": "adk", "limit": 5})
+        second = await toolset.call_tool("search_docs", {"limit": 5, "q": "adk"})
+
+        assert first == second
+        tool.run_async.assert_awaited_once()
+        stats = toolset.get_result_cache_stats()
+        assert stats["result_cache_hits"] == 1
+        assert stats["result_cache_misses"] == 1
+
+    async def test_tool_without_hint_is_not_cached(self):
+        """
+        Given: annotations가 없는 도구
+        When: 같은 인자로 두 번 호출
+        Then: 매번 서버 호출 (카운터 변화 없음)
+        """
+        toolset = DynamicToolset(settings=Settings())
+        tool = make_tool("send_email")
+        await register_mcp_endpoint(toolset, "ep-a", [tool])
+
+        await toolset.call_tool("send_email", {"to": "a@b.c"})
+        await toolset.call_tool("send_email", {"to": "a@b.c"})
+
+        assert tool.run_async.await_count == 2
+        assert toolset.get_result_cache_stats()["result_cache_misses"] == 0
+
+    async def test_endpoint_opt_in_caches_all_tools(self):
+        """
+        Given: result_cache_endpoints에 엔드포인트 URL 지정
+        When: annotations가 없는 도구를 두 번 호출
+        Then: 서버 호출 1회
+        """
+        settings = Settings()
+        settings.mcp.result_cache_endpoints = ["http://ep-a.test/mcp"]
+        toolset = DynamicToolset(settings=settings)
+        tool = make_tool("get_schema")
+        await register_mcp_endpoint(toolset, "ep-a", [tool])
+
+        await toolset.call_tool("get_schema", {"table": "users"})
+        await toolset.call_tool("get_schema", {"table": "users"})
+
+        tool.run_async.assert_awaited_once()
+
+    async def test_per_tool_ttl_zero_opts_out(self):
+        """
+        Given: readOnlyHint 도구지만 result_cache_tool_ttls에서 TTL 0
+        When: 같은 인자로 두 번 호출
+        Then: 매번 서버 호출
+        """
+        settings = Settings()
+        settings.mcp.result_cache_tool_ttls = {"now": 0}
+        toolset = DynamicToolset(settings=settings)
+        tool = make_tool("now", annotations=READ_ONLY)
+        await register_mcp_endpoint(toolset, "ep-a", [tool])
+
+        await toolset.call_tool("now", {})
+        await toolset.call_tool("now", {})
+
+        assert tool.run_async.await_count == 2
+
+    async def test_error_result_is_not_cached(self):
+        """
+        Given: isError=True를 반환하는 읽기 전용 도구
+        When: 같은 인자로 두 번 호출
+        Then: 에러 응답은 캐싱하지 않고 다시 호출
+        """
+        toolset = DynamicToolset(settings=Settings())
+        tool = make_tool("search_docs", annotations=READ_ONLY)
+        tool.run_async = AsyncMock(return_value={"isError": True, "content": []})
+        await register_mcp_endpoint(toolset, "ep-a", [tool])
+
+        await toolset.call_tool("search_docs", {"q": "x"})
+        await toolset.call_tool("search_docs", {"q": "x"})
+
+        assert tool.run_async.await_count == 2
+
+    async def test_tools_list_changed_invalidates_endpoint_results(self):
+        """
+        Given: 캐시된 결과가 있는 두 엔드포인트
+        When: 한 엔드포인트에서 tools/list_changed 알림 수신
+        Then: 해당 엔드포인트 결과만 제거
+        """
+        toolset = DynamicToolset(settings=Settings())
+        await register_mcp_endpoint(toolset, "ep-a", [make_tool("a_tool", annotations=READ_ONLY)])
+        await register_mcp_endpoint(toolset, "ep-b", [make_tool("b_tool", annotations=READ_ONLY)])
+        await toolset.call_tool("a_tool", {})
+        await toolset.call_tool("b_tool", {})
+        toolset._schedule_background_refresh = MagicMock()
+
+        await toolset.handle_tools_list_changed("ep-a")
+
+        assert toolset.get_result_cache_stats()["result_cache_entries"] == 1
+
+    async def test_disabled_when_memory_cap_is_zero(self):
+        """
+        Given: result_cache_max_bytes=0
+        When: readOnlyHint 도구를 두 번 호출
+        Then: 매번 서버 호출
+        """
+        settings = Settings()
+        settings.mcp.result_cache_max_bytes = 0
+        toolset = DynamicToolset(settings=settings)
+        tool = make_tool("search_docs", annotations=READ_ONLY)
+        await register_mcp_endpoint(toolset, "ep-a", [tool])
+
+        await toolset.call_tool("search_docs", {})
+        await toolset.call_tool("search_docs", {})
+
+        assert tool.run_async.await_count == 2
+
+
+class TestAgentToolResultCache:
+    """get_tools()가 반환한 도구 실행 (ADK Agent 경로)"""
+
+    async def test_managed_tool_result_is_cached(self):
+        """
+        Given: readOnlyHint=True 도구 (Normal mode)
+        When: get_tools()가 반환한 도구를 같은 인자로 두 번 실행
+        Then: 서버 호출 1회
+        """
+        toolset = DynamicToolset(settings=Settings())
+        tool = make_tool("search_docs", annotations=READ_ONLY)
+        await register_mcp_endpoint(toolset, "ep-a", [tool])
+
+        (managed,) = await toolset.get_tools()
+        first = await managed.run_async(args={"q": "adk"}, tool_context=None)
+        second = await managed.run_async(args={"q": "adk"}, tool_context=None)
+
+        assert isinstance(managed, ManagedTool)
+        assert first == second
+        tool.run_async.assert_awaited_once()
+        assert toolset.get_result_cache_stats()["result_cache_hits"] == 1
+
+    async def test_deferred_proxy_result_is_cached(self):
+        """
+        Given: Defer mode (threshold 0)
+        When: get_tools()가 반환한 프록시를 같은 인자로 두 번 실행
+        Then: 서버 호출 1회
+        """
+        settings = Settings()
+        settings.mcp.defer_loading_token_threshold = 0
+        toolset = DynamicToolset(settings=settings)
+        tool = make_tool("search_docs", annotations=READ_ONLY)
+        await register_mcp_endpoint(toolset, "ep-a", [tool])
+
+        (proxy,) = await toolset.get_tools()
+        await proxy.run_async(args={"q": "adk"}, tool_context=None)
+        await proxy.run_async(args={"q": "adk"}, tool_context=None)
+
+        assert type(proxy).__name__ == "DeferredToolProxy"
+        tool.run_async.assert_awaited_once()
+
+    async def test_confirmation_or_error_response_is_not_cached(self):
+        """
+        Given: {"error": ...}를 반환하는 읽기 전용 도구 (ADK McpTool 실패/확인 요청)
+        When: get_tools()가 반환한 도구를 두 번 실행
+        Then: 매번 서버 호출
+        """
+        toolset = DynamicToolset(settings=Settings())
+        tool = make_tool("search_docs", annotations=READ_ONLY)
+        tool.run_async = AsyncMock(return_value={"error": "This tool call is rejected."})
+        await register_mcp_endpoint(toolset, "ep-a", [tool])
+
+        (managed,) = await toolset.get_tools()
+        await managed.run_async(args={}, tool_context=None)
+        await managed.run_async(args={}, tool_context=None)
+
+        assert tool.run_async.await_count == 2
+
+    async def test_managed_tool_respects_endpoint_concurrency_limit(self):
+        """
+        Given: max_concurrent_calls_per_endpoint=1, 캐시 대상이 아닌 도구
+        When: get_tools()가 반환한 도구를 동시에 3번 실행
+        Then: 한 번에 하나씩 실행
+        """
+        settings = Settings()
+        settings.mcp.max_concurrent_calls_per_endpoint = 1
+        toolset = DynamicToolset(settings=settings)
+        running = 0
+        max_running = 0
+
+        async def run(args, tool_context):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"content": []}
+
+        tool = make_tool("send_email")
+        tool.run_async = AsyncMock(side_effect=run)
+        await register_mcp_endpoint(toolset, "ep-a", [tool])
+
+        (managed,) = await toolset.get_tools()
+        await asyncio.gather(
+            *(managed.run_async(args={"n": n}, tool_context=None) for n in range(3))
+        )
+
+        assert max_running == 1
+
+    async def test_llm_request_dispatches_to_managed_tool(self):
+        """
+        Given: 선언을 LlmRequest에 추가하는 원본 도구
+        When: ManagedTool.process_llm_request()
+        Then: 원본 선언이 추가되고 실행 대상(tools_dict)은 래퍼
+        """
+        toolset = DynamicToolset(settings=Settings())
+        tool = make_tool("search_docs", annotations=READ_ONLY)
+        tool._get_declaration = MagicMock(
+            return_value=types.FunctionDeclaration(name="search_docs", description="d")
+        )
+        tool.process_llm_request = AsyncMock(
+            side_effect=lambda tool_context, llm_request: llm_request.append_tools([tool])
+        )
+        await register_mcp_endpoint(toolset, "ep-a", [tool])
+        (managed,) = await toolset.get_tools()
+        llm_request = LlmRequest()
+
+        await managed.process_llm_request(tool_context=None, llm_request=llm_request)
+
+        assert llm_request.tools_dict["search_docs"] is managed
+        assert llm_request.config.tools[0].function_declarations[0].name == "search_docs"
@@ -0,0 +1,178 @@
+"""대용량 도구 결과 분리 저장 테스트
+
+ToolResultSpiller(after_tool_callback + read_tool_result)와
+process_message의 tool_result 청크(미리보기 + 조회 URL) 검증
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from google.adk.sessions import InMemorySessionService
+
+from src.adapters.outbound.adk.dynamic_toolset import DynamicToolset
+from src.adapters.outbound.adk.orchestrator_adapter import AdkOrchestratorAdapter
+from src.adapters.outbound.adk.tool_result_spill import READ_TOOL_RESULT_NAME, ToolResultSpiller
+from tests.unit.fakes import FakeToolResultStorage
+
+
+def _tool(name: str) -> MagicMock:
+    tool = MagicMock()
+    tool.name = name
+    return tool
+
+
+def _mcp_text_result(text: str) -> dict:
+    return {"content": [{"type": "text", "text": text}], "isError": False}
+
+
+class TestToolResultSpiller:
+    """after_tool_callback 분리 저장"""
+
+    async def test_small_result_passes_through(self):
+        """
+        Given: 임계값 이하 결과
+        When: after_tool_callback 호출
+        Then: None (원래 결과 사용) + 저장하지 않음
+        """
+        storage = FakeToolResultStorage()
+        spiller = ToolResultSpiller(storage, spill_chars=100, preview_chars=10)
+
+        replaced = await spiller.after_tool_callback(
+            tool=_tool("search"), args={}, tool_context=None, tool_response=_mcp_text_result("ok")
+        )
+
+        assert replaced is None
+        assert storage.results == {}
+
+    async def test_large_result_replaced_with_preview_and_handle(self):
+        """
+        Given: 임계값을 넘는 MCP 텍스트 결과
+        When: after_tool_callback 호출
+        Then: 텍스트 전체 저장 + 미리보기/핸들/전체 길이로 대체
+        """
+        storage = FakeToolResultStorage()
+        spiller = ToolResultSpiller(storage, spill_chars=100, preview_chars=10)
+        text = "x" * 500
+
+        replaced = await spiller.after_tool_callback(
+            tool=_tool("search"), args={}, tool_context=None, tool_response=_mcp_text_result(text)
+        )
+
+        handle = replaced["result_handle"]
+        assert storage.results[handle] == text
+        assert replaced["preview"] == "x" * 10
+        assert replaced["total_chars"] == 500
+        assert READ_TOOL_RESULT_NAME in replaced["message"]
+
+    async def test_read_tool_result_pages_through_spilled_result(self):
+        """
+        Given: 분리 저장된 결과
+        When: read_tool_result 도구로 offset/length 지정 조회
+        Then: 해당 구간 + 다음 offset (끝이면 None)
+        """
+        storage = FakeToolResultStorage()
+        spiller = ToolResultSpiller(storage, spill_chars=100, preview_chars=10)
+        handle = await storage.save_result("0123456789" * 20)
+        read_tool = spiller.build_read_tool()
+
+        page = await read_tool.run_async(
+            args={"handle": handle, "offset": 10, "length": 5}, tool_context=MagicMock()
+        )
+        last = await read_tool.run_async(
+            args={"handle": handle, "offset": 195, "length": 50}, tool_context=MagicMock()
+        )
+
+        assert read_tool.name == READ_TOOL_RESULT_NAME
+        assert page["content"] == "01234"
+        assert page["next_offset"] == 15
+        assert last["content"] == "56789"
+        assert last["next_offset"] is None
+
+    async def test_read_tool_result_caps_page_below_spill_threshold(self):
+        """
+        Given: spill_chars=100
+        When: length=10000으로 read_tool_result 호출
+        Then: 임계값만큼만 반환 (페이지가 다시 분리되지 않음)
+        """
+        storage = FakeToolResultStorage()
+        spiller = ToolResultSpiller(storage, spill_chars=100, preview_chars=10)
+        handle = await storage.save_result("y" * 1000)
+
+        page = await spiller.build_read_tool().run_async(
+            args={"handle": handle, "length": 10000}, tool_context=MagicMock()
+        )
+
+        assert len(page["content"]) == 100
+
+    async def test_read_tool_result_unknown_handle_returns_error(self):
+        """
+        Given: 존재하지 않는 핸들
+        When: read_tool_result 호출
+        Then: 예외 대신 error 필드 (LLM이 처리)
+        """
+        spiller = ToolResultSpiller(FakeToolResultStorage(), spill_chars=100)
+
+        page = await spiller.build_read_tool().run_async(
+            args={"handle": "missing"}, tool_context=MagicMock()
+        )
+
+        assert "not found" in page["error"]
+
+
+class TestProcessMessageSpilledResult:
+    """process_message의 tool_result 청크"""
+
+    async def test_spilled_result_streams_preview_and_fetch_url(self):
+        """
+        Given: Runner가 분리 저장된 결과(function response)를 반환
+        When: process_message 호출
+        Then: tool_result 청크에 미리보기와 조회 URL만 포함
+        """
+        orchestrator = AdkOrchestratorAdapter(
+            model="openai/gpt-4o-mini",
+            dynamic_toolset=DynamicToolset(),
+            enable_llm_logging=False,
+            tool_result_storage=FakeToolResultStorage(),
+        )
+        response = {"result_handle": "abc", "preview": "first part", "total_chars": 50000}
+        event = MagicMock(partial=False)
+        event.get_function_calls.return_value = []
+        event.get_function_responses.return_value = [
+            SimpleNamespace(name="search", response=response)
+        ]
+        event.actions = None
+        event.is_final_response.return_value = False
+
+        async def run_async(**kwargs):
+            yield event
+
+        orchestrator._runner = MagicMock(run_async=run_async)
+        orchestrator._session_service = InMemorySessionService()
+        orchestrator._initialized = True
+
+        chunks = [chunk async for chunk in orchestrator.process_message("hi", "conv-1")]
+
+        assert len(chunks) == 1
+        assert chunks[0].type == "tool_result"
+        assert chunks[0].result == "first part"
+        assert chunks[0].result_url == "/api/tool-results/abc"
+
+    async def test_agent_registers_read_tool_and_callback(self):
+        """
+        Given: tool_result_storage가 주입된 오케스트레이터
+        When: Agent 재구성
+        Then: read_tool_result 내장 도구 + after_tool_callback 등록
+        """
+        orchestrator = AdkOrchestratorAdapter(
+            model="openai/gpt-4o-mini",
+            dynamic_toolset=DynamicToolset(),
+            enable_llm_logging=False,
+            tool_result_storage=FakeToolResultStorage(),
+        )
+        orchestrator._session_service = InMemorySessionService()
+
+        await orchestrator._rebuild_agent()
+
+        names = [getattr(tool, "name", None) for tool in orchestrator._agent.tools]
+        assert READ_TOOL_RESULT_NAME in names
+        assert orchestrator._agent.after_tool_callback is not None
@@ -17,7 +17,6 @@ def settings_with_retry():
     """재시도 설정이 있는 Settings"""
     settings = Settings()
     settings.mcp = McpSettings(
-        max_active_tools=30,
         cache_ttl_seconds=300,
         max_retries=2,
         retry_backoff_seconds=0.1,  # 테스트용 짧은 대기시간
@@ -222,7 +221,6 @@ class TestRetryDisabled:
         # Given: max_retries = 0 설정
         settings = Settings()
         settings.mcp = McpSettings(
-            max_active_tools=30,
             cache_ttl_seconds=300,
             max_retries=0,  # 재시도 비활성화
             retry_backoff_seconds=1.0,
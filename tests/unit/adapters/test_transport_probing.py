@@ -0,0 +1,147 @@
+"""DynamicToolset MCP 전송 방식 동시 probing 테스트
+
+Streamable HTTP / SSE 동시 시도, 먼저 성공한 쪽 채택, 나머지 취소,
+기록된 전송 방식으로 바로 연결하는지 검증
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from google.adk.tools.mcp_tool.mcp_toolset import SseConnectionParams
+
+from src.adapters.outbound.adk.dynamic_toolset import DynamicToolset
+from src.config.settings import McpSettings, Settings
+from src.domain.entities.endpoint import McpTransport
+
+URL = "http://legacy.test/mcp"
+
+
+def _fake_mcp_toolset_factory(delays: dict[McpTransport, float | None]):
+    """전송 방식별 응답 지연을 흉내내는 MCPToolset 대체 팩토리
+
+    delays 값이 None이면 해당 전송 방식은 연결 실패.
+    """
+    created: dict[McpTransport, AsyncMock] = {}
+
+    def factory(connection_params):
+        transport = (
+            McpTransport.SSE
+            if isinstance(connection_params, SseConnectionParams)
+            else McpTransport.STREAMABLE_HTTP
+        )
+        delay = delays[transport]
+
+        async def get_tools(*args, **kwargs):
+            if delay is None:
+                raise ConnectionError(f"{transport.value} not supported")
+            await asyncio.sleep(delay)
+            tool = MagicMock()
+            tool.name = "echo"
+            return [tool]
+
+        toolset = AsyncMock()
+        toolset.get_tools = AsyncMock(side_effect=get_tools)
+        toolset.close = AsyncMock()
+        toolset.connection_params = connection_params
+        created[transport] = toolset
+        return toolset
+
+    return factory, created
+
+
+@pytest.fixture
+def dynamic_toolset():
+    settings = Settings()
+    settings.mcp = McpSettings(probe_timeout_seconds=1.0, call_timeout_seconds=30.0)
+    return DynamicToolset(settings=settings)
+
+
+class TestConcurrentTransportProbing:
+    """동시 probing"""
+
+    async def test_legacy_sse_server_connects_without_waiting_for_http(self, dynamic_toolset):
+        """
+        Given: Streamable HTTP 응답이 멈춰 있는 레거시 SSE 서버
+        When: 전송 방식 미기록 상태로 연결
+        Then: SSE가 채택되고 Streamable HTTP probe는 취소/정리됨
+        """
+        factory, created = _fake_mcp_toolset_factory(
+            {McpTransport.STREAMABLE_HTTP: 60.0, McpTransport.SSE: 0.01}
+        )
+        with patch("src.adapters.outbound.adk.dynamic_toolset.MCPToolset", side_effect=factory):
+            toolset, transport = await asyncio.wait_for(
+                dynamic_toolset._create_mcp_toolset(URL), timeout=0.5
+            )
+
+        assert transport == McpTransport.SSE
+        assert toolset is created[McpTransport.SSE]
+        # 취소된 probe 정리는 반환 전에 완료
+        created[McpTransport.STREAMABLE_HTTP].close.assert_called_once()
+        assert created[McpTransport.SSE].connection_params.timeout == 30.0
+
+    async def test_failed_probe_does_not_win(self, dynamic_toolset):
+        """
+        Given: Streamable HTTP는 즉시 실패, SSE는 조금 늦게 성공
+        When: 연결
+        Then: SSE 채택
+        """
+        factory, _ = _fake_mcp_toolset_factory(
+            {McpTransport.STREAMABLE_HTTP: None, McpTransport.SSE: 0.05}
+        )
+        with patch("src.adapters.outbound.adk.dynamic_toolset.MCPToolset", side_effect=factory):
+            _, transport = await dynamic_toolset._create_mcp_toolset(URL)
+
+        assert transport == McpTransport.SSE
+
+    async def test_all_transports_fail(self, dynamic_toolset):
+        """
+        Given: 두 전송 방식 모두 실패 (하나는 probe 타임아웃)
+        When: 연결
+        Then: ConnectionError
+        """
+        factory, _ = _fake_mcp_toolset_factory(
+            {McpTransport.STREAMABLE_HTTP: 60.0, McpTransport.SSE: None}
+        )
+        with (
+            patch("src.adapters.outbound.adk.dynamic_toolset.MCPToolset", side_effect=factory),
+            pytest.raises(ConnectionError, match="Failed to connect"),
+        ):
+            await dynamic_toolset._create_mcp_toolset(URL)
+
+
+class TestRecordedTransport:
+    """기록된 전송 방식 재사용"""
+
+    async def test_recorded_transport_skips_probing(self, dynamic_toolset):
+        """
+        Given: SSE로 기록된 엔드포인트
+        When: 연결
+        Then: SSE toolset만 생성
+        """
+        factory, created = _fake_mcp_toolset_factory(
+            {McpTransport.STREAMABLE_HTTP: 0.0, McpTransport.SSE: 0.0}
+        )
+        with patch("src.adapters.outbound.adk.dynamic_toolset.MCPToolset", side_effect=factory):
+            _, transport = await dynamic_toolset._create_mcp_toolset(
+                URL, transport=McpTransport.SSE
+            )
+
+        assert transport == McpTransport.SSE
+        assert list(created) == [McpTransport.SSE]
+
+    async def test_recorded_transport_failure_falls_back_to_probing(self, dynamic_toolset):
+        """
+        Given: SSE로 기록됐지만 서버가 Streamable HTTP로 전환됨
+        When: 연결
+        Then: probing으로 Streamable HTTP 채택
+        """
+        factory, _ = _fake_mcp_toolset_factory(
+            {McpTransport.STREAMABLE_HTTP: 0.0, McpTransport.SSE: None}
+        )
+        with patch("src.adapters.outbound.adk.dynamic_toolset.MCPToolset", side_effect=factory):
+            _, transport = await dynamic_toolset._create_mcp_toolset(
+                URL, transport=McpTransport.SSE
+            )
+
+        assert transport == McpTransport.STREAMABLE_HTTP
@@ -0,0 +1,228 @@
+"""TurnScheduler 테스트
+
+같은 대화의 턴 직렬화, 전역 동시 실행 제한의 FIFO 승인, 대기 시간 초과/취소 정리,
+process_message 연동을 검증
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from google.adk.events.event import Event
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from src.adapters.outbound.adk.dynamic_toolset import DynamicToolset
+from src.adapters.outbound.adk.orchestrator_adapter import AdkOrchestratorAdapter
+from src.adapters.outbound.adk.turn_scheduler import TurnScheduler
+from src.domain.exceptions import TurnQueueTimeoutError
+
+
+async def _run(scheduler: TurnScheduler, conversation_id: str, log: list, hold: asyncio.Event):
+    async with scheduler.turn(conversation_id):
+        log.append(("start", conversation_id))
+        await hold.wait()
+        log.append(("end", conversation_id))
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestConversationSerialization:
+    """대화별 직렬화"""
+
+    async def test_same_conversation_turns_do_not_overlap(self):
+        """
+        Given: 같은 대화의 턴 2개 동시 요청
+        When: 첫 턴 완료 전
+        Then: 두 번째 턴은 시작하지 않음 (첫 턴 종료 후 시작)
+        """
+        scheduler = TurnScheduler(max_concurrent_turns=4)
+        log: list = []
+        hold = asyncio.Event()
+
+        first = asyncio.create_task(_run(scheduler, "conv-1", log, hold))
+        second = asyncio.create_task(_run(scheduler, "conv-1", log, hold))
+        await _settle()
+
+        assert log == [("start", "conv-1")]
+        assert scheduler.get_stats()["conversation_waiting"] == 1
+
+        hold.set()
+        await asyncio.gather(first, second)
+
+        assert log == [("start", "conv-1"), ("end", "conv-1")] * 2
+
+    async def test_waiting_on_conversation_does_not_hold_global_slot(self):
+        """
+        Given: max_concurrent_turns=2, conv-1 턴 실행 중 + conv-1 두 번째 턴 대기
+        When: conv-2 턴 요청
+        Then: conv-2는 대기 없이 바로 실행
+        """
+        scheduler = TurnScheduler(max_concurrent_turns=2)
+        log: list = []
+        hold = asyncio.Event()
+
+        tasks = [
+            asyncio.create_task(_run(scheduler, conversation_id, log, hold))
+            for conversation_id in ("conv-1", "conv-1", "conv-2")
+        ]
+        await _settle()
+
+        assert ("start", "conv-2") in log
+        assert scheduler.get_stats()["queued_turns"] == 0
+
+        hold.set()
+        await asyncio.gather(*tasks)
+
+
+class TestAdmissionQueue:
+    """전역 FIFO 승인 대기열"""
+
+    async def test_admission_is_fifo_and_bounded(self):
+        """
+        Given: max_concurrent_turns=1
+        When: 서로 다른 대화 턴 3개가 순서대로 도착
+        Then: 한 번에 1개만 실행 + 도착 순서대로 승인 + 대기열 길이 보고
+        """
+        scheduler = TurnScheduler(max_concurrent_turns=1)
+        log: list = []
+        holds = {c: asyncio.Event() for c in ("a", "b", "c")}
+
+        tasks = []
+        for conversation_id in ("a", "b", "c"):
+            tasks.append(
+                asyncio.create_task(_run(scheduler, conversation_id, log, holds[conversation_id]))
+            )
+            await _settle()
+
+        stats = scheduler.get_stats()
+        assert stats["active_turns"] == 1
+        assert stats["queued_turns"] == 2
+
+        for conversation_id in ("a", "b", "c"):
+            holds[conversation_id].set()
+            await _settle()
+
+        await asyncio.gather(*tasks)
+        assert [c for event, c in log if event == "start"] == ["a", "b", "c"]
+        stats = scheduler.get_stats()
+        assert stats["active_turns"] == 0
+        assert stats["admitted_turns"] == 3
+        assert stats["wait_ms"]["max"] > 0
+
+    async def test_newcomer_does_not_jump_the_queue(self):
+        """
+        Given: 대기 중인 턴 b가 있는 상태에서 a 종료
+        When: 같은 시점에 새 턴 c 도착
+        Then: 슬롯은 먼저 기다린 b가 받음
+        """
+        scheduler = TurnScheduler(max_concurrent_turns=1)
+        log: list = []
+        hold_a, hold_rest = asyncio.Event(), asyncio.Event()
+
+        a = asyncio.create_task(_run(scheduler, "a", log, hold_a))
+        await _settle()
+        b = asyncio.create_task(_run(scheduler, "b", log, hold_rest))
+        await _settle()
+
+        hold_a.set()
+        c = asyncio.create_task(_run(scheduler, "c", log, hold_rest))
+        await _settle()
+
+        assert [c_id for event, c_id in log if event == "start"] == ["a", "b"]
+
+        hold_rest.set()
+        await asyncio.gather(a, b, c)
+
+    async def test_queue_timeout_raises_and_releases(self):
+        """
+        Given: queue_timeout_seconds=0.05, 슬롯 1개가 사용 중
+        When: 다른 턴이 대기
+        Then: TurnQueueTimeoutError + 대기열/대화 상태 정리
+        """
+        scheduler = TurnScheduler(max_concurrent_turns=1, queue_timeout_seconds=0.05)
+        hold = asyncio.Event()
+        running = asyncio.create_task(_run(scheduler, "a", [], hold))
+        await _settle()
+
+        with pytest.raises(TurnQueueTimeoutError):
+            async with scheduler.turn("b"):
+                pass
+
+        stats = scheduler.get_stats()
+        assert stats["queued_turns"] == 0
+        assert stats["timed_out_turns"] == 1
+        assert "b" not in scheduler._conversations
+
+        hold.set()
+        await running
+        assert scheduler.get_stats()["active_turns"] == 0
+        assert scheduler._conversations == {}
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        """
+        Given: 대기열에서 기다리는 턴
+        When: 클라이언트 연결 해제로 취소
+        Then: 대기열에서 제거되고 다음 턴이 정상 승인
+        """
+        scheduler = TurnScheduler(max_concurrent_turns=1)
+        log: list = []
+        hold = asyncio.Event()
+        running = asyncio.create_task(_run(scheduler, "a", log, hold))
+        await _settle()
+        waiting = asyncio.create_task(_run(scheduler, "b", log, hold))
+        await _settle()
+
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+        assert scheduler.get_stats()["queued_turns"] == 0
+
+        hold.set()
+        await running
+        async with scheduler.turn("c"):
+            assert scheduler.get_stats()["active_turns"] == 1
+
+
+class TestProcessMessage:
+    """process_message 연동"""
+
+    async def test_concurrent_turns_on_same_conversation_are_serialized(self):
+        """
+        Given: Runner 실행 중 다른 코루틴으로 양보하는 Orchestrator
+        When: 같은 conversation_id로 process_message 2개 동시 실행
+        Then: Runner 실행 구간이 겹치지 않음
+        """
+        orchestrator = AdkOrchestratorAdapter(
+            model="openai/gpt-4o-mini",
+            dynamic_toolset=DynamicToolset(),
+            enable_llm_logging=False,
+            turn_scheduler=TurnScheduler(max_concurrent_turns=4),
+        )
+        running = 0
+        overlaps = 0
+
+        async def run_async(**kwargs):
+            nonlocal running, overlaps
+            running += 1
+            overlaps += running > 1
+            await asyncio.sleep(0.01)
+            yield Event(
+                author="agenthub_agent",
+                content=types.Content(role="model", parts=[types.Part(text="ok")]),
+            )
+            running -= 1
+
+        orchestrator._runner = MagicMock(run_async=run_async)
+        orchestrator._session_service = InMemorySessionService()
+        orchestrator._initialized = True
+
+        async def turn(text: str) -> list:
+            return [c async for c in orchestrator.process_message(text, "conv-1")]
+
+        results = await asyncio.gather(turn("one"), turn("two"))
+
+        assert overlaps == 0
+        assert all(len(chunks) == 1 for chunks in results)
@@ -0,0 +1,379 @@
+"""DagWorkflowAgent 테스트
+
+의존성 순서 실행, max_parallelism 동시 실행 제한, output_key 데이터 전달,
+실패 step의 의존 step 건너뛰기, 컴파일된 Workflow Runner 캐시를 검증
+"""
+
+import asyncio
+import contextlib
+from types import SimpleNamespace
+from typing import Any
+
+from google.adk.a2a.converters.part_converter import convert_genai_part_to_a2a_part
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events.event import Event
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from src.adapters.outbound.adk.dynamic_toolset import DynamicToolset
+from src.adapters.outbound.adk.orchestrator_adapter import (
+    APP_NAME,
+    DEFAULT_USER_ID,
+    AdkOrchestratorAdapter,
+)
+from src.adapters.outbound.adk.workflow_dag import (
+    WORKFLOW_STEP_EVENT_KEY,
+    DagWorkflowAgent,
+    step_context_builder,
+)
+from src.domain.entities.stream_chunk import StreamChunk
+from src.domain.entities.workflow import Workflow, WorkflowStep
+
+APP = "test_app"
+
+
+class _Tracker:
+    """동시 실행 수/실행 순서 기록"""
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self.log: list[tuple[str, str]] = []
+        self.requests: dict[str, str] = {}  # step 이름 -> context_builder가 만든 요청 텍스트
+
+
+class _FakeStep(BaseAgent):
+    """session.state를 읽어 응답하는 가짜 step agent"""
+
+    tracker: _Tracker
+    reply: str = "ok"
+    read_key: str = ""
+    fail: bool = False
+    delay: float = 0.01
+    context_builder: Any = None
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    async def _run_async_impl(self, ctx):
+        self.tracker.running += 1
+        self.tracker.max_running = max(self.tracker.max_running, self.tracker.running)
+        self.tracker.log.append(("start", self.name))
+        if self.context_builder is not None:
+            parts, _ = self.context_builder(ctx, self.name, lambda part: part)
+            self.tracker.requests[self.name] = parts[0].text
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.tracker.running -= 1
+        self.tracker.log.append(("end", self.name))
+        if self.fail:
+            yield Event(author=self.name, error_code="A2A_ERROR", error_message="boom")
+            return
+        text = self.reply
+        if self.read_key:
+            text = f"{text}<{ctx.session.state.get(self.read_key, '')}>"
+        yield Event(
+            author=self.name,
+            content=types.Content(role="model", parts=[types.Part(text=text)]),
+        )
+
+
+class _HangingStep(_FakeStep):
+    """응답하지 않다가 취소되면 스트림 정리에 시간이 걸리는 step"""
+
+    async def _run_async_impl(self, ctx):
+        try:
+            await asyncio.sleep(10)
+            yield  # pragma: no cover
+        finally:
+            await asyncio.sleep(0.05)
+            self.tracker.log.append(("closed", self.name))
+
+
+async def _run(agent: BaseAgent) -> tuple[list[Event], dict]:
+    session_service = InMemorySessionService()
+    runner = Runner(agent=agent, app_name=APP, session_service=session_service)
+    session = await session_service.create_session(app_name=APP, user_id="u")
+    events = [
+        event
+        async for event in runner.run_async(
+            user_id="u",
+            session_id=session.id,
+            new_message=types.Content(role="user", parts=[types.Part(text="go")]),
+        )
+    ]
+    session = await session_service.get_session(app_name=APP, user_id="u", session_id=session.id)
+    return events, session.state
+
+
+def _progress(events: list[Event]) -> list[tuple[int, str]]:
+    return [
+        (meta["step"], meta["status"])
+        for event in events
+        if (meta := (event.custom_metadata or {}).get(WORKFLOW_STEP_EVENT_KEY))
+    ]
+
+
+class TestDagExecution:
+    """의존성 그래프 실행"""
+
+    async def test_independent_branches_run_concurrently_within_limit(self):
+        """
+        Given: 독립 step 4개, max_parallelism=2
+        When: 실행
+        Then: 최대 2개씩 동시 실행 + 모든 step 완료
+        """
+        tracker = _Tracker()
+        agent = DagWorkflowAgent(
+            name="wf",
+            sub_agents=[_FakeStep(name=f"s{i}", tracker=tracker) for i in range(4)],
+            dependencies=[[], [], [], []],
+            output_keys=["a", "b", "c", "d"],
+            max_parallelism=2,
+        )
+
+        events, state = await _run(agent)
+
+        assert tracker.max_running == 2
+        assert sorted(s for s, status in _progress(events) if status == "complete") == [1, 2, 3, 4]
+        assert state["a"] == "ok"
+
+    async def test_dependent_step_receives_upstream_output(self):
+        """
+        Given: search, stats → report (report가 search 출력 참조)
+        When: 실행
+        Then: report는 두 upstream이 끝난 뒤 시작하고 search 출력을 state에서 읽음
+        """
+        tracker = _Tracker()
+        agent = DagWorkflowAgent(
+            name="wf",
+            sub_agents=[
+                _FakeStep(name="search", tracker=tracker, reply="found"),
+                _FakeStep(name="stats", tracker=tracker, reply="42", delay=0.03),
+                _FakeStep(name="report", tracker=tracker, reply="report", read_key="search"),
+            ],
+            dependencies=[[], [], [0, 1]],
+            output_keys=["search", "stats", "report"],
+        )
+
+        _, state = await _run(agent)
+
+        assert tracker.log.index(("start", "report")) > tracker.log.index(("end", "stats"))
+        assert tracker.max_running == 2
+        assert state["report"] == "report<found>"
+
+    async def test_failed_step_skips_dependents(self):
+        """
+        Given: a(실패) → b → c, 독립 step d
+        When: 실행
+        Then: b, c는 실행하지 않고 skipped, d는 완료
+        """
+        tracker = _Tracker()
+        agent = DagWorkflowAgent(
+            name="wf",
+            sub_agents=[
+                _FakeStep(name="a", tracker=tracker, fail=True),
+                _FakeStep(name="b", tracker=tracker),
+                _FakeStep(name="c", tracker=tracker),
+                _FakeStep(name="d", tracker=tracker),
+            ],
+            dependencies=[[], [0], [1], []],
+            output_keys=["a", "b", "c", "d"],
+        )
+
+        events, state = await _run(agent)
+
+        progress = _progress(events)
+        assert (1, "failed") in progress
+        assert (2, "skipped") in progress
+        assert (3, "skipped") in progress
+        assert (4, "complete") in progress
+        assert ("start", "b") not in tracker.log
+        assert "a" not in state
+
+    async def test_closing_workflow_waits_for_cancelled_steps(self):
+        """
+        Given: 완료된 step 1개 + 응답 없는 step 1개
+        When: 첫 step 응답 후 workflow 이벤트 스트림을 닫음
+        Then: 닫기가 끝나기 전에 취소된 step의 스트림 정리도 끝남
+        """
+        tracker = _Tracker()
+        agent = DagWorkflowAgent(
+            name="wf",
+            sub_agents=[
+                _FakeStep(name="fast", tracker=tracker, delay=0),
+                _HangingStep(name="hanging", tracker=tracker),
+            ],
+            dependencies=[[], []],
+            output_keys=["a", "b"],
+        )
+        session_service = InMemorySessionService()
+        session = await session_service.create_session(app_name=APP, user_id="u")
+        ctx = InvocationContext(
+            session_service=session_service,
+            invocation_id="inv-1",
+            agent=agent,
+            session=session,
+            user_content=types.Content(role="user", parts=[types.Part(text="go")]),
+        )
+
+        async with contextlib.aclosing(agent.run_async(ctx)) as events:
+            async for event in events:
+                if event.author == "fast":
+                    break
+
+        assert ("closed", "hanging") in tracker.log
+
+
+class TestStepContextBuilder:
+    """step 요청 메시지 구성"""
+
+    def test_message_includes_instruction_and_inputs(self):
+        """
+        Given: instruction + 의존 step output_key
+        When: context_builder 호출
+        Then: 사용자 메시지, instruction, 입력 값을 하나의 텍스트 part로 전달
+        """
+        ctx = SimpleNamespace(
+            user_content=types.Content(role="user", parts=[types.Part(text="Summarize")]),
+            session=SimpleNamespace(state={"search": "found"}),
+        )
+        build = step_context_builder("Be brief", ["search"])
+
+        parts, context_id = build(ctx, "step_1", convert_genai_part_to_a2a_part)
+
+        assert context_id is None
+        assert len(parts) == 1
+        assert parts[0].text == "Summarize\n\n[Instruction]\nBe brief\n\n[Input: search]\nfound"
+
+
+def _orchestrator(monkeypatch, tracker: _Tracker) -> AdkOrchestratorAdapter:
+    orchestrator = AdkOrchestratorAdapter(
+        model="openai/gpt-4o-mini",
+        dynamic_toolset=DynamicToolset(),
+        enable_llm_logging=False,
+    )
+    orchestrator._initialized = True
+    orchestrator._session_service = InMemorySessionService()
+    orchestrator._a2a_urls = {"echo": "http://echo", "math": "http://math"}
+
+    def create_remote_agent(endpoint_id, url, name=None, context_builder=None):
+        return _FakeStep(
+            name=name.replace("-", "_"),
+            tracker=tracker,
+            reply=endpoint_id,
+            context_builder=context_builder,
+        )
+
+    monkeypatch.setattr(orchestrator, "_create_remote_agent", create_remote_agent)
+    return orchestrator
+
+
+def _workflow(workflow_id: str) -> Workflow:
+    return Workflow(
+        id=workflow_id,
+        name="Echo then Math",
+        workflow_type="dag",
+        steps=[
+            WorkflowStep(agent_endpoint_id="echo", output_key="echo_result"),
+            WorkflowStep(
+                agent_endpoint_id="math", output_key="math_result", depends_on=["echo_result"]
+            ),
+        ],
+    )
+
+
+class TestOrchestratorWorkflowCache:
+    """컴파일된 Workflow Runner 캐시 + 실행"""
+
+    async def test_same_definition_shares_compiled_runner(self, monkeypatch):
+        """
+        Given: 정의가 같고 ID만 다른 Workflow 2개
+        When: create_workflow_agent
+        Then: 컴파일된 Runner 1개를 공유
+        """
+        orchestrator = _orchestrator(monkeypatch, _Tracker())
+
+        await orchestrator.create_workflow_agent(_workflow("wf-1"))
+        await orchestrator.create_workflow_agent(_workflow("wf-2"))
+
+        assert len(orchestrator._workflow_runners) == 1
+
+    async def test_cache_evicts_least_recently_used(self, monkeypatch):
+        """
+        Given: workflow_cache_size=1
+        When: 서로 다른 정의 2개 생성 후 첫 번째 실행
+        Then: 캐시에는 1개만 유지되고 밀려난 정의는 실행 시 다시 컴파일
+        """
+        orchestrator = _orchestrator(monkeypatch, _Tracker())
+        orchestrator._workflow_cache_size = 1
+        first = _workflow("wf-1")
+        second = _workflow("wf-2")
+        second.steps[1].depends_on = []
+
+        await orchestrator.create_workflow_agent(first)
+        await orchestrator.create_workflow_agent(second)
+        assert list(orchestrator._workflow_runners) == [orchestrator._workflow_cache_key(second)]
+
+        chunks = [c async for c in orchestrator.execute_workflow("wf-1", "go", "conv-1")]
+
+        assert chunks[-1].workflow_status == "success"
+        assert list(orchestrator._workflow_runners) == [orchestrator._workflow_cache_key(first)]
+
+    async def test_execute_streams_step_events(self, monkeypatch):
+        """
+        Given: echo → math DAG Workflow
+        When: execute_workflow
+        Then: step 시작/완료 이벤트가 의존 순서대로 스트리밍되고 status="success"
+        """
+        tracker = _Tracker()
+        orchestrator = _orchestrator(monkeypatch, tracker)
+        await orchestrator.create_workflow_agent(_workflow("wf-1"))
+
+        chunks: list[StreamChunk] = [
+            c async for c in orchestrator.execute_workflow("wf-1", "go", "conv-1")
+        ]
+
+        steps = [(c.type, c.step_number) for c in chunks if c.type.startswith("workflow_step")]
+        assert steps == [
+            ("workflow_step_start", 1),
+            ("workflow_step_complete", 1),
+            ("workflow_step_start", 2),
+            ("workflow_step_complete", 2),
+        ]
+        assert [c.content for c in chunks if c.type == "text"] == ["echo", "math"]
+        assert chunks[-1].type == "workflow_complete"
+        assert chunks[-1].workflow_status == "success"
+
+    async def test_sequential_steps_without_output_key_pass_previous_reply(self, monkeypatch):
+        """
+        Given: output_key가 빈 2-step sequential Workflow
+        When: execute_workflow
+        Then: 두 번째 step 요청에 첫 번째 step 응답이 포함되고 세션 state에는 남지 않음
+        """
+        tracker = _Tracker()
+        orchestrator = _orchestrator(monkeypatch, tracker)
+        workflow = Workflow(
+            id="wf-seq",
+            name="Echo then Math",
+            workflow_type="sequential",
+            steps=[
+                WorkflowStep(agent_endpoint_id="echo", output_key=""),
+                WorkflowStep(agent_endpoint_id="math", output_key="", instruction="Add one"),
+            ],
+        )
+        await orchestrator.create_workflow_agent(workflow)
+
+        chunks = [c async for c in orchestrator.execute_workflow("wf-seq", "go", "conv-1")]
+
+        assert chunks[-1].workflow_status == "success"
+        assert (
+            tracker.requests["step_2_math"]
+            == "go\n\n[Instruction]\nAdd one\n\n[Input: step_1]\necho"
+        )
+        session = await orchestrator._session_service.get_session(
+            app_name=APP_NAME, user_id=DEFAULT_USER_ID, session_id="conv-1_workflow_wf-seq"
+        )
+        assert not any(key.startswith("temp:") for key in session.state)
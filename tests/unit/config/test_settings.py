@@ -3,6 +3,7 @@
 TDD Phase: RED - 테스트 먼저 작성
 """
 
+import pytest
 from pydantic import BaseModel
 
 from src.config.settings import (
@@ -28,6 +29,8 @@ class TestNestedModels:
         settings = LLMSettings()
         assert settings.default_model == "openai/gpt-4o-mini"
         assert settings.timeout == 120
+        assert settings.stream_tokens is False
+        assert settings.context_max_tokens == 0
 
     def test_storage_settings_defaults(self):
         """StorageSettings 기본값"""
@@ -42,12 +45,34 @@ class TestNestedModels:
         assert settings.timeout_seconds == 5
 
     def test_mcp_settings_defaults(self):
-        """McpSettings 기본값 (Step 11: max_active_tools 30 → 100)"""
+        """McpSettings 기본값 (도구 정의 토큰 예산)"""
         settings = McpSettings()
-        assert settings.max_active_tools == 100  # Step 11: 30 → 100
-        assert settings.defer_loading_threshold == 30  # Step 11
+        assert settings.max_tool_definition_tokens == 30000
+        assert settings.defer_loading_token_threshold == 9000
         assert settings.cache_ttl_seconds == 300
 
+    @pytest.mark.parametrize(
+        ("legacy", "replacement"),
+        [
+            ("max_active_tools", "max_tool_definition_tokens"),
+            ("defer_loading_threshold", "defer_loading_token_threshold"),
+        ],
+    )
+    def test_mcp_legacy_tool_count_keys_warn(self, legacy, replacement):
+        """제거된 도구 수 기준 키는 무시되지만 대체 설정을 안내하는 경고 발생"""
+        with pytest.warns(FutureWarning, match=replacement):
+            settings = McpSettings(**{legacy: 100})
+
+        assert settings.defer_loading_token_threshold == 9000
+
+    def test_mcp_result_cache_defaults(self):
+        """McpSettings 도구 결과 캐시 기본값 (annotations opt-in, 엔드포인트 지정 없음)"""
+        settings = McpSettings()
+        assert settings.result_cache_max_bytes == 16 * 1024 * 1024
+        assert settings.result_cache_ttl_seconds == 60.0
+        assert settings.result_cache_tool_ttls == {}
+        assert settings.result_cache_endpoints == []
+
 
 class TestSettingsIntegration:
     """Settings 통합 검증"""
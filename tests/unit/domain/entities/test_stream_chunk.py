@@ -59,6 +59,18 @@ class TestStreamChunkFactories:
         assert chunk.type == "tool_result"
         assert chunk.tool_name == "search"
         assert chunk.result == "Found 3 results"
+        assert chunk.result_url == ""
+
+    def test_tool_result_factory_with_result_url(self):
+        """
+        Given: 분리 저장된 대용량 결과의 미리보기와 조회 URL
+        When: StreamChunk.tool_result(result_url=...) 호출
+        Then: result는 미리보기, result_url은 조회 URL
+        """
+        chunk = StreamChunk.tool_result("search", "preview", result_url="/api/tool-results/abc")
+
+        assert chunk.result == "preview"
+        assert chunk.result_url == "/api/tool-results/abc"
 
     def test_agent_transfer_factory(self):
         """
@@ -116,6 +116,18 @@ class TestUsageValidation:
                 cost_usd=0.001,
             )
 
+    def test_validates_cached_tokens_within_prompt_tokens(self):
+        """cached_tokens는 0 이상 prompt_tokens 이하여야 함"""
+        with pytest.raises(ValueError, match="cached_tokens must be between 0 and prompt_tokens"):
+            Usage(
+                model="test",
+                prompt_tokens=100,
+                completion_tokens=50,
+                total_tokens=150,
+                cost_usd=0.001,
+                cached_tokens=101,
+            )
+
 
 class TestUsageEquality:
     """Usage 엔티티 동등성 테스트"""
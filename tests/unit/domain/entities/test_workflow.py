@@ -7,6 +7,8 @@ without any external dependencies (ADK, FastAPI, etc.)
 
 from datetime import datetime
 
+import pytest
+
 from src.domain.entities.workflow import Workflow, WorkflowStep
 
 
@@ -295,3 +297,100 @@ class TestWorkflowStepIntegration:
         assert workflow.steps[0].output_key == "echo_result"
         assert workflow.steps[1].output_key == "math_result"
         assert workflow.steps[2].output_key == "final_echo"
+
+
+def _dag(*steps: tuple[str, list[str]], workflow_type: str = "dag") -> Workflow:
+    return Workflow(
+        id="wf-dag",
+        name="DAG",
+        workflow_type=workflow_type,
+        steps=[
+            WorkflowStep(agent_endpoint_id=f"agent-{key}", output_key=key, depends_on=deps)
+            for key, deps in steps
+        ],
+    )
+
+
+class TestWorkflowDependencies:
+    """Test dependency graph resolution and definition hashing"""
+
+    def test_dag_dependencies_resolve_to_step_indexes(self):
+        """
+        Given: DAG where "report" depends on "search" and "stats"
+        When: step_dependencies() is called
+        Then: Upstream indexes per step
+        """
+        workflow = _dag(("search", []), ("stats", []), ("report", ["stats", "search"]))
+
+        assert workflow.step_dependencies() == [[], [], [0, 1]]
+
+    def test_sequential_and_parallel_dependencies(self):
+        """
+        Given: sequential / parallel workflows
+        When: step_dependencies() is called
+        Then: Chain on the previous step / no dependencies
+        """
+        steps = (("a", []), ("b", []), ("c", []))
+
+        assert _dag(*steps, workflow_type="sequential").step_dependencies() == [[], [0], [1]]
+        assert _dag(*steps, workflow_type="parallel").step_dependencies() == [[], [], []]
+
+    @pytest.mark.parametrize(
+        "steps",
+        [
+            (("a", ["b"]), ("b", ["a"])),  # cycle
+            (("a", []), ("b", ["missing"])),  # unknown dependency
+            (("a", []), ("a", [])),  # duplicate output_key
+        ],
+    )
+    def test_invalid_dag_raises_value_error(self, steps):
+        """
+        Given: Cyclic, dangling, or duplicate-key DAG
+        When: step_dependencies() is called
+        Then: ValueError
+        """
+        with pytest.raises(ValueError):
+            _dag(*steps).step_dependencies()
+
+    @pytest.mark.parametrize("workflow_type", ["sequential", "parallel"])
+    def test_duplicate_output_key_raises_for_every_type(self, workflow_type):
+        """
+        Given: sequential/parallel workflow whose steps share an output_key
+        When: step_dependencies() is called
+        Then: ValueError (later steps would overwrite the earlier result)
+        """
+        with pytest.raises(ValueError, match="Duplicate output_key"):
+            _dag(("a", []), ("a", []), workflow_type=workflow_type).step_dependencies()
+
+    def test_empty_output_keys_allowed_outside_dag(self):
+        """
+        Given: sequential workflow whose steps have no output_key
+        When: step_dependencies() is called
+        Then: Steps still chain on the previous step
+        """
+        workflow = _dag(("", []), ("", []), workflow_type="sequential")
+
+        assert workflow.step_dependencies() == [[], [0]]
+
+    def test_invalid_workflow_type_raises_value_error(self):
+        """
+        Given: Unknown workflow_type
+        When: step_dependencies() is called
+        Then: ValueError
+        """
+        with pytest.raises(ValueError):
+            _dag(("a", []), workflow_type="loop").step_dependencies()
+
+    def test_definition_hash_ignores_identity(self):
+        """
+        Given: Two workflows with the same steps but different id/name
+        When: definition_hash() is compared
+        Then: Equal hashes; changing a dependency changes the hash
+        """
+        first = _dag(("a", []), ("b", ["a"]))
+        second = _dag(("a", []), ("b", ["a"]))
+        second.id, second.name = "other", "Other"
+        changed = _dag(("a", []), ("b", []))
+
+        assert first.definition_hash() == second.definition_hash()
+        assert first.definition_hash() != changed.definition_hash()
@@ -146,6 +146,20 @@ class TestConversationService:
         assert len(assistant_messages) == 1
         assert assistant_messages[0].content == "Hello! How can I help you?"
 
+    async def test_send_message_passes_escalate_to_orchestrator(
+        self, service, storage, orchestrator
+    ):
+        """escalate=True는 오케스트레이터까지 전달"""
+        # Given
+        storage.conversations["conv-123"] = Conversation(id="conv-123")
+
+        # When
+        async for _ in service.send_message("conv-123", "Hard question", escalate=True):
+            pass
+
+        # Then
+        assert orchestrator.escalated_conversations == ["conv-123"]
+
     async def test_send_message_to_nonexistent_conversation(self, service):
         """존재하지 않는 대화에 메시지 전송 시 에러"""
         # When / Then
@@ -3,7 +3,7 @@
 import pytest
 
 from src.domain.entities.endpoint import Endpoint
-from src.domain.entities.enums import EndpointType
+from src.domain.entities.enums import EndpointType, McpTransport
 from src.domain.entities.tool import Tool
 from src.domain.exceptions import EndpointConnectionError, EndpointNotFoundError
 from src.domain.services.registry_service import RegistryService
@@ -316,6 +316,7 @@ class TestRegistryServiceA2A:
         # Then
         assert len(orchestrator.added_a2a_agents) == 1
         assert orchestrator.added_a2a_agents[0] == (endpoint.id, "http://localhost:9001")
+        assert orchestrator.a2a_agent_cards[endpoint.id] == endpoint.agent_card
 
     async def test_unregister_a2a_calls_orchestrator_remove_agent(
         self, storage, toolset, a2a_client
@@ -444,6 +445,20 @@ class TestRegistryServiceRestore:
         assert len(result["failed"]) == 0
         assert mcp_endpoint.id in toolset.added_servers
 
+    async def test_restore_persists_probed_transport(self, service, storage):
+        """
+        Given: 전송 방식이 기록되지 않은 MCP 엔드포인트 (이전 버전 데이터)
+        When: restore_endpoints() 호출
+        Then: probing으로 확인된 전송 방식이 저장소에 기록됨
+        """
+        mcp_endpoint = Endpoint(url="http://localhost:9000/mcp", type=EndpointType.MCP)
+        await storage.save_endpoint(mcp_endpoint)
+
+        await service.restore_endpoints()
+
+        restored = await storage.get_endpoint(mcp_endpoint.id)
+        assert restored.transport == McpTransport.STREAMABLE_HTTP
+
     async def test_restore_a2a_endpoints_rewires(self, service, storage, a2a_client, orchestrator):
         """
         Given: 저장소에 A2A 엔드포인트 존재
@@ -470,6 +485,7 @@ class TestRegistryServiceRestore:
             a2a_endpoint.id,
             "http://localhost:9001",
         )
+        assert orchestrator.a2a_agent_cards[a2a_endpoint.id]["name"] == "Test A2A"
 
     async def test_restore_failed_endpoint_skipped(self, storage, a2a_client, orchestrator):
         """
@@ -499,6 +515,24 @@ class TestRegistryServiceRestore:
         assert mcp_endpoint.url in result["failed"]
         assert len(result["restored"]) == 0
 
+    async def test_restore_a2a_endpoints_in_single_batch(self, service, storage, orchestrator):
+        """
+        Given: 저장소에 A2A 엔드포인트 3개 존재
+        When: restore_endpoints() 호출
+        Then: Orchestrator에는 한 번의 배치로 연결됨 (에이전트마다 재구성하지 않음)
+        """
+        endpoints = [
+            Endpoint(url=f"http://localhost:900{i}", type=EndpointType.A2A) for i in range(1, 4)
+        ]
+        for endpoint in endpoints:
+            await storage.save_endpoint(endpoint)
+
+        result = await service.restore_endpoints()
+
+        assert orchestrator.a2a_update_batches == 1
+        assert sorted(result["restored"]) == sorted(e.url for e in endpoints)
+        assert {eid for eid, _ in orchestrator.added_a2a_agents} == {e.id for e in endpoints}
+
     async def test_restore_empty_storage(self, service):
         """
         Given: 저장소가 비어있음
@@ -573,6 +607,30 @@ class TestRegistryServiceWithMcpClient:
         assert mcp_client.get_sampling_callback(endpoint.id) is not None
         assert mcp_client.get_elicitation_callback(endpoint.id) is not None
 
+    async def test_tools_list_changed_forwarded_to_toolset(self, service, mcp_client, toolset):
+        """
+        Given: tools.listChanged를 광고하는 MCP 서버
+        When: 등록 후 서버가 notifications/tools/list_changed 전송
+        Then: Toolset에 지원 여부가 설정되고 알림이 해당 엔드포인트로 전달됨
+        """
+        mcp_client.advertise_tools_list_changed = True
+        endpoint = await service.register_endpoint("http://localhost:8080/mcp")
+
+        await mcp_client.notify_tools_list_changed(endpoint.id)
+
+        assert endpoint.id in toolset.list_changed_endpoints
+        assert toolset.tools_changed_notifications == [endpoint.id]
+
+    async def test_server_without_list_changed_keeps_ttl(self, service, toolset):
+        """
+        Given: tools.listChanged를 광고하지 않는 MCP 서버
+        When: 등록
+        Then: Toolset은 기본 TTL 유지 (알림 미지원으로 기록)
+        """
+        endpoint = await service.register_endpoint("http://localhost:8080/mcp")
+
+        assert endpoint.id not in toolset.list_changed_endpoints
+
     async def test_unregister_disconnects_sdk_track(self, service, mcp_client):
         """
         Given: SDK Track이 연결된 MCP 엔드포인트
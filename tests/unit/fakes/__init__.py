@@ -16,6 +16,7 @@ from tests.unit.fakes.fake_storage import (
     FakeConversationStorage,
     FakeEndpointStorage,
 )
+from tests.unit.fakes.fake_tool_result_storage import FakeToolResultStorage
 from tests.unit.fakes.fake_toolset import FakeToolset
 
 __all__ = [
@@ -24,5 +25,6 @@ __all__ = [
     "FakeConversationStorage",
     "FakeEndpointStorage",
     "FakeOrchestrator",
+    "FakeToolResultStorage",
     "FakeToolset",
 ]
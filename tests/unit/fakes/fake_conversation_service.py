@@ -76,6 +76,7 @@ class FakeConversationService:
         conversation_id: str | None,
         content: str,
         page_context: dict | None = None,
+        escalate: bool = False,
     ):
         """메시지 전송 및 스트리밍 응답"""
         if conversation_id is None:
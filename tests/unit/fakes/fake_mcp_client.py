@@ -14,6 +14,7 @@ from src.domain.ports.outbound.mcp_client_port import (
     ElicitationCallback,
     McpClientPort,
     SamplingCallback,
+    ToolsChangedCallback,
 )
 
 
@@ -31,6 +32,8 @@ class FakeMcpClient(McpClientPort):
         self._prompt_results: dict[str, dict[str, str]] = {}
         self._sampling_callbacks: dict[str, SamplingCallback] = {}
         self._elicitation_callbacks: dict[str, ElicitationCallback] = {}
+        self._tools_changed_callbacks: dict[str, ToolsChangedCallback] = {}
+        self.advertise_tools_list_changed = False  # 서버 capability tools.listChanged
 
     # ============================================================
     # 테스트 설정 메서드
@@ -56,6 +59,12 @@ class FakeMcpClient(McpClientPort):
             self._prompt_results[endpoint_id] = {}
         self._prompt_results[endpoint_id][name] = result
 
+    async def notify_tools_list_changed(self, endpoint_id: str) -> None:
+        """서버의 notifications/tools/list_changed 수신 시뮬레이션"""
+        callback = self._tools_changed_callbacks.get(endpoint_id)
+        if callback:
+            await callback(endpoint_id)
+
     def is_connected(self, endpoint_id: str) -> bool:
         """연결 상태 확인 (테스트 검증용)"""
         return self._connections.get(endpoint_id, False)
@@ -77,6 +86,8 @@ class FakeMcpClient(McpClientPort):
         self._prompt_results.clear()
         self._sampling_callbacks.clear()
         self._elicitation_callbacks.clear()
+        self._tools_changed_callbacks.clear()
+        self.advertise_tools_list_changed = False
 
     # ============================================================
     # Port 구현
@@ -88,23 +99,31 @@ class FakeMcpClient(McpClientPort):
         url: str,
         sampling_callback: SamplingCallback | None = None,
         elicitation_callback: ElicitationCallback | None = None,
+        tools_changed_callback: ToolsChangedCallback | None = None,
     ) -> None:
         self._connections[endpoint_id] = True
         if sampling_callback:
             self._sampling_callbacks[endpoint_id] = sampling_callback
         if elicitation_callback:
             self._elicitation_callbacks[endpoint_id] = elicitation_callback
+        if tools_changed_callback:
+            self._tools_changed_callbacks[endpoint_id] = tools_changed_callback
+
+    def supports_tools_list_changed(self, endpoint_id: str) -> bool:
+        return self._connections.get(endpoint_id, False) and self.advertise_tools_list_changed
 
     async def disconnect(self, endpoint_id: str) -> None:
         self._connections.pop(endpoint_id, None)
         self._sampling_callbacks.pop(endpoint_id, None)
         self._elicitation_callbacks.pop(endpoint_id, None)
+        self._tools_changed_callbacks.pop(endpoint_id, None)
 
     async def disconnect_all(self) -> None:
         """모든 세션 정리 (서버 종료 시)"""
         self._connections.clear()
         self._sampling_callbacks.clear()
         self._elicitation_callbacks.clear()
+        self._tools_changed_callbacks.clear()
 
     async def list_resources(self, endpoint_id: str) -> list[Resource]:
         if not self._connections.get(endpoint_id):
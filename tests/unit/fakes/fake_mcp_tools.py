@@ -0,0 +1,121 @@
+"""Fake MCP 도구/Toolset 팩토리 (DynamicToolset 단위 테스트 공용)
+
+ADK McpTool/MCPToolset 대신 MagicMock/AsyncMock으로 구성해 실제 MCP 서버 없이
+DynamicToolset의 캐시/인덱스/선택 로직을 테스트합니다.
+"""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from src.adapters.outbound.adk.dynamic_toolset import DynamicToolset
+from src.config.settings import McpSettings, Settings
+from src.domain.entities.endpoint import Endpoint, EndpointType, McpTransport
+
+_ECHO = object()  # run_async 기본값: 인자를 텍스트 content로 반환
+
+
+def make_tool(
+    name: str,
+    description: str | None = None,
+    *,
+    input_schema: dict[str, Any] | None = None,
+    annotations: Any = None,
+    result: Any = _ECHO,
+) -> MagicMock:
+    """
+    McpTool 대용 Mock 생성
+
+    Args:
+        name: 도구 이름
+        description: 도구 설명 (None이면 "{name} description")
+        input_schema: 입력 스키마 (None이면 빈 dict)
+        annotations: MCP ToolAnnotations (raw_mcp_tool.annotations)
+        result: run_async 반환값 (생략하면 인자를 텍스트 content로 반환)
+
+    Returns:
+        name/description/input_schema/raw_mcp_tool/run_async가 설정된 Mock
+    """
+    schema = input_schema if input_schema is not None else {}
+    tool = MagicMock()
+    tool.name = name
+    tool.description = description if description is not None else f"{name} description"
+    tool.input_schema = schema
+    tool.raw_mcp_tool = MagicMock(inputSchema=schema, annotations=annotations)
+    if result is _ECHO:
+        tool.run_async = AsyncMock(
+            side_effect=lambda args, tool_context: {
+                "content": [{"type": "text", "text": str(args)}]
+            }
+        )
+    else:
+        tool.run_async = AsyncMock(return_value=result)
+    return tool
+
+
+def make_mcp_toolset(tools: list[MagicMock], delay: float = 0.0) -> AsyncMock:
+    """
+    MCPToolset 대용 Mock 생성
+
+    Args:
+        tools: get_tools()가 반환할 도구 목록
+        delay: get_tools() 응답 지연 (초)
+
+    Returns:
+        get_tools/close가 설정된 AsyncMock
+    """
+
+    async def get_tools(*args, **kwargs):
+        await asyncio.sleep(delay)
+        return tools
+
+    toolset = AsyncMock()
+    toolset.get_tools = AsyncMock(side_effect=get_tools)
+    toolset.close = AsyncMock()
+    return toolset
+
+
+async def register_mcp_endpoint(
+    toolset: DynamicToolset,
+    endpoint_id: str,
+    tools: list[MagicMock] | AsyncMock,
+    name: str = "",
+) -> AsyncMock:
+    """
+    MCP 연결 없이 DynamicToolset에 엔드포인트 등록
+
+    Args:
+        toolset: 대상 DynamicToolset
+        endpoint_id: Endpoint ID (URL은 http://{endpoint_id}.test/mcp)
+        tools: 도구 목록 또는 make_mcp_toolset()으로 만든 Mock MCPToolset
+        name: Endpoint 이름
+
+    Returns:
+        등록된 Mock MCPToolset
+    """
+    mcp = tools if isinstance(tools, AsyncMock) else make_mcp_toolset(tools)
+    toolset._create_mcp_toolset = AsyncMock(return_value=(mcp, McpTransport.STREAMABLE_HTTP))
+    await toolset.add_mcp_server(
+        Endpoint(
+            id=endpoint_id,
+            name=name,
+            url=f"http://{endpoint_id}.test/mcp",
+            type=EndpointType.MCP,
+        )
+    )
+    return mcp
+
+
+def make_settings(**mcp: Any) -> Settings:
+    """
+    MCP 설정만 바꾼 Settings 생성
+
+    Args:
+        **mcp: McpSettings 필드 재정의
+
+    Returns:
+        Settings 인스턴스
+    """
+    settings = Settings()
+    settings.mcp = McpSettings(**mcp)
+    return settings
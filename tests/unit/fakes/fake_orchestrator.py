@@ -43,6 +43,9 @@ class FakeOrchestrator(OrchestratorPort):
         self.processed_messages: list[tuple[str, str]] = []  # (message, conv_id)
         self.added_a2a_agents: list[tuple[str, str]] = []  # (endpoint_id, url)
         self.removed_a2a_agents: list[str] = []  # endpoint_id
+        self.a2a_update_batches = 0  # update_a2a_agents() 호출 횟수
+        self.escalated_conversations: list[str] = []  # escalate=True로 처리한 대화 ID
+        self.a2a_agent_cards: dict[str, dict[str, Any]] = {}  # endpoint_id -> 전달된 Agent Card
         self._workflows: dict[str, Workflow] = {}  # workflow_id -> Workflow
         self._generate_result: dict[str, Any] = {
             "role": "assistant",
@@ -59,6 +62,7 @@ class FakeOrchestrator(OrchestratorPort):
         message: str,
         conversation_id: str,
         page_context: dict | None = None,
+        escalate: bool = False,
     ) -> AsyncIterator[StreamChunk]:
         """
         메시지 처리 및 스트리밍 응답
@@ -69,6 +73,8 @@ class FakeOrchestrator(OrchestratorPort):
             raise RuntimeError(self.error_message)
 
         self.processed_messages.append((message, conversation_id))
+        if escalate:
+            self.escalated_conversations.append(conversation_id)
 
         for chunk in self.responses:
             yield chunk
@@ -90,15 +96,20 @@ class FakeOrchestrator(OrchestratorPort):
         """generate_response 결과 설정 (테스트용)"""
         self._generate_result = result
 
-    async def add_a2a_agent(self, endpoint_id: str, url: str) -> None:
+    async def add_a2a_agent(
+        self, endpoint_id: str, url: str, agent_card: dict[str, Any] | None = None
+    ) -> None:
         """
         A2A 에이전트를 LLM sub_agents에 추가
 
         Args:
             endpoint_id: 엔드포인트 ID
             url: A2A 에이전트 URL
+            agent_card: 이미 조회한 Agent Card (있으면 재조회 없이 사용)
         """
         self.added_a2a_agents.append((endpoint_id, url))
+        if agent_card:
+            self.a2a_agent_cards[endpoint_id] = agent_card
 
     async def remove_a2a_agent(self, endpoint_id: str) -> None:
         """
@@ -109,6 +120,25 @@ class FakeOrchestrator(OrchestratorPort):
         """
         self.removed_a2a_agents.append(endpoint_id)
 
+    async def update_a2a_agents(
+        self,
+        add: dict[str, str] | None = None,
+        remove: list[str] | None = None,
+        agent_cards: dict[str, dict[str, Any]] | None = None,
+    ) -> None:
+        """
+        여러 A2A 에이전트 추가/제거를 한 번에 적용
+
+        Args:
+            add: 추가할 에이전트 {endpoint_id: url}
+            remove: 제거할 엔드포인트 ID 목록
+            agent_cards: 이미 조회한 Agent Card {endpoint_id: agent_card}
+        """
+        self.a2a_update_batches += 1
+        self.removed_a2a_agents.extend(remove or [])
+        self.added_a2a_agents.extend((add or {}).items())
+        self.a2a_agent_cards.update(agent_cards or {})
+
     async def create_workflow_agent(self, workflow: Workflow) -> None:
         """
         Workflow Agent 생성 (테스트용 간단 구현)
@@ -191,16 +221,32 @@ class FakeOrchestrator(OrchestratorPort):
         model: str | None = None,
         system_prompt: str | None = None,
         max_tokens: int = 1024,
+        use_cache: bool = True,
     ) -> dict[str, Any]:
         """단일 LLM 응답 생성 (Fake)"""
         return self._generate_result
 
+    async def stream_response(
+        self,
+        messages: list[dict[str, Any]],
+        model: str | None = None,
+        system_prompt: str | None = None,
+        max_tokens: int = 1024,
+    ) -> AsyncIterator[str]:
+        """단일 LLM 응답 스트리밍 (Fake) - generate_response 결과를 한 조각으로 반환"""
+        content = self._generate_result.get("content", "")
+        if content:
+            yield content
+
     def reset(self) -> None:
         """상태 초기화"""
         self.initialized = False
         self.closed = False
         self.processed_messages.clear()
+        self.escalated_conversations.clear()
         self.added_a2a_agents.clear()
         self.removed_a2a_agents.clear()
+        self.a2a_update_batches = 0
+        self.a2a_agent_cards.clear()
         self._workflows.clear()
         self.should_fail = False
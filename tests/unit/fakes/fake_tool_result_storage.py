@@ -0,0 +1,30 @@
+"""Fake Tool Result Storage (테스트용 인메모리 구현)"""
+
+from src.domain.exceptions import ToolResultNotFoundError
+from src.domain.ports.outbound.storage_port import ToolResultStoragePort
+
+
+class FakeToolResultStorage(ToolResultStoragePort):
+    """인메모리 도구 결과 저장소 (테스트 전용)"""
+
+    def __init__(self):
+        self.results: dict[str, str] = {}
+
+    async def save_result(self, content: str) -> str:
+        """도구 결과 저장 (순차 핸들)"""
+        handle = f"{len(self.results):032x}"
+        self.results[handle] = content
+        return handle
+
+    async def read_result(
+        self,
+        handle: str,
+        offset: int = 0,
+        length: int | None = None,
+    ) -> tuple[str, int]:
+        """도구 결과 구간 조회"""
+        if handle not in self.results:
+            raise ToolResultNotFoundError(f"Tool result not found: {handle}")
+        content = self.results[handle]
+        end = None if length is None else offset + length
+        return content[offset:end], len(content)
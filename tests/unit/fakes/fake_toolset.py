@@ -6,6 +6,7 @@ ToolsetPort의 테스트용 구현입니다.
 from typing import Any
 
 from src.domain.entities.endpoint import Endpoint
+from src.domain.entities.enums import McpTransport
 from src.domain.entities.tool import Tool
 from src.domain.exceptions import (
     EndpointConnectionError,
@@ -44,6 +45,8 @@ class FakeToolset(ToolsetPort):
         self.registered_endpoints: dict[str, list[Tool]] = {}
         self.health_status: dict[str, bool] = {}
         self.tool_results: dict[str, Any] = {}  # tool_name -> result
+        self.tools_changed_notifications: list[str] = []  # 알림 받은 endpoint_id 순서
+        self.list_changed_endpoints: set[str] = set()
 
     @property
     def tools(self) -> list[Tool]:
@@ -73,6 +76,10 @@ class FakeToolset(ToolsetPort):
         if self.should_fail_connection:
             raise EndpointConnectionError(f"Failed to connect to {endpoint.url}")
 
+        # 전송 방식 기록 (DynamicToolset probing 결과 모사)
+        if endpoint.transport is None:
+            endpoint.transport = McpTransport.STREAMABLE_HTTP
+
         # 도구에 endpoint_id 설정
         tools = [
             Tool(
@@ -129,6 +136,17 @@ class FakeToolset(ToolsetPort):
         """엔드포인트 상태 확인"""
         return self.health_status.get(endpoint_id, False)
 
+    async def handle_tools_list_changed(self, endpoint_id: str) -> None:
+        """도구 목록 변경 알림 기록"""
+        self.tools_changed_notifications.append(endpoint_id)
+
+    def set_tools_list_changed_support(self, endpoint_id: str, supported: bool) -> None:
+        """tools.listChanged 지원 엔드포인트 기록"""
+        if supported:
+            self.list_changed_endpoints.add(endpoint_id)
+        else:
+            self.list_changed_endpoints.discard(endpoint_id)
+
     async def close(self) -> None:
         """모든 연결 정리"""
         self.registered_endpoints.clear()
@@ -161,5 +179,7 @@ class FakeToolset(ToolsetPort):
         self.registered_endpoints.clear()
         self.health_status.clear()
         self.tool_results.clear()
+        self.tools_changed_notifications.clear()
+        self.list_changed_endpoints.clear()
         self.should_fail_connection = False
         self.should_fail_execution = False
@@ -39,6 +39,8 @@ class FakeUsageStorage(UsageStoragePort):
         total_cost = 0.0
         total_tokens = 0
         call_count = 0
+        cache_hits = 0
+        cached_tokens = 0
         by_model: dict[str, float] = {}
 
         for usage in self._usages:
@@ -46,11 +48,15 @@ class FakeUsageStorage(UsageStoragePort):
                 total_cost += usage.cost_usd
                 total_tokens += usage.total_tokens
                 call_count += 1
+                cache_hits += int(usage.cache_hit)
+                cached_tokens += usage.cached_tokens
                 by_model[usage.model] = by_model.get(usage.model, 0.0) + usage.cost_usd
 
         return {
             "total_cost": total_cost,
             "total_tokens": total_tokens,
             "call_count": call_count,
+            "cache_hits": cache_hits,
+            "cached_tokens": cached_tokens,
             "by_model": by_model,
         }